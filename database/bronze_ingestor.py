@@ -0,0 +1,997 @@
+"""
+Reusable bronze-layer ingestion framework.
+
+Every bronze ingestion script follows the same pattern: fetch records from a
+source, compute a content hash per record, compare it with the latest hash
+stored in bronze.raw_entities, and insert only new or changed records while
+tracking the run in meta.ingestion_runs. BronzeIngestor implements that
+pattern once, with the fast paths built in:
+
+- Existing hashes are prefetched in one DISTINCT ON query (or per batch
+  with external_id = ANY(...) for incremental sources).
+- Records are normalized and hashed in batches, optionally on a thread pool.
+- Changed records are written with one bulk insert per batch.
+- Throughput and per-phase timings are reported in the run statistics.
+- A checkpoint is written to meta.ingestion_runs.metadata after each batch.
+
+A source only declares how to fetch records and which fields identify and
+describe them:
+
+    class MyIngestor(BronzeIngestor):
+        source_system = "my_source"
+        entity_type = "user"
+        key_field = "Id"
+        hash_fields = ("Id", "Name", "Email")
+
+        def fetch_records(self):
+            yield from my_api.get_all_users()
+"""
+
+import json
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.adapters.postgres_adapter import PostgresAdapter
+from database.hashing import content_hash
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_content_hash(
+    record: Dict[str, Any], fields: Optional[Sequence[str]] = None
+) -> str:
+    """
+    Calculate the standard bronze content hash for a record.
+
+    Args:
+        record: Record to hash
+        fields: Fields included in the hash. If None, all fields except
+            metadata fields (starting with '_') are included.
+
+    Returns:
+        SHA-256 hex digest of the record's sorted-key compact JSON
+    """
+    return content_hash(record, fields, compatible=True)
+
+
+def save_run_checkpoint(
+    engine: Engine,
+    run_id: str,
+    checkpoint: Dict[str, Any],
+    records_processed: Optional[int] = None,
+    records_created: Optional[int] = None,
+) -> None:
+    """
+    Store a checkpoint for an ingestion run in meta.ingestion_runs.metadata.
+
+    The checkpoint replaces metadata->'checkpoint'; the rest of the run
+    metadata is preserved. Running counters are updated when provided so
+    progress is visible while the run is still going.
+
+    Args:
+        engine: SQLAlchemy engine for the LSATS database
+        run_id: Ingestion run ID
+        checkpoint: JSON-serializable checkpoint state
+        records_processed: Records processed so far
+        records_created: Records created so far
+    """
+    with engine.connect() as conn:
+        conn.execute(
+            text("""
+                UPDATE meta.ingestion_runs
+                SET metadata = jsonb_set(
+                        COALESCE(metadata, '{}'::jsonb),
+                        '{checkpoint}',
+                        CAST(:checkpoint AS jsonb)
+                    ),
+                    records_processed = COALESCE(:records_processed, records_processed),
+                    records_created = COALESCE(:records_created, records_created)
+                WHERE run_id = :run_id
+            """),
+            {
+                "run_id": run_id,
+                "checkpoint": json.dumps(checkpoint, default=str),
+                "records_processed": records_processed,
+                "records_created": records_created,
+            },
+        )
+        conn.commit()
+
+
+def load_run_checkpoint(engine: Engine, run_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the checkpoint stored for an ingestion run.
+
+    Args:
+        engine: SQLAlchemy engine for the LSATS database
+        run_id: Ingestion run ID
+
+    Returns:
+        The checkpoint dictionary, or None if the run has no checkpoint
+    """
+    with engine.connect() as conn:
+        row = conn.execute(
+            text("""
+                SELECT metadata->'checkpoint'
+                FROM meta.ingestion_runs
+                WHERE run_id = :run_id
+            """),
+            {"run_id": run_id},
+        ).fetchone()
+
+    return row[0] if row and row[0] else None
+
+
+def reopen_ingestion_run(
+    engine: Engine,
+    run_id: str,
+    source_system: str,
+    entity_type: str,
+) -> Dict[str, Any]:
+    """
+    Put an interrupted ingestion run back into 'running' so it can be resumed.
+
+    Runs left 'running' by a killed process and runs marked 'failed' can be
+    reopened; completed runs cannot. The run keeps its original started_at
+    and metadata, including the last checkpoint.
+
+    Args:
+        engine: SQLAlchemy engine for the LSATS database
+        run_id: Ingestion run ID to resume
+        source_system: Expected source system of the run
+        entity_type: Expected entity type of the run
+
+    Returns:
+        The run's metadata dictionary (checkpoint under 'checkpoint', if any)
+
+    Raises:
+        ValueError: If the run does not exist, belongs to another source or
+            entity type, or has already completed
+    """
+    with engine.connect() as conn:
+        row = conn.execute(
+            text("""
+                SELECT source_system, entity_type, status, metadata
+                FROM meta.ingestion_runs
+                WHERE run_id = :run_id
+            """),
+            {"run_id": run_id},
+        ).fetchone()
+
+        if row is None:
+            raise ValueError(f"Ingestion run {run_id} not found")
+        if (row[0], row[1]) != (source_system, entity_type):
+            raise ValueError(
+                f"Ingestion run {run_id} is a {row[0]}/{row[1]} run, "
+                f"not {source_system}/{entity_type}"
+            )
+        if row[2] == "completed":
+            raise ValueError(f"Ingestion run {run_id} already completed")
+
+        conn.execute(
+            text("""
+                UPDATE meta.ingestion_runs
+                SET status = 'running',
+                    completed_at = NULL,
+                    error_message = NULL
+                WHERE run_id = :run_id
+            """),
+            {"run_id": run_id},
+        )
+        conn.commit()
+
+    return row[3] or {}
+
+
+class ResumeCheckpoint:
+    """
+    Compact, resumable progress marker for runs that walk records in key order.
+
+    Instead of the full list of completed keys, the checkpoint stores a
+    watermark (last_<key>): every key up to and including it has been
+    handled. Failed keys are listed separately and retried on resume. Each
+    save therefore writes a payload whose size does not grow with the run.
+
+    Records may finish out of order (e.g. with asyncio.as_completed); the
+    watermark only advances over the contiguous prefix of finished keys, so
+    a resume never skips a key that was still in flight. Keys below the
+    watermark that were not candidates of the original run are treated as
+    done as well; the next regular run picks them up.
+
+    Example:
+        checkpoint = ResumeCheckpoint("uid", saved=run_metadata.get("checkpoint"))
+        df = df.sort_values("uid")
+        df = df[~df["uid"].map(checkpoint.is_done)]
+        checkpoint.start(df["uid"])
+        ...
+        checkpoint.record(uid, "enriched")
+        checkpoint.save(engine, run_id)
+    """
+
+    def __init__(self, key_name: str, saved: Optional[Dict[str, Any]] = None):
+        """
+        Create a checkpoint, optionally restored from a saved payload.
+
+        Args:
+            key_name: Record key name used in the payload (last_<key_name>,
+                failed_<key_name>s)
+            saved: Payload previously written by save()
+        """
+        saved = saved or {}
+        self.key_name = key_name
+        self.last_key = saved.get(f"last_{key_name}")
+        self.failed = set(saved.get(f"failed_{key_name}s", []))
+        self.processed = saved.get("records_processed", 0)
+        self.enriched = saved.get("records_enriched", 0)
+        self.updated_at = saved.get("updated_at")
+        # Keys of the current run in processing order, and finished keys
+        # beyond the watermark
+        self._order: List[Any] = []
+        self._position = 0
+        self._finished: set = set()
+
+    def is_done(self, key: Any) -> bool:
+        """
+        Check whether a key was handled before the checkpoint was saved.
+
+        Args:
+            key: Record key
+
+        Returns:
+            True if the key is at or below the watermark and did not fail
+        """
+        return (
+            self.last_key is not None
+            and key not in self.failed
+            and key <= self.last_key
+        )
+
+    def start(self, keys: Iterable[Any]) -> None:
+        """
+        Register the keys this run will process, in ascending order.
+
+        Args:
+            keys: Keys sorted ascending (the order is_done() compares in)
+        """
+        self._order = list(keys)
+        self._position = 0
+        self._finished = set()
+
+    def record(self, key: Any, action: Optional[str]) -> None:
+        """
+        Record the outcome of one record and advance the watermark.
+
+        Args:
+            key: Record key
+            action: 'enriched', 'error' or any other outcome (e.g. 'skipped')
+        """
+        self.processed += 1
+        if action == "enriched":
+            self.enriched += 1
+            self.failed.discard(key)
+        elif action == "error":
+            self.failed.add(key)
+
+        self._finished.add(key)
+        while (
+            self._position < len(self._order)
+            and self._order[self._position] in self._finished
+        ):
+            self._finished.discard(self._order[self._position])
+            self.last_key = self._order[self._position]
+            self._position += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the JSON payload stored under metadata->'checkpoint'."""
+        return {
+            f"last_{self.key_name}": self.last_key,
+            f"failed_{self.key_name}s": sorted(self.failed),
+            "records_processed": self.processed,
+            "records_enriched": self.enriched,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def save(self, engine: Engine, run_id: str) -> None:
+        """
+        Persist the checkpoint and running counters for a run.
+
+        A failed save is logged and ignored: it only means a resume redoes a
+        little more work.
+
+        Args:
+            engine: SQLAlchemy engine for the LSATS database
+            run_id: Ingestion run ID
+        """
+        try:
+            save_run_checkpoint(
+                engine,
+                run_id,
+                self.to_dict(),
+                records_processed=self.processed,
+                records_created=self.enriched,
+            )
+        except SQLAlchemyError as e:
+            logger.warning(f"⚠️  Failed to save checkpoint for run {run_id}: {e}")
+
+
+class BronzeIngestor:
+    """
+    Base class for content-hash based ingestion into bronze.raw_entities.
+
+    Subclasses set source_system and entity_type, and either key_field or
+    get_external_id(). They provide records through fetch_records() (or
+    fetch_batches() for sources that are already paged). Everything else
+    has a default that can be overridden:
+
+    - normalize_record(): clean a raw source record before hashing/storing
+    - calculate_content_hash(): defaults to hashing hash_fields
+    - build_raw_data(): adds _content_hash and _change_detection metadata
+    - observe_record(): hook for per-source analytics
+    - get_run_metadata(): extra metadata stored with the ingestion run
+    - get_checkpoint_state(): extra state stored with each checkpoint
+
+    Attributes:
+        source_system: Source system identifier in bronze.raw_entities
+        entity_type: Entity type in bronze.raw_entities
+        key_field: Record field holding the external ID
+        hash_fields: Fields included in the content hash (None for all
+            non-metadata fields)
+        trust_stored_hashes: Use the _content_hash stored in raw_data for
+            existing records instead of recomputing it from raw_data
+    """
+
+    source_system: str = ""
+    entity_type: str = ""
+    key_field: Optional[str] = None
+    hash_fields: Optional[Sequence[str]] = None
+    trust_stored_hashes: bool = False
+
+    def __init__(
+        self,
+        db_adapter: PostgresAdapter,
+        force_full_sync: bool = False,
+        dry_run: bool = False,
+        batch_size: int = 1000,
+        normalize_workers: int = 1,
+        prefetch: str = "all",
+        hash_function: Optional[Callable[[Dict[str, Any]], str]] = None,
+        checkpoint_every: int = 1,
+    ):
+        """
+        Initialize the ingestor.
+
+        Args:
+            db_adapter: PostgreSQL adapter for the LSATS database
+            force_full_sync: If True, insert every record regardless of stored hashes
+            dry_run: If True, preview changes without committing to database
+            batch_size: Number of records hashed, compared and written together
+            normalize_workers: Threads used to normalize and hash each batch
+                (1 runs inline). Useful when normalization releases the GIL or
+                performs I/O.
+            prefetch: 'all' loads every existing hash up front; 'batch' looks up
+                only the external IDs in each batch (better for incremental
+                sources touching a small share of a large table)
+            hash_function: Replaces calculate_content_hash() when provided
+            checkpoint_every: Write a checkpoint after this many batches
+        """
+        if prefetch not in ("all", "batch"):
+            raise ValueError(f"prefetch must be 'all' or 'batch', got {prefetch!r}")
+        if not self.source_system or not self.entity_type:
+            raise ValueError(
+                f"{type(self).__name__} must define source_system and entity_type"
+            )
+
+        self.db_adapter = db_adapter
+        self.force_full_sync = force_full_sync
+        self.dry_run = dry_run
+        self.batch_size = max(1, batch_size)
+        self.normalize_workers = max(1, normalize_workers)
+        self.prefetch = prefetch
+        self.checkpoint_every = max(1, checkpoint_every)
+        if hash_function is not None:
+            self.calculate_content_hash = hash_function
+
+    # =========================================================================
+    # SOURCE HOOKS
+    # =========================================================================
+
+    def fetch_records(self) -> Iterable[Dict[str, Any]]:
+        """
+        Yield raw records from the source.
+
+        Returns:
+            Iterable of raw source records
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement fetch_records() or fetch_batches()"
+        )
+
+    def fetch_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield batches of raw records.
+
+        The default groups fetch_records() into batch_size lists. Paged
+        sources can override this to yield their pages directly.
+
+        Yields:
+            Lists of raw source records
+        """
+        batch = []
+        for record in self.fetch_records():
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def get_external_id(self, record: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the external ID of a record.
+
+        Args:
+            record: Normalized record
+
+        Returns:
+            The external ID, or None if the record cannot be identified
+        """
+        if not self.key_field:
+            raise NotImplementedError(
+                f"{type(self).__name__} must set key_field or implement get_external_id()"
+            )
+        value = record.get(self.key_field)
+        if value is None or str(value).strip() == "":
+            return None
+        return str(value).strip()
+
+    def normalize_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize a raw source record before hashing and storage.
+
+        Args:
+            record: Raw source record
+
+        Returns:
+            Normalized record (the record itself by default)
+        """
+        return record
+
+    def calculate_content_hash(self, record: Dict[str, Any]) -> str:
+        """
+        Calculate the content hash used for change detection.
+
+        Must give the same result for a normalized source record and for the
+        raw_data stored from it, since existing hashes are recomputed from
+        bronze unless trust_stored_hashes is set.
+
+        Args:
+            record: Normalized record, or raw_data loaded from bronze
+
+        Returns:
+            Content hash string
+        """
+        return calculate_content_hash(record, self.hash_fields)
+
+    def build_raw_data(self, record: Dict[str, Any], record_hash: str) -> Dict[str, Any]:
+        """
+        Build the raw_data stored in bronze for a new or changed record.
+
+        Args:
+            record: Normalized record
+            record_hash: Content hash of the record
+
+        Returns:
+            Dictionary stored as raw_data
+        """
+        raw_data = dict(record)
+        raw_data["_content_hash"] = record_hash
+        raw_data["_change_detection"] = "content_hash_based"
+        return raw_data
+
+    def observe_record(self, record: Dict[str, Any]) -> None:
+        """
+        Hook called for every identified record, for per-source analytics.
+
+        Args:
+            record: Normalized record
+        """
+
+    def get_run_metadata(self) -> Dict[str, Any]:
+        """
+        Return metadata stored with the ingestion run.
+
+        Returns:
+            JSON-serializable metadata dictionary
+        """
+        return {
+            "ingestion_type": "content_hash_based",
+            "change_detection_method": "sha256_content_hash",
+            "full_sync": self.force_full_sync,
+            "ingestor": type(self).__name__,
+        }
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """
+        Return source-specific state saved with each checkpoint (e.g. a page cookie).
+
+        Returns:
+            JSON-serializable state dictionary
+        """
+        return {}
+
+    # =========================================================================
+    # INGESTION RUN TRACKING
+    # =========================================================================
+
+    def create_ingestion_run(self) -> str:
+        """
+        Create a new ingestion run record for tracking purposes.
+
+        Returns:
+            The ingestion run ID (UUID string)
+        """
+        if self.dry_run:
+            run_id = f"dry-run-{uuid.uuid4()}"
+            logger.info(f"[DRY RUN] Would create ingestion run {run_id}")
+            return run_id
+
+        try:
+            run_id = str(uuid.uuid4())
+
+            with self.db_adapter.engine.connect() as conn:
+                # Mark any stale 'running' runs as failed before starting a new one.
+                # Stale runs occur when a process is OOM-killed or force-stopped before
+                # it can update its own status.
+                conn.execute(text("""
+                    UPDATE meta.ingestion_runs
+                    SET status = 'failed',
+                        completed_at = NOW(),
+                        error_message = 'stale - process terminated before completing (OOM kill or force stop)'
+                    WHERE source_system = :source_system
+                      AND entity_type = :entity_type
+                      AND status = 'running'
+                """), {"source_system": self.source_system, "entity_type": self.entity_type})
+
+                conn.execute(
+                    text("""
+                        INSERT INTO meta.ingestion_runs (
+                            run_id, source_system, entity_type, started_at, status, metadata
+                        ) VALUES (
+                            :run_id, :source_system, :entity_type, :started_at, 'running', :metadata
+                        )
+                    """),
+                    {
+                        "run_id": run_id,
+                        "source_system": self.source_system,
+                        "entity_type": self.entity_type,
+                        "started_at": datetime.now(timezone.utc),
+                        "metadata": json.dumps(self.get_run_metadata(), default=str),
+                    },
+                )
+
+                conn.commit()
+
+            logger.info(
+                f"Created ingestion run {run_id} for {self.source_system}/{self.entity_type}"
+            )
+            return run_id
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to create ingestion run: {e}")
+            raise
+
+    def complete_ingestion_run(
+        self,
+        run_id: str,
+        records_processed: int,
+        records_created: int,
+        records_skipped: int = 0,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """
+        Mark an ingestion run as completed with comprehensive statistics.
+
+        Args:
+            run_id: The ingestion run ID
+            records_processed: Total number of records processed
+            records_created: Number of new records created
+            records_skipped: Number of records skipped (unchanged)
+            error_message: Error message if the run failed
+        """
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would complete ingestion run {run_id}")
+            return
+
+        try:
+            status = "failed" if error_message else "completed"
+
+            with self.db_adapter.engine.connect() as conn:
+                conn.execute(
+                    text("""
+                        UPDATE meta.ingestion_runs
+                        SET completed_at = :completed_at,
+                            status = :status,
+                            records_processed = :records_processed,
+                            records_created = :records_created,
+                            records_updated = :records_skipped,
+                            error_message = :error_message
+                        WHERE run_id = :run_id
+                    """),
+                    {
+                        "run_id": run_id,
+                        "completed_at": datetime.now(timezone.utc),
+                        "status": status,
+                        "records_processed": records_processed,
+                        "records_created": records_created,
+                        "records_skipped": records_skipped,
+                        "error_message": error_message,
+                    },
+                )
+
+                conn.commit()
+
+            logger.info(f"Completed ingestion run {run_id}: {status}")
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to complete ingestion run: {e}")
+
+    def save_checkpoint(self, run_id: str, stats: Dict[str, Any]) -> None:
+        """
+        Write the current progress and source state as the run's checkpoint.
+
+        Args:
+            run_id: The ingestion run ID
+            stats: Running ingestion statistics
+        """
+        if self.dry_run:
+            return
+
+        checkpoint = {
+            "batches_completed": stats["batches"],
+            "records_processed": stats["records_processed"],
+            "last_external_id": stats.get("last_external_id"),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            **self.get_checkpoint_state(),
+        }
+        try:
+            save_run_checkpoint(
+                self.db_adapter.engine,
+                run_id,
+                checkpoint,
+                records_processed=stats["records_processed"],
+                records_created=stats["records_created"],
+            )
+        except SQLAlchemyError as e:
+            # A missed checkpoint only costs progress visibility, not data
+            logger.warning(f"Failed to save checkpoint for run {run_id}: {e}")
+
+    # =========================================================================
+    # CHANGE DETECTION
+    # =========================================================================
+
+    def get_existing_hashes(
+        self, external_ids: Optional[Sequence[str]] = None
+    ) -> Dict[str, str]:
+        """
+        Retrieve the latest content hash for each existing record in bronze.
+
+        Uses DISTINCT ON over (external_id, ingested_at DESC) so only the most
+        recent record per entity is read. With trust_stored_hashes, raw_data is
+        only transferred for records without a stored _content_hash.
+
+        Args:
+            external_ids: Restrict the lookup to these IDs (None for all)
+
+        Returns:
+            Dictionary mapping external_id -> latest content hash
+        """
+        if external_ids is not None and not external_ids:
+            return {}
+
+        id_filter = "AND external_id = ANY(:external_ids)" if external_ids is not None else ""
+        if self.trust_stored_hashes:
+            columns = """
+                raw_data->>'_content_hash' AS content_hash,
+                CASE WHEN raw_data ? '_content_hash' THEN NULL ELSE raw_data END AS raw_data
+            """
+        else:
+            columns = "NULL AS content_hash, raw_data"
+
+        query = f"""
+            SELECT DISTINCT ON (external_id)
+                external_id,
+                {columns}
+            FROM bronze.raw_entities
+            WHERE entity_type = :entity_type
+              AND source_system = :source_system
+              {id_filter}
+            ORDER BY external_id, ingested_at DESC
+        """
+        params = {"entity_type": self.entity_type, "source_system": self.source_system}
+        if external_ids is not None:
+            params["external_ids"] = list(external_ids)
+
+        try:
+            existing_hashes = {}
+            with self.db_adapter.engine.connect() as conn:
+                for external_id, stored_hash, raw_data in conn.execute(text(query), params):
+                    if not stored_hash:
+                        # JSONB comes back as dict
+                        stored_hash = self.calculate_content_hash(raw_data)
+                    existing_hashes[external_id] = stored_hash
+            return existing_hashes
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to retrieve existing hashes: {e}")
+            raise
+
+    def _prepare_record(
+        self, record: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+        """
+        Normalize, identify and hash one record.
+
+        Args:
+            record: Raw source record
+
+        Returns:
+            Tuple of (external_id, normalized record, content hash, error message)
+        """
+        try:
+            normalized = self.normalize_record(record)
+            external_id = self.get_external_id(normalized)
+            if external_id is None:
+                return None, normalized, None, None
+            return external_id, normalized, self.calculate_content_hash(normalized), None
+        except Exception as e:
+            return None, None, None, f"Failed to prepare record: {e}"
+
+    # =========================================================================
+    # MAIN INGESTION LOOP
+    # =========================================================================
+
+    def run(self, batches: Optional[Iterable[List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
+        """
+        Ingest all records with content-hash change detection.
+
+        Args:
+            batches: Batches of raw records to ingest instead of fetch_batches()
+
+        Returns:
+            Dictionary with ingestion statistics and timing metrics
+        """
+        stats: Dict[str, Any] = {
+            "run_id": None,
+            "records_processed": 0,
+            "records_created": 0,
+            "records_skipped_unchanged": 0,
+            "records_skipped_missing_id": 0,
+            "records_skipped_duplicate": 0,
+            "new_records": 0,
+            "changed_records": 0,
+            "batches": 0,
+            "last_external_id": None,
+            "errors": [],
+            "fetch_seconds": 0.0,
+            "prefetch_seconds": 0.0,
+            "prepare_seconds": 0.0,
+            "write_seconds": 0.0,
+            "started_at": datetime.now(timezone.utc),
+        }
+
+        run_id = self.create_ingestion_run()
+        stats["run_id"] = run_id
+        executor = (
+            ThreadPoolExecutor(max_workers=self.normalize_workers)
+            if self.normalize_workers > 1
+            else None
+        )
+
+        try:
+            logger.info(
+                f"🚀 Starting {self.source_system}/{self.entity_type} ingestion "
+                f"(batch_size={self.batch_size}, prefetch={self.prefetch}, "
+                f"normalize_workers={self.normalize_workers})"
+            )
+
+            # Step 1: Prefetch existing hashes once, unless looked up per batch
+            existing_hashes: Dict[str, str] = {}
+            if not self.force_full_sync and self.prefetch == "all":
+                phase_start = time.perf_counter()
+                existing_hashes = self.get_existing_hashes()
+                stats["prefetch_seconds"] += time.perf_counter() - phase_start
+                logger.info(f"📚 Retrieved {len(existing_hashes)} existing content hashes")
+
+            # Step 2: Process the source batch by batch
+            batch_iter = iter(batches if batches is not None else self.fetch_batches())
+            while True:
+                phase_start = time.perf_counter()
+                batch = next(batch_iter, None)
+                stats["fetch_seconds"] += time.perf_counter() - phase_start
+                if batch is None:
+                    break
+                if not batch:
+                    continue
+
+                self._process_batch(batch, run_id, existing_hashes, stats, executor)
+
+                if stats["batches"] % self.checkpoint_every == 0:
+                    self.save_checkpoint(run_id, stats)
+
+            error_summary = None
+            if stats["errors"]:
+                error_summary = f"{len(stats['errors'])} individual record errors occurred"
+
+            self.complete_ingestion_run(
+                run_id=run_id,
+                records_processed=stats["records_processed"],
+                records_created=stats["records_created"],
+                records_skipped=stats["records_skipped_unchanged"],
+                error_message=error_summary,
+            )
+
+            self._finalize_stats(stats)
+            self.log_summary(stats)
+            return stats
+
+        except Exception as e:
+            error_msg = f"{self.source_system}/{self.entity_type} ingestion failed: {e}"
+            logger.error(error_msg, exc_info=True)
+            self.complete_ingestion_run(
+                run_id=run_id,
+                records_processed=stats["records_processed"],
+                records_created=stats["records_created"],
+                records_skipped=stats["records_skipped_unchanged"],
+                error_message=error_msg,
+            )
+            raise
+
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _process_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        run_id: str,
+        existing_hashes: Dict[str, str],
+        stats: Dict[str, Any],
+        executor: Optional[ThreadPoolExecutor],
+    ) -> None:
+        """
+        Normalize, hash, compare and bulk insert one batch of records.
+
+        Args:
+            batch: Raw source records
+            run_id: Ingestion run ID
+            existing_hashes: Latest stored hashes, updated in place
+            stats: Running statistics, updated in place
+            executor: Thread pool for normalization, or None to run inline
+        """
+        phase_start = time.perf_counter()
+        if executor is not None:
+            prepared = list(executor.map(self._prepare_record, batch))
+        else:
+            prepared = [self._prepare_record(record) for record in batch]
+        stats["prepare_seconds"] += time.perf_counter() - phase_start
+
+        if self.prefetch == "batch" and not self.force_full_sync:
+            phase_start = time.perf_counter()
+            batch_ids = [external_id for external_id, _, _, _ in prepared if external_id]
+            existing_hashes.update(self.get_existing_hashes(batch_ids))
+            stats["prefetch_seconds"] += time.perf_counter() - phase_start
+
+        # A source may return the same record more than once in a batch. Only
+        # the last copy is compared and inserted: copies inserted together
+        # would share one ingested_at, leaving the "latest" row ambiguous.
+        last_position = {
+            external_id: position
+            for position, (external_id, _, _, error) in enumerate(prepared)
+            if external_id is not None and not error
+        }
+
+        entities = []
+        for position, (external_id, record, record_hash, error) in enumerate(prepared):
+            if error:
+                logger.error(f"❌ {error}")
+                stats["errors"].append(error)
+                stats["records_processed"] += 1
+                continue
+            if external_id is None:
+                stats["records_skipped_missing_id"] += 1
+                continue
+            if last_position[external_id] != position:
+                stats["records_skipped_duplicate"] += 1
+                continue
+
+            self.observe_record(record)
+            stats["records_processed"] += 1
+            stats["last_external_id"] = external_id
+
+            existing_hash = None if self.force_full_sync else existing_hashes.get(external_id)
+            if existing_hash is None:
+                logger.debug(f"🆕 New {self.entity_type}: {external_id}")
+                stats["new_records"] += 1
+            elif existing_hash != record_hash:
+                logger.debug(f"📝 {self.entity_type} changed: {external_id}")
+                stats["changed_records"] += 1
+            else:
+                stats["records_skipped_unchanged"] += 1
+                continue
+
+            # Duplicates of the same record in later batches are unchanged
+            existing_hashes[external_id] = record_hash
+            stats["records_created"] += 1
+            entities.append(
+                {
+                    "entity_type": self.entity_type,
+                    "source_system": self.source_system,
+                    "external_id": external_id,
+                    "raw_data": self.build_raw_data(record, record_hash),
+                    "ingestion_run_id": run_id,
+                }
+            )
+
+        if entities:
+            if self.dry_run:
+                logger.info(f"[DRY RUN] Would insert {len(entities)} {self.entity_type} records")
+            else:
+                phase_start = time.perf_counter()
+                self.db_adapter.bulk_insert_raw_entities(entities, batch_size=self.batch_size)
+                stats["write_seconds"] += time.perf_counter() - phase_start
+
+        stats["batches"] += 1
+        elapsed = (datetime.now(timezone.utc) - stats["started_at"]).total_seconds()
+        rate = stats["records_processed"] / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"📈 Progress: {stats['records_processed']} processed "
+            f"({stats['records_created']} new/changed, "
+            f"{stats['records_skipped_unchanged']} unchanged) - {rate:.0f} records/s"
+        )
+
+    def _finalize_stats(self, stats: Dict[str, Any]) -> None:
+        """Add completion time, duration and throughput to the statistics."""
+        stats["completed_at"] = datetime.now(timezone.utc)
+        stats["duration_seconds"] = (
+            stats["completed_at"] - stats["started_at"]
+        ).total_seconds()
+        stats["records_per_second"] = (
+            stats["records_processed"] / stats["duration_seconds"]
+            if stats["duration_seconds"] > 0
+            else 0.0
+        )
+
+    def log_summary(self, stats: Dict[str, Any]) -> None:
+        """
+        Log the results of a completed run.
+
+        Args:
+            stats: Final ingestion statistics
+        """
+        logger.info(
+            f"🎉 {self.source_system}/{self.entity_type} ingestion completed in "
+            f"{stats['duration_seconds']:.2f} seconds"
+        )
+        logger.info(f"📊 Results Summary:")
+        logger.info(f"   Total Processed: {stats['records_processed']}")
+        logger.info(f"   New Records Created: {stats['records_created']}")
+        logger.info(f"   ├─ New: {stats['new_records']}")
+        logger.info(f"   └─ Changed: {stats['changed_records']}")
+        logger.info(f"   Skipped (Unchanged): {stats['records_skipped_unchanged']}")
+        if stats["records_skipped_missing_id"]:
+            logger.info(f"   Skipped (Missing ID): {stats['records_skipped_missing_id']}")
+        if stats["records_skipped_duplicate"]:
+            logger.info(f"   Skipped (Duplicate): {stats['records_skipped_duplicate']}")
+        logger.info(f"   Errors: {len(stats['errors'])}")
+        logger.info(
+            f"   Throughput: {stats['records_per_second']:.0f} records/s "
+            f"(fetch {stats['fetch_seconds']:.1f}s, prefetch {stats['prefetch_seconds']:.1f}s, "
+            f"hash {stats['prepare_seconds']:.1f}s, write {stats['write_seconds']:.1f}s)"
+        )
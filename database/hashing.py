@@ -0,0 +1,444 @@
+"""
+Canonical serialization and content hashing for change detection.
+
+Bronze ingesters and silver transforms decide whether a record changed by
+hashing a canonical serialization of its significant fields. This module is
+the shared implementation:
+
+- canonical_json(): sorted-key, compact, type-stable JSON bytes produced by
+  orjson. Datetimes are ISO 8601 (timezone-aware values converted to UTC),
+  bytes are base64, UUIDs are strings, sets are sorted, numpy scalars are
+  plain numbers and NaN/Infinity/NaT/NA become null.
+- compatible_json(): byte-identical to json.dumps(sort_keys=True,
+  separators=(",", ":"), default=str), the serialization every existing
+  script stores hashes for. Use it when switching a script over must not
+  make every stored hash look changed.
+- digest(): sha256 (default), blake2b (128-bit) or xxh3 (128-bit, requires
+  the optional xxhash package).
+- content_hash() / content_hashes(): field projection plus serialization
+  plus digest for one record or a whole batch.
+- normalize_value() / normalize_column() / column_content_hashes(): the
+  document ingesters' cell normalization and sha256-over-sorted-JSON hashes,
+  computed column by column for a whole DataFrame (requires pandas).
+
+Hashes from the two serializers are not interchangeable. Pick one per
+entity and keep it, or plan a one-off full re-sync when switching.
+
+Benchmark: scripts/database/benchmarks/benchmark_hashing.py
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import math
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pragma: no cover - only the columnar helpers need pandas
+    np = pd = None
+
+logger = logging.getLogger(__name__)
+
+HAS_ORJSON = orjson is not None
+
+HASH_ALGORITHMS = ("sha256", "blake2b", "xxh3")
+DEFAULT_ALGORITHM = "sha256"
+
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+else:
+    logger.warning(
+        "orjson is not installed; canonical_json() falls back to the json module. "
+        "Float formatting may differ from orjson-produced hashes."
+    )
+
+# One shared encoder instead of building a JSONEncoder per json.dumps() call
+_COMPATIBLE_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), default=str
+)
+
+
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+
+def _canonical_default(value: Any) -> Any:
+    """
+    Convert values orjson does not serialize natively into canonical JSON types.
+
+    Args:
+        value: Value orjson could not serialize
+
+    Returns:
+        A JSON-serializable replacement
+
+    Raises:
+        TypeError: If the value has no canonical representation
+    """
+    if isinstance(value, datetime):
+        # pandas.NaT is a datetime subclass whose isoformat() is "NaT"
+        if value != value:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.isoformat()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(value)).decode("ascii")
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return None if not value.is_finite() else str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=canonical_json)
+    if hasattr(value, "item") and callable(value.item):
+        # numpy scalars not covered by OPT_SERIALIZE_NUMPY
+        return value.item()
+    if repr(value) in ("<NA>", "NaT"):
+        # pandas.NA and NaT sentinels
+        return None
+    raise TypeError(f"Type is not canonically serializable: {type(value).__name__}")
+
+
+def _replace_non_finite(value: Any) -> Any:
+    """Recursively replace NaN and Infinity floats with None (json fallback only)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Mapping):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def _fallback_canonical_json(value: Any) -> bytes:
+    """Serialize with the json module using the canonical conventions."""
+    encoded = json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_canonical_default,
+    )
+    if "NaN" in encoded or "Infinity" in encoded:
+        encoded = json.dumps(
+            _replace_non_finite(value),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_canonical_default,
+        )
+    return encoded.encode("utf-8")
+
+
+def canonical_json(value: Any) -> bytes:
+    """
+    Serialize a value to canonical JSON bytes.
+
+    The output has sorted keys, no whitespace and UTF-8 text, and the same
+    value always produces the same bytes regardless of dict insertion order
+    or the container type used for sequences.
+
+    Args:
+        value: Any JSON-like value (dicts, lists, scalars, datetimes, UUIDs,
+            bytes, numpy/pandas scalars)
+
+    Returns:
+        Canonical JSON encoded as UTF-8 bytes
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(value, default=_canonical_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Integers beyond 64 bits and mixed-type keys orjson cannot sort
+            pass
+    return _fallback_canonical_json(value)
+
+
+def compatible_json(value: Any) -> bytes:
+    """
+    Serialize a value exactly like the existing ingestion scripts do.
+
+    Equivalent to json.dumps(value, sort_keys=True, separators=(",", ":"),
+    default=str).encode("utf-8"), so hashes match those already stored in
+    bronze.raw_entities.
+
+    Args:
+        value: Any JSON-like value
+
+    Returns:
+        JSON encoded as UTF-8 bytes
+    """
+    return _COMPATIBLE_ENCODER.encode(value).encode("utf-8")
+
+
+# =============================================================================
+# DIGESTS
+# =============================================================================
+
+
+def _get_digest_function(algorithm: str) -> Callable[[bytes], str]:
+    """
+    Resolve a hash algorithm name to a bytes -> hex digest function.
+
+    Args:
+        algorithm: One of HASH_ALGORITHMS
+
+    Returns:
+        Function computing the hex digest of a bytes value
+
+    Raises:
+        ValueError: If the algorithm is unknown
+        ImportError: If xxh3 is requested but xxhash is not installed
+    """
+    if algorithm == "sha256":
+        return lambda data: hashlib.sha256(data).hexdigest()
+    if algorithm == "blake2b":
+        return lambda data: hashlib.blake2b(data, digest_size=16).hexdigest()
+    if algorithm == "xxh3":
+        if xxhash is None:
+            raise ImportError(
+                "xxhash is required for the xxh3 algorithm. "
+                "Install it with: pip install xxhash"
+            )
+        return xxhash.xxh3_128_hexdigest
+    raise ValueError(
+        f"Unknown hash algorithm {algorithm!r}; expected one of {HASH_ALGORITHMS}"
+    )
+
+
+def digest(data: bytes, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """
+    Compute the hex digest of serialized data.
+
+    sha256 is cryptographic and matches every hash stored to date. blake2b
+    and xxh3 produce 128-bit digests that are faster to compute and store;
+    they are only suitable for change detection, not integrity guarantees.
+
+    Args:
+        data: Serialized bytes
+        algorithm: 'sha256', 'blake2b' or 'xxh3'
+
+    Returns:
+        Hex digest string
+    """
+    return _get_digest_function(algorithm)(data)
+
+
+# =============================================================================
+# RECORD HASHING
+# =============================================================================
+
+
+def _project_fields(
+    record: Mapping[str, Any], fields: Optional[Sequence[str]]
+) -> Dict[str, Any]:
+    """Select the significant fields of a record (all non-underscore keys by default)."""
+    if fields is None:
+        return {key: value for key, value in record.items() if not key.startswith("_")}
+    return {field: record.get(field) for field in fields}
+
+
+def content_hash(
+    record: Mapping[str, Any],
+    fields: Optional[Sequence[str]] = None,
+    algorithm: str = DEFAULT_ALGORITHM,
+    compatible: bool = False,
+) -> str:
+    """
+    Calculate the content hash of a single record.
+
+    Args:
+        record: Record to hash
+        fields: Significant fields to include (missing fields hash as null).
+            When None, every key not starting with '_' is included.
+        algorithm: Digest algorithm ('sha256', 'blake2b' or 'xxh3')
+        compatible: Serialize with compatible_json() instead of canonical_json()
+
+    Returns:
+        Hex digest of the serialized significant fields
+    """
+    serialize = compatible_json if compatible else canonical_json
+    return digest(serialize(_project_fields(record, fields)), algorithm)
+
+
+def content_hashes(
+    records: Iterable[Mapping[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+    algorithm: str = DEFAULT_ALGORITHM,
+    compatible: bool = False,
+) -> List[str]:
+    """
+    Calculate content hashes for a batch of records.
+
+    Resolves the serializer and digest once for the whole batch. A pandas
+    DataFrame is accepted and hashed row by row.
+
+    Args:
+        records: Iterable of records, or a DataFrame
+        fields: Significant fields to include (see content_hash())
+        algorithm: Digest algorithm ('sha256', 'blake2b' or 'xxh3')
+        compatible: Serialize with compatible_json() instead of canonical_json()
+
+    Returns:
+        List of hex digests, in input order
+    """
+    if hasattr(records, "to_dict") and hasattr(records, "columns"):
+        records = records.to_dict("records")
+
+    serialize = compatible_json if compatible else canonical_json
+    hexdigest = _get_digest_function(algorithm)
+
+    if fields is None:
+        return [
+            hexdigest(
+                serialize(
+                    {key: value for key, value in record.items() if not key.startswith("_")}
+                )
+            )
+            for record in records
+        ]
+
+    # Build dicts in sorted key order once; sorting is then a no-op per record
+    ordered_fields = sorted(fields)
+    return [
+        hexdigest(serialize({field: record.get(field) for field in ordered_fields}))
+        for record in records
+    ]
+
+
+# =============================================================================
+# COLUMNAR HASHING (document ingesters)
+# =============================================================================
+
+
+def normalize_value(value: Any) -> Any:
+    """
+    Normalize one CSV/Excel cell the way the document ingesters hash it.
+
+    Missing values (NaN, NaT, None) become None, timestamps become ISO 8601
+    strings, numbers and booleans are kept and anything else is stripped text.
+
+    Args:
+        value: Raw cell value from pandas
+
+    Returns:
+        JSON-serializable normalized value
+    """
+    if pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, (int, float, bool)):
+        return value
+    return str(value).strip()
+
+
+def _normalize_datetime_column(column: "pd.Series") -> "pd.Series":
+    """ISO-format a datetime column exactly as Timestamp.isoformat() would."""
+    if column.dt.tz is None and not (column.dt.nanosecond != 0).any():
+        # Timestamp.isoformat() only includes microseconds when non-zero
+        values = column.to_numpy(dtype="datetime64[us]")
+        formatted = np.datetime_as_string(
+            values.astype("datetime64[s]"), unit="s"
+        ).astype(object)
+        fractional = (column.dt.microsecond != 0).to_numpy()
+        if fractional.any():
+            formatted[fractional] = np.datetime_as_string(values[fractional], unit="us")
+        return pd.Series(formatted, index=column.index)
+    return column.map(lambda value: value.isoformat() if pd.notna(value) else None)
+
+
+def normalize_column(column: "pd.Series") -> "pd.Series":
+    """
+    Apply normalize_value() to a whole column, cell for cell.
+
+    Datetime, numeric and all-string columns are handled with columnar
+    operations; columns holding mixed Python objects fall back to
+    normalize_value() per cell.
+
+    Args:
+        column: Column read from a file (or built from stored raw data)
+
+    Returns:
+        Object-dtype Series with None in place of missing values
+    """
+    present = column.notna()
+
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return _normalize_datetime_column(column).astype(object).where(present, None)
+
+    if pd.api.types.is_numeric_dtype(column):
+        # astype(object) yields Python int/float/bool, as iterrows() does
+        return column.astype(object).where(present, None)
+
+    inferred = pd.api.types.infer_dtype(column, skipna=True)
+    if inferred == "string":
+        return column.str.strip().astype(object).where(present, None)
+    if inferred in ("integer", "floating", "mixed-integer-float", "boolean", "empty"):
+        return column.astype(object).where(present, None)
+
+    return column.map(normalize_value).astype(object)
+
+
+def column_content_hashes(
+    df: "pd.DataFrame",
+    fields: Sequence[str],
+    aliases: Optional[Mapping[str, str]] = None,
+) -> "pd.Series":
+    """
+    Hash every row of a DataFrame from its normalized significant fields.
+
+    Each row hashes exactly as sha256(json.dumps({field: normalize_value(...)},
+    sort_keys=True, separators=(",", ":"))) would, but every field is
+    normalized in one columnar pass and rows are serialized without sorting.
+
+    Args:
+        df: Records read from a file or rebuilt from stored raw data
+        fields: Significant fields; missing columns hash as null
+        aliases: Alternative column name per field, used when the field's own
+            column is absent (e.g. renamed database columns)
+
+    Returns:
+        Series of SHA-256 hex digests aligned with df.index
+    """
+    aliases = aliases or {}
+    keys = sorted(fields)
+    columns = []
+    for field in keys:
+        source = field if field in df.columns else aliases.get(field)
+        if source is not None and source in df.columns:
+            columns.append(normalize_column(df[source]).tolist())
+        else:
+            columns.append([None] * len(df))
+
+    # Keys are already sorted, so each dict serializes like sort_keys=True
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    hashes = [
+        hashlib.sha256(encode(dict(zip(keys, values))).encode("utf-8")).hexdigest()
+        for values in zip(*columns)
+    ]
+    return pd.Series(hashes, index=df.index, dtype=object)
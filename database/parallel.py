@@ -0,0 +1,111 @@
+"""
+Chunked process-pool mapping for CPU-bound silver merge stages.
+
+Silver transforms merge per-entity source bundles (one user, one matched
+computer group) with pure Python code. map_chunks() runs such a merge over
+chunks of bundles either inline or in a pool of worker processes:
+
+- chunks are submitted in order and results are yielded in the same order
+- at most max_pending chunks are in flight, so a streamed input is never
+  materialized
+- an initializer installs read-only lookup tables (PI sets, FK maps) once per
+  worker instead of pickling them with every chunk
+
+The mapped function and its chunks must be picklable: use a module-level
+function and plain dicts/lists of records.
+"""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Resolve a worker count option.
+
+    Args:
+        workers: Requested worker processes; 0 or None means one per CPU
+
+    Returns:
+        Number of worker processes (at least 1)
+    """
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split an iterable into lists of at most size items.
+
+    Args:
+        items: Items to split
+        size: Maximum chunk length
+
+    Yields:
+        Consecutive chunks, in input order
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {size}")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(
+    func: Callable[[T], R],
+    chunks: Iterable[T],
+    workers: int = 1,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Sequence[Any] = (),
+    max_pending: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Apply func to every chunk, inline or in worker processes.
+
+    With workers <= 1 the initializer runs once in the current process and
+    chunks are processed inline, so both modes share one code path.
+
+    Args:
+        func: Module-level function taking one chunk
+        chunks: Chunks to process (may be a generator)
+        workers: Worker processes; 1 processes chunks inline
+        initializer: Called once per worker (or once inline) with initargs
+        initargs: Arguments for the initializer
+        max_pending: Chunks in flight at once (default: 2 per worker)
+
+    Yields:
+        func(chunk) for each chunk, in input order
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    max_pending = max_pending or workers * 2
+    logger.info(f"⚙️  Merging in {workers} worker processes")
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=tuple(initargs)
+    ) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
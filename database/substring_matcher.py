@@ -0,0 +1,124 @@
+"""
+Multi-pattern substring matching for silver lab discovery.
+
+Several silver transforms ask "which PI uniqnames occur inside this name?"
+for every OU or computer name. Testing each uniqname with `in` (or an
+ILIKE '%uniqname%' query) per name costs O(patterns × names).
+SubstringMatcher builds an Aho–Corasick automaton over all patterns once
+and reports every pattern contained in a text in a single pass over that
+text, so the cost is linear in the total length of the scanned names plus
+the number of matches.
+
+Matching is case-insensitive by default (str.lower() on patterns and
+text), mirroring ILIKE and the lowercase comparisons the transforms made.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class SubstringMatcher:
+    """
+    Aho–Corasick automaton over a fixed set of patterns.
+
+    Examples:
+        matcher = SubstringMatcher(["smithj", "doe"])
+        matcher.find_all("LSA-SMITHJ-DOE01")  # ["smithj", "doe"]
+    """
+
+    def __init__(self, patterns: Iterable[str], ignore_case: bool = True):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Patterns to search for; empty and None patterns are ignored
+                and duplicates are reported once
+            ignore_case: Compare lowercased patterns against lowercased text
+        """
+        self.ignore_case = ignore_case
+        # Trie transitions, failure links and output patterns per state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        self._patterns: List[str] = []
+
+        seen = set()
+        for pattern in patterns:
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            self._add(pattern)
+        self._link()
+
+    def __len__(self) -> int:
+        """Number of distinct patterns in the automaton."""
+        return len(self._patterns)
+
+    def _add(self, pattern: str):
+        """Insert a pattern into the trie."""
+        key = pattern.lower() if self.ignore_case else pattern
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] += (pattern,)
+        self._patterns.append(pattern)
+
+    def _link(self):
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Scan a text once and yield every pattern occurrence.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (start_index, pattern) for each occurrence, ordered by end index;
+            indexes refer to the lowercased text when ignore_case is set
+        """
+        if not text or not self._patterns:
+            return
+        if self.ignore_case:
+            text = text.lower()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in out[state]:
+                yield index - len(pattern) + 1, pattern
+
+    def find_all(self, text: str) -> List[str]:
+        """
+        List the distinct patterns contained in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Patterns in order of their first occurrence's end position
+        """
+        found: Dict[str, None] = {}
+        for _, pattern in self.iter_matches(text):
+            found.setdefault(pattern)
+        return list(found)
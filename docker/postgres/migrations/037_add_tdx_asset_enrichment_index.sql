@@ -0,0 +1,38 @@
+-- Migration: Index latest enriched TDX asset rows for ModifiedDate skip checks
+--
+-- PROBLEM: 011_enrich_tdx_assets.py chose candidates with a DISTINCT ON scan
+--          over the full asset history, then re-fetched every asset whose
+--          latest row lacked Attributes/Attachments, whether or not it changed.
+-- SOLUTION: For each new search row, look up only the most recent enriched row
+--           of that asset (LATERAL ... ORDER BY ingested_at DESC LIMIT 1) and
+--           compare ModifiedDate values. The latest search row of each asset
+--           is found the same way, and a full sync walks the distinct asset
+--           IDs with a recursive skip scan instead of DISTINCT ON. These two
+--           partial indexes serve those lookups.
+--
+-- Query shape (011_enrich_tdx_assets._get_assets_needing_enrichment):
+--   WHERE entity_type = 'asset' AND source_system = 'tdx'
+--     AND external_id = s.external_id
+--     AND raw_data->>'_enriched_at' IS NOT NULL   -- or IS NULL for search rows
+--   ORDER BY ingested_at DESC LIMIT 1
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_tdx_asset_enriched_latest
+ON bronze.raw_entities (external_id, ingested_at DESC)
+WHERE entity_type = 'asset'
+  AND source_system = 'tdx'
+  AND raw_data->>'_enriched_at' IS NOT NULL;
+
+COMMENT ON INDEX idx_bronze_tdx_asset_enriched_latest IS
+'Latest enriched TDX asset row per external_id. Used by 011_enrich_tdx_assets.py to skip assets whose search-level ModifiedDate is not newer than their last enrichment.';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_tdx_asset_search_latest
+ON bronze.raw_entities (external_id, ingested_at DESC)
+WHERE entity_type = 'asset'
+  AND source_system = 'tdx'
+  AND raw_data->>'ID' IS NOT NULL
+  AND raw_data->>'_enriched_at' IS NULL;
+
+COMMENT ON INDEX idx_bronze_tdx_asset_search_latest IS
+'Latest search-level TDX asset row per external_id. Used by 011_enrich_tdx_assets.py to list asset IDs (skip scan) and fetch each asset''s newest search row without DISTINCT ON over the full history.';
+
+ANALYZE bronze.raw_entities;
@@ -1,4 +1,5 @@
 from .adapters.ldap_adapter import LDAPAdapter
 from .facade.ldap_facade import LDAPFacade
+from .normalizer import LDAPNormalizer, normalize_ldap_value
 
-__all__ = ['LDAPAdapter', 'LDAPFacade']
+__all__ = ['LDAPAdapter', 'LDAPFacade', 'LDAPNormalizer', 'normalize_ldap_value']
@@ -1,10 +1,14 @@
 import logging
 import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import keyring
-from ldap3 import ALL, LEVEL, SUBTREE, Connection, Server
+from ldap3 import ALL, BASE, LEVEL, SUBTREE, Connection, Server
 from ldap3.core.exceptions import LDAPException
 
 # Set up logging to match existing LSATS patterns
@@ -12,6 +16,13 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 logger.info("logging set to DEBUG")
 
+# Characters used to cut a partition's key range into sub-ranges. Directory
+# ordering rules for uid/cn are case-insensitive, so lowercase is sufficient.
+_PARTITION_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Attempts per partition before a partitioned search gives up
+_PARTITION_ATTEMPTS = 3
+
 
 class LDAPAdapter:
     """
@@ -22,6 +33,81 @@ class LDAPAdapter:
     regardless of the underlying server type (Active Directory, OpenLDAP, etc.).
     """
 
+    # Named attribute projections for bronze ingestion, keyed by object type.
+    #   hash_only   - exactly the attributes the bronze content hash reads
+    #   analytics   - the attributes the ingestion statistics read
+    #   full_bronze - every user attribute, as stored in bronze raw_data
+    # Keep hash_only in sync with the matching _calculate_*_content_hash method:
+    # an attribute missing here makes every object look changed.
+    ATTRIBUTE_PROFILES = {
+        "ad_user": {
+            "hash_only": [
+                "name", "cn", "sAMAccountName", "uid", "distinguishedName",
+                "objectGUID", "objectSid", "userPrincipalName", "givenName", "sn",
+                "middleName", "initials", "displayName", "description", "mail",
+                "mailNickname", "telephoneNumber", "proxyAddresses", "title",
+                "umichadOU", "umichadRole", "umichDirectoryID", "uidNumber",
+                "userAccountControl", "accountExpires", "pwdLastSet", "memberOf",
+                "primaryGroupID", "managedObjects", "objectCategory", "objectClass",
+                "whenCreated", "uSNCreated", "legacyExchangeDN",
+                "msExchRecipientTypeDetails", "targetAddress",
+                "umichadNoBatchUpdates", "umichadHidePersonalInfo",
+                "umichadUMDirToADSyncFlag", "extensionAttribute5",
+                "extensionAttribute6", "extensionAttribute9",
+                "dSCorePropagationData", "instanceType", "sAMAccountType",
+            ],
+            "analytics": [
+                "name", "objectGUID", "sAMAccountName", "mail", "memberOf",
+                "userAccountControl", "umichadRole", "whenChanged",
+            ],
+            "full_bronze": ["*"],
+        },
+        "ad_computer": {
+            "hash_only": [
+                "name", "cn", "sAMAccountName", "distinguishedName", "objectGUID",
+                "objectSid", "dNSHostName", "memberOf", "operatingSystem",
+                "operatingSystemVersion", "userAccountControl", "sAMAccountType",
+                "pwdLastSet", "whenCreated", "accountExpires",
+                "servicePrincipalName", "objectCategory", "objectClass",
+                "instanceType", "primaryGroupID", "userCertificate",
+                "isCriticalSystemObject", "localPolicyFlags", "countryCode",
+                "codePage",
+            ],
+            "analytics": [
+                "name", "objectGUID", "sAMAccountName", "dNSHostName", "memberOf",
+                "operatingSystem", "whenChanged",
+            ],
+            "full_bronze": ["*"],
+        },
+        "ad_group": {
+            "hash_only": [
+                "name", "cn", "sAMAccountName", "distinguishedName", "objectGUID",
+                "objectSid", "member", "memberOf", "description", "groupType",
+                "sAMAccountType", "objectCategory", "objectClass", "instanceType",
+                "sIDHistory", "proxiedObjectName",
+            ],
+            "analytics": [
+                "name", "objectGUID", "sAMAccountName", "member", "memberOf",
+                "groupType", "whenChanged",
+            ],
+            "full_bronze": ["*"],
+        },
+        "ad_organizational_unit": {
+            "hash_only": [
+                "name", "ou", "distinguishedName", "objectGUID", "description",
+                "managedBy", "street", "l", "postalCode", "gPLink", "gPOptions",
+                "objectCategory", "objectClass", "whenCreated", "whenChanged",
+                "uSNCreated", "uSNChanged", "dSCorePropagationData",
+                "instanceType", "systemFlags",
+            ],
+            "analytics": [
+                "name", "ou", "distinguishedName", "objectGUID", "description",
+                "managedBy", "whenChanged",
+            ],
+            "full_bronze": ["*"],
+        },
+    }
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize LDAP adapter with configuration settings.
@@ -43,6 +129,8 @@ class LDAPAdapter:
                    - 'auto_bind': Auto-bind on connection (default: True)
                    - 'get_info': Server info level (default: ALL)
                    - 'default_page_size': Default page size for pagination (default: 1000)
+                   - 'partition_workers': Concurrent connections used by partitioned
+                                          searches (default: 4)
 
         Raises:
             ValueError: If required configuration keys are missing
@@ -70,6 +158,7 @@ class LDAPAdapter:
         self.auto_bind = config.get("auto_bind", True)
         self.get_info = config.get("get_info", ALL)
         self.default_page_size = config.get("default_page_size", 1000)
+        self.partition_workers = config.get("partition_workers", 4)
 
         # Store additional configuration for extensibility
         _known_keys = required_keys + [
@@ -81,6 +170,7 @@ class LDAPAdapter:
             "auto_bind",
             "get_info",
             "default_page_size",
+            "partition_workers",
         ]
         self.additional_config = {
             k: v for k, v in config.items() if k not in _known_keys
@@ -180,10 +270,19 @@ class LDAPAdapter:
 
         return self._server
 
-    def _create_connection(self) -> Connection:
+    def _create_connection(
+        self, auto_range: bool = True, empty_attributes: bool = True
+    ) -> Connection:
         """
         Create and bind LDAP connection.
 
+        Args:
+            auto_range: Let ldap3 follow ranged retrieval ('member;range=N-M')
+                        itself and return complete attributes. Pass False to
+                        receive the partial ranges as the server sent them.
+            empty_attributes: Return requested attributes missing from an entry
+                              as empty lists (ldap3's return_empty_attributes)
+
         Returns:
             Connection: Authenticated ldap3 Connection object
 
@@ -195,7 +294,12 @@ class LDAPAdapter:
             password = self._get_password()
 
             connection = Connection(
-                server, user=self.user, password=password, auto_bind=self.auto_bind
+                server,
+                user=self.user,
+                password=password,
+                auto_bind=self.auto_bind,
+                auto_range=auto_range,
+                return_empty_attributes=empty_attributes,
             )
 
             if connection.bound:
@@ -292,6 +396,7 @@ class LDAPAdapter:
             "keyring_service": self.keyring_service,
             "timeout": self.timeout,
             "default_page_size": self.default_page_size,
+            "partition_workers": self.partition_workers,
             "additional_config": self.additional_config,
         }
 
@@ -308,6 +413,31 @@ class LDAPAdapter:
             f"user='{self.user}', keyring_service='{self.keyring_service}')"
         )
 
+    def get_attribute_profile(self, object_type: str, profile: str) -> List[str]:
+        """
+        Look up a named attribute projection from ATTRIBUTE_PROFILES.
+
+        Args:
+            object_type: Directory object type (e.g. 'ad_user', 'ad_computer')
+            profile: Profile name ('hash_only', 'analytics' or 'full_bronze')
+
+        Returns:
+            List[str]: Attribute names to request (a copy, safe to modify)
+
+        Raises:
+            ValueError: If the object type or profile is unknown
+        """
+        if object_type not in self.ATTRIBUTE_PROFILES:
+            raise ValueError(
+                f"object_type must be one of: {list(self.ATTRIBUTE_PROFILES.keys())}"
+            )
+
+        profiles = self.ATTRIBUTE_PROFILES[object_type]
+        if profile not in profiles:
+            raise ValueError(f"profile must be one of: {list(profiles.keys())}")
+
+        return list(profiles[profile])
+
     # Core Search Infrastructure
 
     def search(
@@ -319,6 +449,10 @@ class LDAPAdapter:
         max_results: Optional[int] = None,
         use_pagination: bool = True,
         page_size: Optional[int] = None,
+        partitioned: bool = False,
+        partition_attribute: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        auto_range: bool = True,
     ) -> List:
         """
         Core search method with automatic pagination for complete results.
@@ -336,6 +470,16 @@ class LDAPAdapter:
             max_results: Maximum number of results to return (None for no limit)
             use_pagination: Enable automatic pagination for complete results (default: True)
             page_size: Page size for pagination (defaults to adapter's configured size)
+            partitioned: Split the key space of partition_attribute into ranges and
+                        fetch them concurrently (see _execute_partitioned_search).
+                        Intended for servers with a cumulative result cap such as
+                        MCommunity; ignored when max_results is set (default: False)
+            partition_attribute: Attribute whose values define the partitions
+                                (detected from the filter if None)
+            max_workers: Concurrent connections for partitioned searches
+                        (defaults to adapter's partition_workers)
+            auto_range: Let ldap3 complete ranged attributes (default: True);
+                       if False, entries keep the 'attr;range=N-M' values
 
         Returns:
             List: List of ldap3 Entry objects with full LDAP functionality
@@ -376,7 +520,7 @@ class LDAPAdapter:
 
         try:
             # Create fresh connection for this search
-            conn = self._create_connection()
+            conn = self._create_connection(auto_range=auto_range)
 
             logger.debug(
                 f"Executing search: filter='{search_filter}', base='{base_dn}', scope='{scope}', pagination={use_pagination}"
@@ -411,7 +555,16 @@ class LDAPAdapter:
                 search_kwargs["size_limit"] = max_results
 
             # Determine pagination strategy
-            if use_pagination and not max_results:
+            if partitioned and not max_results:
+                # Fetch key-space partitions concurrently across pooled connections
+                results = self._execute_partitioned_search(
+                    conn,
+                    page_size or self.default_page_size,
+                    partition_attribute,
+                    max_workers or self.partition_workers,
+                    **search_kwargs,
+                )
+            elif use_pagination and not max_results:
                 # Use intelligent pagination to ensure complete results
                 results = self._execute_intelligent_search(
                     conn, page_size, **search_kwargs
@@ -444,17 +597,31 @@ class LDAPAdapter:
             except:
                 pass  # Ignore cleanup errors
 
-    def search_as_dicts(self, *args, **kwargs) -> List[Dict[str, Any]]:
+    def search_as_dicts(
+        self, *args, complete_ranges: bool = True, **kwargs
+    ) -> List[Dict[str, Any]]:
         """
         Convenience method that returns search results as dictionaries.
 
         This is useful when you need simple key-value access or JSON serialization.
         For full LDAP functionality, use search() which returns Entry objects.
 
+        Multi-valued attributes that the server returned as a partial range
+        (e.g. 'member;range=0-1499' from Active Directory groups above
+        MaxValRange) are completed with ranged retrieval and stored under the
+        plain attribute name, so callers never see a silently truncated list.
+        The search runs with ldap3's auto_range disabled so that the partial
+        ranges reach this method instead of being followed inside ldap3.
+
+        Args:
+            complete_ranges: If False, leave partial 'attr;range=N-M' values in
+                place for the caller to stream (see iter_attribute_values) or
+                complete later with complete_ranged_attributes()
+
         Returns:
             List[Dict[str, Any]]: List of dictionaries with 'dn' and attributes
         """
-        entries = self.search(*args, **kwargs)
+        entries = self.search(*args, auto_range=False, **kwargs)
 
         result_dicts = []
         for entry in entries:
@@ -466,6 +633,9 @@ class LDAPAdapter:
                 attr_value = getattr(entry, attr_name)
                 entry_dict[attr_name] = attr_value.value
 
+            if complete_ranges:
+                self.complete_ranged_attributes(entry_dict)
+
             result_dicts.append(entry_dict)
 
         return result_dicts
@@ -640,6 +810,132 @@ class LDAPAdapter:
             except:
                 pass
 
+    def search_two_phase_generator(
+        self,
+        search_filter: str,
+        hash_attributes: List[str],
+        needs_full_fetch: Callable[[Dict[str, Any]], bool],
+        search_base: Optional[str] = None,
+        scope: str = "subtree",
+        full_attributes: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        dn_attribute: str = "distinguishedName",
+        fetch_batch_size: int = 100,
+    ):
+        """
+        Two-phase paged search that fetches full attributes only for changed objects.
+
+        Phase 1 pages through the directory requesting only DN, whenChanged and
+        the small attribute set a content hash is computed from. Each entry is
+        passed to needs_full_fetch (typically "is the content hash different
+        from the stored one?"). Phase 2 then re-reads only the selected entries
+        with full_attributes, in batches of OR-ed DN equality filters.
+
+        For an unchanged directory this transfers the hash attribute set instead
+        of every attribute of every object.
+
+        Args:
+            search_filter: LDAP filter string (e.g., '(objectClass=computer)')
+            hash_attributes: Attributes for phase 1 (see get_attribute_profile)
+            needs_full_fetch: Called with each phase 1 dict; True to fetch it in full
+            search_base: Base DN for search (defaults to adapter's search_base)
+            scope: Search scope - 'base', 'level', or 'subtree' (default: 'subtree')
+            full_attributes: Attributes for phase 2 (None for all available)
+            page_size: Number of results per phase 1 page
+            dn_attribute: Attribute holding the DN, used to filter phase 2
+                         ('distinguishedName' for AD, 'entryDN' for OpenLDAP)
+            fetch_batch_size: Number of DNs per phase 2 search (default: 100)
+
+        Yields:
+            List[Dict[str, Any]]: Each page of dicts. Entries selected by
+                needs_full_fetch carry full attributes; the others carry only
+                the phase 1 attributes. Entries that disappeared between the
+                phases are dropped.
+
+        Example:
+            for batch in adapter.search_two_phase_generator(
+                search_filter='(objectClass=computer)',
+                hash_attributes=adapter.get_attribute_profile('ad_computer', 'hash_only'),
+                needs_full_fetch=lambda c: content_hash(c) != stored.get(c['objectGUID']),
+            ):
+                process(batch)
+        """
+        phase1_attributes = list(dict.fromkeys(list(hash_attributes) + ["whenChanged"]))
+        base_dn = search_base if search_base is not None else self.search_base
+
+        pages = 0
+        total_entries = 0
+        total_fetched = 0
+
+        for page in self.search_paged_generator(
+            search_filter=search_filter,
+            search_base=base_dn,
+            scope=scope,
+            attributes=phase1_attributes,
+            page_size=page_size,
+            return_dicts=True,
+        ):
+            pages += 1
+            total_entries += len(page)
+
+            selected = [needs_full_fetch(entry) for entry in page]
+            changed_dns = [entry["dn"] for entry, sel in zip(page, selected) if sel]
+            if not changed_dns:
+                yield page
+                continue
+
+            full_entries = {}
+            for offset in range(0, len(changed_dns), fetch_batch_size):
+                batch = changed_dns[offset : offset + fetch_batch_size]
+                dn_filter = "".join(
+                    f"({dn_attribute}={self._escape_filter_value(dn)})" for dn in batch
+                )
+                for entry in self.search_as_dicts(
+                    search_filter=f"(|{dn_filter})",
+                    search_base=base_dn,
+                    scope=scope,
+                    attributes=full_attributes,
+                    use_pagination=False,
+                ):
+                    full_entries[entry["dn"].lower()] = entry
+
+            total_fetched += len(full_entries)
+            if len(full_entries) < len(changed_dns):
+                logger.warning(
+                    f"{len(changed_dns) - len(full_entries)} entries disappeared "
+                    "between phase 1 and phase 2 and were dropped"
+                )
+
+            merged_page = []
+            for entry, sel in zip(page, selected):
+                if sel:
+                    full_entry = full_entries.get(entry["dn"].lower())
+                    if full_entry is not None:
+                        merged_page.append(full_entry)
+                else:
+                    merged_page.append(entry)
+
+            yield merged_page
+
+        logger.info(
+            f"Two-phase search completed: {total_entries} entries scanned across "
+            f"{pages} pages, {total_fetched} fetched with full attributes"
+        )
+
+    def _escape_filter_value(self, value: Any) -> str:
+        """
+        Escape a value for use in an LDAP filter assertion (RFC 4515).
+
+        Args:
+            value: Value to escape
+
+        Returns:
+            str: Escaped value
+        """
+        escaped = str(value).replace("\\", "\\5c").replace("*", "\\2a")
+        escaped = escaped.replace("(", "\\28").replace(")", "\\29")
+        return escaped.replace("\x00", "\\00")
+
     def _execute_simple_search(self, conn: Connection, **search_kwargs) -> List:
         """
         Execute a simple search that accepts server-side size limits.
@@ -795,7 +1091,7 @@ class LDAPAdapter:
                 )
                 # Need to reconnect since the connection may be in a bad state
                 conn.unbind()
-                conn = self._create_connection()
+                conn = self._create_connection(auto_range=conn.auto_range)
 
                 return self._execute_cookie_based_pagination(
                     conn, page_size, size_limit, **search_kwargs
@@ -919,7 +1215,7 @@ class LDAPAdapter:
 
                         # Reconnect with fresh connection
                         conn.unbind()
-                        conn = self._create_connection()
+                        conn = self._create_connection(auto_range=conn.auto_range)
 
                         # Use the same chunk size as the limit we hit
                         chunk_size = len(all_results)
@@ -1212,9 +1508,7 @@ class LDAPAdapter:
             str: Modified filter with range constraint added
         """
         # Escape special LDAP characters in boundary value
-        escaped_value = str(boundary_value).replace("\\", "\\5c").replace("*", "\\2a")
-        escaped_value = escaped_value.replace("(", "\\28").replace(")", "\\29")
-        escaped_value = escaped_value.replace("\x00", "\\00")
+        escaped_value = self._escape_filter_value(boundary_value)
 
         # Create the range filter
         operator = ">" if use_greater_than else ">="
@@ -1403,6 +1697,449 @@ class LDAPAdapter:
         )
         return all_results
 
+    # Ranged Attribute Retrieval
+
+    def iter_attribute_values(
+        self,
+        dn: str,
+        attribute: str,
+        range_size: int = 1500,
+        start: int = 0,
+    ) -> Iterator[List[Any]]:
+        """
+        Stream the values of a large multi-valued attribute in pages.
+
+        Uses incremental retrieval (``member;range=N-M``) so that groups with
+        tens of thousands of members can be processed page by page. The server
+        may return fewer values than requested per page (Active Directory caps
+        each page at MaxValRange), so the next page always starts after the
+        upper bound the server actually returned.
+
+        Servers without range option support (e.g. MCommunity/OpenLDAP) return
+        no ranged attribute; in that case the attribute is fetched in one search
+        and yielded in slices of range_size.
+
+        Args:
+            dn: Distinguished name of the entry
+            attribute: Attribute to retrieve (e.g. 'member')
+            range_size: Number of values requested per page (default: 1500)
+            start: Index of the first value to retrieve (default: 0)
+
+        Yields:
+            List[Any]: Each page of attribute values
+
+        Example:
+            for page in adapter.iter_attribute_values(group_dn, "member"):
+                for member_dn in page:
+                    process_member(member_dn)
+        """
+        if range_size < 1:
+            raise ValueError("range_size must be a positive integer")
+
+        range_prefix = f"{attribute.lower()};range="
+        # Without auto_range=False ldap3 would follow the ranges itself and
+        # hand back the complete attribute under its plain name. Empty
+        # attributes are off because ldap3 then tries to drop the plain
+        # attribute, which a request for 'attr;range=N-M' alone never returns
+        conn = self._create_connection(auto_range=False, empty_attributes=False)
+
+        try:
+            low = start
+            while True:
+                requested = f"{attribute};range={low}-{low + range_size - 1}"
+                returned = self._search_entry_attributes(conn, dn, [requested])
+                if returned is None:
+                    logger.warning(f"Entry not found during ranged retrieval: {dn}")
+                    return
+
+                ranged_key = next(
+                    (key for key in returned if key.lower().startswith(range_prefix)),
+                    None,
+                )
+
+                if ranged_key is None:
+                    if low != start:
+                        # Range exhausted without an explicit '*' terminator
+                        return
+
+                    # No range support: fetch the whole attribute and slice it
+                    logger.debug(
+                        f"Server returned no ranged '{attribute}' for {dn}, "
+                        "falling back to a single fetch"
+                    )
+                    returned = self._search_entry_attributes(conn, dn, [attribute])
+                    values = self._as_value_list((returned or {}).get(attribute))
+                    for offset in range(start, len(values), range_size):
+                        yield values[offset : offset + range_size]
+                    return
+
+                values = self._as_value_list(returned[ranged_key])
+                if values:
+                    yield values
+
+                upper = ranged_key.split("=", 1)[1].partition("-")[2]
+                if upper == "*":
+                    return
+
+                low = int(upper) + 1
+
+        except LDAPException:
+            raise
+        except Exception as e:
+            logger.error(f"Ranged retrieval of '{attribute}' failed for {dn}: {e}")
+            raise LDAPException(f"Ranged retrieval failed: {e}")
+        finally:
+            try:
+                conn.unbind()
+            except:
+                pass  # Ignore cleanup errors
+
+    def _search_entry_attributes(
+        self, conn: Connection, dn: str, attributes: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the raw attribute dictionary of a single entry with a BASE search.
+
+        Args:
+            conn: Active LDAP connection
+            dn: Distinguished name of the entry
+            attributes: Attribute descriptions to request
+
+        Returns:
+            Optional[Dict[str, Any]]: Attribute dictionary, or None if not found
+        """
+        conn.search(
+            search_base=dn,
+            search_filter="(objectClass=*)",
+            search_scope=BASE,
+            attributes=attributes,
+        )
+        for response in conn.response or []:
+            if isinstance(response, dict) and response.get("type") == "searchResEntry":
+                return response.get("attributes", {})
+        return None
+
+    def _as_value_list(self, value: Any) -> List[Any]:
+        """Return an attribute value as a list (None becomes an empty list)."""
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return value
+        return [value]
+
+    def complete_ranged_attributes(
+        self, entry_dict: Dict[str, Any], exclude: Iterable[str] = ()
+    ) -> None:
+        """
+        Replace partial 'attr;range=N-M' values in an entry dict with full values.
+
+        Entries without ranged attributes are left unchanged.
+
+        Args:
+            entry_dict: Entry dictionary with a 'dn' key, modified in place
+            exclude: Attributes to leave as partial ranges (case-insensitive)
+        """
+        excluded = {attribute.lower() for attribute in exclude}
+        ranged_keys = [key for key in entry_dict if ";range=" in key.lower()]
+
+        for key in ranged_keys:
+            attribute, _, range_spec = key.partition(";")
+            if attribute.lower() in excluded:
+                continue
+            upper = range_spec.split("=", 1)[1].partition("-")[2]
+            values = list(self._as_value_list(entry_dict.pop(key)))
+
+            if upper != "*":
+                logger.debug(
+                    f"Completing truncated '{attribute}' for {entry_dict['dn']} "
+                    f"from index {int(upper) + 1}"
+                )
+                for page in self.iter_attribute_values(
+                    entry_dict["dn"], attribute, start=int(upper) + 1
+                ):
+                    values.extend(page)
+
+            entry_dict[attribute] = values
+
+    # Partitioned Search
+
+    def _execute_partitioned_search(
+        self,
+        conn: Connection,
+        chunk_size: int,
+        partition_attribute: Optional[str],
+        max_workers: int,
+        **search_kwargs,
+    ) -> List:
+        """
+        Key-space-partitioned search for servers with cumulative result limits.
+
+        Where _execute_filter_based_chunking walks ``attr>=last_value`` chunks
+        strictly one after another, this method splits the value space of the
+        partition attribute into contiguous ranges and fetches them concurrently,
+        one pooled connection per worker.
+
+        Strategy:
+        1. Start with ranges [None, "0"), ["0", "1"), ..., ["z", None)
+        2. Search each range with size_limit=chunk_size
+        3. If a range comes back capped (sizeLimitExceeded or chunk_size results),
+           subdivide it by extending its lower bound with each alphabet character
+           (["a", "b") -> ["a", "a0"), ["a0", "a1"), ..., ["az", "b")) and resubmit
+        4. A capped range that cannot be split further is walked serially with
+           filter-based chunking
+        5. Merge all results, de-duplicating by DN
+
+        A partition that errors is retried (on a fresh pooled connection) up to
+        _PARTITION_ATTEMPTS times; if it still fails the whole search raises,
+        so callers never receive a silently incomplete result.
+
+        Ranges are half-open and chained end to end, so together they always
+        cover the whole key space whatever the server's collation is; a boundary
+        that sorts differently on the server only produces an empty range.
+
+        Args:
+            conn: Active LDAP connection (reused as the first pooled connection)
+            chunk_size: Size limit for each partition search
+            partition_attribute: Attribute to partition on (detected from filter if None)
+            max_workers: Number of concurrent connections
+            **search_kwargs: Search parameters
+
+        Returns:
+            List: Combined, de-duplicated Entry objects from all partitions
+
+        Raises:
+            LDAPException: If any partition still fails after its retries
+        """
+        original_filter = search_kwargs.get("search_filter", "")
+        attribute = partition_attribute or self._detect_sort_attribute(original_filter)
+        max_workers = max(1, max_workers)
+
+        # Remove size_limit from search_kwargs - each partition sets its own
+        search_kwargs.pop("size_limit", None)
+
+        logger.info(
+            f"Using partitioned search on '{attribute}' with {max_workers} workers "
+            f"and chunk_size={chunk_size}"
+        )
+
+        # Connection pool: the caller's connection plus one per extra worker,
+        # created lazily. ldap3 connections are not shared between threads.
+        pool = queue.Queue()
+        pool.put(conn)
+        opened_connections = []
+        pool_lock = threading.Lock()
+
+        def acquire_connection() -> Connection:
+            try:
+                return pool.get_nowait()
+            except queue.Empty:
+                new_conn = self._create_connection(auto_range=conn.auto_range)
+                with pool_lock:
+                    opened_connections.append(new_conn)
+                return new_conn
+
+        # A connection is returned to the pool only after a successful search.
+        # After an error it is dropped, so a retry gets a fresh connection;
+        # opened connections are still unbound at the end.
+        def fetch_partition(lower: Optional[str], upper: Optional[str]):
+            part_conn = acquire_connection()
+            part_kwargs = search_kwargs.copy()
+            part_kwargs["search_filter"] = self._build_partition_filter(
+                original_filter, attribute, lower, upper
+            )
+            part_kwargs["size_limit"] = chunk_size
+            part_conn.search(**part_kwargs)
+
+            entries = [
+                entry for entry in part_conn.entries if hasattr(entry, "entry_dn")
+            ]
+            result_code = part_conn.result.get("result", 0)
+            capped = result_code == 4 or len(entries) >= chunk_size
+            pool.put(part_conn)
+            return entries, capped
+
+        def walk_partition(lower: Optional[str], upper: Optional[str], cap: int):
+            part_conn = acquire_connection()
+            part_kwargs = search_kwargs.copy()
+            part_kwargs["search_filter"] = self._build_partition_filter(
+                original_filter, attribute, lower, upper
+            )
+            entries = self._execute_filter_based_chunking(
+                part_conn, cap, None, **part_kwargs
+            )
+            pool.put(part_conn)
+            return entries, False
+
+        all_results = []
+        seen_dns = set()
+        partitions_searched = 0
+        retried_partitions = 0
+
+        boundaries = [None] + list(_PARTITION_ALPHABET) + [None]
+        initial_ranges = list(zip(boundaries[:-1], boundaries[1:]))
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # future -> (lower, upper, partition function, attempt)
+                pending = {
+                    executor.submit(fetch_partition, lower, upper): (
+                        lower,
+                        upper,
+                        fetch_partition,
+                        1,
+                    )
+                    for lower, upper in initial_ranges
+                }
+
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        lower, upper, partition_func, attempt = pending.pop(future)
+                        partitions_searched += 1
+
+                        try:
+                            entries, capped = future.result()
+                        except Exception as e:
+                            if attempt >= _PARTITION_ATTEMPTS:
+                                for queued in pending:
+                                    queued.cancel()
+                                raise LDAPException(
+                                    f"Partitioned search failed: partition "
+                                    f"[{lower!r}, {upper!r}) on '{attribute}' failed "
+                                    f"after {attempt} attempts: {e}"
+                                ) from e
+                            retried_partitions += 1
+                            logger.warning(
+                                f"Partition [{lower!r}, {upper!r}) on '{attribute}' failed "
+                                f"(attempt {attempt}/{_PARTITION_ATTEMPTS}), retrying: {e}"
+                            )
+                            retry_future = executor.submit(partition_func, lower, upper)
+                            pending[retry_future] = (
+                                lower,
+                                upper,
+                                partition_func,
+                                attempt + 1,
+                            )
+                            continue
+
+                        # Merge with deduplication (capped partitions overlap their
+                        # sub-partitions, so this is required, not just a safety net)
+                        for entry in entries:
+                            if entry.entry_dn not in seen_dns:
+                                seen_dns.add(entry.entry_dn)
+                                all_results.append(entry)
+
+                        if not capped:
+                            continue
+
+                        sub_ranges = self._split_partition(lower, upper)
+                        if sub_ranges and partitions_searched < 5000:
+                            logger.debug(
+                                f"Partition [{lower!r}, {upper!r}) hit the cap with "
+                                f"{len(entries)} entries, splitting into {len(sub_ranges)}"
+                            )
+                            for sub_lower, sub_upper in sub_ranges:
+                                sub_future = executor.submit(
+                                    fetch_partition, sub_lower, sub_upper
+                                )
+                                pending[sub_future] = (
+                                    sub_lower,
+                                    sub_upper,
+                                    fetch_partition,
+                                    1,
+                                )
+                        else:
+                            # Use the observed cap so the serial walk advances
+                            # correctly on servers that stop short of chunk_size
+                            cap = min(len(entries), chunk_size) or chunk_size
+                            logger.debug(
+                                f"Partition [{lower!r}, {upper!r}) cannot be split "
+                                f"further, walking it serially with chunk_size={cap}"
+                            )
+                            walk_serially = partial(walk_partition, cap=cap)
+                            walk_future = executor.submit(walk_serially, lower, upper)
+                            pending[walk_future] = (lower, upper, walk_serially, 1)
+
+                    # Progress logging every 50 partitions
+                    if partitions_searched and partitions_searched % 50 == 0:
+                        logger.info(
+                            f"📊 Partition progress: Retrieved {len(all_results):,} entries "
+                            f"across {partitions_searched} partitions"
+                        )
+        finally:
+            for opened_conn in opened_connections:
+                try:
+                    opened_conn.unbind()
+                except:
+                    pass  # Ignore cleanup errors
+
+        if retried_partitions:
+            logger.info(f"🔁 {retried_partitions} partition searches were retried")
+
+        logger.info(
+            f"Partitioned search completed: {len(all_results)} entries retrieved across "
+            f"{partitions_searched} partitions using {len(opened_connections) + 1} connections"
+        )
+        return all_results
+
+    def _split_partition(
+        self, lower: Optional[str], upper: Optional[str]
+    ) -> List[tuple]:
+        """
+        Split a capped [lower, upper) key range into contiguous sub-ranges.
+
+        Args:
+            lower: Inclusive lower bound (None for the start of the key space)
+            upper: Exclusive upper bound (None for the end of the key space)
+
+        Returns:
+            List[tuple]: (lower, upper) pairs covering the original range, or an
+                empty list if no cut point falls inside the range
+        """
+        prefix = lower or ""
+        cuts = [
+            prefix + char
+            for char in _PARTITION_ALPHABET
+            if upper is None or prefix + char < upper
+        ]
+        if not cuts:
+            return []
+
+        bounds = [lower] + cuts + [upper]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _build_partition_filter(
+        self,
+        original_filter: str,
+        attribute: str,
+        lower: Optional[str],
+        upper: Optional[str],
+    ) -> str:
+        """
+        Restrict an LDAP filter to the half-open key range [lower, upper).
+
+        Bounds are built from _PARTITION_ALPHABET only, so they need no escaping.
+
+        Args:
+            original_filter: Original LDAP filter
+            attribute: Attribute the range applies to
+            lower: Inclusive lower bound (None for unbounded)
+            upper: Exclusive upper bound (None for unbounded)
+
+        Returns:
+            str: Filter matching entries of original_filter within the range
+        """
+        conditions = ""
+        if lower is not None:
+            conditions += f"({attribute}>={lower})"
+        if upper is not None:
+            conditions += f"(!({attribute}>={upper}))"
+
+        if not conditions:
+            return original_filter
+        return f"(&{original_filter}{conditions})"
+
     # Generic Object Type Searches
 
     def search_users(
@@ -1673,6 +2410,7 @@ class LDAPAdapter:
         include_users: bool = True,
         include_groups: bool = True,
         include_sub_ous: bool = True,
+        profile: str = "full_bronze",
     ) -> Dict[str, Any]:
         """
         Extract complete information about a specific organizational unit.
@@ -1682,6 +2420,8 @@ class LDAPAdapter:
             include_users: Whether to include user objects
             include_groups: Whether to include group objects
             include_sub_ous: Whether to include sub-organizational units
+            profile: Attribute profile applied to each object type
+                    (see ATTRIBUTE_PROFILES; default: 'full_bronze', all attributes)
 
         Returns:
             Dict[str, Any]: Complete OU information as JSON structure
@@ -1693,7 +2433,7 @@ class LDAPAdapter:
             search_filter="(objectClass=organizationalUnit)",
             search_base=ou_dn,
             scope="base",
-            attributes=["*"],  # Get all attributes for complete information
+            attributes=self.get_attribute_profile("ad_organizational_unit", profile),
             use_pagination=False,  # Single object
         )
 
@@ -1718,20 +2458,13 @@ class LDAPAdapter:
 
         # Extract users if requested - convert to dicts for JSON compatibility
         if include_users:
-            user_entries = self.search(
+            users = self.search_as_dicts(
                 search_filter="(|(objectClass=person)(objectClass=user)(objectClass=inetOrgPerson))",
                 search_base=ou_dn,
                 scope="level",  # Only direct children, not nested
-                attributes=["*"],
+                attributes=self.get_attribute_profile("ad_user", profile),
                 use_pagination=True,  # Ensure complete user list
             )
-            users = self.search_as_dicts(
-                search_filter="(|(objectClass=person)(objectClass=user)(objectClass=inetOrgPerson))",
-                search_base=ou_dn,
-                scope="level",
-                attributes=["*"],
-                use_pagination=True,
-            )
             result["contained_objects"]["users"] = users
             logger.debug(f"Found {len(users)} users in {ou_dn}")
 
@@ -1741,7 +2474,7 @@ class LDAPAdapter:
                 search_filter="(|(objectClass=group)(objectClass=groupOfNames)(objectClass=posixGroup))",
                 search_base=ou_dn,
                 scope="level",
-                attributes=["*"],
+                attributes=self.get_attribute_profile("ad_group", profile),
                 use_pagination=True,
             )
             result["contained_objects"]["groups"] = groups
@@ -1753,7 +2486,7 @@ class LDAPAdapter:
                 search_filter="(objectClass=organizationalUnit)",
                 search_base=ou_dn,
                 scope="level",
-                attributes=["*"],
+                attributes=self.get_attribute_profile("ad_organizational_unit", profile),
                 use_pagination=True,
             )
             result["contained_objects"]["organizational_units"] = sub_ous
@@ -1945,6 +2678,27 @@ class LDAPAdapter:
             logger.error(f"Error counting search results: {e}")
             raise LDAPException(f"Failed to count search results: {e}")
 
+    def get_schema(self) -> Optional[Any]:
+        """
+        Retrieve the server schema read at bind time.
+
+        ldap3 reads the schema when a connection binds with get_info set to
+        SCHEMA or ALL. If no connection has bound yet, one is opened and closed.
+
+        Returns:
+            ldap3 SchemaInfo, or None if the schema is not available
+        """
+        try:
+            server = self._create_server()
+            if server.schema is None:
+                conn = self._create_connection()
+                conn.unbind()
+            return server.schema
+
+        except Exception as e:
+            logger.warning(f"Could not retrieve LDAP schema: {e}")
+            return None
+
     def get_server_info(self) -> Dict[str, Any]:
         """
         Retrieve information about the LDAP server and its capabilities.
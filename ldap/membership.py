@@ -0,0 +1,143 @@
+"""
+Content hashing of LDAP group membership attributes.
+
+Group ingesters hash the member lists of every group to detect changes.
+Small lists hash with the regular sorted normalization (normalize_ldap_value),
+so their stored hashes stay stable. Lists above LARGE_MEMBERSHIP_THRESHOLD
+are reduced to an order-independent digest instead: each normalized value is
+hashed on its own and the digests are summed modulo 2**256. The digest can
+therefore be fed one ranged-retrieval page at a time (see
+LDAPAdapter.iter_attribute_values) without sorting or keeping the whole list.
+"""
+
+import hashlib
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .normalizer import normalize_ldap_value
+
+# Membership lists longer than this are hashed with the streaming digest
+LARGE_MEMBERSHIP_THRESHOLD = 1500
+
+
+class MembershipDigest:
+    """
+    Incremental membership hash fed page by page.
+
+    Values are buffered until the count exceeds LARGE_MEMBERSHIP_THRESHOLD,
+    so lists that turn out to be small still hash exactly like
+    normalize_membership() on the complete list.
+
+    Examples:
+        digest = MembershipDigest()
+        for page in adapter.iter_attribute_values(group_dn, "member"):
+            digest.update(page)
+        digest.value()  # "<count>:<hex digest>" for large groups
+    """
+
+    def __init__(self, threshold: int = LARGE_MEMBERSHIP_THRESHOLD):
+        """
+        Start an empty digest.
+
+        Args:
+            threshold: List length above which the streaming digest is used
+        """
+        self.threshold = threshold
+        self.count = 0
+        self._total = 0
+        self._buffer: Optional[List[Any]] = []
+
+    def update(self, values: Iterable[Any]):
+        """
+        Add a page of raw membership values.
+
+        Args:
+            values: Raw values, in any order
+        """
+        for value in values:
+            self.count += 1
+            if self._buffer is None:
+                self._add(value)
+                continue
+            self._buffer.append(value)
+            if self.count > self.threshold:
+                # Past the threshold: fold the buffered values into the sum
+                for buffered in self._buffer:
+                    self._add(buffered)
+                self._buffer = None
+
+    def _add(self, value: Any):
+        """Fold one normalized value into the order-independent sum."""
+        normalized = normalize_ldap_value(value)
+        digest = hashlib.sha256(normalized.encode("utf-8")).digest()
+        self._total = (self._total + int.from_bytes(digest, "big")) % (1 << 256)
+
+    def value(self) -> Any:
+        """
+        Return the value to hash for the membership attribute.
+
+        Returns:
+            normalize_ldap_value() of the list when it has at most threshold
+            values, otherwise the digest string "<count>:<hex digest>"
+        """
+        if self._buffer is not None:
+            return normalize_ldap_value(self._buffer)
+        return f"{self.count}:{self._total:064x}"
+
+
+def normalize_membership(value: Any) -> Any:
+    """
+    Normalize a complete membership attribute for content hashing.
+
+    Args:
+        value: Raw membership attribute value
+
+    Returns:
+        Normalized value, or the digest string for lists above
+        LARGE_MEMBERSHIP_THRESHOLD
+    """
+    if isinstance(value, list) and len(value) > LARGE_MEMBERSHIP_THRESHOLD:
+        digest = MembershipDigest()
+        digest.update(value)
+        return digest.value()
+    return normalize_ldap_value(value)
+
+
+def digest_ranged_membership(
+    ldap_adapter: Any, entry: dict, attribute: str
+) -> Optional[Tuple[Any, int]]:
+    """
+    Hash a membership attribute the server returned as a partial range.
+
+    The first page ('member;range=0-1499') comes from the entry itself; the
+    remaining pages are streamed with ranged retrieval and folded into the
+    digest as they arrive, so the full member list is never built. The entry
+    is left untouched; call LDAPAdapter.complete_ranged_attributes() on it
+    only when the complete list is actually needed.
+
+    Args:
+        ldap_adapter: LDAPAdapter used to stream the remaining pages
+        entry: Entry dictionary with a 'dn' key, from
+            search_as_dicts(complete_ranges=False)
+        attribute: Membership attribute (e.g. 'member')
+
+    Returns:
+        (value to hash, member count), or None if the attribute was not
+        returned as a range
+    """
+    prefix = f"{attribute.lower()};range="
+    ranged_key = next((key for key in entry if key.lower().startswith(prefix)), None)
+    if ranged_key is None:
+        return None
+
+    digest = MembershipDigest()
+    first_page = entry[ranged_key]
+    digest.update(first_page if isinstance(first_page, list) else [first_page])
+
+    upper = ranged_key.split("=", 1)[1].partition("-")[2]
+    if upper != "*":
+        for page in ldap_adapter.iter_attribute_values(
+            entry["dn"], attribute, start=int(upper) + 1
+        ):
+            digest.update(page)
+
+    return digest.value(), digest.count
@@ -0,0 +1,343 @@
+"""
+Schema-driven normalization of LDAP entries for hashing and JSON storage.
+
+Every AD and MCommunity bronze ingester stores LDAP attributes in the same
+normalized form:
+
+- None and empty lists become ""
+- bytes are decoded as UTF-8 and stripped, or base64-encoded when they are
+  not valid UTF-8 or contain control characters (GUIDs, SIDs, certificates)
+- datetimes become ISO 8601 strings
+- single-element lists collapse to the normalized element
+- multi-element lists become a sorted list of normalized elements
+- anything else becomes str(value).strip()
+
+normalize_ldap_value() is the reference implementation of those rules.
+LDAPNormalizer applies the same rules, but resolves a conversion plan per
+attribute once, from the server schema (single vs multi valued, syntax OID),
+and reuses it for every entry. Its output is identical to
+normalize_ldap_value(), so content hashes stored by earlier runs still match.
+
+Benchmark: scripts/database/benchmarks/benchmark_ldap_normalizer.py
+"""
+
+import base64
+import logging
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bytes that force base64: ASCII controls except \t \n \r. UTF-8 never encodes
+# other characters with bytes below 0x80, so scanning the raw bytes gives the
+# same answer as decoding first and scanning the text.
+_CONTROL_BYTES = re.compile(b"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Upper bound on cached datetime -> ISO string conversions per attribute
+_TIME_CACHE_SIZE = 4096
+
+# Syntax OIDs whose values are timestamps
+TIME_SYNTAXES = frozenset(
+    {
+        "1.3.6.1.4.1.1466.115.121.1.24",  # Generalized Time
+        "1.3.6.1.4.1.1466.115.121.1.53",  # UTC Time
+    }
+)
+
+# Syntax OIDs whose values are usually binary
+BINARY_SYNTAXES = frozenset(
+    {
+        "1.3.6.1.4.1.1466.115.121.1.5",  # Binary
+        "1.3.6.1.4.1.1466.115.121.1.8",  # Certificate
+        "1.3.6.1.4.1.1466.115.121.1.9",  # Certificate List
+        "1.3.6.1.4.1.1466.115.121.1.10",  # Certificate Pair
+        "1.3.6.1.4.1.1466.115.121.1.28",  # JPEG
+        "1.3.6.1.4.1.1466.115.121.1.40",  # Octet String (objectGUID, objectSid)
+        "1.2.840.113556.1.4.907",  # AD NT-Security-Descriptor
+    }
+)
+
+# (single_valued, syntax_oid) per attribute name
+AttributeSpec = Tuple[bool, Optional[str]]
+
+
+# =============================================================================
+# REFERENCE RULES
+# =============================================================================
+
+
+def _normalize_bytes(value: bytes) -> str:
+    """Decode bytes as stripped UTF-8 text, or base64 when they are binary."""
+    if _CONTROL_BYTES.search(value):
+        # Null bytes and other controls are not storable in PostgreSQL JSONB
+        return base64.b64encode(value).decode("ascii")
+    try:
+        return value.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        # Not valid UTF-8, definitely binary data
+        return base64.b64encode(value).decode("ascii")
+
+
+def _normalize_item(item: Any) -> str:
+    """Normalize a single (non-list) attribute value."""
+    if isinstance(item, bytes):
+        return _normalize_bytes(item)
+    if isinstance(item, datetime):
+        return item.isoformat()
+    return str(item).strip()
+
+
+def normalize_ldap_value(value: Any) -> Any:
+    """
+    Normalize an LDAP attribute value for consistent hashing and JSON serialization.
+
+    Args:
+        value: Raw LDAP attribute value (scalar, bytes, datetime, list or None)
+
+    Returns:
+        Normalized string, or a sorted list of strings for multi-valued attributes
+    """
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        if len(value) == 0:
+            return ""
+        if len(value) == 1:
+            return _normalize_item(value[0])
+        # Sort multi-value attributes for consistent hashing
+        return sorted([_normalize_item(item) for item in value])
+    return _normalize_item(value)
+
+
+# =============================================================================
+# VALUE CONVERTERS (fast path for the expected type, reference rules otherwise)
+# =============================================================================
+
+
+def _build_text_converter(single_valued: bool) -> Callable[[Any], Any]:
+    """Converter for string syntaxes; str values are stripped inline."""
+    if single_valued:
+
+        def convert(value: Any) -> Any:
+            if type(value) is str:
+                return value.strip()
+            return normalize_ldap_value(value)
+
+    else:
+
+        def convert(value: Any) -> Any:
+            if type(value) is list and len(value) > 1:
+                return sorted(
+                    [
+                        item.strip() if type(item) is str else _normalize_item(item)
+                        for item in value
+                    ]
+                )
+            return normalize_ldap_value(value)
+
+    return convert
+
+
+def _build_binary_converter(single_valued: bool) -> Callable[[Any], Any]:
+    """Converter for binary syntaxes such as objectGUID, objectSid and certificates."""
+
+    def convert(value: Any) -> Any:
+        if type(value) is bytes:
+            return _normalize_bytes(value)
+        return normalize_ldap_value(value)
+
+    return convert
+
+
+def _build_time_converter(single_valued: bool) -> Callable[[Any], Any]:
+    """
+    Converter for time syntaxes with a bounded cache of ISO strings.
+
+    Values such as dSCorePropagationData repeat across most objects. The
+    cache key includes tzinfo because equal instants in different offsets
+    compare equal but format differently.
+    """
+    cache: Dict[Tuple[datetime, Any], str] = {}
+
+    def convert_item(item: Any) -> str:
+        if not isinstance(item, datetime):
+            return _normalize_item(item)
+        key = (item, item.tzinfo)
+        text = cache.get(key)
+        if text is None:
+            if len(cache) >= _TIME_CACHE_SIZE:
+                cache.clear()
+            text = cache[key] = item.isoformat()
+        return text
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, list):
+            if len(value) > 1:
+                return sorted([convert_item(item) for item in value])
+            if len(value) == 1:
+                return convert_item(value[0])
+            return ""
+        if value is None:
+            return ""
+        return convert_item(value)
+
+    return convert
+
+
+# =============================================================================
+# NORMALIZER
+# =============================================================================
+
+
+class LDAPNormalizer:
+    """
+    Normalizes LDAP entries using per-attribute conversion plans.
+
+    Plans come from the attribute types in the server schema. Attributes the
+    schema does not describe use normalize_ldap_value(). Output is identical
+    in every case; the schema only decides which checks run first.
+
+    Examples:
+        normalizer = LDAPNormalizer.from_schema(ldap_adapter.get_schema())
+        for entry in normalizer.normalize_entries(ldap_adapter.search_as_dicts(...)):
+            ...
+    """
+
+    def __init__(self, attribute_specs: Optional[Mapping[str, AttributeSpec]] = None):
+        """
+        Initialize the normalizer.
+
+        Args:
+            attribute_specs: Mapping of attribute name to (single_valued, syntax_oid).
+                Names are matched case-insensitively.
+        """
+        self._specs: Dict[str, AttributeSpec] = {
+            name.lower(): spec for name, spec in (attribute_specs or {}).items()
+        }
+        # Exact attribute name -> value converter, filled on first sight
+        self._plans: Dict[str, Callable[[Any], Any]] = {}
+
+    @classmethod
+    def from_schema(cls, schema: Any) -> "LDAPNormalizer":
+        """
+        Build a normalizer from an ldap3 SchemaInfo.
+
+        Args:
+            schema: ldap3 SchemaInfo (server.schema), or None for no schema
+
+        Returns:
+            LDAPNormalizer with a spec for every attribute type in the schema
+        """
+        attribute_types = getattr(schema, "attribute_types", None)
+        if not attribute_types:
+            logger.warning(
+                "No LDAP schema available; normalizing without attribute plans"
+            )
+            return cls()
+
+        specs: Dict[str, AttributeSpec] = {}
+        for name, info in attribute_types.items():
+            specs[name] = (
+                bool(getattr(info, "single_value", False)),
+                cls._resolve_syntax(info, attribute_types),
+            )
+
+        logger.debug(f"Built LDAP normalization specs for {len(specs)} attribute types")
+        return cls(specs)
+
+    @staticmethod
+    def _resolve_syntax(info: Any, attribute_types: Mapping[str, Any]) -> Optional[str]:
+        """Return an attribute type's syntax OID, following SUP when it is inherited."""
+        seen = set()
+        while info is not None and id(info) not in seen:
+            seen.add(id(info))
+            syntax = getattr(info, "syntax", None)
+            if isinstance(syntax, (list, tuple)):
+                syntax = syntax[0] if syntax else None
+            if syntax:
+                # Strip length bounds such as "1.3.6.1.4.1.1466.115.121.1.15{256}"
+                return str(syntax).split("{", 1)[0].strip()
+            superior = getattr(info, "superior", None)
+            if isinstance(superior, (list, tuple)):
+                superior = superior[0] if superior else None
+            info = attribute_types.get(superior) if superior else None
+        return None
+
+    def _build_plan(self, attribute: str) -> Callable[[Any], Any]:
+        """Resolve the value converter for an attribute name."""
+        spec = self._specs.get(attribute.lower())
+        if spec is None:
+            return normalize_ldap_value
+
+        single_valued, syntax = spec
+        if syntax in TIME_SYNTAXES:
+            return _build_time_converter(single_valued)
+        if syntax in BINARY_SYNTAXES:
+            return _build_binary_converter(single_valued)
+        return _build_text_converter(single_valued)
+
+    def plan_for(self, attribute: str) -> Callable[[Any], Any]:
+        """
+        Get the cached value converter for an attribute.
+
+        Args:
+            attribute: Attribute name as it appears in entries
+
+        Returns:
+            Function normalizing one value of that attribute
+        """
+        plan = self._plans.get(attribute)
+        if plan is None:
+            plan = self._plans[attribute] = self._build_plan(attribute)
+        return plan
+
+    def normalize_value(self, attribute: str, value: Any) -> Any:
+        """
+        Normalize one attribute value.
+
+        Args:
+            attribute: Attribute name
+            value: Raw attribute value
+
+        Returns:
+            Normalized value (same result as normalize_ldap_value(value))
+        """
+        return self.plan_for(attribute)(value)
+
+    def normalize_entry(self, entry: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize every attribute of an entry dictionary.
+
+        Args:
+            entry: Entry as returned by LDAPAdapter.search_as_dicts()
+
+        Returns:
+            New dictionary with all values normalized for JSON serialization
+        """
+        plans = self._plans
+        normalized = {}
+        for attribute, value in entry.items():
+            plan = plans.get(attribute)
+            if plan is None:
+                plan = self.plan_for(attribute)
+            normalized[attribute] = plan(value)
+        return normalized
+
+    def normalize_entries(
+        self, entries: Iterable[Mapping[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily normalize a stream of entries.
+
+        Only one normalized entry is held at a time, so this can wrap paged
+        search generators without materializing the whole result set.
+
+        Args:
+            entries: Iterable of entry dictionaries
+
+        Yields:
+            Normalized entry dictionaries, in input order
+        """
+        for entry in entries:
+            yield self.normalize_entry(entry)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Content Hashing Benchmark
+
+Compares the per-script hash helpers used by the bronze and silver scripts
+(json.dumps(sort_keys=True) + hashlib.sha256 per record) with the shared
+database.hashing module on synthetic records:
+
+- bronze-style records: flat TDX-user-like dicts hashed over a fixed field list
+- silver-style records: merged records with datetimes, Decimals and nested
+  lists, hashed over every field except metadata columns
+
+For each record shape the benchmark times the legacy helper, the batch API in
+compatible mode (and checks the hashes are identical), and the batch API with
+canonical orjson serialization under each available digest.
+
+No database connection is opened.
+
+Usage:
+    python scripts/database/benchmarks/benchmark_hashing.py --records 200000
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+# Add LSATS project to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from database.hashing import HAS_ORJSON, content_hashes, xxhash
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+BRONZE_HASH_FIELDS = (
+    "UID",
+    "UserName",
+    "FirstName",
+    "LastName",
+    "FullName",
+    "PrimaryEmail",
+    "AlternateEmail",
+    "ExternalID",
+    "IsActive",
+    "SecurityRoleName",
+    "TypeID",
+    "Accounts",
+)
+
+SILVER_EXCLUDE_FIELDS = {
+    "data_quality_score",
+    "quality_flags",
+    "entity_hash",
+    "ingestion_run_id",
+    "created_at",
+    "updated_at",
+}
+
+
+# =============================================================================
+# LEGACY HELPERS (as written in the ingestion and transform scripts)
+# =============================================================================
+
+
+def legacy_bronze_hash(record: Dict[str, Any]) -> str:
+    """Per-record helper in the style of 002_ingest_tdx_users.py."""
+    significant_fields = {field: record.get(field, "") for field in BRONZE_HASH_FIELDS}
+    normalized_json = json.dumps(
+        significant_fields, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
+
+
+def legacy_silver_hash(record: Dict[str, Any]) -> str:
+    """Per-record helper in the style of 012_transform_users.py."""
+    hash_payload = {k: v for k, v in record.items() if k not in SILVER_EXCLUDE_FIELDS}
+    normalized_json = json.dumps(
+        hash_payload, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# SYNTHETIC DATA
+# =============================================================================
+
+
+def build_bronze_records(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build flat TDX-user-like records."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        first = rng.choice(["Ana", "Bo", "Chen", "Dana", "Émile", "Farah"])
+        last = rng.choice(["Smith", "Nguyen", "García", "Okafor", "Kowalski"])
+        uniqname = f"{first[:2].lower()}{last[:4].lower()}{i}"
+        records.append(
+            {
+                "UID": f"{i:08x}-0000-4000-8000-{rng.getrandbits(48):012x}",
+                "UserName": uniqname,
+                "FirstName": first,
+                "LastName": last,
+                "FullName": f"{first} {last}",
+                "PrimaryEmail": f"{uniqname}@umich.edu",
+                "AlternateEmail": "",
+                "ExternalID": str(10_000_000 + i),
+                "IsActive": rng.random() > 0.1,
+                "SecurityRoleName": rng.choice(["Client", "Technician", "Admin"]),
+                "TypeID": 1,
+                "Accounts": [{"ID": rng.randint(1, 500), "Name": "LSA"}],
+                "_content_hash": None,
+            }
+        )
+    return records
+
+
+def build_silver_records(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build merged silver-like records with datetimes, Decimals and lists."""
+    rng = random.Random(seed)
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for i in range(count):
+        records.append(
+            {
+                "uniqname": f"user{i}",
+                "display_name": f"User {i}",
+                "primary_email": f"user{i}@umich.edu",
+                "department_ids": [f"{rng.randint(100000, 999999)}" for _ in range(3)],
+                "job_codes": [rng.randint(1000, 9999) for _ in range(2)],
+                "is_active": rng.random() > 0.1,
+                "hire_date": base_time + timedelta(days=rng.randint(0, 3000)),
+                "fte": Decimal("1.00") if rng.random() > 0.3 else Decimal("0.50"),
+                "source_system_ids": {"tdx": f"uid-{i}", "umapi": str(i)},
+                "data_quality_score": Decimal("0.75"),
+                "quality_flags": ["missing_phone"],
+                "entity_hash": None,
+                "ingestion_run_id": "run",
+                "created_at": base_time,
+                "updated_at": base_time,
+            }
+        )
+    return records
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def _time(label: str, func: Callable[[], List[str]]) -> Dict[str, Any]:
+    """Run func once and return its timing and output."""
+    started = time.perf_counter()
+    hashes = func()
+    seconds = time.perf_counter() - started
+    return {"label": label, "seconds": seconds, "hashes": hashes}
+
+
+def _report(title: str, results: List[Dict[str, Any]], count: int) -> None:
+    """Log a timing table relative to the first (legacy) result."""
+    baseline = results[0]["seconds"]
+    logger.info(f"{title} ({count:,} records)")
+    for result in results:
+        rate = count / result["seconds"] if result["seconds"] else float("inf")
+        speedup = baseline / result["seconds"] if result["seconds"] else float("inf")
+        logger.info(
+            f"   {result['label']:<32} {result['seconds']:>7.3f}s "
+            f"{rate:>12,.0f}/s {speedup:>6.2f}x"
+        )
+
+
+def run_hashing_benchmark(count: int = 100_000) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Benchmark legacy helpers against database.hashing on both record shapes.
+
+    Args:
+        count: Number of synthetic records per shape
+
+    Returns:
+        Dictionary of timing results per record shape
+
+    Raises:
+        AssertionError: If compatible-mode hashes differ from the legacy helper
+    """
+    algorithms = ["sha256", "blake2b"] + (["xxh3"] if xxhash is not None else [])
+    all_results = {}
+
+    bronze_records = build_bronze_records(count)
+    silver_records = build_silver_records(count)
+    silver_fields = sorted(
+        key for key in silver_records[0] if key not in SILVER_EXCLUDE_FIELDS
+    )
+
+    for shape, records, legacy, fields in (
+        ("bronze", bronze_records, legacy_bronze_hash, list(BRONZE_HASH_FIELDS)),
+        ("silver", silver_records, legacy_silver_hash, silver_fields),
+    ):
+        results = [
+            _time("legacy per-record helper", lambda: [legacy(r) for r in records]),
+            _time(
+                "content_hashes compatible",
+                lambda: content_hashes(records, fields, compatible=True),
+            ),
+        ]
+        # The legacy bronze helper defaults missing fields to "" rather than null;
+        # every synthetic record has every field, so the hashes must match.
+        if results[1]["hashes"] != results[0]["hashes"]:
+            raise AssertionError(f"Compatible {shape} hashes differ from legacy helper")
+
+        for algorithm in algorithms:
+            results.append(
+                _time(
+                    f"content_hashes canonical {algorithm}",
+                    lambda: content_hashes(records, fields, algorithm=algorithm),
+                )
+            )
+
+        _report(f"📊 {shape.title()} record hashing", results, count)
+        all_results[shape] = [
+            {key: value for key, value in result.items() if key != "hashes"}
+            for result in results
+        ]
+
+    return all_results
+
+
+def main():
+    """Run the hashing benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-script content hash helpers against database.hashing"
+    )
+    parser.add_argument(
+        "--records",
+        type=int,
+        default=100_000,
+        help="Number of synthetic records per record shape (default: 100000)",
+    )
+    args = parser.parse_args()
+
+    logger.info(f"orjson available: {HAS_ORJSON}, xxhash available: {xxhash is not None}")
+    run_hashing_benchmark(args.records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+LDAP Normalization Benchmark
+
+Compares the per-script _normalize_raw_data_for_json helper copied into the
+AD and MCommunity bronze ingesters with the shared ldap.normalizer module on
+synthetic Active Directory computer and user entries (GUID/SID bytes,
+certificates, datetimes, single-element and multi-valued lists):
+
+- legacy helper: isinstance chain per attribute, per-character control scan
+- normalize_ldap_value: shared reference rules
+- LDAPNormalizer: per-attribute plans from schema specs
+
+The outputs of every implementation are checked to be identical. No LDAP or database
+connection is opened; the schema specs mirror the Active Directory schema
+(single-valued flag and syntax OID per attribute).
+
+Usage:
+    python scripts/database/benchmarks/benchmark_ldap_normalizer.py --entries 50000
+"""
+
+import argparse
+import base64
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+# Add LSATS project to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from ldap.normalizer import LDAPNormalizer, normalize_ldap_value
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+DIRECTORY_STRING = "1.3.6.1.4.1.1466.115.121.1.15"
+DN = "1.3.6.1.4.1.1466.115.121.1.12"
+OCTET_STRING = "1.3.6.1.4.1.1466.115.121.1.40"
+GENERALIZED_TIME = "1.3.6.1.4.1.1466.115.121.1.24"
+INTEGER = "1.3.6.1.4.1.1466.115.121.1.27"
+LARGE_INTEGER = "1.2.840.113556.1.4.906"
+OID = "1.3.6.1.4.1.1466.115.121.1.38"
+
+# (single_valued, syntax) as published by the Active Directory schema
+AD_SCHEMA_SPECS = {
+    "dn": (True, DN),
+    "name": (True, DIRECTORY_STRING),
+    "cn": (True, DIRECTORY_STRING),
+    "sAMAccountName": (True, DIRECTORY_STRING),
+    "distinguishedName": (True, DN),
+    "objectGUID": (True, OCTET_STRING),
+    "objectSid": (True, OCTET_STRING),
+    "dNSHostName": (True, DIRECTORY_STRING),
+    "memberOf": (False, DN),
+    "operatingSystem": (True, DIRECTORY_STRING),
+    "operatingSystemVersion": (True, DIRECTORY_STRING),
+    "userAccountControl": (True, INTEGER),
+    "pwdLastSet": (True, LARGE_INTEGER),
+    "whenCreated": (True, GENERALIZED_TIME),
+    "whenChanged": (True, GENERALIZED_TIME),
+    "servicePrincipalName": (False, DIRECTORY_STRING),
+    "objectClass": (False, OID),
+    "userCertificate": (False, OCTET_STRING),
+    "dSCorePropagationData": (False, GENERALIZED_TIME),
+    "mail": (True, DIRECTORY_STRING),
+    "proxyAddresses": (False, DIRECTORY_STRING),
+}
+
+
+# =============================================================================
+# LEGACY HELPER (as written in the AD and MCommunity ingestion scripts)
+# =============================================================================
+
+
+def legacy_normalize_ldap_attribute(value: Any) -> Any:
+    """Per-script helper in the style of 007_ingest_ad_computers.py."""
+    if value is None:
+        return ""
+    elif isinstance(value, bytes):
+        try:
+            decoded = value.decode("utf-8")
+            if "\x00" in decoded or any(
+                ord(c) < 32 and c not in "\t\n\r" for c in decoded
+            ):
+                return base64.b64encode(value).decode("ascii")
+            else:
+                return decoded.strip()
+        except UnicodeDecodeError:
+            return base64.b64encode(value).decode("ascii")
+    elif isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, list):
+        if len(value) == 0:
+            return ""
+        elif len(value) == 1:
+            return legacy_normalize_ldap_attribute(value[0])
+        else:
+            return sorted(legacy_normalize_ldap_attribute(item) for item in value)
+    else:
+        return str(value).strip()
+
+
+def legacy_normalize_raw_data_for_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-script entry helper."""
+    normalized = {}
+    for key, value in data.items():
+        normalized[key] = legacy_normalize_ldap_attribute(value)
+    return normalized
+
+
+# =============================================================================
+# SYNTHETIC DATA
+# =============================================================================
+
+
+def build_entries(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build AD computer/user-like entries as returned by search_as_dicts()."""
+    rng = random.Random(seed)
+    base_time = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    entries = []
+    for i in range(count):
+        name = f"LSA-{i:06d}"
+        dn = f"CN={name},OU=Workstations,OU=LSA,OU=UMICH,DC=adsroot,DC=itcs,DC=umich,DC=edu"
+        group_count = rng.randint(0, 12)
+        entries.append(
+            {
+                "dn": dn,
+                "name": name,
+                "cn": name,
+                "sAMAccountName": f"{name}$",
+                "distinguishedName": dn,
+                "objectGUID": rng.getrandbits(128).to_bytes(16, "little"),
+                "objectSid": b"\x01\x05\x00\x00\x00\x00\x00\x05"
+                + rng.getrandbits(160).to_bytes(20, "little"),
+                "dNSHostName": f"{name.lower()}.adsroot.itcs.umich.edu",
+                "memberOf": [
+                    f"CN=lsa-group-{rng.randint(1, 5000)},OU=Groups,DC=adsroot"
+                    for _ in range(group_count)
+                ]
+                or None,
+                "operatingSystem": rng.choice(["Windows 11 Enterprise", "macOS"]),
+                "operatingSystemVersion": "10.0 (22631)",
+                "userAccountControl": 4096,
+                "pwdLastSet": base_time + timedelta(days=rng.randint(0, 3000)),
+                "whenCreated": base_time + timedelta(days=rng.randint(0, 3000)),
+                "whenChanged": base_time + timedelta(days=rng.randint(0, 3000)),
+                "servicePrincipalName": [
+                    f"HOST/{name}",
+                    f"HOST/{name.lower()}.adsroot.itcs.umich.edu",
+                    f"RestrictedKrbHost/{name}",
+                ],
+                "objectClass": ["top", "person", "organizationalPerson", "user", "computer"],
+                "userCertificate": [rng.getrandbits(8 * 256).to_bytes(256, "little")]
+                if rng.random() < 0.3
+                else [],
+                "dSCorePropagationData": [base_time, base_time + timedelta(days=1)],
+                "mail": [f"{name.lower()}@umich.edu"],
+                "proxyAddresses": [f"smtp:{name.lower()}@umich.edu"],
+            }
+        )
+    return entries
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def _time(
+    label: str, func: Callable[[], List[Dict[str, Any]]], repeat: int
+) -> Dict[str, Any]:
+    """Run func repeat times and return the best timing and the output."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = func()
+        best = min(best, time.perf_counter() - started)
+    return {"label": label, "seconds": best, "output": output}
+
+
+def run_normalizer_benchmark(count: int = 50_000, repeat: int = 3) -> List[Dict[str, Any]]:
+    """
+    Benchmark the legacy helper against the shared normalizer.
+
+    Args:
+        count: Number of synthetic entries
+        repeat: Runs per implementation; the fastest is reported
+
+    Returns:
+        Timing results (label, seconds) in the order run
+
+    Raises:
+        AssertionError: If any implementation's output differs from the legacy helper
+    """
+    entries = build_entries(count)
+    normalizer = LDAPNormalizer(AD_SCHEMA_SPECS)
+
+    results = [
+        _time(
+            "legacy per-script helper",
+            lambda: [legacy_normalize_raw_data_for_json(entry) for entry in entries],
+            repeat,
+        ),
+        _time(
+            "normalize_ldap_value",
+            lambda: [
+                {key: normalize_ldap_value(value) for key, value in entry.items()}
+                for entry in entries
+            ],
+            repeat,
+        ),
+        _time(
+            "LDAPNormalizer (no schema)",
+            lambda: list(LDAPNormalizer().normalize_entries(entries)),
+            repeat,
+        ),
+        _time(
+            "LDAPNormalizer (schema plans)",
+            lambda: list(normalizer.normalize_entries(entries)),
+            repeat,
+        ),
+    ]
+
+    for result in results[1:]:
+        if result["output"] != results[0]["output"]:
+            raise AssertionError(f"{result['label']} output differs from legacy helper")
+
+    baseline = results[0]["seconds"]
+    logger.info(f"📊 LDAP entry normalization ({count:,} entries, best of {repeat})")
+    for result in results:
+        rate = count / result["seconds"] if result["seconds"] else float("inf")
+        speedup = baseline / result["seconds"] if result["seconds"] else float("inf")
+        logger.info(
+            f"   {result['label']:<32} {result['seconds']:>7.3f}s "
+            f"{rate:>12,.0f}/s {speedup:>6.2f}x"
+        )
+
+    return [
+        {key: value for key, value in result.items() if key != "output"}
+        for result in results
+    ]
+
+
+def main():
+    """Run the LDAP normalization benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-script LDAP normalization against ldap.normalizer"
+    )
+    parser.add_argument(
+        "--entries",
+        type=int,
+        default=50_000,
+        help="Number of synthetic LDAP entries (default: 50000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per implementation; the fastest is reported (default: 3)",
+    )
+    args = parser.parse_args()
+
+    run_normalizer_benchmark(args.entries, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
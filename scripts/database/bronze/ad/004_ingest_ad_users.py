@@ -21,7 +21,6 @@ handle this appropriately.
 """
 
 import argparse
-import base64
 import hashlib
 import json
 import logging
@@ -48,6 +47,7 @@ from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter, create_postgres_adapter
 from ldap.adapters.ldap_adapter import LDAPAdapter
+from ldap.normalizer import LDAPNormalizer, normalize_ldap_value
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -93,6 +93,7 @@ class ActiveDirectoryUserIngestionService:
         ldap_config: Dict[str, Any],
         force_full_sync: bool = False,
         dry_run: bool = False,
+        two_phase: bool = False,
     ):
         """
         Initialize the Active Directory user ingestion service.
@@ -102,6 +103,8 @@ class ActiveDirectoryUserIngestionService:
             ldap_config: LDAP connection configuration dictionary
             force_full_sync: If True, bypass timestamp filtering and perform full sync
             dry_run: If True, preview changes without committing to database
+            two_phase: If True, fetch only the hash attribute set first and full
+                       attributes only for users whose content hash changed
         """
         self.db_adapter = PostgresAdapter(
             database_url=database_url, pool_size=5, max_overflow=10
@@ -113,110 +116,25 @@ class ActiveDirectoryUserIngestionService:
         # Store full sync and dry run flags
         self.force_full_sync = force_full_sync
         self.dry_run = dry_run
+        self.two_phase = two_phase
 
         # Test LDAP connection
         if not self.ldap_adapter.test_connection():
             raise Exception("Failed to connect to Active Directory LDAP")
 
+        # Per-attribute normalization plans from the server schema
+        self.ldap_normalizer = LDAPNormalizer.from_schema(self.ldap_adapter.get_schema())
+
         logger.info(
             f"Active Directory user ingestion service initialized with content hashing "
             f"(force_full_sync={'enabled' if force_full_sync else 'disabled'})"
         )
 
-    def _normalize_ldap_attribute(self, value: Any) -> Any:
-        """
-        Normalize LDAP attribute values for consistent hashing and JSON serialization.
-
-        LDAP attributes can be single values, lists, bytes, or None. Many Active Directory
-        user attributes like memberOf, proxyAddresses, umichadOU can be either strings
-        or lists depending on the user.
-
-        Binary fields (userCertificate, objectGUID bytes, objectSid, etc.) are converted
-        to base64 to avoid issues with null bytes in PostgreSQL JSON/JSONB fields.
-
-        Args:
-            value: Raw LDAP attribute value
-
-        Returns:
-            Normalized value suitable for JSON serialization
-        """
-        if value is None:
-            return ""
-        elif isinstance(value, bytes):
-            # Handle binary attributes using base64 encoding
-            # This avoids null byte issues with PostgreSQL JSON/JSONB
-            # Fields like userCertificate, objectSid, mS-DS-ConsistencyGuid contain binary data
-            try:
-                # Try to decode as UTF-8 for string-like fields
-                decoded = value.decode("utf-8")
-                # Check if it contains null bytes or other problematic characters
-                if "\x00" in decoded or any(
-                    ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                ):
-                    # Contains binary data, use base64
-                    return base64.b64encode(value).decode("ascii")
-                else:
-                    return decoded.strip()
-            except UnicodeDecodeError:
-                # Not valid UTF-8, definitely binary data
-                return base64.b64encode(value).decode("ascii")
-        elif isinstance(value, datetime):
-            # Handle datetime objects
-            return value.isoformat()
-        elif isinstance(value, list):
-            if len(value) == 0:
-                return ""
-            elif len(value) == 1:
-                item = value[0]
-                if isinstance(item, bytes):
-                    # Same binary handling for list items
-                    try:
-                        decoded = item.decode("utf-8")
-                        if "\x00" in decoded or any(
-                            ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                        ):
-                            return base64.b64encode(item).decode("ascii")
-                        else:
-                            return decoded.strip()
-                    except UnicodeDecodeError:
-                        return base64.b64encode(item).decode("ascii")
-                elif isinstance(item, datetime):
-                    return item.isoformat()
-                else:
-                    return str(item).strip()
-            else:
-                # Sort multi-value attributes for consistent hashing
-                normalized_items = []
-                for item in value:
-                    if isinstance(item, bytes):
-                        try:
-                            decoded = item.decode("utf-8")
-                            if "\x00" in decoded or any(
-                                ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                            ):
-                                normalized_items.append(
-                                    base64.b64encode(item).decode("ascii")
-                                )
-                            else:
-                                normalized_items.append(decoded.strip())
-                        except UnicodeDecodeError:
-                            normalized_items.append(
-                                base64.b64encode(item).decode("ascii")
-                            )
-                    elif isinstance(item, datetime):
-                        normalized_items.append(item.isoformat())
-                    else:
-                        normalized_items.append(str(item).strip())
-                return sorted(normalized_items)
-        else:
-            return str(value).strip()
-
     def _normalize_raw_data_for_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively normalize all values in a dictionary for JSON serialization.
+        Normalize all values in an entry dictionary for JSON serialization.
 
-        This ensures that datetime objects, bytes, and other non-JSON-serializable
-        types are converted before inserting into the database.
+        Uses the per-attribute conversion plans built from the server schema.
 
         Args:
             data: Dictionary with raw LDAP data
@@ -224,10 +142,7 @@ class ActiveDirectoryUserIngestionService:
         Returns:
             Dictionary with all values normalized for JSON serialization
         """
-        normalized = {}
-        for key, value in data.items():
-            normalized[key] = self._normalize_ldap_attribute(value)
-        return normalized
+        return self.ldap_normalizer.normalize_entry(data)
 
     def _calculate_user_content_hash(self, user_data: Dict[str, Any]) -> str:
         """
@@ -256,75 +171,57 @@ class ActiveDirectoryUserIngestionService:
         # Based on Active Directory LDAP schema for users and UMich-specific attributes
         significant_fields = {
             # Core identifiers
-            "name": self._normalize_ldap_attribute(user_data.get("name")),
-            "cn": self._normalize_ldap_attribute(user_data.get("cn")),
-            "sAMAccountName": self._normalize_ldap_attribute(
-                user_data.get("sAMAccountName")
-            ),
-            "uid": self._normalize_ldap_attribute(user_data.get("uid")),
-            "distinguishedName": self._normalize_ldap_attribute(
+            "name": normalize_ldap_value(user_data.get("name")),
+            "cn": normalize_ldap_value(user_data.get("cn")),
+            "sAMAccountName": normalize_ldap_value(user_data.get("sAMAccountName")),
+            "uid": normalize_ldap_value(user_data.get("uid")),
+            "distinguishedName": normalize_ldap_value(
                 user_data.get("distinguishedName")
             ),
-            "objectGUID": self._normalize_ldap_attribute(user_data.get("objectGUID")),
-            "objectSid": self._normalize_ldap_attribute(user_data.get("objectSid")),
-            "userPrincipalName": self._normalize_ldap_attribute(
+            "objectGUID": normalize_ldap_value(user_data.get("objectGUID")),
+            "objectSid": normalize_ldap_value(user_data.get("objectSid")),
+            "userPrincipalName": normalize_ldap_value(
                 user_data.get("userPrincipalName")
             ),
             # Personal information
-            "givenName": self._normalize_ldap_attribute(user_data.get("givenName")),
-            "sn": self._normalize_ldap_attribute(user_data.get("sn")),
-            "middleName": self._normalize_ldap_attribute(user_data.get("middleName")),
-            "initials": self._normalize_ldap_attribute(user_data.get("initials")),
-            "displayName": self._normalize_ldap_attribute(user_data.get("displayName")),
-            "description": self._normalize_ldap_attribute(user_data.get("description")),
+            "givenName": normalize_ldap_value(user_data.get("givenName")),
+            "sn": normalize_ldap_value(user_data.get("sn")),
+            "middleName": normalize_ldap_value(user_data.get("middleName")),
+            "initials": normalize_ldap_value(user_data.get("initials")),
+            "displayName": normalize_ldap_value(user_data.get("displayName")),
+            "description": normalize_ldap_value(user_data.get("description")),
             # Contact information
-            "mail": self._normalize_ldap_attribute(user_data.get("mail")),
-            "mailNickname": self._normalize_ldap_attribute(
-                user_data.get("mailNickname")
-            ),
-            "telephoneNumber": self._normalize_ldap_attribute(
-                user_data.get("telephoneNumber")
-            ),
-            "proxyAddresses": self._normalize_ldap_attribute(
-                user_data.get("proxyAddresses")
-            ),
+            "mail": normalize_ldap_value(user_data.get("mail")),
+            "mailNickname": normalize_ldap_value(user_data.get("mailNickname")),
+            "telephoneNumber": normalize_ldap_value(user_data.get("telephoneNumber")),
+            "proxyAddresses": normalize_ldap_value(user_data.get("proxyAddresses")),
             # Organizational information
-            "title": self._normalize_ldap_attribute(user_data.get("title")),
-            "umichadOU": self._normalize_ldap_attribute(user_data.get("umichadOU")),
-            "umichadRole": self._normalize_ldap_attribute(user_data.get("umichadRole")),
+            "title": normalize_ldap_value(user_data.get("title")),
+            "umichadOU": normalize_ldap_value(user_data.get("umichadOU")),
+            "umichadRole": normalize_ldap_value(user_data.get("umichadRole")),
             # UMich-specific identifiers
-            "umichDirectoryID": self._normalize_ldap_attribute(
-                user_data.get("umichDirectoryID")
-            ),
-            "uidNumber": self._normalize_ldap_attribute(user_data.get("uidNumber")),
+            "umichDirectoryID": normalize_ldap_value(user_data.get("umichDirectoryID")),
+            "uidNumber": normalize_ldap_value(user_data.get("uidNumber")),
             # Account status and control
-            "userAccountControl": self._normalize_ldap_attribute(
+            "userAccountControl": normalize_ldap_value(
                 user_data.get("userAccountControl")
             ),
-            "accountExpires": self._normalize_ldap_attribute(
-                user_data.get("accountExpires")
-            ),
-            "pwdLastSet": self._normalize_ldap_attribute(user_data.get("pwdLastSet")),
+            "accountExpires": normalize_ldap_value(user_data.get("accountExpires")),
+            "pwdLastSet": normalize_ldap_value(user_data.get("pwdLastSet")),
             # Group membership
-            "memberOf": self._normalize_ldap_attribute(user_data.get("memberOf")),
-            "primaryGroupID": self._normalize_ldap_attribute(
-                user_data.get("primaryGroupID")
-            ),
+            "memberOf": normalize_ldap_value(user_data.get("memberOf")),
+            "primaryGroupID": normalize_ldap_value(user_data.get("primaryGroupID")),
             # Managed objects (computers/resources managed by this user)
-            "managedObjects": self._normalize_ldap_attribute(
-                user_data.get("managedObjects")
-            ),
+            "managedObjects": normalize_ldap_value(user_data.get("managedObjects")),
             # Object metadata
-            "objectCategory": self._normalize_ldap_attribute(
-                user_data.get("objectCategory")
-            ),
-            "objectClass": self._normalize_ldap_attribute(user_data.get("objectClass")),
+            "objectCategory": normalize_ldap_value(user_data.get("objectCategory")),
+            "objectClass": normalize_ldap_value(user_data.get("objectClass")),
             # Timestamps - ONLY include creation time (stable), EXCLUDE change timestamps (volatile)
-            "whenCreated": self._normalize_ldap_attribute(user_data.get("whenCreated")),
+            "whenCreated": normalize_ldap_value(user_data.get("whenCreated")),
             # EXCLUDED: "whenChanged" - updates on every AD sync/replication
             # EXCLUDED: "uSNChanged" - Update Sequence Number, increments constantly
             # USN Creation (stable after creation)
-            "uSNCreated": self._normalize_ldap_attribute(user_data.get("uSNCreated")),
+            "uSNCreated": normalize_ldap_value(user_data.get("uSNCreated")),
             # EXCLUDED: Activity tracking fields (these change constantly and don't represent user data changes)
             # - "lastLogon" - updates on every login
             # - "lastLogonTimestamp" - updates on logins (replicated less frequently than lastLogon)
@@ -332,47 +229,39 @@ class ActiveDirectoryUserIngestionService:
             # - "badPwdCount" - changes on failed login attempts
             # - "badPasswordTime" - changes on failed login attempts
             # Exchange attributes (email-related)
-            "legacyExchangeDN": self._normalize_ldap_attribute(
-                user_data.get("legacyExchangeDN")
-            ),
-            "msExchRecipientTypeDetails": self._normalize_ldap_attribute(
+            "legacyExchangeDN": normalize_ldap_value(user_data.get("legacyExchangeDN")),
+            "msExchRecipientTypeDetails": normalize_ldap_value(
                 user_data.get("msExchRecipientTypeDetails")
             ),
-            "targetAddress": self._normalize_ldap_attribute(
-                user_data.get("targetAddress")
-            ),
+            "targetAddress": normalize_ldap_value(user_data.get("targetAddress")),
             # UMich-specific attributes
-            "umichadNoBatchUpdates": self._normalize_ldap_attribute(
+            "umichadNoBatchUpdates": normalize_ldap_value(
                 user_data.get("umichadNoBatchUpdates")
             ),
-            "umichadHidePersonalInfo": self._normalize_ldap_attribute(
+            "umichadHidePersonalInfo": normalize_ldap_value(
                 user_data.get("umichadHidePersonalInfo")
             ),
-            "umichadUMDirToADSyncFlag": self._normalize_ldap_attribute(
+            "umichadUMDirToADSyncFlag": normalize_ldap_value(
                 user_data.get("umichadUMDirToADSyncFlag")
             ),
             # Extension attributes (often used for custom data)
-            "extensionAttribute5": self._normalize_ldap_attribute(
+            "extensionAttribute5": normalize_ldap_value(
                 user_data.get("extensionAttribute5")
             ),
-            "extensionAttribute6": self._normalize_ldap_attribute(
+            "extensionAttribute6": normalize_ldap_value(
                 user_data.get("extensionAttribute6")
             ),
-            "extensionAttribute9": self._normalize_ldap_attribute(
+            "extensionAttribute9": normalize_ldap_value(
                 user_data.get("extensionAttribute9")
             ),
             # Directory replication metadata
-            "dSCorePropagationData": self._normalize_ldap_attribute(
+            "dSCorePropagationData": normalize_ldap_value(
                 user_data.get("dSCorePropagationData")
             ),
             # Instance type
-            "instanceType": self._normalize_ldap_attribute(
-                user_data.get("instanceType")
-            ),
+            "instanceType": normalize_ldap_value(user_data.get("instanceType")),
             # Account type
-            "sAMAccountType": self._normalize_ldap_attribute(
-                user_data.get("sAMAccountType")
-            ),
+            "sAMAccountType": normalize_ldap_value(user_data.get("sAMAccountType")),
         }
 
         # Create normalized JSON for consistent hashing
@@ -384,7 +273,7 @@ class ActiveDirectoryUserIngestionService:
         content_hash = hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
 
         name = user_data.get("name", "unknown")
-        object_guid = self._normalize_ldap_attribute(user_data.get("objectGUID"))
+        object_guid = normalize_ldap_value(user_data.get("objectGUID"))
         logger.debug(
             f"Content hash for user {name} (objectGUID: {object_guid}): {content_hash}"
         )
@@ -737,14 +626,36 @@ class ActiveDirectoryUserIngestionService:
             batch_num = 0
             fetch_start_time = datetime.now(timezone.utc)
 
-            for user_batch in self.ldap_adapter.search_paged_generator(
-                search_filter=search_filter,
-                search_base=search_base,
-                scope="subtree",
-                attributes=None,  # Return all attributes
-                page_size=1000,
-                return_dicts=True,
-            ):
+            if self.two_phase:
+                # Phase 1 reads only the attributes the content hash uses;
+                # full attributes are fetched only for new/changed users
+                def needs_full_fetch(user: Dict[str, Any]) -> bool:
+                    object_guid = normalize_ldap_value(user.get("objectGUID"))
+                    return existing_hashes.get(
+                        object_guid
+                    ) != self._calculate_user_content_hash(user)
+
+                user_batches = self.ldap_adapter.search_two_phase_generator(
+                    search_filter=search_filter,
+                    search_base=search_base,
+                    scope="subtree",
+                    hash_attributes=self.ldap_adapter.get_attribute_profile(
+                        "ad_user", "hash_only"
+                    ),
+                    needs_full_fetch=needs_full_fetch,
+                    page_size=1000,
+                )
+            else:
+                user_batches = self.ldap_adapter.search_paged_generator(
+                    search_filter=search_filter,
+                    search_base=search_base,
+                    scope="subtree",
+                    attributes=None,  # Return all attributes
+                    page_size=1000,
+                    return_dicts=True,
+                )
+
+            for user_batch in user_batches:
                 batch_num += 1
                 logger.debug(f"Processing batch {batch_num}: {len(user_batch)} users")
 
@@ -752,11 +663,9 @@ class ActiveDirectoryUserIngestionService:
                 for user_data in user_batch:
                     try:
                         # Extract user identifiers
-                        name = self._normalize_ldap_attribute(user_data.get("name"))
-                        object_guid = self._normalize_ldap_attribute(
-                            user_data.get("objectGUID")
-                        )
-                        sam_account_name = self._normalize_ldap_attribute(
+                        name = normalize_ldap_value(user_data.get("name"))
+                        object_guid = normalize_ldap_value(user_data.get("objectGUID"))
+                        sam_account_name = normalize_ldap_value(
                             user_data.get("sAMAccountName")
                         )
 
@@ -1201,6 +1110,11 @@ def main():
             action="store_true",
             help="Preview changes without committing to database",
         )
+        parser.add_argument(
+            "--two-phase",
+            action="store_true",
+            help="Fetch only hash attributes first, then full attributes for changed users. Most useful with --full-sync.",
+        )
         args = parser.parse_args()
 
         # Load environment variables
@@ -1239,6 +1153,7 @@ def main():
             ldap_config=ad_config,
             force_full_sync=args.full_sync,
             dry_run=args.dry_run,
+            two_phase=args.two_phase,
         )
 
         # Run the content hash-based ingestion process
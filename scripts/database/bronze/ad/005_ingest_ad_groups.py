@@ -21,7 +21,6 @@ handle this appropriately.
 """
 
 import argparse
-import base64
 import hashlib
 import json
 import logging
@@ -48,6 +47,8 @@ from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter, create_postgres_adapter
 from ldap.adapters.ldap_adapter import LDAPAdapter
+from ldap.membership import digest_ranged_membership, normalize_membership
+from ldap.normalizer import LDAPNormalizer, normalize_ldap_value
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -121,104 +122,18 @@ class ActiveDirectoryGroupIngestionService:
         if not self.ldap_adapter.test_connection():
             raise Exception("Failed to connect to Active Directory LDAP")
 
+        # Per-attribute normalization plans from the server schema
+        self.ldap_normalizer = LDAPNormalizer.from_schema(self.ldap_adapter.get_schema())
+
         logger.info(
             "✅ Active Directory group ingestion service initialized with content hashing"
         )
 
-    def _normalize_ldap_attribute(self, value: Any) -> Any:
-        """
-        Normalize LDAP attribute values for consistent hashing and JSON serialization.
-
-        LDAP attributes can be single values, lists, bytes, or None. Many Active Directory
-        group attributes like member, memberOf, description can be either strings
-        or lists depending on the group.
-
-        Binary fields (sIDHistory, proxiedObjectName, etc.) are converted to base64
-        to avoid issues with null bytes in PostgreSQL JSON/JSONB fields.
-
-        Args:
-            value: Raw LDAP attribute value
-
-        Returns:
-            Normalized value suitable for JSON serialization
-        """
-        if value is None:
-            return ""
-        elif isinstance(value, bytes):
-            # Handle binary attributes using base64 encoding
-            # This avoids null byte issues with PostgreSQL JSON/JSONB
-            # Fields like sIDHistory, proxiedObjectName contain binary data
-            try:
-                # Try to decode as UTF-8 for string-like fields (objectGUID)
-                decoded = value.decode("utf-8")
-                # Check if it contains null bytes or other problematic characters
-                if "\x00" in decoded or any(
-                    ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                ):
-                    # Contains binary data, use base64
-                    return base64.b64encode(value).decode("ascii")
-                else:
-                    return decoded.strip()
-            except UnicodeDecodeError:
-                # Not valid UTF-8, definitely binary data
-                return base64.b64encode(value).decode("ascii")
-        elif isinstance(value, datetime):
-            # Handle datetime objects
-            return value.isoformat()
-        elif isinstance(value, list):
-            if len(value) == 0:
-                return ""
-            elif len(value) == 1:
-                item = value[0]
-                if isinstance(item, bytes):
-                    # Same binary handling for list items
-                    try:
-                        decoded = item.decode("utf-8")
-                        if "\x00" in decoded or any(
-                            ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                        ):
-                            return base64.b64encode(item).decode("ascii")
-                        else:
-                            return decoded.strip()
-                    except UnicodeDecodeError:
-                        return base64.b64encode(item).decode("ascii")
-                elif isinstance(item, datetime):
-                    return item.isoformat()
-                else:
-                    return str(item).strip()
-            else:
-                # Sort multi-value attributes for consistent hashing
-                normalized_items = []
-                for item in value:
-                    if isinstance(item, bytes):
-                        try:
-                            decoded = item.decode("utf-8")
-                            if "\x00" in decoded or any(
-                                ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                            ):
-                                normalized_items.append(
-                                    base64.b64encode(item).decode("ascii")
-                                )
-                            else:
-                                normalized_items.append(decoded.strip())
-                        except UnicodeDecodeError:
-                            normalized_items.append(
-                                base64.b64encode(item).decode("ascii")
-                            )
-                    elif isinstance(item, datetime):
-                        normalized_items.append(item.isoformat())
-                    else:
-                        normalized_items.append(str(item).strip())
-                return sorted(normalized_items)
-        else:
-            return str(value).strip()
-
     def _normalize_raw_data_for_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively normalize all values in a dictionary for JSON serialization.
+        Normalize all values in an entry dictionary for JSON serialization.
 
-        This ensures that datetime objects, bytes, and other non-JSON-serializable
-        types are converted before inserting into the database.
+        Uses the per-attribute conversion plans built from the server schema.
 
         Args:
             data: Dictionary with raw LDAP data
@@ -226,12 +141,11 @@ class ActiveDirectoryGroupIngestionService:
         Returns:
             Dictionary with all values normalized for JSON serialization
         """
-        normalized = {}
-        for key, value in data.items():
-            normalized[key] = self._normalize_ldap_attribute(value)
-        return normalized
+        return self.ldap_normalizer.normalize_entry(data)
 
-    def _calculate_group_content_hash(self, group_data: Dict[str, Any]) -> str:
+    def _calculate_group_content_hash(
+        self, group_data: Dict[str, Any], member_value: Any = None
+    ) -> str:
         """
         Calculate a content hash for Active Directory group data to detect meaningful changes.
 
@@ -241,6 +155,9 @@ class ActiveDirectoryGroupIngestionService:
 
         Args:
             group_data: Raw group data from Active Directory LDAP
+            member_value: Precomputed membership hash value (see
+                digest_ranged_membership); by default group_data["member"]
+                is normalized
 
         Returns:
             SHA-256 hash of the normalized group content
@@ -249,41 +166,33 @@ class ActiveDirectoryGroupIngestionService:
         # Based on Active Directory LDAP schema for groups
         significant_fields = {
             # Core identifiers
-            "name": self._normalize_ldap_attribute(group_data.get("name")),
-            "cn": self._normalize_ldap_attribute(group_data.get("cn")),
-            "sAMAccountName": self._normalize_ldap_attribute(
-                group_data.get("sAMAccountName")
-            ),
-            "distinguishedName": self._normalize_ldap_attribute(
+            "name": normalize_ldap_value(group_data.get("name")),
+            "cn": normalize_ldap_value(group_data.get("cn")),
+            "sAMAccountName": normalize_ldap_value(group_data.get("sAMAccountName")),
+            "distinguishedName": normalize_ldap_value(
                 group_data.get("distinguishedName")
             ),
-            "objectGUID": self._normalize_ldap_attribute(group_data.get("objectGUID")),
-            "objectSid": self._normalize_ldap_attribute(group_data.get("objectSid")),
+            "objectGUID": normalize_ldap_value(group_data.get("objectGUID")),
+            "objectSid": normalize_ldap_value(group_data.get("objectSid")),
             # Group membership
-            "member": self._normalize_ldap_attribute(group_data.get("member")),
-            "memberOf": self._normalize_ldap_attribute(group_data.get("memberOf")),
-            # Group metadata
-            "description": self._normalize_ldap_attribute(
-                group_data.get("description")
-            ),
-            "groupType": self._normalize_ldap_attribute(group_data.get("groupType")),
-            "sAMAccountType": self._normalize_ldap_attribute(
-                group_data.get("sAMAccountType")
+            "member": (
+                member_value
+                if member_value is not None
+                else normalize_membership(group_data.get("member"))
             ),
+            "memberOf": normalize_ldap_value(group_data.get("memberOf")),
+            # Group metadata
+            "description": normalize_ldap_value(group_data.get("description")),
+            "groupType": normalize_ldap_value(group_data.get("groupType")),
+            "sAMAccountType": normalize_ldap_value(group_data.get("sAMAccountType")),
             # Group category and object class
-            "objectCategory": self._normalize_ldap_attribute(
-                group_data.get("objectCategory")
-            ),
-            "objectClass": self._normalize_ldap_attribute(
-                group_data.get("objectClass")
-            ),
+            "objectCategory": normalize_ldap_value(group_data.get("objectCategory")),
+            "objectClass": normalize_ldap_value(group_data.get("objectClass")),
             # Instance type
-            "instanceType": self._normalize_ldap_attribute(
-                group_data.get("instanceType")
-            ),
+            "instanceType": normalize_ldap_value(group_data.get("instanceType")),
             # Historical data
-            "sIDHistory": self._normalize_ldap_attribute(group_data.get("sIDHistory")),
-            "proxiedObjectName": self._normalize_ldap_attribute(
+            "sIDHistory": normalize_ldap_value(group_data.get("sIDHistory")),
+            "proxiedObjectName": normalize_ldap_value(
                 group_data.get("proxiedObjectName")
             ),
         }
@@ -303,7 +212,7 @@ class ActiveDirectoryGroupIngestionService:
         content_hash = hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
 
         name = group_data.get("name", "unknown")
-        object_guid = self._normalize_ldap_attribute(group_data.get("objectGUID"))
+        object_guid = normalize_ldap_value(group_data.get("objectGUID"))
         # logger.debug(
         #     f"Content hash for group {name} (objectGUID: {object_guid}): {content_hash}"
         # )
@@ -539,6 +448,7 @@ class ActiveDirectoryGroupIngestionService:
                 scope="subtree",
                 attributes=None,  # Return all attributes
                 use_pagination=True,
+                complete_ranges=False,
             )
 
             if not raw_groups:
@@ -553,11 +463,9 @@ class ActiveDirectoryGroupIngestionService:
             for group_data in raw_groups:
                 try:
                     # Extract group identifiers
-                    name = self._normalize_ldap_attribute(group_data.get("name"))
-                    object_guid = self._normalize_ldap_attribute(
-                        group_data.get("objectGUID")
-                    )
-                    sam_account_name = self._normalize_ldap_attribute(
+                    name = normalize_ldap_value(group_data.get("name"))
+                    object_guid = normalize_ldap_value(group_data.get("objectGUID"))
+                    sam_account_name = normalize_ldap_value(
                         group_data.get("sAMAccountName")
                     )
 
@@ -568,14 +476,28 @@ class ActiveDirectoryGroupIngestionService:
                         )
                         continue
 
+                    # Groups above MaxValRange return 'member;range=0-1499'.
+                    # Their membership is hashed page by page as it streams in;
+                    # the full list is only fetched if the group is stored.
+                    ranged_membership = digest_ranged_membership(
+                        self.ldap_adapter, group_data, "member"
+                    )
+                    self.ldap_adapter.complete_ranged_attributes(
+                        group_data, exclude=("member",)
+                    )
+
                     # Track analytics for reporting
                     # Count members
-                    members = group_data.get("member")
-                    if members:
+                    if ranged_membership is not None:
+                        member_value, member_count = ranged_membership
+                    else:
+                        member_value = None
+                        members = group_data.get("member")
                         if isinstance(members, list):
                             member_count = len(members)
                         else:
-                            member_count = 1
+                            member_count = 1 if members else 0
+                    if member_count:
                         ingestion_stats["total_members"] += member_count
                         ingestion_stats["groups_with_members"] += 1
 
@@ -599,7 +521,9 @@ class ActiveDirectoryGroupIngestionService:
                                 ingestion_stats["distribution_groups"] += 1
 
                     # Calculate content hash for this group
-                    current_hash = self._calculate_group_content_hash(group_data)
+                    current_hash = self._calculate_group_content_hash(
+                        group_data, member_value
+                    )
 
                     # Check if this group is new or has changed
                     existing_hash = existing_hashes.get(object_guid)
@@ -636,6 +560,9 @@ class ActiveDirectoryGroupIngestionService:
                         if dry_run:
                             logger.info(f"[DRY RUN] Would insert group: {name} ({object_guid})")
                         else:
+                            # Fetch the rest of a ranged member list for storage
+                            self.ldap_adapter.complete_ranged_attributes(group_data)
+
                             # Normalize all raw data for JSON serialization
                             # This converts datetime, bytes, and other non-JSON types
                             normalized_data = self._normalize_raw_data_for_json(group_data)
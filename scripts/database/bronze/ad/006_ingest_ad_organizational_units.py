@@ -33,7 +33,6 @@ expensive to recreate later.
 """
 
 import argparse
-import base64
 import hashlib
 import json
 import logging
@@ -62,6 +61,7 @@ from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter, create_postgres_adapter
 from ldap.adapters.ldap_adapter import LDAPAdapter
+from ldap.normalizer import LDAPNormalizer, normalize_ldap_value
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -146,6 +146,9 @@ class ActiveDirectoryOUIngestionService:
         if not self.ldap_adapter.test_connection():
             raise Exception("Failed to connect to Active Directory LDAP")
 
+        # Per-attribute normalization plans from the server schema
+        self.ldap_normalizer = LDAPNormalizer.from_schema(self.ldap_adapter.get_schema())
+
         # Configure search bases (default to Research & Instrumentation + Workstations)
         self.search_bases = search_bases or [
             "OU=Research and Instrumentation,OU=LSA,OU=Organizations,OU=UMICH,DC=adsroot,DC=itcs,DC=umich,DC=edu",
@@ -158,93 +161,11 @@ class ActiveDirectoryOUIngestionService:
         for search_base in self.search_bases:
             logger.info(f"  - {search_base}")
 
-    def _normalize_ldap_attribute(self, value: Any) -> Any:
-        """
-        Normalize LDAP attribute values for consistent hashing and JSON serialization.
-
-        LDAP attributes can be single values, lists, bytes, or None. Binary fields
-        are converted to base64 to avoid issues with null bytes in PostgreSQL JSON/JSONB.
-
-        Args:
-            value: Raw LDAP attribute value
-
-        Returns:
-            Normalized value suitable for JSON serialization
-        """
-        if value is None:
-            return ""
-        elif isinstance(value, bytes):
-            # Handle binary attributes using base64 encoding
-            try:
-                # Try to decode as UTF-8 for string-like fields
-                decoded = value.decode("utf-8")
-                # Check if it contains null bytes or other problematic characters
-                if "\x00" in decoded or any(
-                    ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                ):
-                    # Contains binary data, use base64
-                    return base64.b64encode(value).decode("ascii")
-                else:
-                    return decoded.strip()
-            except UnicodeDecodeError:
-                # Not valid UTF-8, definitely binary data
-                return base64.b64encode(value).decode("ascii")
-        elif isinstance(value, datetime):
-            # Handle datetime objects
-            return value.isoformat()
-        elif isinstance(value, list):
-            if len(value) == 0:
-                return ""
-            elif len(value) == 1:
-                item = value[0]
-                if isinstance(item, bytes):
-                    try:
-                        decoded = item.decode("utf-8")
-                        if "\x00" in decoded or any(
-                            ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                        ):
-                            return base64.b64encode(item).decode("ascii")
-                        else:
-                            return decoded.strip()
-                    except UnicodeDecodeError:
-                        return base64.b64encode(item).decode("ascii")
-                elif isinstance(item, datetime):
-                    return item.isoformat()
-                else:
-                    return str(item).strip()
-            else:
-                # Sort multi-value attributes for consistent hashing
-                normalized_items = []
-                for item in value:
-                    if isinstance(item, bytes):
-                        try:
-                            decoded = item.decode("utf-8")
-                            if "\x00" in decoded or any(
-                                ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                            ):
-                                normalized_items.append(
-                                    base64.b64encode(item).decode("ascii")
-                                )
-                            else:
-                                normalized_items.append(decoded.strip())
-                        except UnicodeDecodeError:
-                            normalized_items.append(
-                                base64.b64encode(item).decode("ascii")
-                            )
-                    elif isinstance(item, datetime):
-                        normalized_items.append(item.isoformat())
-                    else:
-                        normalized_items.append(str(item).strip())
-                return sorted(normalized_items)
-        else:
-            return str(value).strip()
-
     def _normalize_raw_data_for_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively normalize all values in a dictionary for JSON serialization.
+        Normalize all values in an entry dictionary for JSON serialization.
 
-        This ensures that datetime objects, bytes, and other non-JSON-serializable
-        types are converted before inserting into the database.
+        Uses the per-attribute conversion plans built from the server schema.
 
         Args:
             data: Dictionary with raw LDAP data
@@ -252,10 +173,7 @@ class ActiveDirectoryOUIngestionService:
         Returns:
             Dictionary with all values normalized for JSON serialization
         """
-        normalized = {}
-        for key, value in data.items():
-            normalized[key] = self._normalize_ldap_attribute(value)
-        return normalized
+        return self.ldap_normalizer.normalize_entry(data)
 
     def _parse_ou_hierarchy(self, distinguished_name: str) -> List[str]:
         """
@@ -488,8 +406,8 @@ class ActiveDirectoryOUIngestionService:
         """
         enrichment = {}
 
-        dn = self._normalize_ldap_attribute(ou_data.get("distinguishedName"))
-        ou_name = self._normalize_ldap_attribute(ou_data.get("ou"))
+        dn = normalize_ldap_value(ou_data.get("distinguishedName"))
+        ou_name = normalize_ldap_value(ou_data.get("ou"))
 
         # Hierarchical structure (cheap string parsing)
         hierarchy = self._parse_ou_hierarchy(dn)
@@ -550,40 +468,36 @@ class ActiveDirectoryOUIngestionService:
         # Extract significant fields for change detection
         significant_fields = {
             # Core identifiers
-            "name": self._normalize_ldap_attribute(ou_data.get("name")),
-            "ou": self._normalize_ldap_attribute(ou_data.get("ou")),
-            "distinguishedName": self._normalize_ldap_attribute(
-                ou_data.get("distinguishedName")
-            ),
-            "objectGUID": self._normalize_ldap_attribute(ou_data.get("objectGUID")),
+            "name": normalize_ldap_value(ou_data.get("name")),
+            "ou": normalize_ldap_value(ou_data.get("ou")),
+            "distinguishedName": normalize_ldap_value(ou_data.get("distinguishedName")),
+            "objectGUID": normalize_ldap_value(ou_data.get("objectGUID")),
             # OU metadata
-            "description": self._normalize_ldap_attribute(ou_data.get("description")),
-            "managedBy": self._normalize_ldap_attribute(ou_data.get("managedBy")),
-            "street": self._normalize_ldap_attribute(ou_data.get("street")),
-            "l": self._normalize_ldap_attribute(ou_data.get("l")),  # Locality
-            "postalCode": self._normalize_ldap_attribute(ou_data.get("postalCode")),
+            "description": normalize_ldap_value(ou_data.get("description")),
+            "managedBy": normalize_ldap_value(ou_data.get("managedBy")),
+            "street": normalize_ldap_value(ou_data.get("street")),
+            "l": normalize_ldap_value(ou_data.get("l")),  # Locality
+            "postalCode": normalize_ldap_value(ou_data.get("postalCode")),
             # Group policy
-            "gPLink": self._normalize_ldap_attribute(ou_data.get("gPLink")),
-            "gPOptions": self._normalize_ldap_attribute(ou_data.get("gPOptions")),
+            "gPLink": normalize_ldap_value(ou_data.get("gPLink")),
+            "gPOptions": normalize_ldap_value(ou_data.get("gPOptions")),
             # Object metadata
-            "objectCategory": self._normalize_ldap_attribute(
-                ou_data.get("objectCategory")
-            ),
-            "objectClass": self._normalize_ldap_attribute(ou_data.get("objectClass")),
+            "objectCategory": normalize_ldap_value(ou_data.get("objectCategory")),
+            "objectClass": normalize_ldap_value(ou_data.get("objectClass")),
             # Timestamps
-            "whenCreated": self._normalize_ldap_attribute(ou_data.get("whenCreated")),
-            "whenChanged": self._normalize_ldap_attribute(ou_data.get("whenChanged")),
+            "whenCreated": normalize_ldap_value(ou_data.get("whenCreated")),
+            "whenChanged": normalize_ldap_value(ou_data.get("whenChanged")),
             # USN (Update Sequence Number) for change tracking
-            "uSNCreated": self._normalize_ldap_attribute(ou_data.get("uSNCreated")),
-            "uSNChanged": self._normalize_ldap_attribute(ou_data.get("uSNChanged")),
+            "uSNCreated": normalize_ldap_value(ou_data.get("uSNCreated")),
+            "uSNChanged": normalize_ldap_value(ou_data.get("uSNChanged")),
             # Directory replication metadata
-            "dSCorePropagationData": self._normalize_ldap_attribute(
+            "dSCorePropagationData": normalize_ldap_value(
                 ou_data.get("dSCorePropagationData")
             ),
             # Instance type
-            "instanceType": self._normalize_ldap_attribute(ou_data.get("instanceType")),
+            "instanceType": normalize_ldap_value(ou_data.get("instanceType")),
             # System flags
-            "systemFlags": self._normalize_ldap_attribute(ou_data.get("systemFlags")),
+            "systemFlags": normalize_ldap_value(ou_data.get("systemFlags")),
             # Enrichment metadata (changes to children trigger new record)
             "_direct_computer_count": enrichment.get("_direct_computer_count"),
             "_child_ou_count": enrichment.get("_child_ou_count"),
@@ -599,7 +513,7 @@ class ActiveDirectoryOUIngestionService:
         content_hash = hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
 
         name = ou_data.get("name", "unknown")
-        object_guid = self._normalize_ldap_attribute(ou_data.get("objectGUID"))
+        object_guid = normalize_ldap_value(ou_data.get("objectGUID"))
         logger.debug(
             f"Content hash for OU {name} (objectGUID: {object_guid}): {content_hash}"
         )
@@ -981,14 +895,10 @@ class ActiveDirectoryOUIngestionService:
             for ou_data in all_ous:
                 try:
                     # Extract OU identifiers
-                    name = self._normalize_ldap_attribute(ou_data.get("name"))
-                    object_guid = self._normalize_ldap_attribute(
-                        ou_data.get("objectGUID")
-                    )
-                    ou_name = self._normalize_ldap_attribute(ou_data.get("ou"))
-                    dn = self._normalize_ldap_attribute(
-                        ou_data.get("distinguishedName")
-                    )
+                    name = normalize_ldap_value(ou_data.get("name"))
+                    object_guid = normalize_ldap_value(ou_data.get("objectGUID"))
+                    ou_name = normalize_ldap_value(ou_data.get("ou"))
+                    dn = normalize_ldap_value(ou_data.get("distinguishedName"))
 
                     # Skip if no objectGUID (required as external_id)
                     if not object_guid:
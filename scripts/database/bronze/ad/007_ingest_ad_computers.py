@@ -19,7 +19,6 @@ IMPORTANT: Many LDAP attributes can be either strings or lists of strings depend
 the computer record. The normalization functions handle this appropriately.
 """
 
-import base64
 import hashlib
 import json
 import logging
@@ -46,6 +45,7 @@ from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter, create_postgres_adapter
 from ldap.adapters.ldap_adapter import LDAPAdapter
+from ldap.normalizer import LDAPNormalizer, normalize_ldap_value
 
 # Set up logging (will be reconfigured in main() with proper directory)
 logger = logging.getLogger(__name__)
@@ -93,104 +93,18 @@ class ActiveDirectoryComputerIngestionService:
         if not self.ldap_adapter.test_connection():
             raise Exception("Failed to connect to Active Directory LDAP")
 
+        # Per-attribute normalization plans from the server schema
+        self.ldap_normalizer = LDAPNormalizer.from_schema(self.ldap_adapter.get_schema())
+
         logger.info(
             "Active Directory computer ingestion service initialized with content hashing"
         )
 
-    def _normalize_ldap_attribute(self, value: Any) -> Any:
-        """
-        Normalize LDAP attribute values for consistent hashing and JSON serialization.
-
-        LDAP attributes can be single values, lists, bytes, or None. Many Active Directory
-        computer attributes like memberOf, servicePrincipalName can be either strings
-        or lists depending on the computer.
-
-        Binary fields (userCertificate, msDS-KeyCredentialLink, etc.) are converted to base64
-        to avoid issues with null bytes in PostgreSQL JSON/JSONB fields.
-
-        Args:
-            value: Raw LDAP attribute value
-
-        Returns:
-            Normalized value suitable for JSON serialization
-        """
-        if value is None:
-            return ""
-        elif isinstance(value, bytes):
-            # Handle binary attributes using base64 encoding
-            # This avoids null byte issues with PostgreSQL JSON/JSONB
-            # Fields like userCertificate, msDS-KeyCredentialLink contain binary data
-            try:
-                # Try to decode as UTF-8 for string-like fields (objectGUID)
-                decoded = value.decode("utf-8")
-                # Check if it contains null bytes or other problematic characters
-                if "\x00" in decoded or any(
-                    ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                ):
-                    # Contains binary data, use base64
-                    return base64.b64encode(value).decode("ascii")
-                else:
-                    return decoded.strip()
-            except UnicodeDecodeError:
-                # Not valid UTF-8, definitely binary data
-                return base64.b64encode(value).decode("ascii")
-        elif isinstance(value, datetime):
-            # Handle datetime objects
-            return value.isoformat()
-        elif isinstance(value, list):
-            if len(value) == 0:
-                return ""
-            elif len(value) == 1:
-                item = value[0]
-                if isinstance(item, bytes):
-                    # Same binary handling for list items
-                    try:
-                        decoded = item.decode("utf-8")
-                        if "\x00" in decoded or any(
-                            ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                        ):
-                            return base64.b64encode(item).decode("ascii")
-                        else:
-                            return decoded.strip()
-                    except UnicodeDecodeError:
-                        return base64.b64encode(item).decode("ascii")
-                elif isinstance(item, datetime):
-                    return item.isoformat()
-                else:
-                    return str(item).strip()
-            else:
-                # Sort multi-value attributes for consistent hashing
-                normalized_items = []
-                for item in value:
-                    if isinstance(item, bytes):
-                        try:
-                            decoded = item.decode("utf-8")
-                            if "\x00" in decoded or any(
-                                ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                            ):
-                                normalized_items.append(
-                                    base64.b64encode(item).decode("ascii")
-                                )
-                            else:
-                                normalized_items.append(decoded.strip())
-                        except UnicodeDecodeError:
-                            normalized_items.append(
-                                base64.b64encode(item).decode("ascii")
-                            )
-                    elif isinstance(item, datetime):
-                        normalized_items.append(item.isoformat())
-                    else:
-                        normalized_items.append(str(item).strip())
-                return sorted(normalized_items)
-        else:
-            return str(value).strip()
-
     def _normalize_raw_data_for_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively normalize all values in a dictionary for JSON serialization.
+        Normalize all values in an entry dictionary for JSON serialization.
 
-        This ensures that datetime objects, bytes, and other non-JSON-serializable
-        types are converted before inserting into the database.
+        Uses the per-attribute conversion plans built from the server schema.
 
         Args:
             data: Dictionary with raw LDAP data
@@ -198,10 +112,7 @@ class ActiveDirectoryComputerIngestionService:
         Returns:
             Dictionary with all values normalized for JSON serialization
         """
-        normalized = {}
-        for key, value in data.items():
-            normalized[key] = self._normalize_ldap_attribute(value)
-        return normalized
+        return self.ldap_normalizer.normalize_entry(data)
 
     def _calculate_computer_content_hash(self, computer_data: Dict[str, Any]) -> str:
         """
@@ -221,94 +132,70 @@ class ActiveDirectoryComputerIngestionService:
         # Based on Active Directory LDAP schema for computers
         significant_fields = {
             # Core identifiers
-            "name": self._normalize_ldap_attribute(computer_data.get("name")),
-            "cn": self._normalize_ldap_attribute(computer_data.get("cn")),
-            "sAMAccountName": self._normalize_ldap_attribute(
-                computer_data.get("sAMAccountName")
-            ),
-            "distinguishedName": self._normalize_ldap_attribute(
+            "name": normalize_ldap_value(computer_data.get("name")),
+            "cn": normalize_ldap_value(computer_data.get("cn")),
+            "sAMAccountName": normalize_ldap_value(computer_data.get("sAMAccountName")),
+            "distinguishedName": normalize_ldap_value(
                 computer_data.get("distinguishedName")
             ),
-            "objectGUID": self._normalize_ldap_attribute(
-                computer_data.get("objectGUID")
-            ),
-            "objectSid": self._normalize_ldap_attribute(computer_data.get("objectSid")),
-            "dNSHostName": self._normalize_ldap_attribute(
-                computer_data.get("dNSHostName")
-            ),
+            "objectGUID": normalize_ldap_value(computer_data.get("objectGUID")),
+            "objectSid": normalize_ldap_value(computer_data.get("objectSid")),
+            "dNSHostName": normalize_ldap_value(computer_data.get("dNSHostName")),
             # Computer group memberships
-            "memberOf": self._normalize_ldap_attribute(computer_data.get("memberOf")),
+            "memberOf": normalize_ldap_value(computer_data.get("memberOf")),
             # Operating system information
-            "operatingSystem": self._normalize_ldap_attribute(
+            "operatingSystem": normalize_ldap_value(
                 computer_data.get("operatingSystem")
             ),
-            "operatingSystemVersion": self._normalize_ldap_attribute(
+            "operatingSystemVersion": normalize_ldap_value(
                 computer_data.get("operatingSystemVersion")
             ),
             # Computer account control and type
-            "userAccountControl": self._normalize_ldap_attribute(
+            "userAccountControl": normalize_ldap_value(
                 computer_data.get("userAccountControl")
             ),
-            "sAMAccountType": self._normalize_ldap_attribute(
-                computer_data.get("sAMAccountType")
-            ),
+            "sAMAccountType": normalize_ldap_value(computer_data.get("sAMAccountType")),
             # Timestamps (ONLY include meaningful business timestamps)
             # EXCLUDED: lastLogon, lastLogonTimestamp, badPasswordTime (change on every login)
             # EXCLUDED: whenChanged (changes automatically without meaningful updates)
-            "pwdLastSet": self._normalize_ldap_attribute(
-                computer_data.get("pwdLastSet")
-            ),
-            "whenCreated": self._normalize_ldap_attribute(
-                computer_data.get("whenCreated")
-            ),
-            "accountExpires": self._normalize_ldap_attribute(
-                computer_data.get("accountExpires")
-            ),
+            "pwdLastSet": normalize_ldap_value(computer_data.get("pwdLastSet")),
+            "whenCreated": normalize_ldap_value(computer_data.get("whenCreated")),
+            "accountExpires": normalize_ldap_value(computer_data.get("accountExpires")),
             # Service principal names
-            "servicePrincipalName": self._normalize_ldap_attribute(
+            "servicePrincipalName": normalize_ldap_value(
                 computer_data.get("servicePrincipalName")
             ),
             # Computer category and object class
-            "objectCategory": self._normalize_ldap_attribute(
-                computer_data.get("objectCategory")
-            ),
-            "objectClass": self._normalize_ldap_attribute(
-                computer_data.get("objectClass")
-            ),
+            "objectCategory": normalize_ldap_value(computer_data.get("objectCategory")),
+            "objectClass": normalize_ldap_value(computer_data.get("objectClass")),
             # EXCLUDED: uSNCreated, uSNChanged (auto-increment on every AD change)
             # EXCLUDED: dSCorePropagationData (replication metadata, not business data)
             # EXCLUDED: logonCount, badPwdCount (change frequently without meaningful updates)
             # Instance type
-            "instanceType": self._normalize_ldap_attribute(
-                computer_data.get("instanceType")
-            ),
+            "instanceType": normalize_ldap_value(computer_data.get("instanceType")),
             # Primary group
-            "primaryGroupID": self._normalize_ldap_attribute(
-                computer_data.get("primaryGroupID")
-            ),
+            "primaryGroupID": normalize_ldap_value(computer_data.get("primaryGroupID")),
             # Certificate and key credentials
-            "userCertificate": self._normalize_ldap_attribute(
+            "userCertificate": normalize_ldap_value(
                 computer_data.get("userCertificate")
             ),
-            "msDS-KeyCredentialLink": self._normalize_ldap_attribute(
+            "msDS-KeyCredentialLink": normalize_ldap_value(
                 computer_data.get("msDS-KeyCredentialLink")
             ),
             # Additional metadata
-            "isCriticalSystemObject": self._normalize_ldap_attribute(
+            "isCriticalSystemObject": normalize_ldap_value(
                 computer_data.get("isCriticalSystemObject")
             ),
-            "localPolicyFlags": self._normalize_ldap_attribute(
+            "localPolicyFlags": normalize_ldap_value(
                 computer_data.get("localPolicyFlags")
             ),
-            "msDS-SupportedEncryptionTypes": self._normalize_ldap_attribute(
+            "msDS-SupportedEncryptionTypes": normalize_ldap_value(
                 computer_data.get("msDS-SupportedEncryptionTypes")
             ),
-            "countryCode": self._normalize_ldap_attribute(
-                computer_data.get("countryCode")
-            ),
-            "codePage": self._normalize_ldap_attribute(computer_data.get("codePage")),
+            "countryCode": normalize_ldap_value(computer_data.get("countryCode")),
+            "codePage": normalize_ldap_value(computer_data.get("codePage")),
             # LAPS password expiration (if used)
-            "ms-Mcs-AdmPwdExpirationTime": self._normalize_ldap_attribute(
+            "ms-Mcs-AdmPwdExpirationTime": normalize_ldap_value(
                 computer_data.get("ms-Mcs-AdmPwdExpirationTime")
             ),
         }
@@ -322,7 +209,7 @@ class ActiveDirectoryComputerIngestionService:
         content_hash = hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
 
         name = computer_data.get("name", "unknown")
-        object_guid = self._normalize_ldap_attribute(computer_data.get("objectGUID"))
+        object_guid = normalize_ldap_value(computer_data.get("objectGUID"))
         logger.debug(
             f"Content hash for computer {name} (objectGUID: {object_guid}): {content_hash}"
         )
@@ -517,7 +404,11 @@ class ActiveDirectoryComputerIngestionService:
             logger.error(f"Failed to complete ingestion run: {e}")
 
     def ingest_incremental(
-        self, full_sync: bool = False, dry_run: bool = False, batch_size: int = 500
+        self,
+        full_sync: bool = False,
+        dry_run: bool = False,
+        batch_size: int = 500,
+        two_phase: bool = False,
     ) -> Dict[str, Any]:
         """
         Ingest University of Michigan Active Directory computers using intelligent content hashing.
@@ -534,6 +425,8 @@ class ActiveDirectoryComputerIngestionService:
             full_sync: If True, process all computers. If False, use incremental mode.
             dry_run: If True, preview changes without committing to database.
             batch_size: Number of records to process per batch.
+            two_phase: If True, fetch only the hash attribute set first and
+                       full attributes only for computers whose hash changed.
 
         Returns:
             Dictionary with comprehensive ingestion statistics
@@ -586,15 +479,38 @@ class ActiveDirectoryComputerIngestionService:
                 f"Fetching computer data from Active Directory LDAP ({search_base})..."
             )
 
-            # Request all attributes for comprehensive computer data
-            # Note: using attributes=None returns all available attributes
-            raw_computers = self.ldap_adapter.search_as_dicts(
-                search_filter="(objectClass=computer)",
-                search_base=search_base,
-                scope="subtree",
-                attributes=None,  # Return all attributes
-                use_pagination=True,
-            )
+            if two_phase:
+                # Phase 1 reads only the attributes the content hash uses;
+                # full attributes are fetched only for new/changed computers
+                def needs_full_fetch(computer: Dict[str, Any]) -> bool:
+                    object_guid = normalize_ldap_value(computer.get("objectGUID"))
+                    return existing_hashes.get(
+                        object_guid
+                    ) != self._calculate_computer_content_hash(computer)
+
+                raw_computers = [
+                    computer
+                    for page in self.ldap_adapter.search_two_phase_generator(
+                        search_filter="(objectClass=computer)",
+                        search_base=search_base,
+                        scope="subtree",
+                        hash_attributes=self.ldap_adapter.get_attribute_profile(
+                            "ad_computer", "hash_only"
+                        ),
+                        needs_full_fetch=needs_full_fetch,
+                    )
+                    for computer in page
+                ]
+            else:
+                # Request all attributes for comprehensive computer data
+                # Note: using attributes=None returns all available attributes
+                raw_computers = self.ldap_adapter.search_as_dicts(
+                    search_filter="(objectClass=computer)",
+                    search_base=search_base,
+                    scope="subtree",
+                    attributes=None,  # Return all attributes
+                    use_pagination=True,
+                )
 
             if not raw_computers:
                 logger.warning("No computers found in Active Directory LDAP")
@@ -611,14 +527,12 @@ class ActiveDirectoryComputerIngestionService:
             for computer_data in raw_computers:
                 try:
                     # Extract computer identifiers
-                    name = self._normalize_ldap_attribute(computer_data.get("name"))
-                    object_guid = self._normalize_ldap_attribute(
-                        computer_data.get("objectGUID")
-                    )
-                    sam_account_name = self._normalize_ldap_attribute(
+                    name = normalize_ldap_value(computer_data.get("name"))
+                    object_guid = normalize_ldap_value(computer_data.get("objectGUID"))
+                    sam_account_name = normalize_ldap_value(
                         computer_data.get("sAMAccountName")
                     )
-                    dns_hostname = self._normalize_ldap_attribute(
+                    dns_hostname = normalize_ldap_value(
                         computer_data.get("dNSHostName")
                     )
 
@@ -1023,6 +937,11 @@ def main():
         default=500,
         help="Number of records to process per batch (default: 500)",
     )
+    parser.add_argument(
+        "--two-phase",
+        action="store_true",
+        help="Fetch only hash attributes first, then full attributes for changed computers",
+    )
     args = parser.parse_args()
 
     try:
@@ -1082,10 +1001,14 @@ def main():
         logger.info(f"   Mode: {'FULL SYNC' if args.full_sync else 'INCREMENTAL'}")
         logger.info(f"   Dry Run: {args.dry_run}")
         logger.info(f"   Batch Size: {args.batch_size}")
+        logger.info(f"   Two-Phase: {args.two_phase}")
         logger.info("=" * 80)
 
         results = ingestion_service.ingest_incremental(
-            full_sync=args.full_sync, dry_run=args.dry_run, batch_size=args.batch_size
+            full_sync=args.full_sync,
+            dry_run=args.dry_run,
+            batch_size=args.batch_size,
+            two_phase=args.two_phase,
         )
 
         # Calculate duration
@@ -46,6 +46,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter
+from database.hashing import column_content_hashes, normalize_column
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -68,6 +69,9 @@ logger = logging.getLogger(__name__)
 DATA_FOLDER = os.environ.get("LSATS_DATA_FOLDER", "/var/lsats/data")
 FILE_PATTERN = "lab_awards*.csv"
 
+# Number of CSV rows read, hashed and written per chunk
+DEFAULT_CHUNK_SIZE = 50_000
+
 
 class LabAwardsIngestionService:
     """
@@ -91,12 +95,46 @@ class LabAwardsIngestionService:
     - Detailed ingestion statistics and monitoring
     """
 
+    # Fields included in the content hash
+    HASH_FIELDS = (
+        "Award Id",
+        "Project/Grant",
+        "Award Title",
+        "Person Role",
+        "Person Last Name",
+        "Person First Name",
+        "Person Uniqname",
+        "Person Appt Department Id",
+        "Person Appt Department",
+        "Person Appt School/College",
+        "Award Admin Department",
+        "Award Admin School/College",
+        "Award Project Start Date",
+        "Award Project End Date",
+        "Pre NCE Project End Date",
+        "Award Direct Dollars",
+        "Award Indirect Dollars",
+        "Award Total Dollars",
+        "Facilities & Admin Rate (%)",
+        "Direct Sponsor Name",
+        "Direct Sponsor Award Reference Number\n(Current Budget Period)",
+        "Direct Sponsor Category",
+        "Direct Sponsor Subcategory",
+        "Prime Sponsor Name",
+        "Prime Sponsor Award Reference Number",
+        "Prime Sponsor Category",
+        "Prime Sponsor Subcategory",
+        "Award Publish Date",
+        "Award Class",
+    )
+
     def __init__(
         self,
         database_url: str,
         data_folder: str = DATA_FOLDER,
         force_full_sync: bool = False,
         dry_run: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
         """
         Initialize the lab awards ingestion service.
@@ -106,6 +144,7 @@ class LabAwardsIngestionService:
             data_folder: Path to folder containing CSV files (default: 'data')
             force_full_sync: If True, bypass timestamp filtering (not used for content hash but kept for standard)
             dry_run: If True, preview changes without committing to database
+            chunk_size: Number of CSV rows read and processed at a time
         """
         self.db_adapter = PostgresAdapter(
             database_url=database_url, pool_size=5, max_overflow=10
@@ -113,6 +152,7 @@ class LabAwardsIngestionService:
         self.data_folder = data_folder
         self.force_full_sync = force_full_sync
         self.dry_run = dry_run
+        self.chunk_size = chunk_size
 
         logger.info(
             f"Lab awards ingestion service initialized with data folder: {data_folder} "
@@ -182,6 +222,39 @@ class LabAwardsIngestionService:
             normalized[key] = self._normalize_value(value)
         return normalized
 
+    def _infer_csv_dtypes(self, source_file: str) -> Dict[str, Any]:
+        """
+        Infer one dtype per CSV column across the whole file, in bounded memory.
+
+        pandas infers dtypes per chunk, so a column such as Person Appt
+        Department Id could parse as int in one chunk and float in another,
+        changing composite IDs and hashes. This scans the file once and
+        applies the rules a whole-file read would: any text makes a column
+        text, otherwise any float (or missing value) makes it float.
+
+        Args:
+            source_file: Path to the CSV file
+
+        Returns:
+            Mapping of column name to dtype, for use with pd.read_csv(dtype=...)
+        """
+        kinds: Dict[str, set] = {}
+        for chunk in pd.read_csv(source_file, chunksize=self.chunk_size):
+            for column, dtype in chunk.dtypes.items():
+                kinds.setdefault(column, set()).add(dtype.kind)
+
+        dtypes = {}
+        for column, column_kinds in kinds.items():
+            if column_kinds <= {"i", "u"}:
+                dtypes[column] = "int64"
+            elif column_kinds <= {"i", "u", "f"}:
+                dtypes[column] = "float64"
+            elif column_kinds == {"b"}:
+                dtypes[column] = "bool"
+            else:
+                dtypes[column] = "str"
+        return dtypes
+
     def _calculate_award_content_hash(self, award_data: Dict[str, Any]) -> str:
         """
         Calculate a content hash for lab award data to detect meaningful changes.
@@ -205,41 +278,7 @@ class LabAwardsIngestionService:
             return self._normalize_value(award_data.get(key))
 
         # Extract significant fields for change detection
-        significant_fields = {
-            "Award Id": get_value("Award Id"),
-            "Project/Grant": get_value("Project/Grant"),
-            "Award Title": get_value("Award Title"),
-            "Person Role": get_value("Person Role"),
-            "Person Last Name": get_value("Person Last Name"),
-            "Person First Name": get_value("Person First Name"),
-            "Person Uniqname": get_value("Person Uniqname"),
-            "Person Appt Department Id": get_value("Person Appt Department Id"),
-            "Person Appt Department": get_value("Person Appt Department"),
-            "Person Appt School/College": get_value("Person Appt School/College"),
-            "Award Admin Department": get_value("Award Admin Department"),
-            "Award Admin School/College": get_value("Award Admin School/College"),
-            "Award Project Start Date": get_value("Award Project Start Date"),
-            "Award Project End Date": get_value("Award Project End Date"),
-            "Pre NCE Project End Date": get_value("Pre NCE Project End Date"),
-            "Award Direct Dollars": get_value("Award Direct Dollars"),
-            "Award Indirect Dollars": get_value("Award Indirect Dollars"),
-            "Award Total Dollars": get_value("Award Total Dollars"),
-            "Facilities & Admin Rate (%)": get_value("Facilities & Admin Rate (%)"),
-            "Direct Sponsor Name": get_value("Direct Sponsor Name"),
-            "Direct Sponsor Award Reference Number\n(Current Budget Period)": get_value(
-                "Direct Sponsor Award Reference Number\n(Current Budget Period)"
-            ),
-            "Direct Sponsor Category": get_value("Direct Sponsor Category"),
-            "Direct Sponsor Subcategory": get_value("Direct Sponsor Subcategory"),
-            "Prime Sponsor Name": get_value("Prime Sponsor Name"),
-            "Prime Sponsor Award Reference Number": get_value(
-                "Prime Sponsor Award Reference Number"
-            ),
-            "Prime Sponsor Category": get_value("Prime Sponsor Category"),
-            "Prime Sponsor Subcategory": get_value("Prime Sponsor Subcategory"),
-            "Award Publish Date": get_value("Award Publish Date"),
-            "Award Class": get_value("Award Class"),
-        }
+        significant_fields = {field: get_value(field) for field in self.HASH_FIELDS}
 
         # Create normalized JSON for consistent hashing
         normalized_json = json.dumps(
@@ -290,15 +329,21 @@ class LabAwardsIngestionService:
 
             results_df = self.db_adapter.query_to_dataframe(query)
 
-            # Calculate content hashes for existing records
+            # Calculate content hashes for existing records in one batch.
+            # external_id is already in Award ID-Person Uniqname-Dept ID format.
+            # JSONB comes back as dicts; dtype=object keeps JSON integers as
+            # ints so the hashes match those computed from the CSV file.
             existing_hashes = {}
-            for _, row in results_df.iterrows():
-                composite_id = row[
-                    "external_id"
-                ]  # Already in Award ID-Person Uniqname-Dept ID format
-                raw_data = row["raw_data"]  # JSONB comes back as dict
-                content_hash = self._calculate_award_content_hash(raw_data)
-                existing_hashes[composite_id] = content_hash
+            if not results_df.empty:
+                stored_df = pd.DataFrame(
+                    results_df["raw_data"].tolist(), dtype=object
+                )
+                existing_hashes = dict(
+                    zip(
+                        results_df["external_id"],
+                        column_content_hashes(stored_df, self.HASH_FIELDS),
+                    )
+                )
 
             logger.info(
                 f"Retrieved content hashes for {len(existing_hashes)} existing lab award records"
@@ -500,182 +545,33 @@ class LabAwardsIngestionService:
             # Step 2: Get existing award content hashes from bronze layer
             existing_hashes = self._get_existing_award_hashes()
 
-            # Step 3: Read data from CSV file
-            logger.info(f"Reading award data from {source_file}...")
-            df = pd.read_csv(source_file)
+            # Step 3: Read data from CSV file in bounded-memory chunks, with
+            # dtypes fixed across chunks so IDs and hashes stay stable
+            logger.info(
+                f"Reading award data from {source_file} in chunks of {self.chunk_size}..."
+            )
+            dtypes = self._infer_csv_dtypes(source_file)
+            chunks = pd.read_csv(source_file, dtype=dtypes, chunksize=self.chunk_size)
+
+            # Step 4: Detect changes and write each chunk in bulk
+            for chunk_number, df in enumerate(chunks, start=1):
+                ingestion_stats["records_read_from_file"] += len(df)
+                self._ingest_award_chunk(
+                    df, existing_hashes, run_id, source_file, ingestion_stats
+                )
+                logger.info(
+                    f"Progress: chunk {chunk_number}, {ingestion_stats['records_processed']} awards processed "
+                    f"({ingestion_stats['records_created']} new/changed, "
+                    f"{ingestion_stats['records_skipped_unchanged']} unchanged)"
+                )
 
-            if df.empty:
+            if ingestion_stats["records_read_from_file"] == 0:
                 logger.warning("No awards found in CSV file")
                 return ingestion_stats
 
-            logger.info(f"Retrieved {len(df)} award records from CSV file")
-            ingestion_stats["records_read_from_file"] = len(df)
-
-            # Step 4: Process each award with content hash change detection
-            for idx, row in df.iterrows():
-                try:
-                    award_data = row.to_dict()
-
-                    # Extract award identifiers
-                    award_id = self._normalize_value(award_data.get("Award Id"))
-                    person_uniqname = self._normalize_value(
-                        award_data.get("Person Uniqname")
-                    )
-                    person_dept_id = self._normalize_value(
-                        award_data.get("Person Appt Department Id")
-                    )
-                    award_title = self._normalize_value(award_data.get("Award Title"))
-
-                    # Skip if missing required fields for composite external_id
-                    if not award_id:
-                        logger.warning(
-                            f"Skipping row {idx} - missing Award ID for award: {award_title}"
-                        )
-                        continue
-
-                    if not person_uniqname:
-                        logger.warning(
-                            f"Skipping row {idx} - missing Person Uniqname for award: {award_id}"
-                        )
-                        continue
-
-                    if not person_dept_id:
-                        logger.warning(
-                            f"Skipping row {idx} - missing Person Appt Department Id for award: {award_id}, person: {person_uniqname}"
-                        )
-                        continue
-
-                    # Construct composite external_id: Award ID-Person Uniqname-Person Appt Department Id
-                    composite_id = f"{award_id}-{person_uniqname}-{person_dept_id}"
-
-                    # Track analytics for reporting
-                    award_class = self._normalize_value(award_data.get("Award Class"))
-                    if award_class:
-                        ingestion_stats["award_classes"][award_class] = (
-                            ingestion_stats["award_classes"].get(award_class, 0) + 1
-                        )
-
-                    sponsor = self._normalize_value(
-                        award_data.get("Direct Sponsor Name")
-                    )
-                    if sponsor:
-                        ingestion_stats["sponsors"][sponsor] = (
-                            ingestion_stats["sponsors"].get(sponsor, 0) + 1
-                        )
-
-                    department = self._normalize_value(
-                        award_data.get("Award Admin Department")
-                    )
-                    if department:
-                        ingestion_stats["departments"][department] = (
-                            ingestion_stats["departments"].get(department, 0) + 1
-                        )
-
-                    # Track financial stats
-                    total_dollars_str = award_data.get("Award Total Dollars")
-                    if pd.notna(total_dollars_str):
-                        # Remove $ and , from dollar amounts
-                        total_dollars_clean = (
-                            str(total_dollars_str).replace("$", "").replace(",", "")
-                        )
-                        try:
-                            total_dollars = float(total_dollars_clean)
-                            ingestion_stats["total_award_dollars"] += total_dollars
-                        except ValueError:
-                            logger.debug(
-                                f"Could not parse Award Total Dollars: {total_dollars_str}"
-                            )
-
-                    # Calculate content hash for this award
-                    current_hash = self._calculate_award_content_hash(award_data)
-
-                    # Check if this award is new or has changed using composite ID
-                    existing_hash = existing_hashes.get(composite_id)
-
-                    logger.debug(f"Checking award: {composite_id}")
-                    logger.debug(f"  Current hash:  {current_hash}")
-                    logger.debug(f"  Existing hash: {existing_hash}")
-
-                    should_insert = False
-
-                    if existing_hash is None:
-                        # This is a completely new award record
-                        logger.info(
-                            f"🆕 New award record detected: {composite_id} - {award_title}"
-                        )
-                        should_insert = True
-                        ingestion_stats["new_awards"] += 1
-
-                    elif existing_hash != current_hash:
-                        # This award record exists but has changed
-                        logger.info(
-                            f"📝 Award record changed: {composite_id} - {award_title}"
-                        )
-                        logger.debug(f"   Old hash: {existing_hash}")
-                        logger.debug(f"   New hash: {current_hash}")
-                        should_insert = True
-                        ingestion_stats["changed_awards"] += 1
-
-                    else:
-                        # This award record exists and hasn't changed - skip it
-                        logger.debug(
-                            f"⏭️  Award record unchanged, skipping: {composite_id}"
-                        )
-                        should_insert = False
-                        ingestion_stats["records_skipped_unchanged"] += 1
-
-                    # Only insert if the award is new or changed
-                    if should_insert:
-                        if self.dry_run:
-                            logger.info(f"[DRY RUN] Would insert award {composite_id}")
-                        else:
-                            # Normalize all raw data for JSON serialization
-                            normalized_data = self._normalize_award_data(award_data)
-
-                            # Enhance with metadata for future reference
-                            normalized_data["_content_hash"] = current_hash
-                            normalized_data["_change_detection"] = "content_hash_based"
-                            normalized_data["_composite_id"] = composite_id
-                            normalized_data["_source_file"] = source_file
-                            normalized_data["_ingestion_timestamp"] = datetime.now(
-                                timezone.utc
-                            ).isoformat()
-
-                            # Insert into bronze layer using composite ID as external_id
-                            entity_id = self.db_adapter.insert_raw_entity(
-                                entity_type="lab_award",
-                                source_system="lab_awards",
-                                external_id=composite_id,
-                                raw_data=normalized_data,
-                                ingestion_run_id=run_id,
-                            )
-
-                        ingestion_stats["records_created"] += 1
-
-                    # Log progress periodically
-                    if (
-                        ingestion_stats["records_processed"] % 100 == 0
-                        and ingestion_stats["records_processed"] > 0
-                    ):
-                        logger.info(
-                            f"Progress: {ingestion_stats['records_processed']} awards processed "
-                            f"({ingestion_stats['records_created']} new/changed, "
-                            f"{ingestion_stats['records_skipped_unchanged']} unchanged)"
-                        )
-
-                except Exception as record_error:
-                    award_id_safe = (
-                        award_data.get("Award Id", "unknown")
-                        if "Award Id" in award_data
-                        else "unknown"
-                    )
-                    error_msg = (
-                        f"Failed to process award {award_id_safe}: {record_error}"
-                    )
-                    logger.error(error_msg)
-                    ingestion_stats["errors"].append(error_msg)
-
-                ingestion_stats["records_processed"] += 1
+            logger.info(
+                f"Retrieved {ingestion_stats['records_read_from_file']} award records from CSV file"
+            )
 
             # Complete the ingestion run
             error_summary = None
@@ -735,6 +631,145 @@ class LabAwardsIngestionService:
 
             raise
 
+    def _ingest_award_chunk(
+        self,
+        df: pd.DataFrame,
+        existing_hashes: Dict[str, str],
+        run_id: str,
+        source_file: str,
+        ingestion_stats: Dict[str, Any],
+    ) -> None:
+        """
+        Run change detection for one chunk of CSV rows and bulk insert the changes.
+
+        Composite IDs, analytics and content hashes are computed over whole
+        columns; new and changed records are found with a single lookup
+        against existing_hashes and written in one bulk insert.
+
+        Args:
+            df: Chunk of award rows as read from the CSV file
+            existing_hashes: Composite ID -> latest content hash in bronze
+            run_id: Ingestion run ID
+            source_file: Path to the source CSV file
+            ingestion_stats: Running statistics, updated in place
+        """
+        award_ids = normalize_column(df["Award Id"])
+        uniqnames = normalize_column(df["Person Uniqname"])
+        dept_ids = normalize_column(df["Person Appt Department Id"])
+
+        # Skip rows missing any part of the composite external_id
+        # (falsy values: None, empty string or zero)
+        missing = pd.Series(False, index=df.index)
+        for label, values in (
+            ("Award ID", award_ids),
+            ("Person Uniqname", uniqnames),
+            ("Person Appt Department Id", dept_ids),
+        ):
+            missing_here = ~missing & (values.isna() | (values == "") | (values == 0))
+            if missing_here.any():
+                logger.warning(
+                    f"Skipping {int(missing_here.sum())} rows - missing {label}"
+                )
+                for idx in df.index[missing_here]:
+                    logger.debug(f"Skipping row {idx} - missing {label}")
+            missing |= missing_here
+
+        if missing.all():
+            return
+        valid = ~missing
+        df = df[valid]
+
+        # Construct composite external_id: Award ID-Person Uniqname-Person Appt Department Id
+        composite_ids = (
+            award_ids[valid].astype(str)
+            + "-"
+            + uniqnames[valid].astype(str)
+            + "-"
+            + dept_ids[valid].astype(str)
+        )
+
+        # Track analytics for reporting
+        for stat_key, column in (
+            ("award_classes", "Award Class"),
+            ("sponsors", "Direct Sponsor Name"),
+            ("departments", "Award Admin Department"),
+        ):
+            if column not in df.columns:
+                continue
+            values = normalize_column(df[column]).dropna()
+            for value, count in values[values != ""].value_counts().items():
+                ingestion_stats[stat_key][value] = (
+                    ingestion_stats[stat_key].get(value, 0) + int(count)
+                )
+
+        # Track financial stats: remove $ and , from dollar amounts
+        if "Award Total Dollars" in df.columns:
+            total_dollars = pd.to_numeric(
+                df["Award Total Dollars"]
+                .dropna()
+                .astype(str)
+                .str.replace(r"[$,]", "", regex=True),
+                errors="coerce",
+            )
+            ingestion_stats["total_award_dollars"] += float(total_dollars.sum())
+
+        # Calculate content hashes for the whole chunk and diff against bronze
+        current_hashes = column_content_hashes(df, self.HASH_FIELDS)
+        existing = composite_ids.map(existing_hashes)
+        is_new = existing.isna()
+        is_changed = ~is_new & (existing != current_hashes)
+        to_insert = is_new | is_changed
+
+        ingestion_stats["records_processed"] += len(df)
+        ingestion_stats["new_awards"] += int(is_new.sum())
+        ingestion_stats["changed_awards"] += int(is_changed.sum())
+        ingestion_stats["records_skipped_unchanged"] += int((~to_insert).sum())
+        ingestion_stats["records_created"] += int(to_insert.sum())
+
+        for composite_id in composite_ids[is_new]:
+            logger.debug(f"🆕 New award record detected: {composite_id}")
+        for composite_id in composite_ids[is_changed]:
+            logger.debug(f"📝 Award record changed: {composite_id}")
+
+        if not to_insert.any():
+            return
+
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would insert {int(to_insert.sum())} awards")
+            return
+
+        # Normalize all raw data for JSON serialization
+        changed_df = df[to_insert]
+        normalized_df = pd.DataFrame(
+            {
+                column: normalize_column(changed_df[column])
+                for column in changed_df.columns
+            },
+            index=changed_df.index,
+        )
+
+        # Enhance with metadata for future reference
+        normalized_df["_content_hash"] = current_hashes[to_insert]
+        normalized_df["_change_detection"] = "content_hash_based"
+        normalized_df["_composite_id"] = composite_ids[to_insert]
+        normalized_df["_source_file"] = source_file
+        normalized_df["_ingestion_timestamp"] = datetime.now(timezone.utc).isoformat()
+
+        entities = [
+            {
+                "entity_type": "lab_award",
+                "source_system": "lab_awards",
+                # Composite ID is the external_id
+                "external_id": composite_id,
+                "raw_data": raw_data,
+                "ingestion_run_id": run_id,
+            }
+            for composite_id, raw_data in zip(
+                composite_ids[to_insert], normalized_df.to_dict("records")
+            )
+        ]
+        self.db_adapter.bulk_insert_raw_entities(entities)
+
     def get_award_analytics(self) -> Dict[str, pd.DataFrame]:
         """
         Analyze lab award data from bronze layer.
@@ -922,6 +957,12 @@ def main():
             default=DATA_FOLDER,
             help=f"Path to folder containing lab awards CSV files (default: {DATA_FOLDER})",
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Number of CSV rows read and processed at a time (default: {DEFAULT_CHUNK_SIZE})",
+        )
         args = parser.parse_args()
 
         # Load environment variables
@@ -940,6 +981,7 @@ def main():
             data_folder=args.data_folder,
             force_full_sync=args.full_sync,
             dry_run=args.dry_run,
+            chunk_size=args.chunk_size,
         )
 
         # Run the content hash-based ingestion process
@@ -21,7 +21,6 @@ handle this appropriately.
 """
 
 import argparse
-import base64
 import hashlib
 import json
 import logging
@@ -48,6 +47,8 @@ from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter, create_postgres_adapter
 from ldap.adapters.ldap_adapter import LDAPAdapter
+from ldap.membership import normalize_membership
+from ldap.normalizer import normalize_ldap_value
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -124,88 +125,6 @@ class MCommunityGroupIngestionService:
             f"dry_run={'enabled' if dry_run else 'disabled'})"
         )
 
-    def _normalize_ldap_attribute(self, value: Any) -> Any:
-        """
-        Normalize LDAP attribute values for consistent hashing and JSON serialization.
-
-        LDAP attributes can be single values, lists, bytes, or None. Many MCommunity
-        attributes like cn, ou, umichPostalAddress can be either strings or
-        lists depending on the user.
-
-        Binary fields are converted to base64 to avoid issues with null bytes in
-        PostgreSQL JSON/JSONB fields.
-
-        Args:
-            value: Raw LDAP attribute value
-
-        Returns:
-            Normalized value suitable for JSON serialization
-        """
-        if value is None:
-            return ""
-        elif isinstance(value, bytes):
-            # Handle binary attributes using base64 encoding
-            try:
-                # Try to decode as UTF-8 for string-like fields
-                decoded = value.decode("utf-8")
-                # Check if it contains null bytes or other problematic characters
-                if "\x00" in decoded or any(
-                    ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                ):
-                    return base64.b64encode(value).decode("ascii")
-                else:
-                    return decoded.strip()
-            except UnicodeDecodeError:
-                return base64.b64encode(value).decode("ascii")
-        elif isinstance(value, datetime):
-            return value.isoformat()
-        elif isinstance(value, list):
-            if len(value) == 0:
-                return ""
-            elif len(value) == 1:
-                item = value[0]
-                if isinstance(item, bytes):
-                    try:
-                        decoded = item.decode("utf-8")
-                        if "\x00" in decoded or any(
-                            ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                        ):
-                            return base64.b64encode(item).decode("ascii")
-                        else:
-                            return decoded.strip()
-                    except UnicodeDecodeError:
-                        return base64.b64encode(item).decode("ascii")
-                elif isinstance(item, datetime):
-                    return item.isoformat()
-                else:
-                    return str(item).strip()
-            else:
-                # Sort multi-value attributes for consistent hashing
-                normalized_items = []
-                for item in value:
-                    if isinstance(item, bytes):
-                        try:
-                            decoded = item.decode("utf-8")
-                            if "\x00" in decoded or any(
-                                ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                            ):
-                                normalized_items.append(
-                                    base64.b64encode(item).decode("ascii")
-                                )
-                            else:
-                                normalized_items.append(decoded.strip())
-                        except UnicodeDecodeError:
-                            normalized_items.append(
-                                base64.b64encode(item).decode("ascii")
-                            )
-                    elif isinstance(item, datetime):
-                        normalized_items.append(item.isoformat())
-                    else:
-                        normalized_items.append(str(item).strip())
-                return sorted(normalized_items)
-        else:
-            return str(value).strip()
-
     def _calculate_group_content_hash(self, group_data: Dict[str, Any]) -> str:
         """
         Calculate a content hash for MCommunity group data to detect meaningful changes.
@@ -224,83 +143,67 @@ class MCommunityGroupIngestionService:
         # Based on MCommunity LDAP schema for groups
         significant_fields = {
             # Core identifiers
-            "cn": self._normalize_ldap_attribute(group_data.get("cn")),
-            "gidNumber": self._normalize_ldap_attribute(group_data.get("gidNumber")),
+            "cn": normalize_ldap_value(group_data.get("cn")),
+            "gidNumber": normalize_ldap_value(group_data.get("gidNumber")),
             # Membership (people and nested groups)
-            "member": self._normalize_ldap_attribute(group_data.get("member")),
-            "groupMember": self._normalize_ldap_attribute(
+            "member": normalize_membership(group_data.get("member")),
+            "groupMember": normalize_membership(
                 group_data.get("groupMember")
             ),
-            "rfc822mail": self._normalize_ldap_attribute(
+            "rfc822mail": normalize_ldap_value(
                 group_data.get("rfc822mail")
             ),  # External email members
             # Group metadata
-            "description": self._normalize_ldap_attribute(
-                group_data.get("description")
-            ),
-            "postalAddress": self._normalize_ldap_attribute(
-                group_data.get("postalAddress")
-            ),
-            "labeledUri": self._normalize_ldap_attribute(group_data.get("labeledUri")),
+            "description": normalize_ldap_value(group_data.get("description")),
+            "postalAddress": normalize_ldap_value(group_data.get("postalAddress")),
+            "labeledUri": normalize_ldap_value(group_data.get("labeledUri")),
             # Group ownership and administration
-            "owner": self._normalize_ldap_attribute(group_data.get("owner")),
-            "errorsTo": self._normalize_ldap_attribute(group_data.get("errorsTo")),
-            "requestsTo": self._normalize_ldap_attribute(group_data.get("requestsTo")),
-            "rfc822ErrorsTo": self._normalize_ldap_attribute(
-                group_data.get("rfc822ErrorsTo")
-            ),
-            "rfc822RequestsTo": self._normalize_ldap_attribute(
+            "owner": normalize_ldap_value(group_data.get("owner")),
+            "errorsTo": normalize_ldap_value(group_data.get("errorsTo")),
+            "requestsTo": normalize_ldap_value(group_data.get("requestsTo")),
+            "rfc822ErrorsTo": normalize_ldap_value(group_data.get("rfc822ErrorsTo")),
+            "rfc822RequestsTo": normalize_ldap_value(
                 group_data.get("rfc822RequestsTo")
             ),
             # Email group settings
-            "umichGroupEmail": self._normalize_ldap_attribute(
-                group_data.get("umichGroupEmail")
-            ),
-            "membersonly": self._normalize_ldap_attribute(
-                group_data.get("membersonly")
-            ),
-            "joinable": self._normalize_ldap_attribute(group_data.get("joinable")),
-            "RealtimeBlockList": self._normalize_ldap_attribute(
+            "umichGroupEmail": normalize_ldap_value(group_data.get("umichGroupEmail")),
+            "membersonly": normalize_ldap_value(group_data.get("membersonly")),
+            "joinable": normalize_ldap_value(group_data.get("joinable")),
+            "RealtimeBlockList": normalize_ldap_value(
                 group_data.get("RealtimeBlockList")
             ),
-            "supressNoEmailError": self._normalize_ldap_attribute(
+            "supressNoEmailError": normalize_ldap_value(
                 group_data.get("supressNoEmailError")
             ),
-            "permittedGroup": self._normalize_ldap_attribute(
-                group_data.get("permittedGroup")
-            ),
-            "umichPermittedSenders": self._normalize_ldap_attribute(
+            "permittedGroup": normalize_ldap_value(group_data.get("permittedGroup")),
+            "umichPermittedSenders": normalize_ldap_value(
                 group_data.get("umichPermittedSenders")
             ),
-            "umichPermittedSendersDomains": self._normalize_ldap_attribute(
+            "umichPermittedSendersDomains": normalize_ldap_value(
                 group_data.get("umichPermittedSendersDomains")
             ),
             # Privacy and access control
-            "umichPrivate": self._normalize_ldap_attribute(
-                group_data.get("umichPrivate")
-            ),
+            "umichPrivate": normalize_ldap_value(group_data.get("umichPrivate")),
             # Auto-reply settings
-            "umichAutoReply": self._normalize_ldap_attribute(
-                group_data.get("umichAutoReply")
-            ),
-            "umichAutoReplyStart": self._normalize_ldap_attribute(
+            "umichAutoReply": normalize_ldap_value(group_data.get("umichAutoReply")),
+            "umichAutoReplyStart": normalize_ldap_value(
                 group_data.get("umichAutoReplyStart")
             ),
-            "umichAutoReplyEnd": self._normalize_ldap_attribute(
+            "umichAutoReplyEnd": normalize_ldap_value(
                 group_data.get("umichAutoReplyEnd")
             ),
             # Service entitlements
-            "umichServiceEntitlement": self._normalize_ldap_attribute(
+            "umichServiceEntitlement": normalize_ldap_value(
                 group_data.get("umichServiceEntitlement")
             ),
             # Expiry and disabled status
-            "umichExpiryTimestamp": self._normalize_ldap_attribute(
+            "umichExpiryTimestamp": normalize_ldap_value(
                 group_data.get("umichExpiryTimestamp")
             ),
-            "umichEntryDisabled": self._normalize_ldap_attribute(
+            "umichEntryDisabled": normalize_ldap_value(
                 group_data.get("umichEntryDisabled")
             ),
-            "umichDisabledTimestamp": self._normalize_ldap_attribute(
+            "umichDisabledTimestamp": normalize_ldap_value(
                 group_data.get("umichDisabledTimestamp")
             ),
         }
@@ -314,7 +217,7 @@ class MCommunityGroupIngestionService:
         content_hash = hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
 
         cn = group_data.get("cn", "unknown")
-        gid_number = self._normalize_ldap_attribute(group_data.get("gidNumber"))
+        gid_number = normalize_ldap_value(group_data.get("gidNumber"))
         logger.debug(
             f"Content hash for group {cn} (gidNumber: {gid_number}): {content_hash}"
         )
@@ -541,6 +444,10 @@ class MCommunityGroupIngestionService:
                 scope="subtree",
                 attributes=None,  # Return all attributes
                 use_pagination=True,
+                # MCommunity caps cumulative results per search; fetch cn
+                # key-space partitions concurrently instead of chunk by chunk
+                partitioned=True,
+                partition_attribute="cn",
             )
 
             if not raw_groups:
@@ -553,10 +460,8 @@ class MCommunityGroupIngestionService:
             for group_data in raw_groups:
                 try:
                     # Extract group identifiers
-                    cn = self._normalize_ldap_attribute(group_data.get("cn"))
-                    gid_number = self._normalize_ldap_attribute(
-                        group_data.get("gidNumber")
-                    )
+                    cn = normalize_ldap_value(group_data.get("cn"))
+                    gid_number = normalize_ldap_value(group_data.get("gidNumber"))
 
                     # Skip if no gidNumber (required as external_id)
                     if not gid_number:
@@ -598,19 +503,19 @@ class MCommunityGroupIngestionService:
                         ingestion_stats["groups_with_email"] += 1
 
                     if (
-                        self._normalize_ldap_attribute(group_data.get("umichPrivate"))
+                        normalize_ldap_value(group_data.get("umichPrivate"))
                         == "TRUE"
                     ):
                         ingestion_stats["private_groups"] += 1
 
                     if (
-                        self._normalize_ldap_attribute(group_data.get("joinable"))
+                        normalize_ldap_value(group_data.get("joinable"))
                         == "TRUE"
                     ):
                         ingestion_stats["joinable_groups"] += 1
 
                     if (
-                        self._normalize_ldap_attribute(group_data.get("membersonly"))
+                        normalize_ldap_value(group_data.get("membersonly"))
                         == "TRUE"
                     ):
                         ingestion_stats["members_only_groups"] += 1
@@ -972,6 +877,9 @@ def main():
             "port": int(os.getenv("MCOMMUNITY_LDAP_PORT", "636")),
             "use_ssl": os.getenv("MCOMMUNITY_LDAP_USE_SSL", "true").lower() == "true",
             "timeout": int(os.getenv("MCOMMUNITY_LDAP_TIMEOUT", "90")),
+            "partition_workers": int(
+                os.getenv("MCOMMUNITY_LDAP_PARTITION_WORKERS", "4")
+            ),
         }
         # Validate configuration
         if not database_url:
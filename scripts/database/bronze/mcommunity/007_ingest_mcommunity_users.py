@@ -20,7 +20,6 @@ handle this appropriately.
 """
 
 import argparse
-import base64
 import hashlib
 import json
 import logging
@@ -47,6 +46,7 @@ from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter, create_postgres_adapter
 from ldap.adapters.ldap_adapter import LDAPAdapter
+from ldap.normalizer import normalize_ldap_value
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -122,88 +122,6 @@ class MCommunityUserIngestionService:
             f"dry_run={'enabled' if dry_run else 'disabled'})"
         )
 
-    def _normalize_ldap_attribute(self, value: Any) -> Any:
-        """
-        Normalize LDAP attribute values for consistent hashing and JSON serialization.
-
-        LDAP attributes can be single values, lists, bytes, or None. Many MCommunity
-        attributes like cn, ou, umichPostalAddress can be either strings or
-        lists depending on the user.
-
-        Binary fields are converted to base64 to avoid issues with null bytes in
-        PostgreSQL JSON/JSONB fields.
-
-        Args:
-            value: Raw LDAP attribute value
-
-        Returns:
-            Normalized value suitable for JSON serialization
-        """
-        if value is None:
-            return ""
-        elif isinstance(value, bytes):
-            # Handle binary attributes using base64 encoding
-            try:
-                # Try to decode as UTF-8 for string-like fields
-                decoded = value.decode("utf-8")
-                # Check if it contains null bytes or other problematic characters
-                if "\x00" in decoded or any(
-                    ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                ):
-                    return base64.b64encode(value).decode("ascii")
-                else:
-                    return decoded.strip()
-            except UnicodeDecodeError:
-                return base64.b64encode(value).decode("ascii")
-        elif isinstance(value, datetime):
-            return value.isoformat()
-        elif isinstance(value, list):
-            if len(value) == 0:
-                return ""
-            elif len(value) == 1:
-                item = value[0]
-                if isinstance(item, bytes):
-                    try:
-                        decoded = item.decode("utf-8")
-                        if "\x00" in decoded or any(
-                            ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                        ):
-                            return base64.b64encode(item).decode("ascii")
-                        else:
-                            return decoded.strip()
-                    except UnicodeDecodeError:
-                        return base64.b64encode(item).decode("ascii")
-                elif isinstance(item, datetime):
-                    return item.isoformat()
-                else:
-                    return str(item).strip()
-            else:
-                # Sort multi-value attributes for consistent hashing
-                normalized_items = []
-                for item in value:
-                    if isinstance(item, bytes):
-                        try:
-                            decoded = item.decode("utf-8")
-                            if "\x00" in decoded or any(
-                                ord(c) < 32 and c not in "\t\n\r" for c in decoded
-                            ):
-                                normalized_items.append(
-                                    base64.b64encode(item).decode("ascii")
-                                )
-                            else:
-                                normalized_items.append(decoded.strip())
-                        except UnicodeDecodeError:
-                            normalized_items.append(
-                                base64.b64encode(item).decode("ascii")
-                            )
-                    elif isinstance(item, datetime):
-                        normalized_items.append(item.isoformat())
-                    else:
-                        normalized_items.append(str(item).strip())
-                return sorted(normalized_items)
-        else:
-            return str(value).strip()
-
     def _calculate_user_content_hash(self, user_data: Dict[str, Any]) -> str:
         """
         Calculate a content hash for MCommunity user data to detect meaningful changes.
@@ -220,27 +138,23 @@ class MCommunityUserIngestionService:
         # Extract significant fields for change detection
         # Based on actual MCommunity LDAP schema from sample data
         significant_fields = {
-            "uid": self._normalize_ldap_attribute(user_data.get("uid")),
-            "uidNumber": self._normalize_ldap_attribute(user_data.get("uidNumber")),
-            "cn": self._normalize_ldap_attribute(user_data.get("cn")),
-            "displayName": self._normalize_ldap_attribute(user_data.get("displayName")),
-            "givenName": self._normalize_ldap_attribute(user_data.get("givenName")),
-            "sn": self._normalize_ldap_attribute(user_data.get("sn")),
-            "mail": self._normalize_ldap_attribute(user_data.get("mail")),
-            "ou": self._normalize_ldap_attribute(user_data.get("ou")),
-            "umichTitle": self._normalize_ldap_attribute(user_data.get("umichTitle")),
-            "telephoneNumber": self._normalize_ldap_attribute(
-                user_data.get("telephoneNumber")
-            ),
-            "homeDirectory": self._normalize_ldap_attribute(
-                user_data.get("homeDirectory")
-            ),
-            "loginShell": self._normalize_ldap_attribute(user_data.get("loginShell")),
-            "gidNumber": self._normalize_ldap_attribute(user_data.get("gidNumber")),
-            "umichPostalAddress": self._normalize_ldap_attribute(
+            "uid": normalize_ldap_value(user_data.get("uid")),
+            "uidNumber": normalize_ldap_value(user_data.get("uidNumber")),
+            "cn": normalize_ldap_value(user_data.get("cn")),
+            "displayName": normalize_ldap_value(user_data.get("displayName")),
+            "givenName": normalize_ldap_value(user_data.get("givenName")),
+            "sn": normalize_ldap_value(user_data.get("sn")),
+            "mail": normalize_ldap_value(user_data.get("mail")),
+            "ou": normalize_ldap_value(user_data.get("ou")),
+            "umichTitle": normalize_ldap_value(user_data.get("umichTitle")),
+            "telephoneNumber": normalize_ldap_value(user_data.get("telephoneNumber")),
+            "homeDirectory": normalize_ldap_value(user_data.get("homeDirectory")),
+            "loginShell": normalize_ldap_value(user_data.get("loginShell")),
+            "gidNumber": normalize_ldap_value(user_data.get("gidNumber")),
+            "umichPostalAddress": normalize_ldap_value(
                 user_data.get("umichPostalAddress")
             ),
-            "umichPostalAddressData": self._normalize_ldap_attribute(
+            "umichPostalAddressData": normalize_ldap_value(
                 user_data.get("umichPostalAddressData")
             ),
         }
@@ -254,7 +168,7 @@ class MCommunityUserIngestionService:
         content_hash = hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
 
         uid = user_data.get("uid", "unknown")
-        display_name = self._normalize_ldap_attribute(user_data.get("displayName"))
+        display_name = normalize_ldap_value(user_data.get("displayName"))
         logger.debug(f"Content hash for user {uid} ({display_name}): {content_hash}")
 
         return content_hash
@@ -501,6 +415,10 @@ class MCommunityUserIngestionService:
                 scope="subtree",
                 attributes=user_attributes,
                 use_pagination=True,
+                # MCommunity caps cumulative results per search; fetch uid
+                # key-space partitions concurrently instead of chunk by chunk
+                partitioned=True,
+                partition_attribute="uid",
             )
 
             if not raw_users:
@@ -513,11 +431,9 @@ class MCommunityUserIngestionService:
             for user_data in raw_users:
                 try:
                     # Extract user identifiers
-                    uid = self._normalize_ldap_attribute(user_data.get("uid"))
-                    uid_number = self._normalize_ldap_attribute(
-                        user_data.get("uidNumber")
-                    )
-                    display_name = self._normalize_ldap_attribute(
+                    uid = normalize_ldap_value(user_data.get("uid"))
+                    uid_number = normalize_ldap_value(user_data.get("uidNumber"))
+                    display_name = normalize_ldap_value(
                         user_data.get("displayName", "Unknown User")
                     )
 
@@ -538,9 +454,7 @@ class MCommunityUserIngestionService:
                             ingestion_stats["unique_departments"].add(ou)
 
                     # Track job titles
-                    job_title = self._normalize_ldap_attribute(
-                        user_data.get("umichTitle")
-                    )
+                    job_title = normalize_ldap_value(user_data.get("umichTitle"))
                     if job_title:
                         ingestion_stats["unique_job_titles"].add(job_title)
 
@@ -728,6 +642,9 @@ def main():
             "port": int(os.getenv("MCOMMUNITY_LDAP_PORT", "636")),
             "use_ssl": os.getenv("MCOMMUNITY_LDAP_USE_SSL", "true").lower() == "true",
             "timeout": int(os.getenv("MCOMMUNITY_LDAP_TIMEOUT", "90")),
+            "partition_workers": int(
+                os.getenv("MCOMMUNITY_LDAP_PARTITION_WORKERS", "4")
+            ),
         }
 
         # Validate configuration
@@ -4,8 +4,8 @@ Async User Ingestion Service for TeamDynamix
 
 This service implements async user ingestion with:
 1. Batched API calls to search_users with department ID chunks
-2. Concurrent processing of API responses
-3. Async ingestion of individual user records
+2. Each API response processed as soon as it arrives
+3. Per-batch hash comparison and a single bulk insert per API batch
 4. Proper rate limiting and error handling
 
 The approach optimizes for maximum throughput while respecting API constraints.
@@ -68,8 +68,8 @@ class AsyncUserIngestionService:
     1. Queries bronze layer for all department IDs
     2. Batches department IDs into chunks of 200 (API limitation)
     3. Makes concurrent API calls to search_user for each batch
-    4. Processes user records concurrently
-    5. Ingests individual user records asynchronously
+    4. Hashes and compares each batch's users against prefetched hashes
+    5. Bulk inserts each batch's new or changed users in one write
     """
 
     def __init__(
@@ -100,7 +100,7 @@ class AsyncUserIngestionService:
             tdx_web_services_key: TDX web services key for admin auth (optional)
             tdx_app_id: TeamDynamix application ID
             max_concurrent_batches: Maximum number of API batches to process concurrently
-            max_concurrent_ingestions: Maximum number of user records to ingest concurrently
+            max_concurrent_ingestions: Maximum number of batch bulk inserts running concurrently
             api_rate_limit_delay: Delay between API calls (seconds)
             batch_size: Number of department IDs per API call (max 200)
         """
@@ -395,187 +395,139 @@ class AsyncUserIngestionService:
 
                 return batch_result
 
-    async def ingest_user_record(
-        self,
-        user_data: Dict[str, Any],
-        batch_index: int,
-        ingestion_run_id: str,
-        loop: asyncio.AbstractEventLoop,
-        existing_hashes: Dict[str, str],
-        dry_run: bool = False,
-    ) -> Dict[str, Any]:
+    def _prepare_batch_users(
+        self, users: List[Dict[str, Any]]
+    ) -> Tuple[List[str], List[str]]:
         """
-        Ingest a single user record into the bronze layer asynchronously.
+        Resolve external IDs and content hashes for every user in an API batch.
 
         Args:
-            user_data: User data from TeamDynamix API
-            batch_index: Which batch this user came from
-            ingestion_run_id: UUID of the current ingestion run
-            loop: Event loop for async execution
-            existing_hashes: Dictionary of external_id -> entity_hash for change detection
-            dry_run: If True, log what would be done but don't commit
+            users: User records returned by search_user
 
         Returns:
-            Dictionary with ingestion result
+            Tuple of (external_ids, content_hashes), aligned with users
         """
-        async with self.ingestion_semaphore:  # Limit concurrent ingestions
-            user_uid = user_data.get("UID", "unknown")
-            user_name = user_data.get("FullName", "Unknown User")
-            external_id = user_data.get("ExternalID", str(uuid.uuid4()))
-
-            ingestion_result = {
-                "user_uid": user_uid,
-                "user_name": user_name,
-                "external_id": external_id,
-                "batch_index": batch_index,
-                "success": False,
-                "action": None,  # 'created', 'skipped', or 'error'
-                "error_message": None,
-                "started_at": datetime.now(timezone.utc),
-            }
-
-            try:
-                # Calculate content hash for change detection
-                current_hash = self._calculate_user_content_hash(user_data)
-
-                # Check if record exists and unchanged
-                if external_id in existing_hashes:
-                    if existing_hashes[external_id] == current_hash:
-                        ingestion_result["success"] = True
-                        ingestion_result["action"] = "skipped"
-                        logger.debug(
-                            f"⏭️  User unchanged, skipping: {user_name} ({external_id})"
-                        )
-                        return ingestion_result
-
-                # Prepare enhanced user data with metadata
-                enhanced_user_data = user_data.copy()
-                enhanced_user_data["_ingestion_method"] = "async_batch_search"
-                enhanced_user_data["_ingestion_source"] = "search_user"
-                enhanced_user_data["_batch_index"] = batch_index
-                enhanced_user_data["_ingestion_timestamp"] = datetime.now(
-                    timezone.utc
-                ).isoformat()
-                enhanced_user_data["_content_hash_basic"] = current_hash
-
-                if dry_run:
-                    ingestion_result["success"] = True
-                    ingestion_result["action"] = (
-                        "created" if external_id not in existing_hashes else "updated"
-                    )
-                    ingestion_result["raw_id"] = str(uuid.uuid4())  # Mock ID
-                    logger.info(
-                        f"[DRY RUN] Would ingest user: {user_name} ({external_id}) - Action: {ingestion_result['action']}"
-                    )
-                    return ingestion_result
-
-                # Execute the synchronous database insert in a thread pool
-                def perform_ingestion():
-                    return self.db_adapter.insert_raw_entity(
-                        entity_type="user",
-                        source_system="tdx",
-                        external_id=external_id,
-                        raw_data=enhanced_user_data,
-                        ingestion_run_id=ingestion_run_id,
-                    )
-
-                raw_id = await loop.run_in_executor(self.executor, perform_ingestion)
-
-                ingestion_result["raw_id"] = raw_id
-                ingestion_result["success"] = True
-                ingestion_result["action"] = "created"
-
-                logger.debug(
-                    f"📝 Ingested user: {user_name} (UID: {user_uid}, External ID: {external_id})"
-                )
-
-                return ingestion_result
-
-            except Exception as e:
-                error_msg = f"Failed to ingest user {user_uid}: {str(e)}"
-                logger.error(f"❌ {error_msg}")
-
-                ingestion_result["error_message"] = error_msg
-                ingestion_result["action"] = "error"
-                return ingestion_result
+        external_ids = [
+            user_data.get("ExternalID", str(uuid.uuid4())) for user_data in users
+        ]
+        content_hashes = [
+            self._calculate_user_content_hash(user_data) for user_data in users
+        ]
+        return external_ids, content_hashes
 
-    async def process_batch_users_concurrently(
+    async def process_batch_users(
         self,
         batch_result: Dict[str, Any],
         ingestion_run_id: str,
         loop: asyncio.AbstractEventLoop,
         existing_hashes: Dict[str, str],
         dry_run: bool = False,
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         """
-        Process all users from a batch concurrently.
+        Hash, compare and bulk insert all users from one API batch.
+
+        Hashing runs in the thread pool for the whole batch, the comparison
+        against existing_hashes is a single pass on the event loop, and all
+        new or changed users are written with one bulk insert (one commit).
+        existing_hashes is updated in place so a user returned by several
+        department batches is only written once per run.
 
         Args:
             batch_result: Result from fetch_users_for_department_batch
             ingestion_run_id: UUID of the current ingestion run
             loop: Event loop for async execution
-            existing_hashes: Dictionary of external_id -> entity_hash for change detection
+            existing_hashes: Dictionary of external_id -> content hash for change detection
             dry_run: If True, preview changes without committing
 
         Returns:
-            List of ingestion results for all users in the batch
+            Dictionary with created/skipped/failed counts and error messages
         """
+        batch_index = batch_result["batch_index"]
+        summary = {
+            "batch_index": batch_index,
+            "created": 0,
+            "skipped": 0,
+            "failed": 0,
+            "errors": [],
+        }
+
         if not batch_result["success"] or not batch_result["users_found"]:
-            logger.warning(
-                f"⚠️  Batch {batch_result['batch_index']}: No users to process"
-            )
-            return []
+            logger.warning(f"⚠️  Batch {batch_index}: No users to process")
+            return summary
 
         users = batch_result["users_found"]
-        batch_index = batch_result["batch_index"]
-
-        logger.info(
-            f"🔄 Batch {batch_index}: Starting concurrent ingestion of {len(users)} users..."
-        )
 
-        # Create ingestion tasks for all users in this batch
-        ingestion_tasks = [
-            self.ingest_user_record(
-                user_data, batch_index, ingestion_run_id, loop, existing_hashes, dry_run
+        try:
+            external_ids, current_hashes = await loop.run_in_executor(
+                self.executor, self._prepare_batch_users, users
             )
-            for user_data in users
-        ]
-
-        # Execute all ingestion tasks concurrently
-        ingestion_results = await asyncio.gather(
-            *ingestion_tasks, return_exceptions=True
-        )
-
-        # Handle any exceptions that occurred during ingestion
-        processed_results = []
-        for result in ingestion_results:
-            if isinstance(result, Exception):
-                error_result = {
-                    "user_uid": "unknown",
-                    "user_name": "Unknown User",
-                    "batch_index": batch_index,
-                    "success": False,
-                    "action": "error",
-                    "error_message": f"Async ingestion exception: {str(result)}",
+        except Exception as e:
+            error_msg = f"Batch {batch_index}: failed to hash users: {str(e)}"
+            logger.error(f"❌ {error_msg}")
+            summary["failed"] = len(users)
+            summary["errors"].append(error_msg)
+            return summary
+
+        # Compare against existing hashes and claim changed IDs before awaiting
+        ingestion_timestamp = datetime.now(timezone.utc).isoformat()
+        entities = []
+        for user_data, external_id, current_hash in zip(
+            users, external_ids, current_hashes
+        ):
+            if existing_hashes.get(external_id) == current_hash:
+                summary["skipped"] += 1
+                continue
+
+            existing_hashes[external_id] = current_hash
+
+            enhanced_user_data = user_data.copy()
+            enhanced_user_data["_ingestion_method"] = "async_batch_search"
+            enhanced_user_data["_ingestion_source"] = "search_user"
+            enhanced_user_data["_batch_index"] = batch_index
+            enhanced_user_data["_ingestion_timestamp"] = ingestion_timestamp
+            enhanced_user_data["_content_hash_basic"] = current_hash
+
+            entities.append(
+                {
+                    "entity_type": "user",
+                    "source_system": "tdx",
+                    "external_id": external_id,
+                    "raw_data": enhanced_user_data,
+                    "ingestion_run_id": ingestion_run_id,
+                    "ingestion_metadata": "{}",
                 }
-                processed_results.append(error_result)
-                logger.error(
-                    f"❌ Async ingestion exception in batch {batch_index}: {result}"
+            )
+
+        if entities:
+            if dry_run:
+                logger.info(
+                    f"[DRY RUN] Batch {batch_index}: Would insert {len(entities)} users"
                 )
+                summary["created"] = len(entities)
             else:
-                processed_results.append(result)
-
-        # Count action types
-        created = sum(1 for r in processed_results if r.get("action") == "created")
-        skipped = sum(1 for r in processed_results if r.get("action") == "skipped")
-        errors = sum(1 for r in processed_results if r.get("action") == "error")
+                try:
+                    async with self.ingestion_semaphore:  # Limit concurrent writes
+                        summary["created"] = await loop.run_in_executor(
+                            self.executor,
+                            self.db_adapter.bulk_insert_raw_entities,
+                            entities,
+                        )
+                except Exception as e:
+                    error_msg = f"Batch {batch_index}: bulk insert of {len(entities)} users failed: {str(e)}"
+                    logger.error(f"❌ {error_msg}")
+                    summary["failed"] = len(entities)
+                    summary["errors"].append(error_msg)
+                    # Unwritten users must be retried by later batches or runs
+                    for entity in entities:
+                        existing_hashes.pop(entity["external_id"], None)
 
         logger.info(
             f"✅ Batch {batch_index}: Completed - "
-            f"{created} created, {skipped} skipped, {errors} errors"
+            f"{summary['created']} created, {summary['skipped']} skipped, "
+            f"{summary['failed']} errors"
         )
 
-        return processed_results
+        return summary
 
     def create_ingestion_run(
         self,
@@ -723,7 +675,8 @@ class AsyncUserIngestionService:
         1. Querying department IDs from bronze layer
         2. Creating department batches for API calls
         3. Concurrent API calls to fetch users by department batch
-        4. Concurrent ingestion of user records
+        4. Per-batch hash comparison and one bulk insert per API batch,
+           started as soon as that batch's API call returns
         5. Progress tracking and error handling
 
         Args:
@@ -798,7 +751,7 @@ class AsyncUserIngestionService:
             )
             ingestion_stats["run_id"] = run_id
 
-            # Step 5: Execute concurrent API calls for all batches
+            # Step 5: Execute concurrent API calls, ingesting each batch as it arrives
             logger.info(
                 f"⚡ Starting {len(department_batches)} concurrent API batches..."
             )
@@ -811,32 +764,38 @@ class AsyncUserIngestionService:
                 for batch_index, batch_ids in enumerate(department_batches)
             ]
 
-            # Execute all API calls concurrently
-            batch_results = await asyncio.gather(*api_tasks, return_exceptions=True)
-
-            # Process batch results and handle exceptions
-            processed_batch_results = []
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    error_msg = f"Async API call exception: {str(result)}"
+            # Each completed API batch goes straight to hash comparison and one bulk write
+            ingestion_tasks = []
+            for api_task in asyncio.as_completed(api_tasks):
+                try:
+                    result = await api_task
+                except Exception as e:
+                    error_msg = f"Async API call exception: {str(e)}"
                     logger.error(f"❌ {error_msg}")
                     ingestion_stats["errors"].append(error_msg)
                     ingestion_stats["batches_failed"] += 1
-                else:
-                    processed_batch_results.append(result)
+                    ingestion_stats["batches_processed"] += 1
+                    continue
 
-                    if result["success"]:
-                        ingestion_stats["batches_successful"] += 1
-                        ingestion_stats["total_users_found"] += result.get(
-                            "user_count", 0
-                        )
-                        ingestion_stats["api_call_duration_total"] += result.get(
-                            "api_call_duration", 0
+                if result["success"]:
+                    ingestion_stats["batches_successful"] += 1
+                    ingestion_stats["total_users_found"] += result.get(
+                        "user_count", 0
+                    )
+                    ingestion_stats["api_call_duration_total"] += result.get(
+                        "api_call_duration", 0
+                    )
+                    ingestion_tasks.append(
+                        asyncio.ensure_future(
+                            self.process_batch_users(
+                                result, run_id, loop, existing_hashes, dry_run
+                            )
                         )
-                    else:
-                        ingestion_stats["batches_failed"] += 1
-                        if result.get("error_message"):
-                            ingestion_stats["errors"].append(result["error_message"])
+                    )
+                else:
+                    ingestion_stats["batches_failed"] += 1
+                    if result.get("error_message"):
+                        ingestion_stats["errors"].append(result["error_message"])
 
                 ingestion_stats["batches_processed"] += 1
 
@@ -845,45 +804,23 @@ class AsyncUserIngestionService:
                 f"{ingestion_stats['total_users_found']} total users found"
             )
 
-            # Step 6: Process all users concurrently across all successful batches
-            if processed_batch_results:
-                logger.info(
-                    f"🔄 Starting concurrent user ingestion for {ingestion_stats['total_users_found']} users..."
+            # Step 6: Wait for the remaining batch writes and count results
+            if ingestion_tasks:
+                all_batch_summaries = await asyncio.gather(
+                    *ingestion_tasks, return_exceptions=True
                 )
 
-                # Create user processing tasks for all successful batches
-                user_processing_tasks = [
-                    self.process_batch_users_concurrently(
-                        batch_result, run_id, loop, existing_hashes, dry_run
-                    )
-                    for batch_result in processed_batch_results
-                    if batch_result["success"]
-                ]
-
-                # Execute all user processing tasks concurrently
-                if user_processing_tasks:
-                    all_ingestion_results = await asyncio.gather(
-                        *user_processing_tasks, return_exceptions=True
-                    )
+                for batch_summary in all_batch_summaries:
+                    if isinstance(batch_summary, Exception):
+                        error_msg = f"Async user processing exception: {str(batch_summary)}"
+                        logger.error(f"❌ {error_msg}")
+                        ingestion_stats["errors"].append(error_msg)
+                        continue
 
-                    # Flatten and count ingestion results
-                    for batch_ingestion_results in all_ingestion_results:
-                        if isinstance(batch_ingestion_results, Exception):
-                            error_msg = f"Async user processing exception: {str(batch_ingestion_results)}"
-                            logger.error(f"❌ {error_msg}")
-                            ingestion_stats["errors"].append(error_msg)
-                        else:
-                            for user_result in batch_ingestion_results:
-                                if user_result.get("action") == "created":
-                                    ingestion_stats["total_users_created"] += 1
-                                elif user_result.get("action") == "skipped":
-                                    ingestion_stats["total_users_skipped"] += 1
-                                elif user_result.get("action") == "error":
-                                    ingestion_stats["total_users_failed"] += 1
-                                    if user_result.get("error_message"):
-                                        ingestion_stats["errors"].append(
-                                            user_result["error_message"]
-                                        )
+                    ingestion_stats["total_users_created"] += batch_summary["created"]
+                    ingestion_stats["total_users_skipped"] += batch_summary["skipped"]
+                    ingestion_stats["total_users_failed"] += batch_summary["failed"]
+                    ingestion_stats["errors"].extend(batch_summary["errors"])
 
             # Step 7: Complete the ingestion run
             error_summary = None
@@ -1024,7 +961,7 @@ async def main():
             "--max-concurrent-ingestions",
             type=int,
             default=20,
-            help="Maximum concurrent record ingestions (default: 20)",
+            help="Maximum concurrent batch bulk inserts (default: 20)",
         )
         parser.add_argument(
             "--api-delay",
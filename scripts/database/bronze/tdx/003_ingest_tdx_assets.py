@@ -19,7 +19,7 @@ import os
 import sys
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import dateutil.parser
 
@@ -137,6 +137,27 @@ class TDXAssetIngestionService:
             # Return a very old date as fallback to ensure record gets processed
             return datetime(1970, 1, 1, tzinfo=timezone.utc)
 
+    def _is_modified_after(
+        self, modified_date: Optional[str], stored_modified_date: Optional[str]
+    ) -> bool:
+        """
+        Check whether a search-level ModifiedDate is newer than the stored one.
+
+        Args:
+            modified_date: ModifiedDate from the current search results
+            stored_modified_date: ModifiedDate of the latest bronze row
+
+        Returns:
+            True if both dates are present and the current one is later
+        """
+        if not modified_date or not stored_modified_date:
+            return False
+        if modified_date == stored_modified_date:
+            return False
+        return self._parse_tdx_timestamp(modified_date) > self._parse_tdx_timestamp(
+            stored_modified_date
+        )
+
     def _calculate_basic_content_hash(self, asset_data: Dict[str, Any]) -> str:
         """
         Calculate basic content hash (matching enrich script).
@@ -215,20 +236,21 @@ class TDXAssetIngestionService:
             logger.error(f"❌ Failed to get last ingestion timestamp: {e}")
             return None
 
-    def _get_existing_asset_hashes(self) -> Dict[str, str]:
+    def _get_existing_asset_hashes(self) -> Dict[str, Tuple[str, Optional[str]]]:
         """
-        Load basic content hashes for all existing assets in bronze layer.
+        Load basic content hashes and ModifiedDates for all existing assets in bronze layer.
 
         Only checks _content_hash_basic to avoid collision with enrichment hashes.
 
         Returns:
-            Dictionary mapping external_id to _content_hash_basic
+            Dictionary mapping external_id to (_content_hash_basic, ModifiedDate)
         """
         try:
             query = """
             SELECT DISTINCT ON (external_id)
                 external_id,
-                raw_data->>'_content_hash_basic' as content_hash_basic
+                raw_data->>'_content_hash_basic' as content_hash_basic,
+                raw_data->>'ModifiedDate' as modified_date
             FROM bronze.raw_entities
             WHERE entity_type = 'asset'
               AND source_system = 'tdx'
@@ -242,7 +264,12 @@ class TDXAssetIngestionService:
                 return {}
 
             logger.info(f"📚 Loaded {len(result_df)} existing asset hashes")
-            return dict(zip(result_df["external_id"], result_df["content_hash_basic"]))
+            return dict(
+                zip(
+                    result_df["external_id"],
+                    zip(result_df["content_hash_basic"], result_df["modified_date"]),
+                )
+            )
 
         except SQLAlchemyError as e:
             logger.error(f"❌ Failed to load existing asset hashes: {e}")
@@ -490,9 +517,15 @@ class TDXAssetIngestionService:
                     # Calculate basic content hash for change detection
                     current_hash = self._calculate_basic_content_hash(asset)
 
-                    # Check if this asset exists and is unchanged
+                    # Check if this asset exists and is unchanged. A newer ModifiedDate
+                    # with an identical basic hash means a field only get_asset returns
+                    # changed; storing the new search row lets 011_enrich_tdx_assets.py
+                    # see the newer ModifiedDate and re-fetch just this asset.
                     if external_id in existing_hashes:
-                        if existing_hashes[external_id] == current_hash:
+                        existing_hash, existing_modified = existing_hashes[external_id]
+                        if existing_hash == current_hash and not self._is_modified_after(
+                            asset.get("ModifiedDate"), existing_modified
+                        ):
                             # No changes, skip this asset
                             logger.debug(
                                 f"⏭️  Asset unchanged, skipping: {asset.get('Name')} (ID: {external_id})"
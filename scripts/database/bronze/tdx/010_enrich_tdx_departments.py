@@ -13,6 +13,7 @@ Entity: Departments (from TeamDynamix Accounts API)
 """
 
 import argparse
+import asyncio
 import hashlib
 import json
 import logging
@@ -20,6 +21,7 @@ import os
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -76,6 +78,7 @@ class ProgressiveBronzeEnrichmentService:
         tdx_web_services_key: str = None,
         tdx_app_id: str = None,
         api_rate_limit_delay: float = 1.0,
+        max_concurrent_enrichments: int = 3,
     ):
         """
         Initialize the progressive enrichment service.
@@ -89,7 +92,8 @@ class ProgressiveBronzeEnrichmentService:
             tdx_beid: TDX BEID for admin auth (optional)
             tdx_web_services_key: TDX web services key for admin auth (optional)
             tdx_app_id: TeamDynamix application ID
-            api_rate_limit_delay: Delay between individual API calls (seconds)
+            api_rate_limit_delay: Delay before each individual API call (seconds)
+            max_concurrent_enrichments: Maximum concurrent get_account() calls
         """
         self.db_adapter = PostgresAdapter(
             database_url=database_url, pool_size=5, max_overflow=10
@@ -105,13 +109,19 @@ class ProgressiveBronzeEnrichmentService:
             web_services_key=tdx_web_services_key,
         )
 
-        # Rate limiting for individual get_account() calls
+        # Rate limiting and concurrency for individual get_account() calls
         self.api_rate_limit_delay = api_rate_limit_delay
+        self.max_concurrent_enrichments = max_concurrent_enrichments
 
-        logger.info(
-            f"🔌 Progressive bronze enrichment service initialized "
-            f"(API delay: {api_rate_limit_delay}s between calls)"
-        )
+        # Semaphore for controlling concurrency
+        self.enrichment_semaphore = asyncio.Semaphore(max_concurrent_enrichments)
+
+        # Thread pool for synchronous API and database calls
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent_enrichments)
+
+        logger.info(f"🔌 Progressive bronze enrichment service initialized:")
+        logger.info(f"   Max concurrent enrichments: {max_concurrent_enrichments}")
+        logger.info(f"   API rate limit delay: {api_rate_limit_delay}s")
 
     def _get_last_enrichment_timestamp(self) -> Optional[datetime]:
         """
@@ -294,26 +304,29 @@ class ProgressiveBronzeEnrichmentService:
             logger.error(f"❌ Failed to query departments needing enrichment: {e}")
             raise
 
-    def enrich_department_record(
+    async def enrich_department_record(
         self,
         raw_id: str,
         external_id: str,
         original_raw_data: Dict[str, Any],
-        dry_run: bool = False,
+        loop: asyncio.AbstractEventLoop,
     ) -> Dict[str, Any]:
         """
         Enrich a single department record by calling get_account(ID) for complete data.
 
         Uses hash-based change detection to skip enrichment if data hasn't changed.
+        The API call runs in the thread pool under the enrichment semaphore; the
+        enriched payload is returned for the caller to write in a batch.
 
         Args:
             raw_id: The raw_id of the bronze record to enrich
             external_id: The TeamDynamix department ID
             original_raw_data: The current raw_data from the bronze record
-            dry_run: If True, preview changes without committing
+            loop: Event loop for async execution
 
         Returns:
-            Dictionary with enrichment results and statistics
+            Dictionary with enrichment results and statistics. Enriched results
+            carry the new raw_data under 'enriched_raw_data'.
         """
         enrichment_result = {
             "raw_id": raw_id,
@@ -323,108 +336,152 @@ class ProgressiveBronzeEnrichmentService:
             "error_message": None,
             "fields_added": [],
             "attributes_count": 0,
+            "enriched_raw_data": None,
         }
 
-        try:
-            # Call TeamDynamix get_account(ID) for complete department data
-            logger.debug(f"🔬 Calling get_account({external_id}) for complete data...")
+        async with self.enrichment_semaphore:  # Limit concurrent API calls
+            try:
+                # Call TeamDynamix get_account(ID) for complete department data
+                logger.debug(
+                    f"🔬 Calling get_account({external_id}) for complete data..."
+                )
 
-            # Add rate limiting to respect TeamDynamix API limits
-            time.sleep(self.api_rate_limit_delay)
+                # Execute the synchronous API call in a thread pool
+                def make_api_call():
+                    time.sleep(self.api_rate_limit_delay)  # Rate limiting
+                    return self.tdx_facade.accounts.get_account(int(external_id))
 
-            complete_data = self.tdx_facade.accounts.get_account(int(external_id))
+                complete_data = await loop.run_in_executor(self.executor, make_api_call)
 
-            if not complete_data:
-                raise ValueError(f"get_account({external_id}) returned empty response")
+                if not complete_data:
+                    raise ValueError(
+                        f"get_account({external_id}) returned empty response"
+                    )
 
-            # Calculate enriched content hash
-            enriched_hash = self._calculate_enriched_content_hash(complete_data)
+            except Exception as e:
+                error_msg = f"Failed to enrich department {external_id}: {str(e)}"
+                logger.warning(f"⚠️  {error_msg}")
 
-            # Check if enriched data has changed
-            existing_enriched_hash = original_raw_data.get("_content_hash_enriched")
-            if existing_enriched_hash == enriched_hash:
-                enrichment_result["success"] = True
-                enrichment_result["action"] = "skipped"
-                logger.debug(
-                    f"⏭️  Department {external_id} enriched data unchanged, skipping"
-                )
+                enrichment_result["error_message"] = error_msg
+                enrichment_result["action"] = "error"
                 return enrichment_result
 
-            # Analyze what new fields we're getting
-            original_fields = set(original_raw_data.keys())
-            complete_fields = set(complete_data.keys())
-            new_fields = complete_fields - original_fields
-
-            # Special attention to Attributes field since that's what we're primarily after
-            attributes = complete_data.get("Attributes", [])
-            attributes_count = len(attributes) if attributes else 0
-
-            enrichment_result["fields_added"] = list(new_fields)
-            enrichment_result["attributes_count"] = attributes_count
-
-            # Prepare the enriched raw data
-            enriched_raw_data = complete_data.copy()
-            enriched_raw_data["_ingestion_method"] = "hash_based_enriched"
-            enriched_raw_data["_ingestion_source"] = "get_account"
-            enriched_raw_data["_enrichment_timestamp"] = datetime.now(
-                timezone.utc
-            ).isoformat()
-            enriched_raw_data["_original_ingestion_method"] = original_raw_data.get(
-                "_ingestion_method", "unknown"
-            )
-            # Store both basic and enriched hashes
-            enriched_raw_data["_content_hash_basic"] = (
-                self._calculate_basic_content_hash(complete_data)
+        # Calculate enriched content hash
+        enriched_hash = self._calculate_enriched_content_hash(complete_data)
+
+        # Check if enriched data has changed
+        existing_enriched_hash = original_raw_data.get("_content_hash_enriched")
+        if existing_enriched_hash == enriched_hash:
+            enrichment_result["success"] = True
+            enrichment_result["action"] = "skipped"
+            logger.debug(
+                f"⏭️  Department {external_id} enriched data unchanged, skipping"
             )
-            enriched_raw_data["_content_hash_enriched"] = enriched_hash
+            return enrichment_result
 
-            # Update the bronze record with the enriched data (unless dry run)
-            if dry_run:
-                logger.debug(
-                    f"[DRY RUN] Would update raw_id {raw_id} with {len(new_fields)} new fields, "
-                    f"{attributes_count} attributes"
-                )
-            else:
-                with self.db_adapter.engine.connect() as conn:
-                    # Update the raw_data field and ingestion_metadata
-                    update_query = text("""
-                        UPDATE bronze.raw_entities
-                        SET raw_data = :enriched_raw_data,
-                            ingestion_metadata = jsonb_set(
-                                COALESCE(ingestion_metadata, '{}'::jsonb),
-                                '{full_data}',
-                                'true'::jsonb
-                            )
-                        WHERE raw_id = :raw_id
-                    """)
-
-                    conn.execute(
-                        update_query,
-                        {
-                            "raw_id": raw_id,
-                            "enriched_raw_data": json.dumps(enriched_raw_data),
-                        },
-                    )
+        # Analyze what new fields we're getting
+        original_fields = set(original_raw_data.keys())
+        complete_fields = set(complete_data.keys())
+        new_fields = complete_fields - original_fields
+
+        # Special attention to Attributes field since that's what we're primarily after
+        attributes = complete_data.get("Attributes", [])
+        attributes_count = len(attributes) if attributes else 0
+
+        enrichment_result["fields_added"] = list(new_fields)
+        enrichment_result["attributes_count"] = attributes_count
+
+        # Prepare the enriched raw data
+        enriched_raw_data = complete_data.copy()
+        enriched_raw_data["_ingestion_method"] = "hash_based_enriched"
+        enriched_raw_data["_ingestion_source"] = "get_account"
+        enriched_raw_data["_enrichment_timestamp"] = datetime.now(
+            timezone.utc
+        ).isoformat()
+        enriched_raw_data["_original_ingestion_method"] = original_raw_data.get(
+            "_ingestion_method", "unknown"
+        )
+        # Store both basic and enriched hashes
+        enriched_raw_data["_content_hash_basic"] = self._calculate_basic_content_hash(
+            complete_data
+        )
+        enriched_raw_data["_content_hash_enriched"] = enriched_hash
 
-                    conn.commit()
+        enrichment_result["enriched_raw_data"] = enriched_raw_data
+        enrichment_result["success"] = True
+        enrichment_result["action"] = "enriched"
 
-            enrichment_result["success"] = True
-            enrichment_result["action"] = "enriched"
+        logger.debug(
+            f"✅ Enriched department {external_id} - added {len(new_fields)} fields, "
+            f"{attributes_count} attributes"
+        )
 
-            logger.debug(
-                f"✅ Successfully enriched department {external_id} - added {len(new_fields)} fields, "
-                f"{attributes_count} attributes"
-            )
+        return enrichment_result
 
-            return enrichment_result
+    def write_enriched_records(
+        self, enrichment_results: List[Dict[str, Any]], dry_run: bool = False
+    ) -> int:
+        """
+        Write a batch of enriched department payloads back to bronze in one statement.
 
-        except Exception as e:
-            error_msg = f"Failed to enrich department {external_id}: {str(e)}"
-            logger.warning(f"⚠️  {error_msg}")
+        Replaces raw_data in place and sets ingestion_metadata.full_data = true
+        for every raw_id in the batch via UPDATE ... FROM unnest(...).
 
-            enrichment_result["error_message"] = error_msg
-            enrichment_result["action"] = "error"
-            return enrichment_result
+        Args:
+            enrichment_results: Results from enrich_department_record() with action 'enriched'
+            dry_run: If True, preview changes without committing
+
+        Returns:
+            Number of records updated
+        """
+        if not enrichment_results:
+            return 0
+
+        if dry_run:
+            for result in enrichment_results:
+                logger.debug(
+                    f"[DRY RUN] Would update raw_id {result['raw_id']} with "
+                    f"{len(result['fields_added'])} new fields, "
+                    f"{result['attributes_count']} attributes"
+                )
+            return 0
+
+        try:
+            with self.db_adapter.engine.connect() as conn:
+                update_query = text("""
+                    UPDATE bronze.raw_entities AS r
+                    SET raw_data = batch.enriched_raw_data,
+                        ingestion_metadata = jsonb_set(
+                            COALESCE(r.ingestion_metadata, '{}'::jsonb),
+                            '{full_data}',
+                            'true'::jsonb
+                        )
+                    FROM unnest(
+                        CAST(:raw_ids AS uuid[]),
+                        CAST(:enriched_raw_data AS jsonb[])
+                    ) AS batch(raw_id, enriched_raw_data)
+                    WHERE r.raw_id = batch.raw_id
+                """)
+
+                result = conn.execute(
+                    update_query,
+                    {
+                        "raw_ids": [str(r["raw_id"]) for r in enrichment_results],
+                        "enriched_raw_data": [
+                            json.dumps(r["enriched_raw_data"])
+                            for r in enrichment_results
+                        ],
+                    },
+                )
+                updated_count = result.rowcount
+                conn.commit()
+
+            logger.debug(f"💾 Wrote {updated_count} enriched department records")
+            return updated_count
+
+        except SQLAlchemyError as e:
+            logger.error(f"❌ Failed to write enriched department batch: {e}")
+            raise
 
     def update_original_records_metadata(
         self, processed_raw_ids: List[str], dry_run: bool = False
@@ -432,7 +489,8 @@ class ProgressiveBronzeEnrichmentService:
         """
         Update the ingestion_metadata for original records to mark them as having basic data only.
 
-        This retroactively adds full_data=false to records that were processed with basic ingestion.
+        This retroactively adds full_data=false to processed records that were not
+        rewritten with enriched data, in a single set-based UPDATE over all raw_ids.
 
         Args:
             processed_raw_ids: List of raw_id values that were processed for enrichment
@@ -447,12 +505,12 @@ class ProgressiveBronzeEnrichmentService:
 
             if dry_run:
                 logger.info(
-                    f"[DRY RUN] Would update ingestion_metadata for existing records"
+                    f"[DRY RUN] Would update ingestion_metadata for "
+                    f"{len(processed_raw_ids)} processed records"
                 )
                 return 0
 
-            # Create a query to update ingestion_metadata for all processed records
-            # We'll update any records that don't already have full_data metadata
+            # Only touch processed records that don't already have full_data metadata
             with self.db_adapter.engine.connect() as conn:
                 update_query = text("""
                     UPDATE bronze.raw_entities
@@ -464,12 +522,16 @@ class ProgressiveBronzeEnrichmentService:
                             ELSE 'false'::jsonb
                         END
                     )
-                    WHERE entity_type = 'department'
+                    WHERE raw_id = ANY(CAST(:raw_ids AS uuid[]))
+                    AND entity_type = 'department'
                     AND source_system = 'tdx'
                     AND (ingestion_metadata->>'full_data' IS NULL)
                 """)
 
-                result = conn.execute(update_query)
+                result = conn.execute(
+                    update_query,
+                    {"raw_ids": [str(raw_id) for raw_id in processed_raw_ids]},
+                )
                 updated_count = result.rowcount
                 conn.commit()
 
@@ -494,6 +556,7 @@ class ProgressiveBronzeEnrichmentService:
                 "stage": "detail_enrichment",
                 "departments_to_process": departments_to_process,
                 "api_rate_limit_delay": self.api_rate_limit_delay,
+                "max_concurrent_enrichments": self.max_concurrent_enrichments,
                 "incremental_since": incremental_since.isoformat()
                 if incremental_since
                 else None,
@@ -574,28 +637,32 @@ class ProgressiveBronzeEnrichmentService:
         except SQLAlchemyError as e:
             logger.error(f"❌ Failed to complete enrichment run: {e}")
 
-    def run_progressive_enrichment(
+    async def run_progressive_enrichment(
         self,
         full_sync: bool = False,
         dry_run: bool = False,
         batch_size: Optional[int] = None,
         stop_on_errors: bool = False,
+        progress_interval: int = 25,
     ) -> Dict[str, Any]:
         """
         Run the progressive enrichment process to complete department data.
 
         This method:
         1. Finds bronze records with _ingestion_method = 'hash_based' and no enriched hash
-        2. Calls get_account(ID) for each to get complete data including Attributes
+        2. Calls get_account(ID) for each to get complete data including Attributes,
+           up to max_concurrent_enrichments calls at a time
         3. Calculates enriched content hash and compares to existing hash
-        4. Only updates records where enriched data has changed
+        4. Only updates records where enriched data has changed, one bronze write per batch
         5. Updates _ingestion_method to 'hash_based_enriched' and stores enriched hash
+        6. Marks the remaining processed records full_data=false in one UPDATE
 
         Args:
             full_sync: If True, re-enrich ALL records (ignore last enrichment timestamp)
             dry_run: If True, preview changes without committing to database
             batch_size: Maximum number of departments to process in this run
-            stop_on_errors: Whether to stop processing if individual enrichments fail
+            stop_on_errors: Whether to stop processing after a batch with failed enrichments
+            progress_interval: Departments per concurrent batch and bronze write (default: 25)
 
         Returns:
             Dictionary with detailed enrichment statistics
@@ -664,28 +731,46 @@ class ProgressiveBronzeEnrichmentService:
                 f"🚀 Starting progressive enrichment for {len(departments_to_enrich)} departments..."
             )
 
-            # Process each department for enrichment
-            for index, row in departments_to_enrich.iterrows():
-                try:
-                    raw_id = row["raw_id"]
-                    external_id = row["external_id"]
-                    department_name = row["department_name"]
-                    original_raw_data = row["raw_data"]  # This comes as dict from JSONB
-
-                    logger.info(
-                        f"📝 Enriching department {enrichment_stats['departments_processed'] + 1}/{len(departments_to_enrich)}: "
-                        f"{department_name} (ID: {external_id})"
+            loop = asyncio.get_event_loop()
+            total_departments = len(departments_to_enrich)
+            processed_raw_ids: List[str] = []
+
+            # Process departments in batches: concurrent API calls, one bronze write
+            for batch_start in range(0, total_departments, progress_interval):
+                batch_df = departments_to_enrich.iloc[
+                    batch_start : batch_start + progress_interval
+                ]
+
+                enrichment_tasks = [
+                    self.enrich_department_record(
+                        raw_id=row["raw_id"],
+                        external_id=row["external_id"],
+                        original_raw_data=row["raw_data"],  # dict from JSONB
+                        loop=loop,
                     )
+                    for _, row in batch_df.iterrows()
+                ]
+                batch_results = await asyncio.gather(
+                    *enrichment_tasks, return_exceptions=True
+                )
 
-                    # Enrich this specific department
-                    enrichment_result = self.enrich_department_record(
-                        raw_id=raw_id,
-                        external_id=external_id,
-                        original_raw_data=original_raw_data,
-                        dry_run=dry_run,
-                    )
+                enriched_results = []
+                for (_, row), enrichment_result in zip(
+                    batch_df.iterrows(), batch_results
+                ):
+                    enrichment_stats["departments_processed"] += 1
+
+                    if isinstance(enrichment_result, Exception):
+                        error_msg = f"Unexpected error processing department {row['external_id']}: {enrichment_result}"
+                        logger.error(f"❌ {error_msg}")
+                        enrichment_stats["errors"].append(error_msg)
+                        enrichment_stats["departments_failed"] += 1
+                        continue
+
+                    processed_raw_ids.append(row["raw_id"])
 
                     if enrichment_result["action"] == "enriched":
+                        enriched_results.append(enrichment_result)
                         enrichment_stats["departments_enriched"] += 1
                         enrichment_stats["total_attributes_added"] += enrichment_result[
                             "attributes_count"
@@ -695,7 +780,8 @@ class ProgressiveBronzeEnrichmentService:
                         )
 
                         logger.info(
-                            f"   ✅ Enriched: +{len(enrichment_result['fields_added'])} fields, "
+                            f"   ✅ Enriched {row['department_name']} (ID: {row['external_id']}): "
+                            f"+{len(enrichment_result['fields_added'])} fields, "
                             f"+{enrichment_result['attributes_count']} attributes"
                         )
                     elif enrichment_result["action"] == "skipped":
@@ -711,32 +797,27 @@ class ProgressiveBronzeEnrichmentService:
                             f"   ❌ Failed: {enrichment_result['error_message']}"
                         )
 
-                        if stop_on_errors:
-                            logger.error(
-                                "🛑 Stopping enrichment due to error and stop_on_errors=True"
-                            )
-                            break
-
-                    enrichment_stats["departments_processed"] += 1
+                # One bronze write per batch for all enriched departments
+                await loop.run_in_executor(
+                    self.executor,
+                    self.write_enriched_records,
+                    enriched_results,
+                    dry_run,
+                )
 
-                    # Progress logging
-                    if enrichment_stats["departments_processed"] % 25 == 0:
-                        logger.info(
-                            f"📈 Progress: {enrichment_stats['departments_processed']}/{len(departments_to_enrich)} departments processed"
-                        )
+                logger.info(
+                    f"📈 Progress: {enrichment_stats['departments_processed']}/{total_departments} departments processed"
+                )
 
-                except Exception as dept_error:
-                    error_msg = f"Unexpected error processing department {row.get('external_id', 'unknown')}: {dept_error}"
-                    logger.error(f"❌ {error_msg}")
-                    enrichment_stats["errors"].append(error_msg)
-                    enrichment_stats["departments_failed"] += 1
-                    enrichment_stats["departments_processed"] += 1
+                if stop_on_errors and enrichment_stats["departments_failed"]:
+                    logger.error(
+                        "🛑 Stopping enrichment due to error and stop_on_errors=True"
+                    )
+                    break
 
-                    if stop_on_errors:
-                        logger.error(
-                            "🛑 Stopping enrichment due to unexpected error and stop_on_errors=True"
-                        )
-                        break
+            # Mark processed records that were not rewritten as basic-data only
+            # (enriched records already carry full_data=true from the batch write)
+            self.update_original_records_metadata(processed_raw_ids, dry_run=dry_run)
 
             # Complete the enrichment run (unless dry run)
             if not dry_run:
@@ -854,15 +935,17 @@ class ProgressiveBronzeEnrichmentService:
             raise
 
     def close(self):
-        """Clean up database connections."""
+        """Clean up database connections and thread pool."""
         if self.db_adapter:
             self.db_adapter.close()
+        if self.executor:
+            self.executor.shutdown(wait=True)
         logger.info("🔌 Progressive bronze enrichment service closed")
 
 
-def main():
+async def main():
     """
-    Main function to run progressive bronze enrichment from command line.
+    Main async function to run progressive bronze enrichment from command line.
     """
     try:
         # Load environment variables
@@ -893,7 +976,19 @@ def main():
             type=float,
             default=1.0,
             metavar="SECONDS",
-            help="Delay between API calls (default: 1.0 seconds)",
+            help="Delay before each API call (default: 1.0 seconds)",
+        )
+        parser.add_argument(
+            "--max-concurrent",
+            type=int,
+            default=3,
+            help="Maximum concurrent API calls (default: 3)",
+        )
+        parser.add_argument(
+            "--progress-interval",
+            type=int,
+            default=25,
+            help="Departments per concurrent batch and bronze write (default: 25)",
         )
         parser.add_argument(
             "--stop-on-errors",
@@ -947,6 +1042,7 @@ def main():
             tdx_web_services_key=tdx_web_services_key,
             tdx_app_id=tdx_app_id,
             api_rate_limit_delay=args.api_delay,
+            max_concurrent_enrichments=args.max_concurrent,
         )
 
         # Handle --show-status
@@ -967,15 +1063,17 @@ def main():
         print(
             f"   Batch Size:          {args.batch_size if args.batch_size else 'Unlimited'}"
         )
+        print(f"   Max Concurrent:      {args.max_concurrent} API calls")
         print(f"   API Delay:           {args.api_delay}s")
         print(f"   Stop on Errors:      {args.stop_on_errors}")
         print("=" * 80)
 
-        results = enrichment_service.run_progressive_enrichment(
+        results = await enrichment_service.run_progressive_enrichment(
             full_sync=args.full_sync,
             dry_run=args.dry_run,
             batch_size=args.batch_size,
             stop_on_errors=args.stop_on_errors,
+            progress_interval=args.progress_interval,
         )
 
         # Display comprehensive summary
@@ -1020,4 +1118,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Run the async main function
+    asyncio.run(main())
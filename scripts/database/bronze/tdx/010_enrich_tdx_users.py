@@ -43,6 +43,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter
+from database.bronze_ingestor import ResumeCheckpoint, reopen_ingestion_run
 from teamdynamix.facade.teamdynamix_facade import TeamDynamixFacade
 
 # Configure logging
@@ -555,6 +556,7 @@ class TDXUserEnrichmentService:
         dry_run: bool = False,
         full_sync: bool = False,
         progress_interval: int = 100,
+        checkpoint: Optional[ResumeCheckpoint] = None,
     ) -> List[Dict[str, Any]]:
         """
         Process multiple users concurrently with enrichment.
@@ -563,6 +565,15 @@ class TDXUserEnrichmentService:
         existing basic hashes for all candidate UIDs. Users whose basic hash matches
         their last enriched hash are skipped without making an API call.
 
+        When a checkpoint is given, it is updated and persisted after every batch
+        so an interrupted run can be resumed with --resume. users_df must then
+        be sorted by UID.
+
+        Only enriched users count as completed: their latest bronze row now
+        carries _enriched_at, so they would drop out of the candidate set anyway,
+        while skipped users are re-checked cheaply (no API call) on resume.
+        Failed UIDs are recorded and retried on resume.
+
         Args:
             users_df: DataFrame of users needing enrichment
             ingestion_run_id: UUID of the current enrichment run
@@ -570,6 +581,7 @@ class TDXUserEnrichmentService:
             dry_run: If True, preview changes without committing
             full_sync: If True, bypass hash comparison and enrich all candidates
             progress_interval: Log progress every N users (default: 100)
+            checkpoint: Run checkpoint (UID watermark and failed UIDs)
 
         Returns:
             List of enrichment results for all users
@@ -581,6 +593,10 @@ class TDXUserEnrichmentService:
         total_users = len(users_df)
         logger.info(f"🔄 Starting concurrent enrichment of {total_users:,} users...")
 
+        track_checkpoint = checkpoint is not None and not dry_run
+        if track_checkpoint:
+            checkpoint.start(users_df["uid"])
+
         # Pre-check: batch-fetch existing enrichment state to identify skippable users
         uids = users_df["uid"].tolist()
         existing_state: Dict[str, Dict[str, Any]] = {}
@@ -655,6 +671,15 @@ class TDXUserEnrichmentService:
                 else:
                     processed_results.append(result)
 
+            # Persist progress so an interrupted run can resume after this batch
+            if track_checkpoint:
+                for uid, result in zip(batch_df["uid"], batch_results):
+                    action = (
+                        "error" if isinstance(result, Exception) else result.get("action")
+                    )
+                    checkpoint.record(uid, action)
+                checkpoint.save(self.db_adapter.engine, ingestion_run_id)
+
             # Calculate progress statistics
             elapsed_time = (datetime.now(timezone.utc) - start_time).total_seconds()
             users_processed = len(processed_results)
@@ -823,6 +848,7 @@ class TDXUserEnrichmentService:
         full_sync: bool = False,
         dry_run: bool = False,
         progress_interval: int = 100,
+        resume_run_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Run the complete async user enrichment process.
@@ -835,10 +861,15 @@ class TDXUserEnrichmentService:
         full_sync bypasses hash comparison and re-enriches all candidates —
         use this after algorithm changes to regenerate stored hashes.
 
+        resume_run_id continues an interrupted run: the run is reopened, its
+        stored full_sync mode is reused and UIDs up to its checkpoint watermark
+        are not enriched again (failed UIDs are retried).
+
         Args:
             full_sync: If True, bypass hash comparison and enrich all candidates
             dry_run: If True, preview changes without committing to database
             progress_interval: Log progress every N users (default: 100)
+            resume_run_id: Run ID of an interrupted enrichment run to continue
 
         Returns:
             Dictionary with comprehensive enrichment statistics
@@ -863,6 +894,29 @@ class TDXUserEnrichmentService:
             if dry_run:
                 logger.info("⚠️  DRY RUN MODE - No changes will be committed")
 
+            # Resuming: reopen the interrupted run and restore its checkpoint
+            checkpoint = ResumeCheckpoint("uid")
+            if resume_run_id:
+                run_metadata = reopen_ingestion_run(
+                    self.db_adapter.engine, resume_run_id, "tdx", "user"
+                )
+                if run_metadata.get("enrichment_type") != "detailed_user_data":
+                    raise ValueError(
+                        f"Run {resume_run_id} is not a TDX user enrichment run"
+                    )
+                full_sync = bool(run_metadata.get("full_sync", full_sync))
+                enrichment_stats["full_sync"] = full_sync
+                enrichment_stats["run_id"] = resume_run_id
+
+                checkpoint = ResumeCheckpoint("uid", run_metadata.get("checkpoint"))
+                logger.info(
+                    f"♻️  Resuming enrichment run {resume_run_id}: "
+                    f"{checkpoint.enriched:,} users already enriched "
+                    f"(through UID {checkpoint.last_key}), "
+                    f"{len(checkpoint.failed):,} failed users to retry "
+                    f"(last checkpoint: {checkpoint.updated_at or 'none'})"
+                )
+
             if full_sync:
                 logger.info(
                     "🔄 Full sync mode: bypassing hash comparison, enriching ALL candidates"
@@ -879,14 +933,33 @@ class TDXUserEnrichmentService:
             # Step 1: Get candidates (latest bronze row per UID lacks _enriched_at)
             users_df = self._get_users_needing_enrichment(full_sync=full_sync)
 
+            # Walk candidates in UID order so the checkpoint watermark can
+            # tell which users a resumed run has already handled
+            if not users_df.empty:
+                users_df = users_df.sort_values("uid", kind="stable")
+                users_df = users_df[
+                    ~users_df["uid"].map(checkpoint.is_done)
+                ].reset_index(drop=True)
+
             if users_df.empty:
                 logger.info("✨ All users have complete enrichment data")
+                if resume_run_id:
+                    self.complete_enrichment_run(
+                        run_id=resume_run_id,
+                        total_users_processed=checkpoint.processed,
+                        total_users_enriched=checkpoint.enriched,
+                        total_errors=0,
+                    )
+                    enrichment_stats["completed_at"] = datetime.now(timezone.utc)
                 return enrichment_stats
 
             enrichment_stats["total_users_needing_enrichment"] = len(users_df)
 
-            # Step 2: Create enrichment run for tracking
-            run_id = self.create_enrichment_run(len(users_df), full_sync=full_sync)
+            # Step 2: Create enrichment run for tracking (or continue the resumed one)
+            if resume_run_id:
+                run_id = resume_run_id
+            else:
+                run_id = self.create_enrichment_run(len(users_df), full_sync=full_sync)
             enrichment_stats["run_id"] = run_id
 
             # Step 3: Process all users concurrently (hash pre-check inside)
@@ -899,6 +972,7 @@ class TDXUserEnrichmentService:
                 dry_run=dry_run,
                 full_sync=full_sync,
                 progress_interval=progress_interval,
+                checkpoint=checkpoint,
             )
 
             # Step 4: Calculate statistics
@@ -927,10 +1001,13 @@ class TDXUserEnrichmentService:
             if enrichment_stats["errors"]:
                 error_summary = f"{len(enrichment_stats['errors'])} errors occurred during enrichment"
 
+            # Run totals include users enriched before an interruption
             self.complete_enrichment_run(
                 run_id=run_id,
-                total_users_processed=len(users_df),
-                total_users_enriched=enrichment_stats["total_users_enriched"],
+                total_users_processed=max(len(users_df), checkpoint.processed),
+                total_users_enriched=(
+                    checkpoint.enriched or enrichment_stats["total_users_enriched"]
+                ),
                 total_errors=enrichment_stats["total_users_failed"],
                 error_message=error_summary,
             )
@@ -1072,8 +1149,18 @@ async def main():
                 "to the basic hash."
             ),
         )
+        parser.add_argument(
+            "--resume",
+            metavar="RUN_ID",
+            help=(
+                "Resume an interrupted enrichment run: reuses the run ID and its "
+                "full-sync mode, and skips users already enriched per its checkpoint"
+            ),
+        )
 
         args = parser.parse_args()
+        if args.resume and args.dry_run:
+            parser.error("--resume cannot be combined with --dry-run")
 
         # Load environment variables
         load_dotenv()
@@ -1134,6 +1221,8 @@ async def main():
         print(f"API Delay:           {args.api_delay}s")
         print(f"Progress Interval:   {args.progress_interval} users")
         print(f"Max Enrichment Age:  {args.max_enrichment_age} days")
+        if args.resume:
+            print(f"Resuming Run:        {args.resume}")
         print("=" * 80)
         print()
 
@@ -1141,6 +1230,7 @@ async def main():
             full_sync=args.full_sync,
             dry_run=args.dry_run,
             progress_interval=args.progress_interval,
+            resume_run_id=args.resume,
         )
 
         # Display comprehensive summary
@@ -1154,7 +1244,7 @@ async def main():
         print("=" * 80)
         print(f"Run ID:              {results.get('run_id', 'N/A')}")
         print(
-            f"Mode:                {'FULL SYNC' if args.full_sync else 'HASH-DRIVEN'}"
+            f"Mode:                {'FULL SYNC' if results['full_sync'] else 'HASH-DRIVEN'}"
         )
         print(f"Dry Run:             {args.dry_run}")
         print(f"Duration:            {total_duration:.2f} seconds")
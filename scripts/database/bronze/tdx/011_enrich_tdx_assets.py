@@ -42,6 +42,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..
 from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter
+from database.bronze_ingestor import ResumeCheckpoint, reopen_ingestion_run
 from teamdynamix.facade.teamdynamix_facade import TeamDynamixFacade
 
 # Determine log directory based on script location
@@ -159,75 +160,122 @@ class TDXAssetEnrichmentService:
         self, full_sync: bool = False, since_timestamp: Optional[datetime] = None
     ) -> pd.DataFrame:
         """
-        Query bronze layer for assets that need enrichment.
+        Query bronze layer for assets whose search-level data is newer than their enrichment.
 
-        An asset needs enrichment if:
-        - Attributes is NULL or missing
-        - Attachments is NULL or missing
-        - Never been enriched (_enriched_at missing)
-        - In incremental mode: only assets modified since last enrichment
+        Candidates are the latest search rows (written by 003_ingest_tdx_assets.py)
+        per asset. Incremental runs take the assets with search rows ingested
+        since the last enrichment run; full syncs walk every asset ID with a
+        recursive skip scan (one index probe per asset). For each candidate the
+        latest search row and the most recent enriched row are then fetched
+        with LATERAL lookups on (external_id, ingested_at DESC), served by the
+        partial indexes idx_bronze_tdx_asset_search_latest and
+        idx_bronze_tdx_asset_enriched_latest, so neither path sorts the full
+        asset history.
+
+        Whether an API call is needed is then decided by _filter_unmodified_assets()
+        from the two ModifiedDate values.
 
         Args:
-            full_sync: If True, get all assets. If False, only recently updated
-            since_timestamp: Only get assets modified after this timestamp
+            full_sync: If True, consider every asset's latest search row
+            since_timestamp: Only consider search rows ingested after this timestamp
 
         Returns:
-            DataFrame with columns: asset_id, asset_name, asset_tag, external_id, raw_data
+            DataFrame with columns: asset_id, asset_name, asset_tag, external_id,
+            ingested_at, search_modified_date, enriched_modified_date, enriched_at
         """
         try:
-            # Base query to find assets needing enrichment
-            query = """
-            WITH latest_assets AS (
-                SELECT DISTINCT ON (raw_data->>'ID')
-                    raw_data->>'ID' as asset_id,
-                    raw_data->>'Name' as asset_name,
-                    raw_data->>'Tag' as asset_tag,
-                    external_id,
-                    raw_data,
-                    ingested_at,
-                    raw_data->'_enriched_at' as enriched_at
-                FROM bronze.raw_entities
-                WHERE entity_type = 'asset'
-                  AND source_system = 'tdx'
-                  AND raw_data->>'ID' IS NOT NULL
-                ORDER BY raw_data->>'ID', ingested_at DESC
-            )
-            SELECT
-                asset_id,
-                asset_name,
-                asset_tag,
-                external_id,
-                ingested_at,
-                enriched_at
-            FROM latest_assets
-            WHERE (
-                -- Missing or incomplete enrichment data
-                raw_data->'Attributes' IS NULL OR
-                raw_data->'Attachments' IS NULL OR
-                raw_data->'_enriched_at' IS NULL
-            )
+            search_rows = """
+                    entity_type = 'asset'
+                    AND source_system = 'tdx'
+                    AND raw_data->>'ID' IS NOT NULL
+                    AND raw_data->>'_enriched_at' IS NULL
             """
-
-            # Add incremental filter if not full sync
+            params = {}
             if not full_sync and since_timestamp:
-                query += """
-                AND ingested_at > :since_timestamp
+                candidate_ids = f"""
+                SELECT DISTINCT external_id
+                FROM bronze.raw_entities
+                WHERE {search_rows}
+                  AND ingested_at > :since_timestamp
                 """
                 params = {"since_timestamp": since_timestamp}
             else:
-                params = {}
+                # Loose index scan: each step jumps to the next external_id
+                candidate_ids = f"""
+                (
+                    SELECT external_id
+                    FROM bronze.raw_entities
+                    WHERE {search_rows}
+                    ORDER BY external_id
+                    LIMIT 1
+                )
+                UNION ALL
+                SELECT (
+                    SELECT r.external_id
+                    FROM bronze.raw_entities r
+                    WHERE {search_rows}
+                      AND r.external_id > c.external_id
+                    ORDER BY r.external_id
+                    LIMIT 1
+                )
+                FROM candidate_ids c
+                WHERE c.external_id IS NOT NULL
+                """
 
-            query += """
-            ORDER BY ingested_at DESC
+            query = f"""
+            WITH RECURSIVE candidate_ids(external_id) AS (
+                {candidate_ids}
+            ),
+            latest_search AS (
+                SELECT s.*
+                FROM candidate_ids c
+                CROSS JOIN LATERAL (
+                    SELECT
+                        raw_data->>'ID' as asset_id,
+                        raw_data->>'Name' as asset_name,
+                        raw_data->>'Tag' as asset_tag,
+                        external_id,
+                        ingested_at,
+                        raw_data->>'ModifiedDate' as search_modified_date
+                    FROM bronze.raw_entities
+                    WHERE {search_rows}
+                      AND external_id = c.external_id
+                    ORDER BY ingested_at DESC
+                    LIMIT 1
+                ) s
+            )
+            SELECT
+                s.asset_id,
+                s.asset_name,
+                s.asset_tag,
+                s.external_id,
+                s.ingested_at,
+                s.search_modified_date,
+                e.enriched_modified_date,
+                e.enriched_at
+            FROM latest_search s
+            LEFT JOIN LATERAL (
+                SELECT
+                    raw_data->>'ModifiedDate' as enriched_modified_date,
+                    raw_data->>'_enriched_at' as enriched_at
+                FROM bronze.raw_entities
+                WHERE entity_type = 'asset'
+                  AND source_system = 'tdx'
+                  AND external_id = s.external_id
+                  AND raw_data->>'_enriched_at' IS NOT NULL
+                ORDER BY ingested_at DESC
+                LIMIT 1
+            ) e ON TRUE
+            ORDER BY s.ingested_at DESC
             """
 
             result_df = self.db_adapter.query_to_dataframe(query, params)
 
             if result_df.empty:
-                logger.info("✨ All assets have complete enrichment data")
+                logger.info("✨ No new search-level asset data since last enrichment")
                 return result_df
 
-            logger.info(f"🔍 Found {len(result_df)} assets needing enrichment")
+            logger.info(f"🔍 Found {len(result_df)} candidate assets")
 
             # Log sample assets
             sample_assets = result_df.head(5)
@@ -243,6 +291,64 @@ class TDXAssetEnrichmentService:
             logger.error(f"❌ Failed to query assets needing enrichment: {e}")
             raise
 
+    @staticmethod
+    def _parse_modified_date(value: Optional[str]) -> Optional[datetime]:
+        """
+        Parse a TDX ModifiedDate (e.g. "2024-07-23T00:09:00.17Z") as an aware datetime.
+
+        Args:
+            value: ModifiedDate string from raw_data
+
+        Returns:
+            Timezone-aware datetime (UTC assumed if naive), or None if missing/invalid
+        """
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+    def _filter_unmodified_assets(self, assets_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop candidates whose enriched row is at least as new as their search row.
+
+        TDX bumps ModifiedDate on any change to an asset, including fields only
+        get_asset returns, so an asset whose search-level ModifiedDate is not newer
+        than the ModifiedDate stored with its last enrichment cannot have changed.
+        Assets never enriched, or with an unparseable ModifiedDate on either side,
+        are kept.
+
+        Args:
+            assets_df: Candidates from _get_assets_needing_enrichment()
+
+        Returns:
+            The candidates that need an API call
+        """
+        if assets_df.empty:
+            return assets_df
+
+        unchanged = pd.Series(
+            [
+                search is not None and enriched is not None and search <= enriched
+                for search, enriched in zip(
+                    map(self._parse_modified_date, assets_df["search_modified_date"]),
+                    map(self._parse_modified_date, assets_df["enriched_modified_date"]),
+                )
+            ],
+            index=assets_df.index,
+            dtype=bool,
+        )
+
+        logger.info(
+            f"   ⏭️  {int(unchanged.sum()):,} assets unchanged since last enrichment "
+            f"(no API call needed)"
+        )
+        logger.info(f"   🔄 {int((~unchanged).sum()):,} assets to enrich")
+
+        return assets_df[~unchanged].reset_index(drop=True)
+
     def _calculate_basic_content_hash(self, asset_data: Dict[str, Any]) -> str:
         """
         Calculate basic content hash (matching ingest script).
@@ -468,15 +574,24 @@ class TDXAssetEnrichmentService:
         ingestion_run_id: str,
         loop: asyncio.AbstractEventLoop,
         dry_run: bool = False,
+        checkpoint: Optional[ResumeCheckpoint] = None,
+        checkpoint_interval: int = 50,
     ) -> List[Dict[str, Any]]:
         """
         Process multiple assets concurrently with enrichment.
 
+        When a checkpoint is given, it is updated as assets complete and
+        persisted every checkpoint_interval assets (and once at the end) so an
+        interrupted run can be resumed with --resume. assets_df must then be
+        sorted by asset ID.
+
         Args:
             assets_df: DataFrame of assets needing enrichment
             ingestion_run_id: UUID of the current enrichment run
             loop: Event loop for async execution
             dry_run: If True, preview changes without committing
+            checkpoint: Run checkpoint (asset ID watermark and failed asset IDs)
+            checkpoint_interval: Persist the checkpoint every N completed assets
 
         Returns:
             List of enrichment results for all assets
@@ -488,6 +603,10 @@ class TDXAssetEnrichmentService:
         total_assets = len(assets_df)
         logger.info(f"🔄 Starting concurrent enrichment of {total_assets} assets...")
 
+        track_checkpoint = checkpoint is not None and not dry_run
+        if track_checkpoint:
+            checkpoint.start(assets_df["asset_id"])
+
         # Create enrichment tasks for all assets
         enrichment_tasks = [
             self.enrich_asset_record(
@@ -511,6 +630,14 @@ class TDXAssetEnrichmentService:
             enrichment_results.append(result)
             completed += 1
 
+            if track_checkpoint:
+                # An exception carries no asset ID; the watermark stops before
+                # that asset, so a resume starts again from there
+                if not isinstance(result, Exception):
+                    checkpoint.record(result["asset_id"], result.get("action"))
+                if completed % checkpoint_interval == 0 or completed == total_assets:
+                    checkpoint.save(self.db_adapter.engine, ingestion_run_id)
+
             # Log progress every 50 assets
             if completed % 50 == 0:
                 enriched = sum(
@@ -679,14 +806,23 @@ class TDXAssetEnrichmentService:
             logger.error(f"❌ Failed to complete enrichment run: {e}")
 
     async def run_async_asset_enrichment(
-        self, full_sync: bool = False, dry_run: bool = False
+        self,
+        full_sync: bool = False,
+        dry_run: bool = False,
+        resume_run_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Run the complete async asset enrichment process.
 
+        resume_run_id continues an interrupted run: the run is reopened, its
+        full_sync mode and incremental_since timestamp are reused so the
+        candidate set matches the original run, and assets up to its
+        checkpoint watermark are not fetched again (failed assets are retried).
+
         Args:
             full_sync: If True, enrich all assets. If False, use incremental mode
             dry_run: If True, preview changes without committing to database
+            resume_run_id: Run ID of an interrupted enrichment run to continue
 
         Returns:
             Dictionary with comprehensive enrichment statistics
@@ -694,6 +830,7 @@ class TDXAssetEnrichmentService:
         enrichment_stats = {
             "started_at": datetime.now(timezone.utc),
             "total_assets_needing_enrichment": 0,
+            "total_assets_unchanged": 0,
             "total_assets_enriched": 0,
             "total_assets_failed": 0,
             "total_attributes": 0,
@@ -707,10 +844,39 @@ class TDXAssetEnrichmentService:
         try:
             logger.info("🚀 Starting async asset enrichment process...")
 
-            # Determine processing mode
-            last_timestamp = (
-                None if full_sync else self._get_last_enrichment_timestamp()
-            )
+            checkpoint = ResumeCheckpoint("asset_id")
+            if resume_run_id:
+                # Reopen the interrupted run and restore its mode and checkpoint
+                run_metadata = reopen_ingestion_run(
+                    self.db_adapter.engine, resume_run_id, "tdx", "asset"
+                )
+                if run_metadata.get("enrichment_type") != "detailed_asset_data":
+                    raise ValueError(
+                        f"Run {resume_run_id} is not a TDX asset enrichment run"
+                    )
+                full_sync = bool(run_metadata.get("full_sync", full_sync))
+                incremental_since = run_metadata.get("incremental_since")
+                last_timestamp = (
+                    datetime.fromisoformat(incremental_since)
+                    if incremental_since and not full_sync
+                    else None
+                )
+                enrichment_stats["full_sync"] = full_sync
+                enrichment_stats["run_id"] = resume_run_id
+
+                checkpoint = ResumeCheckpoint("asset_id", run_metadata.get("checkpoint"))
+                logger.info(
+                    f"♻️  Resuming enrichment run {resume_run_id}: "
+                    f"{checkpoint.enriched:,} assets already enriched "
+                    f"(through asset {checkpoint.last_key}), "
+                    f"{len(checkpoint.failed):,} failed assets to retry "
+                    f"(last checkpoint: {checkpoint.updated_at or 'none'})"
+                )
+            else:
+                # Determine processing mode
+                last_timestamp = (
+                    None if full_sync else self._get_last_enrichment_timestamp()
+                )
 
             if dry_run:
                 logger.info("⚠️  DRY RUN MODE - No changes will be committed")
@@ -729,23 +895,59 @@ class TDXAssetEnrichmentService:
                 full_sync=full_sync, since_timestamp=last_timestamp
             )
 
+            # Walk candidates in asset ID order so the checkpoint watermark can
+            # tell which assets a resumed run has already handled
+            if not assets_df.empty:
+                assets_df = assets_df.sort_values("asset_id", kind="stable")
+                assets_df = assets_df[
+                    ~assets_df["asset_id"].map(checkpoint.is_done)
+                ].reset_index(drop=True)
+
             if assets_df.empty:
                 logger.info("✨ All assets have complete enrichment data")
+                if resume_run_id:
+                    self.complete_enrichment_run(
+                        run_id=resume_run_id,
+                        total_assets_processed=checkpoint.processed,
+                        total_assets_enriched=checkpoint.enriched,
+                        total_errors=0,
+                    )
+                enrichment_stats["completed_at"] = datetime.now(timezone.utc)
                 return enrichment_stats
 
+            # Step 1b: Skip assets not modified since their last enrichment. The run
+            # is still recorded when nothing is left so the incremental window advances.
+            candidate_count = len(assets_df)
+            if not full_sync:
+                assets_df = self._filter_unmodified_assets(assets_df)
+                enrichment_stats["total_assets_unchanged"] = candidate_count - len(
+                    assets_df
+                )
+
             enrichment_stats["total_assets_needing_enrichment"] = len(assets_df)
 
-            # Step 2: Create enrichment run for tracking
-            run_id = self.create_enrichment_run(
-                len(assets_df), full_sync=full_sync, incremental_since=last_timestamp
-            )
+            # Step 2: Create enrichment run for tracking (or continue the resumed one)
+            if resume_run_id:
+                run_id = resume_run_id
+            else:
+                run_id = self.create_enrichment_run(
+                    len(assets_df), full_sync=full_sync, incremental_since=last_timestamp
+                )
             enrichment_stats["run_id"] = run_id
 
             # Step 3: Process all assets concurrently
             loop = asyncio.get_event_loop()
 
-            enrichment_results = await self.process_assets_concurrently(
-                assets_df=assets_df, ingestion_run_id=run_id, loop=loop, dry_run=dry_run
+            enrichment_results = (
+                await self.process_assets_concurrently(
+                    assets_df=assets_df,
+                    ingestion_run_id=run_id,
+                    loop=loop,
+                    dry_run=dry_run,
+                    checkpoint=checkpoint,
+                )
+                if not assets_df.empty
+                else []
             )
 
             # Step 4: Calculate statistics
@@ -769,10 +971,13 @@ class TDXAssetEnrichmentService:
             if enrichment_stats["errors"]:
                 error_summary = f"{len(enrichment_stats['errors'])} errors occurred during enrichment"
 
+            # Run totals include assets enriched before an interruption
             self.complete_enrichment_run(
                 run_id=run_id,
-                total_assets_processed=len(assets_df),
-                total_assets_enriched=enrichment_stats["total_assets_enriched"],
+                total_assets_processed=max(candidate_count, checkpoint.processed),
+                total_assets_enriched=(
+                    checkpoint.enriched or enrichment_stats["total_assets_enriched"]
+                ),
                 total_errors=enrichment_stats["total_assets_failed"],
                 error_message=error_summary,
             )
@@ -810,6 +1015,9 @@ class TDXAssetEnrichmentService:
             logger.info(
                 f"   Assets Needing Enrich:  {enrichment_stats['total_assets_needing_enrichment']:>6,}"
             )
+            logger.info(
+                f"   Unchanged (skipped):    {enrichment_stats['total_assets_unchanged']:>6,}"
+            )
             logger.info(
                 f"   ├─ Enriched:            {enrichment_stats['total_assets_enriched']:>6,}"
             )
@@ -894,8 +1102,18 @@ async def main():
             default=0.1,
             help="API rate limit delay in seconds (default: 0.1)",
         )
+        parser.add_argument(
+            "--resume",
+            metavar="RUN_ID",
+            help=(
+                "Resume an interrupted enrichment run: reuses the run ID, its mode and "
+                "incremental window, and skips assets already enriched per its checkpoint"
+            ),
+        )
 
         args = parser.parse_args()
+        if args.resume and args.dry_run:
+            parser.error("--resume cannot be combined with --dry-run")
 
         # Load environment variables
         load_dotenv()
@@ -953,11 +1171,13 @@ async def main():
         print(f"Dry Run:             {args.dry_run}")
         print(f"Max Concurrent:      {args.max_concurrent} API calls")
         print(f"API Delay:           {args.api_delay}s")
+        if args.resume:
+            print(f"Resuming Run:        {args.resume}")
         print("=" * 80)
         print()
 
         results = await enrichment_service.run_async_asset_enrichment(
-            full_sync=args.full_sync, dry_run=args.dry_run
+            full_sync=args.full_sync, dry_run=args.dry_run, resume_run_id=args.resume
         )
 
         # Display comprehensive summary
@@ -971,11 +1191,12 @@ async def main():
         print("=" * 80)
         print(f"Run ID:              {results.get('run_id', 'N/A')}")
         print(
-            f"Mode:                {'FULL SYNC' if args.full_sync else 'INCREMENTAL'}"
+            f"Mode:                {'FULL SYNC' if results['full_sync'] else 'INCREMENTAL'}"
         )
         print(f"Dry Run:             {args.dry_run}")
         print(f"Duration:            {total_duration:.2f} seconds")
         print(f"")
+        print(f"Unchanged (skipped): {results['total_assets_unchanged']:>6,}")
         print(f"Assets Needing Data: {results['total_assets_needing_enrichment']:>6,}")
         print(f"├─ Enriched:         {results['total_assets_enriched']:>6,}")
         print(f"└─ Failed:           {results['total_assets_failed']:>6,}")
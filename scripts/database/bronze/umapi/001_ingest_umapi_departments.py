@@ -39,7 +39,7 @@ from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter
 from umich.api.department_api import DepartmentAPI
-from umich.api.um_api import create_headers
+from umich.api.um_api import create_headers, get_token_manager
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -107,8 +107,16 @@ class UMichDepartmentIngestionService:
         )
 
         # Initialize UMich Department API with proper authentication
+        # The shared token manager refreshes the token before it expires and
+        # reuses a still-valid token cached by an earlier script (UM_API_TOKEN_CACHE)
+        self.um_token_manager = get_token_manager(um_client_key, um_client_secret, scope)
         self.um_headers = create_headers(um_client_key, um_client_secret, scope)
-        self.um_dept_api = DepartmentAPI(um_base_url, um_category_id, self.um_headers)
+        self.um_dept_api = DepartmentAPI(
+            um_base_url,
+            um_category_id,
+            self.um_headers,
+            token_manager=self.um_token_manager,
+        )
 
         # Store full sync and dry run flags
         self.force_full_sync = force_full_sync
@@ -593,6 +601,9 @@ class UMichDepartmentIngestionService:
                 f"   Errors:               {len(ingestion_stats['errors']):>6,}"
             )
             logger.info(f"   Duration:             {duration:.2f}s")
+            logger.info(
+                f"   OAuth Token Requests: {self.um_token_manager.stats['token_requests']:>6,}"
+            )
             logger.info("=" * 80)
 
             if self.dry_run:
@@ -12,16 +12,15 @@ import json
 import logging
 import os
 import sys
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Set
 
 # Core Python imports for PostgreSQL operations
 import pandas as pd
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -32,8 +31,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter, create_postgres_adapter
+from database.bronze_ingestor import BronzeIngestor
 from umich.api.department_api import DepartmentAPI
-from umich.api.um_api import create_headers  # For um ich API authentication
+from umich.api.um_api import create_headers, get_token_manager  # For um ich API authentication
 
 script_name = os.path.basename(__file__).replace(".py", "")
 log_dir = "/var/log/lsats/bronze"
@@ -51,7 +51,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class UMichEmployeeIngestionService:
+class UMichEmployeeIngestionService(BronzeIngestor):
     """
     Employee ingestion service for University of Michigan employee data.
 
@@ -64,6 +64,10 @@ class UMichEmployeeIngestionService:
     4. Only creates new bronze records when employee content has actually changed
     5. Preserves complete change history for employee analysis
 
+    The change detection loop, run tracking and bulk writes come from
+    BronzeIngestor; this class supplies the API pages, the hash and the
+    stored raw_data.
+
     Key Features:
     - Efficient change detection without requiring timestamps
     - Employee-department relationship tracking
@@ -73,6 +77,12 @@ class UMichEmployeeIngestionService:
     - Full sync option to bypass change detection
     """
 
+    source_system = "umich_api"
+    entity_type = "user"
+    key_field = "EmplId"
+    # Employee records have always stored their _content_hash
+    trust_stored_hashes = True
+
     def __init__(
         self,
         database_url: str,
@@ -83,6 +93,7 @@ class UMichEmployeeIngestionService:
         scope: str = "department",
         force_full_sync: bool = False,
         dry_run: bool = False,
+        page_workers: int = 4,
     ):
         """
         Initialize the UMich employee ingestion service.
@@ -96,18 +107,30 @@ class UMichEmployeeIngestionService:
             scope: API scope (default: "department")
             force_full_sync: If True, bypass change detection and process all records
             dry_run: If True, preview changes without committing to database
+            page_workers: Number of API pages fetched concurrently (1 for sequential)
         """
-        self.db_adapter = PostgresAdapter(
-            database_url=database_url, pool_size=5, max_overflow=10
+        super().__init__(
+            db_adapter=PostgresAdapter(
+                database_url=database_url, pool_size=5, max_overflow=10
+            ),
+            force_full_sync=force_full_sync,
+            dry_run=dry_run,
         )
 
         # Initialize UMich Department API with proper authentication
+        # The shared token manager refreshes the token before it expires and
+        # reuses a still-valid token cached by an earlier script (UM_API_TOKEN_CACHE)
+        self.um_token_manager = get_token_manager(um_client_key, um_client_secret, scope)
         self.um_headers = create_headers(um_client_key, um_client_secret, scope)
-        self.um_dept_api = DepartmentAPI(um_base_url, um_category_id, self.um_headers)
+        self.um_dept_api = DepartmentAPI(
+            um_base_url,
+            um_category_id,
+            self.um_headers,
+            token_manager=self.um_token_manager,
+        )
 
-        # Store flags
-        self.force_full_sync = force_full_sync
-        self.dry_run = dry_run
+        self.page_workers = max(1, page_workers)
+        self._reset_analytics()
 
         logger.info(
             f"✅ UMich employee ingestion service initialized with content hashing "
@@ -115,6 +138,12 @@ class UMichEmployeeIngestionService:
             f"dry_run={'enabled' if dry_run else 'disabled'})"
         )
 
+    def _reset_analytics(self) -> None:
+        """Clear the analytics collected by observe_record()."""
+        self.unique_departments: Set[str] = set()
+        self.job_families: Set[str] = set()
+        self.employment_statuses: Set[str] = set()
+
     def _calculate_employee_content_hash(self, emp_data: Dict[str, Any]) -> str:
         """
         Calculate a content hash for umich employee data to detect meaningful changes.
@@ -166,173 +195,56 @@ class UMichEmployeeIngestionService:
 
         return content_hash
 
-    def _get_existing_employee_hashes(self) -> Dict[str, str]:
-        """
-        Retrieve the latest content hash for each umich employee from the bronze layer.
-
-        This uses a window function to get only the most recent record for each
-        employee, allowing efficient comparison with new data.
+    def calculate_content_hash(self, record: Dict[str, Any]) -> str:
+        """Hash employees with the umich-specific significant fields."""
+        return self._calculate_employee_content_hash(record)
 
-        Returns:
-            Dictionary mapping EmplId -> latest_content_hash
+    def fetch_batches(self) -> Iterator[List[Dict[str, Any]]]:
         """
-        try:
-            # Query to get the most recent record for each employee
-            query = """
-            WITH latest_employees AS (
-                SELECT
-                    external_id,
-                    raw_data,
-                    ingested_at,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY external_id
-                        ORDER BY ingested_at DESC
-                    ) as row_num
-                FROM bronze.raw_entities
-                WHERE entity_type = 'user'
-                AND source_system = 'umich_api'
-            )
-            SELECT
-                external_id,
-                raw_data
-            FROM latest_employees
-            WHERE row_num = 1
-            """
-
-            results_df = self.db_adapter.query_to_dataframe(query)
-
-            # Calculate content hashes for existing records
-            existing_hashes = {}
-            for _, row in results_df.iterrows():
-                empl_id = row["external_id"]
-                raw_data = row["raw_data"]  # JSONB comes back as dict
+        Yield employee pages from the UMich API as they arrive.
 
-                # Use stored hash if available, otherwise calculate it
-                content_hash = raw_data.get("_content_hash")
-                if not content_hash:
-                    content_hash = self._calculate_employee_content_hash(raw_data)
+        Pages are fetched concurrently, so change detection starts on the
+        first page while later pages are still downloading.
 
-                existing_hashes[empl_id] = content_hash
-
-            logger.info(
-                f"📚 Retrieved content hashes for {len(existing_hashes)} existing umich employees"
-            )
-            return existing_hashes
-
-        except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to retrieve existing employee hashes: {e}")
-            raise
-
-    def create_ingestion_run(self, source_system: str, entity_type: str) -> str:
-        """Create a new ingestion run record for tracking purposes."""
-        if self.dry_run:
-            run_id = f"dry-run-{uuid.uuid4()}"
-            logger.info(f"[DRY RUN] Would create ingestion run {run_id}")
-            return run_id
-
-        try:
-            run_id = str(uuid.uuid4())
-
-            # Metadata specific to umich content hashing approach
-            metadata = {
-                "ingestion_type": "content_hash_based",
-                "source_api": "umich_department_employee_api",
-                "change_detection_method": "sha256_content_hash",
-                "includes_department_relationships": True,
-                "full_sync": self.force_full_sync,
-            }
-
-            with self.db_adapter.engine.connect() as conn:
-                # Mark any stale 'running' runs as failed before starting a new one.
-                # Stale runs occur when a process is OOM-killed or force-stopped before
-                # it can update its own status.
-                conn.execute(text("""
-                    UPDATE meta.ingestion_runs
-                    SET status = 'failed',
-                        completed_at = NOW(),
-                        error_message = 'stale - process terminated before completing (OOM kill or force stop)'
-                    WHERE source_system = :source_system
-                      AND entity_type = :entity_type
-                      AND status = 'running'
-                """), {"source_system": source_system, "entity_type": entity_type})
-
-                insert_query = text("""
-                    INSERT INTO meta.ingestion_runs (
-                        run_id, source_system, entity_type, started_at, status, metadata
-                    ) VALUES (
-                        :run_id, :source_system, :entity_type, :started_at, 'running', :metadata
-                    )
-                """)
-
-                conn.execute(
-                    insert_query,
-                    {
-                        "run_id": run_id,
-                        "source_system": source_system,
-                        "entity_type": entity_type,
-                        "started_at": datetime.now(timezone.utc),
-                        "metadata": json.dumps(metadata),
-                    },
-                )
-
-                conn.commit()
-
-            logger.info(
-                f"🚀 Created umich ingestion run {run_id} for {source_system}/{entity_type}"
-            )
-            return run_id
-
-        except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to create ingestion run: {e}")
-            raise
-
-    def complete_ingestion_run(
-        self,
-        run_id: str,
-        records_processed: int,
-        records_created: int,
-        records_skipped: int = 0,
-        error_message: Optional[str] = None,
-    ):
-        """Mark an ingestion run as completed with comprehensive statistics."""
-        if self.dry_run:
-            logger.info(f"[DRY RUN] Would complete ingestion run {run_id}")
-            return
-
-        try:
-            status = "failed" if error_message else "completed"
-
-            with self.db_adapter.engine.connect() as conn:
-                update_query = text("""
-                    UPDATE meta.ingestion_runs
-                    SET completed_at = :completed_at,
-                        status = :status,
-                        records_processed = :records_processed,
-                        records_created = :records_created,
-                        records_updated = :records_skipped,
-                        error_message = :error_message
-                    WHERE run_id = :run_id
-                """)
-
-                conn.execute(
-                    update_query,
-                    {
-                        "run_id": run_id,
-                        "completed_at": datetime.now(timezone.utc),
-                        "status": status,
-                        "records_processed": records_processed,
-                        "records_created": records_created,
-                        "records_skipped": records_skipped,
-                        "error_message": error_message,
-                    },
-                )
-
-                conn.commit()
-
-            logger.info(f"🏁 Completed umich ingestion run {run_id}: {status}")
+        Yields:
+            Pages of raw employee records
+        """
+        logger.info(
+            f"🔬 Fetching employee data from University of Michigan API "
+            f"({self.page_workers} concurrent page requests)..."
+        )
+        yield from self.um_dept_api.iter_department_employee_pages(
+            max_workers=self.page_workers
+        )
 
-        except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to complete ingestion run: {e}")
+    def observe_record(self, record: Dict[str, Any]) -> None:
+        """Track analytics for reporting (using actual API fields)."""
+        self.unique_departments.add(record.get("DepartmentId", "Unknown"))
+        # Track job codes since API doesn't have Job_Family
+        self.job_families.add(record.get("Jobcode", "Unknown"))
+        # All returned employees are active; the API has no status field
+        self.employment_statuses.add("Active")
+
+    def build_raw_data(self, record: Dict[str, Any], record_hash: str) -> Dict[str, Any]:
+        """Enhance raw data with metadata for future reference."""
+        enhanced_raw_data = super().build_raw_data(record, record_hash)
+        enhanced_raw_data["_department_name"] = record.get(
+            "Dept_Description", "Unknown Department"
+        )
+        enhanced_raw_data["_full_job_title"] = (
+            f"{record.get('Job_Family', '')} - {record.get('Job_Title', '')}"
+        ).strip(" - ")
+        return enhanced_raw_data
+
+    def get_run_metadata(self) -> Dict[str, Any]:
+        """Metadata specific to umich content hashing approach."""
+        return {
+            "ingestion_type": "content_hash_based",
+            "source_api": "umich_department_employee_api",
+            "change_detection_method": "sha256_content_hash",
+            "includes_department_relationships": True,
+            "full_sync": self.force_full_sync,
+        }
 
     def ingest_umich_employees_with_change_detection(self) -> Dict[str, Any]:
         """
@@ -348,204 +260,42 @@ class UMichEmployeeIngestionService:
         Returns:
             Dictionary with comprehensive ingestion statistics
         """
-        # Create ingestion run for tracking
-        run_id = self.create_ingestion_run("umich_api", "user")
-
-        ingestion_stats = {
-            "run_id": run_id,
-            "records_processed": 0,
-            "records_created": 0,
-            "records_skipped_unchanged": 0,
-            "new_employees": 0,
-            "changed_employees": 0,
-            "unique_departments": set(),
-            "job_families": set(),
-            "employment_statuses": set(),
-            "errors": [],
-            "started_at": datetime.now(timezone.utc),
+        logger.info(
+            "🚀 Starting UMich employee ingestion with content hash change detection..."
+        )
+        if self.force_full_sync:
+            logger.info("🔄 Full sync mode: Processing ALL records")
+        else:
+            logger.info("⚡ Incremental mode: Processing only new/changed records")
+
+        self._reset_analytics()
+        ingestion_stats = self.run()
+
+        ingestion_stats["new_employees"] = ingestion_stats["new_records"]
+        ingestion_stats["changed_employees"] = ingestion_stats["changed_records"]
+        ingestion_stats["unique_departments"] = self.unique_departments
+        ingestion_stats["job_families"] = self.job_families
+        ingestion_stats["employment_statuses"] = self.employment_statuses
+
+        # Convert sets to counts for final reporting
+        analytics_counts = {
+            "departments": len(self.unique_departments),
+            "job_families": len(self.job_families),
+            "employment_statuses": len(self.employment_statuses),
         }
+        ingestion_stats["analytics_summary"] = analytics_counts
 
-        try:
-            logger.info(
-                "🚀 Starting UMich employee ingestion with content hash change detection..."
-            )
-
-            # Step 1: Get existing employee content hashes from bronze layer
-            if self.force_full_sync:
-                logger.info("🔄 Full sync mode: Processing ALL records")
-                existing_hashes = {}
-            else:
-                logger.info("⚡ Incremental mode: Processing only new/changed records")
-                existing_hashes = self._get_existing_employee_hashes()
-
-            # Step 2: Fetch current data from UMich Department API
-            logger.info("🔬 Fetching employee data from University of Michigan API...")
-            raw_employees = self.um_dept_api.get_all_department_employees()
-            logger.info(f"📥 Retrieved {len(raw_employees)} employees from UMich API")
-
-            # Step 3: Process each employee with content hash change detection
-            for emp_data in raw_employees:
-                try:
-                    # Extract employee identifier
-                    empl_id = emp_data.get("EmplId", "unknown")
-                    uniqname = emp_data.get("UniqName", "Unknown Employee")
-
-                    # Track analytics for reporting (using actual API fields)
-                    ingestion_stats["unique_departments"].add(
-                        emp_data.get("DepartmentId", "Unknown")
-                    )
-                    # Track job codes since API doesn't have Job_Family
-                    ingestion_stats["job_families"].add(
-                        emp_data.get("Jobcode", "Unknown")
-                    )
-                    # Track departments as "employment status" proxy since no actual status field
-                    ingestion_stats["employment_statuses"].add(
-                        "Active"  # All returned employees are active
-                    )
-
-                    # Calculate content hash for this employee
-                    current_hash = self._calculate_employee_content_hash(emp_data)
-
-                    # Check if this employee is new or has changed
-                    existing_hash = existing_hashes.get(empl_id)
-
-                    if existing_hash is None:
-                        # This is a completely new employee
-                        logger.info(
-                            f"🆕 New employee detected: {uniqname} (ID: {empl_id})"
-                        )
-                        should_insert = True
-                        ingestion_stats["new_employees"] += 1
-
-                    elif existing_hash != current_hash:
-                        # This employee exists but has changed
-                        logger.info(f"📝 Employee changed: {uniqname} (ID: {empl_id})")
-                        logger.debug(f"   Old hash: {existing_hash}")
-                        logger.debug(f"   New hash: {current_hash}")
-                        should_insert = True
-                        ingestion_stats["changed_employees"] += 1
-
-                    else:
-                        # This employee exists and hasn't changed - skip it
-                        logger.debug(
-                            f"⏭️  Employee unchanged, skipping: {uniqname} (ID: {empl_id})"
-                        )
-                        should_insert = False
-                        ingestion_stats["records_skipped_unchanged"] += 1
-
-                    # Only insert if the employee is new or changed
-                    if should_insert:
-                        if self.dry_run:
-                            logger.info(
-                                f"[DRY RUN] Would insert employee {empl_id} ({uniqname})"
-                            )
-                        else:
-                            # Enhance raw data with metadata for future reference
-                            enhanced_raw_data = emp_data.copy()
-                            enhanced_raw_data["_content_hash"] = current_hash
-                            enhanced_raw_data["_change_detection"] = (
-                                "content_hash_based"
-                            )
-                            enhanced_raw_data["_department_name"] = emp_data.get(
-                                "Dept_Description", "Unknown Department"
-                            )
-                            enhanced_raw_data["_full_job_title"] = (
-                                f"{emp_data.get('Job_Family', '')} - "
-                                f"{emp_data.get('Job_Title', '')}"
-                            ).strip(" - ")
-
-                            # Insert into bronze layer
-                            entity_id = self.db_adapter.insert_raw_entity(
-                                entity_type="user",
-                                source_system="umich_api",
-                                external_id=empl_id,
-                                raw_data=enhanced_raw_data,
-                                ingestion_run_id=run_id,
-                            )
-
-                        ingestion_stats["records_created"] += 1
-
-                    # Log progress periodically
-                    if (
-                        ingestion_stats["records_processed"] % 100 == 0
-                        and ingestion_stats["records_processed"] > 0
-                    ):
-                        logger.info(
-                            f"📈 Progress: {ingestion_stats['records_processed']} employees processed "
-                            f"({ingestion_stats['records_created']} new/changed, "
-                            f"{ingestion_stats['records_skipped_unchanged']} unchanged)"
-                        )
-
-                except Exception as record_error:
-                    error_msg = f"Failed to process employee {empl_id}: {record_error}"
-                    logger.error(f"❌ {error_msg}")
-                    ingestion_stats["errors"].append(error_msg)
-
-                ingestion_stats["records_processed"] += 1
-
-            # Convert sets to counts for final reporting
-            analytics_counts = {
-                "departments": len(ingestion_stats["unique_departments"]),
-                "job_families": len(ingestion_stats["job_families"]),
-                "employment_statuses": len(ingestion_stats["employment_statuses"]),
-            }
-            ingestion_stats["analytics_summary"] = analytics_counts
-
-            # Complete the ingestion run
-            error_summary = None
-            if ingestion_stats["errors"]:
-                error_summary = f"{len(ingestion_stats['errors'])} individual record errors occurred"
-
-            self.complete_ingestion_run(
-                run_id=run_id,
-                records_processed=ingestion_stats["records_processed"],
-                records_created=ingestion_stats["records_created"],
-                records_skipped=ingestion_stats["records_skipped_unchanged"],
-                error_message=error_summary,
-            )
-
-            ingestion_stats["completed_at"] = datetime.now(timezone.utc)
-            duration = (
-                ingestion_stats["completed_at"] - ingestion_stats["started_at"]
-            ).total_seconds()
-
-            # Log comprehensive results
-            logger.info(
-                f"🎉 UMich employee ingestion completed in {duration:.2f} seconds"
-            )
-            logger.info(f"📊 Results Summary:")
-            logger.info(f"   Total Processed: {ingestion_stats['records_processed']}")
-            logger.info(f"   New Records Created: {ingestion_stats['records_created']}")
-            logger.info(f"   ├─ New Employees: {ingestion_stats['new_employees']}")
-            logger.info(
-                f"   └─ Changed Employees: {ingestion_stats['changed_employees']}"
-            )
-            logger.info(
-                f"   Skipped (Unchanged): {ingestion_stats['records_skipped_unchanged']}"
-            )
-            logger.info(f"   Employee Analytics:")
-            logger.info(f"   ├─ Unique Departments: {analytics_counts['departments']}")
-            logger.info(f"   ├─ Job Families: {analytics_counts['job_families']}")
-            logger.info(
-                f"   └─ Employment Statuses: {analytics_counts['employment_statuses']}"
-            )
-            logger.info(f"   Errors: {len(ingestion_stats['errors'])}")
-
-            return ingestion_stats
-
-        except Exception as e:
-            error_msg = f"UMich employee ingestion failed: {str(e)}"
-            logger.error(f"❌ {error_msg}", exc_info=True)
-
-            self.complete_ingestion_run(
-                run_id=run_id,
-                records_processed=ingestion_stats["records_processed"],
-                records_created=ingestion_stats["records_created"],
-                records_skipped=ingestion_stats["records_skipped_unchanged"],
-                error_message=error_msg,
-            )
+        logger.info(f"   Employee Analytics:")
+        logger.info(f"   ├─ Unique Departments: {analytics_counts['departments']}")
+        logger.info(f"   ├─ Job Families: {analytics_counts['job_families']}")
+        logger.info(
+            f"   └─ Employment Statuses: {analytics_counts['employment_statuses']}"
+        )
+        logger.info(
+            f"   OAuth Token Requests: {self.um_token_manager.stats['token_requests']}"
+        )
 
-            raise
+        return ingestion_stats
 
     def get_employee_analytics(self) -> Dict[str, pd.DataFrame]:
         """
@@ -891,6 +641,12 @@ def main():
             action="store_true",
             help="Preview changes without committing to database",
         )
+        parser.add_argument(
+            "--page-workers",
+            type=int,
+            default=int(os.getenv("UMAPI_PAGE_WORKERS", "4")),
+            help="Number of API pages fetched concurrently (default: UMAPI_PAGE_WORKERS or 4)",
+        )
         args = parser.parse_args()
 
         # Load environment variables
@@ -925,6 +681,7 @@ def main():
             um_client_secret=um_client_secret,
             force_full_sync=args.full_sync,
             dry_run=args.dry_run,
+            page_workers=args.page_workers,
         )
 
         # Run the content hash-based ingestion process
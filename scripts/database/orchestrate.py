@@ -0,0 +1,1027 @@
+#!/usr/bin/env python3
+"""
+LSATS Data Hub Pipeline Orchestrator
+
+Runs the bronze ingestion and silver transformation scripts as dependency
+graphs instead of long serial chains.
+
+Bronze: each step declares the source system it talks to and the steps whose
+output it reads.
+
+- steps from different sources (UMich API, MCommunity, AD, documents, TDX)
+  never wait for each other
+- steps from the same source share a per-source concurrency cap, so a single
+  upstream API or LDAP server is never hit by more scripts than it tolerates
+- TDX enrichment waits only for the TDX ingest step that feeds it
+
+Silver: each transform declares the tables it reads and writes. Dependencies
+are derived from those declarations in numbered order: a transform waits for
+every earlier transform that writes a table it reads or writes, or that reads
+a table it writes. Every transform therefore sees exactly the data it would
+see in the serial `sort` order, while unrelated transforms (all of Tier 1)
+run side by side up to --max-parallel. A transform is skipped as unchanged
+when none of its inputs changed since its last successful run (see
+RunRecorder.input_fingerprints) and none of its dependencies ran in the same
+orchestration; --force runs everything.
+
+In both pipelines a failed step skips its dependents; unrelated steps keep
+running. Every step runs as its own Python process (same interpreter as the
+orchestrator), exactly as the shell wrappers run them, and its output is
+streamed to this log with a [step] prefix. Per-step timing and status are
+recorded in meta.ingestion_runs under source_system='<pipeline>_orchestrator'
+(entity_type is the script name), plus one summary row per orchestration run.
+
+Usage:
+    python scripts/database/orchestrate.py bronze
+    python scripts/database/orchestrate.py bronze --sources tdx ad
+    python scripts/database/orchestrate.py bronze --source-cap tdx=1 --max-parallel 4
+    python scripts/database/orchestrate.py silver --max-parallel 4
+    python scripts/database/orchestrate.py silver --force
+    python scripts/database/orchestrate.py silver --dry-run
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Add LSATS project to Python path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from database.adapters.postgres_adapter import PostgresAdapter
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Logging is configured in main() once the pipeline (and its log directory) is known
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Step:
+    """One script in a pipeline."""
+
+    name: str  # Script file name without .py; recorded as entity_type
+    source: str  # Source group; concurrency caps and credentials are per source
+    script: str  # Path relative to scripts/database
+    depends_on: Tuple[str, ...] = ()  # Step names that must complete first
+    inputs: Tuple[str, ...] = ()  # Tables read: "silver.<table>" or bronze_input()
+    outputs: Tuple[str, ...] = ()  # Tables written: "silver.<table>"
+
+
+def bronze_input(source_system: str, entity_type: str) -> str:
+    """Name a bronze.raw_entities slice as a step input."""
+    return f"bronze:{source_system}/{entity_type}"
+
+
+# Bronze scripts and the steps whose bronze rows they read. Sources are
+# independent systems; within TDX, user ingestion reads the department IDs
+# that department ingestion wrote and each enricher reads its ingester's rows.
+BRONZE_STEPS: Tuple[Step, ...] = (
+    Step("001_ingest_umapi_departments", "umapi", "bronze/umapi/001_ingest_umapi_departments.py"),
+    Step("009_ingest_umapi_employees", "umapi", "bronze/umapi/009_ingest_umapi_employees.py"),
+    Step("005_ingest_mcommunity_groups", "mcommunity", "bronze/mcommunity/005_ingest_mcommunity_groups.py"),
+    Step("007_ingest_mcommunity_users", "mcommunity", "bronze/mcommunity/007_ingest_mcommunity_users.py"),
+    Step("004_ingest_ad_users", "ad", "bronze/ad/004_ingest_ad_users.py"),
+    Step("005_ingest_ad_groups", "ad", "bronze/ad/005_ingest_ad_groups.py"),
+    Step("006_ingest_ad_organizational_units", "ad", "bronze/ad/006_ingest_ad_organizational_units.py"),
+    Step("007_ingest_ad_computers", "ad", "bronze/ad/007_ingest_ad_computers.py"),
+    Step("008_ingest_lab_awards", "document", "bronze/document/008_ingest_lab_awards.py"),
+    Step("009_ingest_keyconfigure_computers", "document", "bronze/document/009_ingest_keyconfigure_computers.py"),
+    Step("001_ingest_tdx_departments", "tdx", "bronze/tdx/001_ingest_tdx_departments.py"),
+    Step(
+        "002_ingest_tdx_users",
+        "tdx",
+        "bronze/tdx/002_ingest_tdx_users.py",
+        depends_on=("001_ingest_tdx_departments",),
+    ),
+    Step("003_ingest_tdx_assets", "tdx", "bronze/tdx/003_ingest_tdx_assets.py"),
+    Step(
+        "010_enrich_tdx_departments",
+        "tdx",
+        "bronze/tdx/010_enrich_tdx_departments.py",
+        depends_on=("001_ingest_tdx_departments",),
+    ),
+    Step(
+        "010_enrich_tdx_users",
+        "tdx",
+        "bronze/tdx/010_enrich_tdx_users.py",
+        depends_on=("002_ingest_tdx_users",),
+    ),
+    Step(
+        "011_enrich_tdx_assets",
+        "tdx",
+        "bronze/tdx/011_enrich_tdx_assets.py",
+        depends_on=("003_ingest_tdx_assets",),
+    ),
+)
+
+# Maximum concurrent scripts per source. TDX and the LDAP directories are
+# shared, rate-limited services; the UMich API scripts share one OAuth token.
+BRONZE_SOURCE_CAPS: Dict[str, int] = {
+    "umapi": 1,
+    "mcommunity": 2,
+    "ad": 2,
+    "document": 2,
+    "tdx": 2,
+}
+
+
+
+def silver_step(
+    name: str, tier: str, inputs: Sequence[str], outputs: Sequence[str]
+) -> Step:
+    """Declare a silver transform; dependencies come from derive_dependencies()."""
+    return Step(name, tier, f"silver/{name}.py", (), tuple(inputs), tuple(outputs))
+
+
+# Silver transforms in numbered (serial) order with the tables they read and
+# write. Views are listed as their base tables. Reads of a transform's own
+# output table for hash comparison are listed too: they order it against
+# other writers of that table.
+SILVER_STEPS: Tuple[Step, ...] = (
+    # Tier 1: source-specific transforms
+    silver_step("001_transform_tdx_users", "tier1", [bronze_input("tdx", "user"), "silver.tdx_users"], ["silver.tdx_users"]),
+    silver_step("002_transform_tdx_departments", "tier1", [bronze_input("tdx", "department")], ["silver.tdx_departments"]),
+    silver_step("002_transform_umapi_employees", "tier1", [bronze_input("umich_api", "user"), "silver.umapi_employees"], ["silver.umapi_employees"]),
+    silver_step("003_transform_ad_groups", "tier1", [bronze_input("active_directory", "group"), "silver.ad_groups"], ["silver.ad_groups"]),
+    silver_step("004_transform_ad_users", "tier1", [bronze_input("active_directory", "user"), "silver.ad_users"], ["silver.ad_users"]),
+    silver_step("004_transform_tdx_assets", "tier1", [bronze_input("tdx", "asset"), "silver.tdx_assets"], ["silver.tdx_assets"]),
+    silver_step("005_transform_mcommunity_groups", "tier1", [bronze_input("mcommunity_ldap", "group"), "silver.mcommunity_groups"], ["silver.mcommunity_groups"]),
+    silver_step("005_transform_umapi_departments", "tier1", [bronze_input("umich_api", "department")], ["silver.umapi_departments"]),
+    silver_step("006_transform_keyconfigure_computers", "tier1", [bronze_input("key_client", "computer"), "silver.keyconfigure_computers"], ["silver.keyconfigure_computers"]),
+    silver_step("006_transform_mcommunity_users", "tier1", [bronze_input("mcommunity_ldap", "user"), "silver.mcommunity_users"], ["silver.mcommunity_users"]),
+    silver_step("007_transform_ad_computers", "tier1", [bronze_input("active_directory", "computer"), "silver.ad_computers"], ["silver.ad_computers"]),
+    silver_step("008_transform_lab_awards", "tier1", [bronze_input("lab_awards", "lab_award"), "silver.lab_awards"], ["silver.lab_awards"]),
+    silver_step("009_transform_ad_organizational_units", "tier1", [bronze_input("active_directory", "organizational_unit"), "silver.ad_organizational_units"], ["silver.ad_organizational_units"]),
+    # Tier 2: consolidated transforms
+    silver_step("010_transform_departments", "tier2", ["silver.tdx_departments", "silver.umapi_departments", "silver.departments"], ["silver.departments"]),
+    silver_step("011_transform_groups", "tier2", ["silver.ad_groups", "silver.mcommunity_groups", "silver.groups"], ["silver.groups"]),
+    silver_step("012_transform_group_relationships", "tier2", ["silver.groups", "silver.group_members", "silver.group_owners"], ["silver.group_members", "silver.group_owners"]),
+    silver_step(
+        "012_transform_users",
+        "tier2",
+        [
+            bronze_input("tdx", "department"),
+            "silver.tdx_users",
+            "silver.umapi_employees",
+            "silver.mcommunity_users",
+            "silver.ad_users",
+            "silver.lab_awards",
+            "silver.ad_organizational_units",
+            "silver.users",
+        ],
+        ["silver.users"],
+    ),
+    silver_step(
+        "013_transform_computers",
+        "tier2",
+        [
+            "silver.tdx_assets",
+            "silver.keyconfigure_computers",
+            "silver.ad_computers",
+            "silver.users",
+            "silver.departments",
+            "silver.groups",
+            "silver.computers",
+            "silver.computer_groups",
+        ],
+        ["silver.computers", "silver.computer_groups"],
+    ),
+    # Tier 3: composite and aggregate transforms
+    silver_step("014_aggregate_tdx_labs", "tier3", ["silver.users", "silver.tdx_users", "silver.departments", "silver.computers", "silver.tdx_labs"], ["silver.tdx_labs"]),
+    silver_step("014_transform_lab_computers", "tier3", ["silver.computers", "silver.labs", "silver.lab_members", "silver.lab_computers"], ["silver.computers", "silver.lab_computers"]),
+    silver_step("014_transform_lab_managers", "tier3", ["silver.labs", "silver.lab_members", "silver.departments", "silver.users", "silver.lab_managers"], ["silver.lab_managers"]),
+    silver_step("015_aggregate_award_labs", "tier3", ["silver.users", "silver.lab_awards", "silver.award_labs"], ["silver.award_labs"]),
+    silver_step("016_aggregate_ad_labs", "tier3", ["silver.users", "silver.departments", "silver.ad_organizational_units", "silver.ad_labs"], ["silver.ad_labs"]),
+    silver_step("017_transform_silver_labs_composite", "tier3", ["silver.tdx_labs", "silver.award_labs", "silver.ad_labs", "silver.lab_members", "silver.users", "silver.labs"], ["silver.labs"]),
+    silver_step("018_transform_lab_members", "tier3", ["silver.users", "silver.groups", "silver.group_members", "silver.group_owners", "silver.lab_members"], ["silver.lab_members"]),
+)
+
+
+def derive_dependencies(steps: Sequence[Step]) -> List[Step]:
+    """
+    Add dependencies implied by declared inputs and outputs.
+
+    A step depends on every earlier step (in declaration order) that writes a
+    table it reads or writes, or that reads a table it writes. Concurrent
+    execution then reads and writes each table in the same order as running
+    the steps one by one.
+
+    Args:
+        steps: Steps in serial order
+
+    Returns:
+        Steps with derived dependencies added to the declared ones
+    """
+    derived = []
+    for index, step in enumerate(steps):
+        reads, writes = set(step.inputs), set(step.outputs)
+        depends_on = list(step.depends_on)
+        for earlier in steps[:index]:
+            if (
+                set(earlier.outputs) & (reads | writes) or set(earlier.inputs) & writes
+            ) and earlier.name not in depends_on:
+                depends_on.append(earlier.name)
+        derived.append(replace(step, depends_on=tuple(depends_on)))
+    return derived
+
+
+PIPELINES: Dict[str, Dict[str, Any]] = {
+    "bronze": {
+        "steps": BRONZE_STEPS,
+        "source_caps": BRONZE_SOURCE_CAPS,
+        "skip_unchanged": False,
+    },
+    "silver": {
+        "steps": tuple(derive_dependencies(SILVER_STEPS)),
+        # Tiers share the global --max-parallel limit only
+        "source_caps": {},
+        "skip_unchanged": True,
+    },
+}
+
+# systemd LoadCredentialEncrypted= files exported as environment variables,
+# mirroring the credential blocks in the orchestrate_bronze_*.sh wrappers
+SOURCE_CREDENTIALS: Dict[str, Tuple[str, str]] = {
+    "ad": ("AD_PASSWORD", "ad_password"),
+    "mcommunity": ("MCOMMUNITY_LDAP_PASSWORD", "ldap_password"),
+}
+
+# Extra environment per source, applied only when not already set
+SOURCE_ENV_DEFAULTS: Dict[str, Dict[str, str]] = {
+    # Share the UMich API OAuth token between scripts instead of re-authenticating
+    "umapi": {
+        "UM_API_TOKEN_CACHE": os.path.join(PROJECT_ROOT, ".cache", "umapi_token.json")
+    },
+}
+
+def validate_steps(steps: Sequence[Step]) -> None:
+    """
+    Check that step names are unique, dependencies exist and there are no cycles.
+
+    Args:
+        steps: Steps of one pipeline
+
+    Raises:
+        ValueError: If the step graph is invalid
+    """
+    names = [step.name for step in steps]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate step names: {', '.join(duplicates)}")
+
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        missing = [dep for dep in step.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"{step.name} depends on unknown steps: {', '.join(missing)}")
+
+    # Kahn's algorithm: any step never reaching zero in-degree is on a cycle
+    remaining = {step.name: set(step.depends_on) for step in steps}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle among: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def select_steps(steps: Sequence[Step], sources: Optional[Sequence[str]]) -> List[Step]:
+    """
+    Restrict a pipeline to the given sources.
+
+    Dependencies on steps outside the selection are dropped, so e.g. running
+    only TDX enrichment after a separate ingest run is possible by selecting
+    its source.
+
+    Args:
+        steps: All pipeline steps
+        sources: Source groups to keep, or None for all
+
+    Returns:
+        Selected steps with dependencies limited to the selection
+    """
+    if not sources:
+        return list(steps)
+
+    selected = [step for step in steps if step.source in sources]
+    names = {step.name for step in selected}
+    return [
+        replace(step, depends_on=tuple(dep for dep in step.depends_on if dep in names))
+        for step in selected
+    ]
+
+
+class RunRecorder:
+    """Records orchestration and per-step runs in meta.ingestion_runs."""
+
+    # Columns recording when a silver row was last written, by preference
+    WATERMARK_COLUMNS = ("updated_at", "created_at")
+
+    def __init__(self, db_adapter: Optional[PostgresAdapter], source_system: str):
+        """
+        Initialize the recorder.
+
+        Args:
+            db_adapter: Database adapter, or None to only log (dry runs,
+                no DATABASE_URL)
+            source_system: source_system value of every recorded row
+        """
+        self.db_adapter = db_adapter
+        self.source_system = source_system
+
+    def _execute(self, query: str, params: Dict[str, Any]) -> None:
+        """Execute one statement; recording failures never stop the pipeline."""
+        if self.db_adapter is None:
+            return
+        try:
+            with self.db_adapter.engine.connect() as conn:
+                conn.execute(text(query), params)
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to record run status: {e}")
+
+    def mark_stale_runs(self) -> None:
+        """Fail 'running' rows left behind by a killed orchestrator."""
+        self._execute(
+            """
+            UPDATE meta.ingestion_runs
+            SET status = 'failed',
+                completed_at = NOW(),
+                error_message = 'stale - orchestrator terminated before completing'
+            WHERE source_system = :source_system
+              AND status = 'running'
+            """,
+            {"source_system": self.source_system},
+        )
+
+    def input_fingerprints(self, inputs: Sequence[str]) -> Optional[Dict[str, str]]:
+        """
+        Capture a value per input that changes whenever the input changes.
+
+        Fingerprints are read from the data itself, never from the statistics
+        collector, whose counters are flushed asynchronously and can lag
+        behind a step that just finished.
+
+        - silver tables: row count and newest updated_at (created_at for
+          tables without it)
+        - bronze inputs: row count and newest ingested_at of the source/entity
+          slice, plus the newest completed ingestion run recorded for it, so
+          in-place enrichment UPDATEs (which keep ingested_at) count as changes
+
+        Args:
+            inputs: Step inputs
+
+        Returns:
+            Fingerprint per input, or None when they cannot be read (no
+            database, query failure, a silver input without a write
+            timestamp), in which case the step must run
+        """
+        if self.db_adapter is None:
+            return None
+
+        silver_tables = sorted(
+            name.split(".", 1)[1] for name in inputs if name.startswith("silver.")
+        )
+        bronze_slices = sorted(name for name in inputs if name.startswith("bronze:"))
+        fingerprints = {name: "missing" for name in inputs}
+        try:
+            with self.db_adapter.engine.connect() as conn:
+                columns: Dict[str, set] = {}
+                if silver_tables:
+                    rows = conn.execute(
+                        text(
+                            """
+                            SELECT table_name, column_name
+                            FROM information_schema.columns
+                            WHERE table_schema = 'silver'
+                              AND table_name = ANY(:tables)
+                            """
+                        ),
+                        {"tables": silver_tables},
+                    )
+                    for table, column in rows:
+                        columns.setdefault(table, set()).add(column)
+
+                for table, table_columns in sorted(columns.items()):
+                    column = next(
+                        (c for c in self.WATERMARK_COLUMNS if c in table_columns), None
+                    )
+                    if column is None:
+                        # No write timestamp to compare, so the step always runs
+                        return None
+                    count, latest = conn.execute(
+                        text(f"SELECT COUNT(*), MAX({column}) FROM silver.{table}")
+                    ).one()
+                    fingerprints[f"silver.{table}"] = self._watermark(count, latest)
+
+                for name in bronze_slices:
+                    source_system, entity_type = name[len("bronze:"):].split("/", 1)
+                    count, latest, last_run = conn.execute(
+                        text(
+                            """
+                            SELECT COUNT(*), MAX(ingested_at), (
+                                SELECT MAX(completed_at)
+                                FROM meta.ingestion_runs
+                                WHERE source_system = :source_system
+                                  AND entity_type = :entity_type
+                                  AND status = 'completed'
+                            )
+                            FROM bronze.raw_entities
+                            WHERE source_system = :source_system
+                              AND entity_type = :entity_type
+                            """
+                        ),
+                        {"source_system": source_system, "entity_type": entity_type},
+                    ).one()
+                    fingerprints[name] = (
+                        f"{self._watermark(count, latest)}|"
+                        f"{last_run.isoformat() if last_run else 'none'}"
+                    )
+        except Exception as e:
+            logger.warning(f"⚠️  Could not read input fingerprints: {e}")
+            return None
+        return fingerprints
+
+    @staticmethod
+    def _watermark(count: int, latest: Optional[datetime]) -> str:
+        """Format a row count and newest write timestamp as a fingerprint."""
+        if not count:
+            return "empty"
+        return f"{count}@{latest.isoformat() if latest else 'none'}"
+
+    def last_fingerprints(self, entity_type: str) -> Optional[Dict[str, str]]:
+        """
+        Get the input fingerprints stored by a step's most recent finished run.
+
+        Args:
+            entity_type: Step name
+
+        Returns:
+            Stored fingerprints, or None when the last run failed, predates
+            fingerprinting or cannot be read
+        """
+        if self.db_adapter is None:
+            return None
+        try:
+            with self.db_adapter.engine.connect() as conn:
+                row = conn.execute(
+                    text(
+                        """
+                        SELECT status, metadata->'input_fingerprints'
+                        FROM meta.ingestion_runs
+                        WHERE source_system = :source_system
+                          AND entity_type = :entity_type
+                          AND status IN ('completed', 'failed')
+                        ORDER BY started_at DESC
+                        LIMIT 1
+                        """
+                    ),
+                    {"source_system": self.source_system, "entity_type": entity_type},
+                ).fetchone()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not read last run of {entity_type}: {e}")
+            return None
+        if row is None or row[0] != "completed":
+            return None
+        return row[1]
+
+    def start(self, entity_type: str, metadata: Dict[str, Any]) -> str:
+        """
+        Insert a 'running' row.
+
+        Args:
+            entity_type: Step name, or the pipeline name for the summary row
+            metadata: JSON metadata stored with the row
+
+        Returns:
+            The run_id of the new row
+        """
+        run_id = str(uuid.uuid4())
+        self._execute(
+            """
+            INSERT INTO meta.ingestion_runs
+            (run_id, source_system, entity_type, started_at, status, metadata)
+            VALUES (:run_id, :source_system, :entity_type, :started_at, 'running', :metadata)
+            """,
+            {
+                "run_id": run_id,
+                "source_system": self.source_system,
+                "entity_type": entity_type,
+                "started_at": datetime.now(timezone.utc),
+                "metadata": json.dumps(metadata),
+            },
+        )
+        return run_id
+
+    def finish(
+        self,
+        run_id: str,
+        status: str,
+        metadata: Dict[str, Any],
+        records_processed: int = 0,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """
+        Complete a row started with start().
+
+        Args:
+            run_id: Row to update
+            status: 'completed' or 'failed'
+            metadata: Metadata merged into the stored metadata
+            records_processed: Steps completed (summary row) or 0
+            error_message: Failure description
+        """
+        self._execute(
+            """
+            UPDATE meta.ingestion_runs
+            SET status = :status,
+                completed_at = :completed_at,
+                records_processed = :records_processed,
+                error_message = :error_message,
+                metadata = metadata || CAST(:metadata AS jsonb)
+            WHERE run_id = :run_id
+            """,
+            {
+                "run_id": run_id,
+                "status": status,
+                "completed_at": datetime.now(timezone.utc),
+                "records_processed": records_processed,
+                "error_message": error_message,
+                "metadata": json.dumps(metadata),
+            },
+        )
+
+    def record_skipped(self, entity_type: str, metadata: Dict[str, Any], reason: str) -> None:
+        """Record a step that never ran because a dependency failed."""
+        run_id = self.start(entity_type, metadata)
+        self.finish(run_id, "failed", {"skipped": True}, error_message=reason)
+
+    def record_unchanged(
+        self, entity_type: str, metadata: Dict[str, Any], fingerprints: Dict[str, str]
+    ) -> None:
+        """Record a step skipped because none of its inputs changed."""
+        run_id = self.start(entity_type, metadata)
+        self.finish(
+            run_id, "completed", {"unchanged": True, "input_fingerprints": fingerprints}
+        )
+
+
+
+class PipelineOrchestrator:
+    """
+    Runs pipeline steps concurrently in dependency order.
+
+    A step starts once all of its dependencies completed, a slot under its
+    source's cap is free and the global parallelism limit allows it. With
+    skip_unchanged, a step whose input fingerprints match those stored by its
+    last successful run, and none of whose dependencies ran in this
+    orchestration, is recorded as unchanged instead of being run; unchanged
+    steps satisfy their dependents like completed ones.
+    """
+
+    # Step statuses that let dependents run
+    SUCCESSFUL = ("completed", "unchanged")
+
+    def __init__(
+        self,
+        pipeline: str,
+        steps: Sequence[Step],
+        source_caps: Dict[str, int],
+        recorder: RunRecorder,
+        max_parallel: int = 6,
+        fail_fast: bool = False,
+        skip_unchanged: bool = False,
+        python: str = sys.executable,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            pipeline: Pipeline name (recorded on the summary row)
+            steps: Steps to run
+            source_caps: Maximum concurrent steps per source (default: max_parallel)
+            recorder: Run recorder for meta.ingestion_runs
+            max_parallel: Maximum concurrent steps overall
+            fail_fast: Do not start new steps after the first failure
+            skip_unchanged: Skip steps whose declared inputs did not change
+            python: Interpreter used to run each script
+        """
+        validate_steps(steps)
+        self.pipeline = pipeline
+        self.steps = list(steps)
+        self.source_caps = source_caps
+        self.recorder = recorder
+        self.max_parallel = max_parallel
+        self.fail_fast = fail_fast
+        self.skip_unchanged = skip_unchanged
+        self.python = python
+
+        self.orchestration_run_id: Optional[str] = None
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def _step_env(self, step: Step) -> Dict[str, str]:
+        """Build the child environment for a step."""
+        env = dict(os.environ)
+        for key, value in SOURCE_ENV_DEFAULTS.get(step.source, {}).items():
+            env.setdefault(key, value)
+
+        credential = SOURCE_CREDENTIALS.get(step.source)
+        credentials_dir = os.environ.get("CREDENTIALS_DIRECTORY")
+        if credential and credentials_dir:
+            env_var, file_name = credential
+            path = os.path.join(credentials_dir, file_name)
+            if os.path.exists(path):
+                with open(path) as f:
+                    env[env_var] = f.read().strip()
+        return env
+
+    async def _stream_output(self, step: Step, stream: asyncio.StreamReader) -> None:
+        """Forward a child's output to the orchestrator log, line by line."""
+        while True:
+            line = await stream.readline()
+            if not line:
+                break
+            logger.info(f"[{step.name}] {line.decode('utf-8', errors='replace').rstrip()}")
+
+    def _step_metadata(self, step: Step) -> Dict[str, Any]:
+        """Metadata recorded with every row for a step."""
+        return {
+            "pipeline": self.pipeline,
+            "source": step.source,
+            "script": step.script,
+            "depends_on": list(step.depends_on),
+            "orchestration_run_id": self.orchestration_run_id,
+        }
+
+    async def _run_step(
+        self,
+        step: Step,
+        source_semaphore: asyncio.Semaphore,
+        global_semaphore: asyncio.Semaphore,
+        dependency_ran: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Run one script once its slots are free and record the outcome.
+
+        Args:
+            step: Step to run
+            source_semaphore: Concurrency slot of the step's source
+            global_semaphore: Global concurrency slot
+            dependency_ran: A dependency ran in this orchestration, so the
+                step runs even if its input fingerprints look unchanged
+
+        Returns:
+            Result dict (step, source, status, duration_seconds, error)
+        """
+        fingerprints = None
+        if self.skip_unchanged and step.inputs:
+            fingerprints = self.recorder.input_fingerprints(step.inputs)
+            if (
+                not dependency_ran
+                and fingerprints is not None
+                and fingerprints == self.recorder.last_fingerprints(step.name)
+            ):
+                logger.info(f"➖ {step.name} unchanged inputs, skipping")
+                self.recorder.record_unchanged(
+                    step.name, self._step_metadata(step), fingerprints
+                )
+                return {
+                    "step": step.name,
+                    "source": step.source,
+                    "status": "unchanged",
+                    "duration_seconds": 0.0,
+                    "error": None,
+                }
+
+        async with source_semaphore, global_semaphore:
+            run_id = self.recorder.start(step.name, self._step_metadata(step))
+            logger.info(f"▶️  Starting {step.name} ({step.source})")
+            started = time.monotonic()
+
+            error_message = None
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self.python,
+                    os.path.join(SCRIPTS_DIR, step.script),
+                    cwd=PROJECT_ROOT,
+                    env=self._step_env(step),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                )
+                await self._stream_output(step, process.stdout)
+                exit_code = await process.wait()
+                if exit_code != 0:
+                    error_message = f"exited with status {exit_code}"
+            except Exception as e:
+                exit_code = None
+                error_message = f"failed to start: {e}"
+
+            duration = time.monotonic() - started
+            status = "completed" if error_message is None else "failed"
+            metadata = {"duration_seconds": round(duration, 2), "exit_code": exit_code}
+
+            if status == "completed" and fingerprints is not None:
+                # Inputs the step also writes are re-read so its own writes do
+                # not count as a change next time
+                own_tables = [name for name in step.inputs if name in step.outputs]
+                after = self.recorder.input_fingerprints(own_tables) if own_tables else {}
+                if after is not None:
+                    metadata["input_fingerprints"] = {**fingerprints, **after}
+
+            self.recorder.finish(run_id, status, metadata, error_message=error_message)
+
+            if status == "completed":
+                logger.info(f"✅ {step.name} completed in {duration:.1f}s")
+            else:
+                logger.error(f"❌ {step.name} {error_message} after {duration:.1f}s")
+
+            return {
+                "step": step.name,
+                "source": step.source,
+                "status": status,
+                "duration_seconds": duration,
+                "error": error_message,
+            }
+
+    def _skip(self, step: Step, reason: str) -> None:
+        """Mark a step as skipped."""
+        logger.warning(f"⏭️  Skipping {step.name}: {reason}")
+        self.recorder.record_skipped(step.name, self._step_metadata(step), reason)
+        self.results[step.name] = {
+            "step": step.name,
+            "source": step.source,
+            "status": "skipped",
+            "duration_seconds": 0.0,
+            "error": reason,
+        }
+
+    async def run(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Run every step and wait for the whole graph to finish.
+
+        Returns:
+            Result per step name (status completed/unchanged/failed/skipped,
+            duration, error)
+        """
+        self.recorder.mark_stale_runs()
+        self.orchestration_run_id = self.recorder.start(
+            self.pipeline,
+            {
+                "pipeline": self.pipeline,
+                "steps": [step.name for step in self.steps],
+                "source_caps": self.source_caps,
+                "max_parallel": self.max_parallel,
+                "skip_unchanged": self.skip_unchanged,
+            },
+        )
+        started = time.monotonic()
+
+        global_semaphore = asyncio.Semaphore(self.max_parallel)
+        source_semaphores = {
+            source: asyncio.Semaphore(self.source_caps.get(source, self.max_parallel))
+            for source in {step.source for step in self.steps}
+        }
+
+        pending = {step.name: step for step in self.steps}
+        running: Dict[asyncio.Task, Step] = {}
+        stop_launching = False
+
+        while pending or running:
+            # Launch or skip every step whose dependencies are resolved
+            for name, step in list(pending.items()):
+                dep_results = [self.results.get(dep) for dep in step.depends_on]
+                if any(result is None for result in dep_results):
+                    continue
+                del pending[name]
+                failed = [
+                    r["step"] for r in dep_results if r["status"] not in self.SUCCESSFUL
+                ]
+                if failed:
+                    self._skip(step, f"dependency did not complete: {', '.join(failed)}")
+                elif stop_launching:
+                    self._skip(step, "fail-fast after an earlier failure")
+                else:
+                    task = asyncio.create_task(
+                        self._run_step(
+                            step,
+                            source_semaphores[step.source],
+                            global_semaphore,
+                            dependency_ran=any(
+                                r["status"] == "completed" for r in dep_results
+                            ),
+                        )
+                    )
+                    running[task] = step
+
+            if not running:
+                # Everything left was skipped in this pass
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = running.pop(task)
+                result = task.result()
+                self.results[step.name] = result
+                if result["status"] not in self.SUCCESSFUL and self.fail_fast:
+                    stop_launching = True
+
+        duration = time.monotonic() - started
+        completed = sum(1 for r in self.results.values() if r["status"] == "completed")
+        unchanged = sum(1 for r in self.results.values() if r["status"] == "unchanged")
+        unsuccessful = [
+            name
+            for name, r in self.results.items()
+            if r["status"] not in self.SUCCESSFUL
+        ]
+        self.recorder.finish(
+            self.orchestration_run_id,
+            "completed" if not unsuccessful else "failed",
+            {
+                "duration_seconds": round(duration, 2),
+                "steps_unchanged": unchanged,
+                "step_seconds": {
+                    name: round(r["duration_seconds"], 2)
+                    for name, r in self.results.items()
+                },
+            },
+            records_processed=completed,
+            error_message=(
+                f"Unsuccessful steps: {', '.join(unsuccessful)}" if unsuccessful else None
+            ),
+        )
+        self._log_report(duration)
+        return self.results
+
+    def _log_report(self, duration: float) -> None:
+        """Log per-step timing and the saving over a serial run."""
+        serial = sum(r["duration_seconds"] for r in self.results.values())
+        icons = {"completed": "✅", "unchanged": "➖", "failed": "❌", "skipped": "⏭️ "}
+
+        logger.info("=" * 80)
+        logger.info(f"📊 {self.pipeline.upper()} ORCHESTRATION SUMMARY")
+        logger.info("=" * 80)
+        for step in self.steps:
+            result = self.results.get(step.name)
+            if result is None:
+                continue
+            logger.info(
+                f"   {icons[result['status']]} {step.name:<38} {step.source:<11} "
+                f"{result['duration_seconds']:>8.1f}s"
+            )
+        logger.info("")
+        for status in ("completed", "unchanged", "failed", "skipped"):
+            count = sum(1 for r in self.results.values() if r["status"] == status)
+            if count:
+                logger.info(f"   {status.title() + ':':<22}{count:>8}")
+        logger.info(f"   Wall clock:           {duration:>8.1f}s")
+        logger.info(f"   Sum of step times:    {serial:>8.1f}s")
+        logger.info("=" * 80)
+
+    def log_plan(self) -> None:
+        """Log the steps, their dependencies and caps without running anything."""
+        logger.info(f"📋 {self.pipeline} plan ({len(self.steps)} steps)")
+        for source in sorted({step.source for step in self.steps}):
+            cap = self.source_caps.get(source, self.max_parallel)
+            logger.info(f"   {source} (max {cap} concurrent)")
+            for step in self.steps:
+                if step.source != source:
+                    continue
+                after = (
+                    f" after {', '.join(step.depends_on)}" if step.depends_on else ""
+                )
+                logger.info(f"      - {step.name}{after}")
+
+
+def parse_source_caps(values: Sequence[str], defaults: Dict[str, int]) -> Dict[str, int]:
+    """Apply --source-cap SOURCE=N overrides to the default caps."""
+    caps = dict(defaults)
+    for value in values:
+        source, _, cap = value.partition("=")
+        if not cap.isdigit() or int(cap) < 1:
+            raise argparse.ArgumentTypeError(
+                f"Invalid --source-cap '{value}' (expected SOURCE=N with N >= 1)"
+            )
+        caps[source] = int(cap)
+    return caps
+
+
+def setup_logging(pipeline: str) -> None:
+    """Log to stdout and /var/log/lsats/<pipeline>/orchestrate.log."""
+    log_dir = f"/var/log/lsats/{pipeline}"
+    os.makedirs(log_dir, exist_ok=True)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler(f"{log_dir}/orchestrate.log"),
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
+
+
+def main():
+    """Run a pipeline from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Run LSATS pipeline scripts concurrently in dependency order"
+    )
+    parser.add_argument("pipeline", choices=sorted(PIPELINES), help="Pipeline to run")
+    parser.add_argument(
+        "--sources",
+        nargs="+",
+        help="Only run steps from these sources, or tiers for silver (default: all)",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=6,
+        help="Maximum concurrent steps overall (default: 6)",
+    )
+    parser.add_argument(
+        "--source-cap",
+        action="append",
+        default=[],
+        metavar="SOURCE=N",
+        help="Override a source's concurrency cap, e.g. --source-cap tdx=1 (repeatable)",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Do not start new steps after the first failure",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every step even when its inputs are unchanged (silver)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show the execution plan without running anything",
+    )
+    args = parser.parse_args()
+    setup_logging(args.pipeline)
+
+    config = PIPELINES[args.pipeline]
+    try:
+        source_caps = parse_source_caps(args.source_cap, config["source_caps"])
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    steps = select_steps(config["steps"], args.sources)
+    if not steps:
+        parser.error(f"No {args.pipeline} steps for sources: {', '.join(args.sources)}")
+
+    load_dotenv()
+
+    db_adapter = None
+    database_url = os.getenv("DATABASE_URL")
+    if args.dry_run:
+        pass
+    elif database_url:
+        db_adapter = PostgresAdapter(database_url=database_url, pool_size=2, max_overflow=2)
+    else:
+        logger.warning("⚠️  DATABASE_URL not set; step runs will not be recorded")
+
+    orchestrator = PipelineOrchestrator(
+        pipeline=args.pipeline,
+        steps=steps,
+        source_caps=source_caps,
+        recorder=RunRecorder(db_adapter, f"{args.pipeline}_orchestrator"),
+        max_parallel=args.max_parallel,
+        fail_fast=args.fail_fast,
+        skip_unchanged=config["skip_unchanged"] and not args.force,
+    )
+    orchestrator.log_plan()
+    if args.dry_run:
+        return
+
+    try:
+        results = asyncio.run(orchestrator.run())
+    finally:
+        if db_adapter is not None:
+            db_adapter.close()
+
+    if any(
+        result["status"] not in PipelineOrchestrator.SUCCESSFUL
+        for result in results.values()
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,19 @@
 #!/bin/bash
 # orchestrate_bronze.sh
-# Master bronze orchestrator: runs all source groups in series.
+# Master bronze orchestrator: runs all source groups through orchestrate.py.
 # Used by the lsats-bronze.timer for full nightly ingestion.
 # Individual groups can be triggered directly via their own service units.
 #
-# Run order: umapi → mcommunity → ad → document → tdx
-# (Groups are independent of each other; tdx runs last since it's slowest)
+# Source groups (umapi, mcommunity, ad, document, tdx) are independent systems
+# and run concurrently, each under its own concurrency cap. TDX enrichment
+# waits only for the TDX ingest step that feeds it. Per-step timing and status
+# are recorded in meta.ingestion_runs (source_system = 'bronze_orchestrator').
+# AD and MCommunity passwords are read from $CREDENTIALS_DIRECTORY by
+# orchestrate.py when running under systemd.
 # To run manually: sudo -u lsats /bin/bash /opt/LSATS_Data_Hub/scripts/database/orchestrate_bronze.sh
 set -euo pipefail
 
+PYTHON="/opt/LSATS_Data_Hub/venv/bin/python"
 SCRIPT_DIR="/opt/LSATS_Data_Hub/scripts/database"
 LOG_DIR="/var/log/lsats/bronze"
 LOG="${LOG_DIR}/orchestrate_bronze_$(date +%Y%m%d_%H%M%S).log"
@@ -19,10 +24,6 @@ exec > >(tee -a "$LOG") 2>&1
 
 echo "=== Full Bronze Ingestion Started: $(date) ==="
 
-/bin/bash "${SCRIPT_DIR}/orchestrate_bronze_umapi.sh"
-/bin/bash "${SCRIPT_DIR}/orchestrate_bronze_mcommunity.sh"
-/bin/bash "${SCRIPT_DIR}/orchestrate_bronze_ad.sh"
-/bin/bash "${SCRIPT_DIR}/orchestrate_bronze_document.sh"
-/bin/bash "${SCRIPT_DIR}/orchestrate_bronze_tdx.sh"
+"$PYTHON" "${SCRIPT_DIR}/orchestrate.py" bronze "$@"
 
 echo "=== Full Bronze Ingestion Complete: $(date) ==="
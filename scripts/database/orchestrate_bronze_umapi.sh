@@ -11,6 +11,8 @@ SCRIPT_DIR="/opt/LSATS_Data_Hub/scripts/database/bronze/umapi"
 LOG_DIR="/var/log/lsats/bronze"
 LOG="${LOG_DIR}/orchestrate_umapi_$(date +%Y%m%d_%H%M%S).log"
 export PGPASSFILE="/opt/LSATS_Data_Hub/.pgpass"
+# Share the UMich API OAuth token between scripts instead of re-authenticating in each one
+export UM_API_TOKEN_CACHE="/opt/LSATS_Data_Hub/.cache/umapi_token.json"
 
 mkdir -p "$LOG_DIR"
 exec > >(tee -a "$LOG") 2>&1
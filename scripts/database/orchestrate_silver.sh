@@ -1,13 +1,18 @@
 #!/bin/bash
 # orchestrate_silver.sh
-# Runs all silver transformation scripts in tier order.
+# Runs all silver transformation scripts through orchestrate.py.
 # Takes a pre-silver snapshot before running transforms for rollback safety.
 # Used by the lsats-silver.timer for scheduled transformation runs.
 #
-# Tier order:
+# Tiers:
 #   Tier 1 (001-009): Source-specific transforms (independent of each other)
 #   Tier 2 (010-013): Consolidated transforms (depend on Tier 1)
-#   Tier 3 (013-017): Composite/aggregate transforms (depend on Tier 2)
+#   Tier 3 (014-018): Composite/aggregate transforms (depend on Tier 2)
+#
+# orchestrate.py derives each transform's dependencies from the tables it
+# reads and writes, runs independent transforms concurrently, skips transforms
+# whose inputs are unchanged since their last successful run (pass --force to
+# this script to run everything) and logs a per-transform timing report.
 #
 # Suggested cadence: weekly, after bronze completes (timer set to run after bronze window)
 # To run manually: sudo -u lsats /bin/bash /opt/LSATS_Data_Hub/scripts/database/orchestrate_silver.sh
@@ -40,10 +45,7 @@ echo "Snapshot complete ($(du -h "${SNAPSHOT_FILE}" | cut -f1))"
 # Keep only the 2 most recent pre-silver snapshots
 ls -t "${SNAPSHOT_DIR}"/pre_silver_*.dump 2>/dev/null | tail -n +3 | xargs -r rm --
 
-# Run all silver scripts in numbered order
-for script in $(ls "$SCRIPT_DIR"/*.py | sort); do
-    echo "--- Running: $(basename "$script") ---"
-    "$PYTHON" "$script"
-done
+# Run all silver transforms in dependency order
+"$PYTHON" "${SCRIPT_DIR}/../orchestrate.py" silver "$@"
 
 echo "=== Silver Transformation Complete: $(date) ==="
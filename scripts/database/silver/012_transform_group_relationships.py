@@ -11,6 +11,8 @@ Key features:
 - Populates silver.group_members and silver.group_owners
 - Maintains source_system traceability
 - Deduplicates members/owners within groups
+- Explodes and parses member/owner lists column-wise, then writes only the
+  edges added, changed or removed since the last run
 """
 
 import argparse
@@ -26,7 +28,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import text
+import numpy as np
+import pandas as pd
+from sqlalchemy import column, table, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -64,66 +69,213 @@ class GroupRelationshipsService:
         "group_cn": re.compile(r"cn=([^,]+)", re.IGNORECASE),
     }
 
+    # Natural keys of member / owner edges (match the unique indexes)
+    MEMBER_KEY = ["group_id", "member_type", "member_id", "source_system"]
+    OWNER_KEY = ["group_id", "owner_type", "owner_id", "source_system"]
+
     def __init__(self, database_url: str):
         self.db_adapter = PostgresAdapter(
             database_url=database_url, pool_size=5, max_overflow=10
         )
         logger.info("✨ Group relationships service initialized")
 
-    def _parse_identifier(self, identifier: str) -> Tuple[str, str]:
+    @classmethod
+    def _parse_identifiers(cls, identifiers: pd.Series) -> pd.DataFrame:
         """
-        Parse an identifier (DN or simple name) to extract ID and type.
+        Parse identifiers (DNs or simple names) to extract IDs and types.
+
+        Column-wise version of the per-string rules:
+        - DNs under people/accounts/privileged OUs are users (uid/cn value)
+        - DNs under group OUs are groups (cn value)
+        - other DNs use their uid/cn value; lsa-/arcts-/turbo names are groups
+        - simple names with spaces or "lsa-" are groups, anything else a user
 
         Args:
-            identifier: DN string or simple name
+            identifiers: Non-empty DN strings or simple names
+
+        Returns:
+            DataFrame aligned with identifiers with columns "id" and "type"
+            ('user', 'group' or 'unknown')
+        """
+        identifiers = identifiers.astype(object)
+        lower = identifiers.str.lower()
+        is_dn = identifiers.str.contains("=", regex=False)
+
+        uid = identifiers.str.extract(
+            cls.DN_PATTERNS["user_uid"].pattern, flags=re.IGNORECASE, expand=False
+        )
+        cn = identifiers.str.extract(
+            cls.DN_PATTERNS["group_cn"].pattern, flags=re.IGNORECASE, expand=False
+        )
+        has_uid = uid.notna()
+
+        # Check for user / group DN patterns
+        user_ou = lower.str.contains("ou=people|ou=accounts|ou=privileged")
+        group_ou = lower.str.contains("ou=user groups|ou=groups|ou=mcommadsync")
+        # Heuristic for groups in other DNs and simple names
+        uid_is_group = uid.str.contains("lsa-|arcts-|turbo", na=False)
+        name_is_group = identifiers.str.contains(" ", regex=False) | lower.str.contains(
+            "lsa-", regex=False
+        )
+
+        # First matching rule wins, as in the per-string checks
+        conditions = [
+            (is_dn & user_ou & has_uid).to_numpy(dtype=bool),
+            (is_dn & group_ou & cn.notna()).to_numpy(dtype=bool),
+            (is_dn & has_uid).to_numpy(dtype=bool),
+            is_dn.to_numpy(dtype=bool),
+        ]
+        uid, cn, identifiers_array = (
+            values.to_numpy(dtype=object) for values in (uid, cn, identifiers)
+        )
+        ids = np.select(
+            conditions,
+            [uid, cn, uid, identifiers_array],
+            default=identifiers_array,
+        )
+        types = np.select(
+            conditions,
+            [
+                "user",
+                "group",
+                np.where(uid_is_group.to_numpy(dtype=bool), "group", "user"),
+                "unknown",
+            ],
+            default=np.where(name_is_group.to_numpy(dtype=bool), "group", "user"),
+        )
+        return pd.DataFrame({"id": ids, "type": types}, index=identifiers.index)
+
+    @staticmethod
+    def _explode_identifiers(groups_df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        Explode a JSONB list column into one row per (group, identifier).
+
+        Empty entries are dropped and repeated identifiers within a group are
+        kept once, in list order.
+
+        Returns:
+            DataFrame with group_id, source_system and identifier columns
+        """
+        has_items = groups_df[column].map(lambda v: isinstance(v, list) and len(v) > 0)
+        exploded = groups_df.loc[has_items, ["group_id", "source_system", column]]
+        exploded = exploded.explode(column)
+        exploded = exploded[exploded[column].astype(bool)]
+        exploded["identifier"] = exploded[column].astype(str).astype(object)
+        return exploded.drop(columns=column).drop_duplicates(
+            ["group_id", "identifier"]
+        )
+
+    def _extract_relationships(
+        self, groups_df: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Extract unique member and owner edges from silver.groups rows.
+
+        Each distinct identifier is parsed once, however many groups list it.
+
+        Returns:
+            (members, owners) DataFrames with columns
+            group_id, member_type, member_id, is_direct_member, source_system and
+            group_id, owner_type, owner_id, source_system
+        """
+        members = self._explode_identifiers(groups_df, "members")
+        owners = self._explode_identifiers(groups_df, "owners")
+        direct = self._explode_identifiers(groups_df, "direct_members")
+
+        identifiers = pd.Series(
+            pd.unique(pd.concat([members["identifier"], owners["identifier"]])),
+            dtype=object,
+        )
+        parsed = self._parse_identifiers(identifiers)
+        parsed.index = identifiers
+        parsed = parsed[parsed["type"].isin(("user", "group"))]
+
+        members = self._attach_parsed(members, parsed)
+        direct_keys = pd.MultiIndex.from_frame(direct[["group_id", "identifier"]])
+        members["is_direct_member"] = pd.MultiIndex.from_frame(
+            members[["group_id", "identifier"]]
+        ).isin(direct_keys)
+        # For AD, everything is effectively direct or we assume so if source is AD
+        members.loc[
+            members["source_system"].str.contains(
+                "active_directory", regex=False, na=False
+            ),
+            "is_direct_member",
+        ] = True
+        members = members.rename(columns={"id": "member_id", "type": "member_type"})
+        members = members.drop_duplicates(
+            ["group_id", "member_type", "member_id", "source_system"]
+        )
+
+        owners = self._attach_parsed(owners, parsed)
+        owners = owners.rename(columns={"id": "owner_id", "type": "owner_type"})
+        owners = owners.drop_duplicates(
+            ["group_id", "owner_type", "owner_id", "source_system"]
+        )
+
+        return (
+            members[self.MEMBER_KEY + ["is_direct_member"]].reset_index(drop=True),
+            owners[self.OWNER_KEY].reset_index(drop=True),
+        )
+
+    @staticmethod
+    def _attach_parsed(edges: pd.DataFrame, parsed: pd.DataFrame) -> pd.DataFrame:
+        """Add parsed id/type columns, dropping unparseable identifiers, in edge order."""
+        edges = edges.assign(
+            id=edges["identifier"].map(parsed["id"]),
+            type=edges["identifier"].map(parsed["type"]),
+        )
+        return edges[edges["type"].notna()]
+
+    def _load_existing_relationships(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Load stored group_members and group_owners rows keyed like extracted edges."""
+        members = self.db_adapter.query_to_dataframe(
+            """
+            SELECT
+                membership_id::text AS row_id,
+                group_id,
+                member_type,
+                COALESCE(member_uniqname, member_group_id) AS member_id,
+                source_system,
+                is_direct_member
+            FROM silver.group_members
+            """
+        )
+        owners = self.db_adapter.query_to_dataframe(
+            """
+            SELECT
+                ownership_id::text AS row_id,
+                group_id,
+                owner_type,
+                COALESCE(owner_uniqname, owner_group_id) AS owner_id,
+                source_system
+            FROM silver.group_owners
+            """
+        )
+        return members, owners
+
+    @staticmethod
+    def _diff_edges(
+        current: pd.DataFrame, existing: pd.DataFrame, key: List[str]
+    ) -> Tuple[pd.DataFrame, List[str], pd.DataFrame]:
+        """
+        Diff extracted edges against stored rows on their natural key.
 
         Returns:
-            Tuple of (id, type) where type is 'user' or 'group'
+            (added edges, row IDs of removed edges, edges present in both with
+            the stored columns suffixed "_stored")
         """
-        if not identifier:
-            return "", "unknown"
-
-        identifier_lower = identifier.lower()
-
-        # Check if it looks like a DN
-        if "=" in identifier:
-            # Check for user DN patterns
-            if (
-                "ou=people" in identifier_lower
-                or "ou=accounts" in identifier_lower
-                or "ou=privileged" in identifier_lower
-            ):
-                match = self.DN_PATTERNS["user_uid"].search(identifier)
-                if match:
-                    return match.group(1), "user"
-
-            # Check for group DN patterns
-            if (
-                "ou=user groups" in identifier_lower
-                or "ou=groups" in identifier_lower
-                or "ou=mcommadsync" in identifier_lower
-            ):
-                match = self.DN_PATTERNS["group_cn"].search(identifier)
-                if match:
-                    return match.group(1), "group"
-
-            # Fallback for other DNs
-            match = self.DN_PATTERNS["user_uid"].search(identifier)
-            if match:
-                val = match.group(1)
-                # Heuristic for groups
-                if "lsa-" in val or "arcts-" in val or "turbo" in val:
-                    return val, "group"
-                return val, "user"
-        else:
-            # Simple identifier (not a DN)
-            # If it's a uniqname, it's a user. If it has spaces or looks like a group name, it's a group.
-            # This is ambiguous, but we can check against known patterns
-            if " " in identifier or "lsa-" in identifier_lower:
-                return identifier, "group"
-            return identifier, "user"
-
-        return identifier, "unknown"
+        merged = current.astype({col: object for col in key}).merge(
+            existing.astype({col: object for col in key}),
+            on=key,
+            how="outer",
+            indicator=True,
+            suffixes=("", "_stored"),
+        )
+        added = merged.loc[merged["_merge"] == "left_only", current.columns]
+        removed = merged.loc[merged["_merge"] == "right_only", "row_id"].tolist()
+        common = merged[merged["_merge"] == "both"]
+        return added, removed, common
 
     def _create_ingestion_run(self) -> str:
         """Create a new ingestion run record."""
@@ -205,7 +357,10 @@ class GroupRelationshipsService:
             "members_extracted": 0,
             "owners_extracted": 0,
             "members_inserted": 0,
+            "members_updated": 0,
+            "members_deleted": 0,
             "owners_inserted": 0,
+            "owners_deleted": 0,
             "started_at": start_time,
         }
 
@@ -232,171 +387,146 @@ class GroupRelationshipsService:
             total_groups = len(groups_df)
             logger.info(f"📦 Processing {total_groups} groups")
 
-            all_members = []
-            all_owners = []
-
-            # Track unique combinations to prevent duplicates
-            seen_members = set()
-            seen_owners = set()
-
-            for idx, row in groups_df.iterrows():
-                group_id = row["group_id"]
-                source_system = row["source_system"]
-
-                # Parse Members
-                members_list = (
-                    row["members"] if isinstance(row["members"], list) else []
-                )
-                direct_members_list = (
-                    row["direct_members"]
-                    if isinstance(row["direct_members"], list)
-                    else []
-                )
-                direct_members_set = set(str(m) for m in direct_members_list)
-
-                # Deduplicate members list (some groups have duplicate DNs in JSONB)
-                unique_members = list(dict.fromkeys(str(m) for m in members_list if m))
-
-                for member_str in unique_members:
-                    m_id, m_type = self._parse_identifier(member_str)
-
-                    if m_type in ("user", "group"):
-                        is_direct = member_str in direct_members_set
-                        # For AD, everything is effectively direct or we assume so if source is AD
-                        if "active_directory" in source_system:
-                            is_direct = True
-
-                        # Create unique key for deduplication
-                        unique_key = (group_id, m_type, m_id, source_system)
-
-                        if unique_key not in seen_members:
-                            seen_members.add(unique_key)
-                            all_members.append(
-                                {
-                                    "group_id": group_id,
-                                    "member_type": m_type,
-                                    "member_uniqname": m_id
-                                    if m_type == "user"
-                                    else None,
-                                    "member_group_id": m_id
-                                    if m_type == "group"
-                                    else None,
-                                    "is_direct_member": is_direct,
-                                    "source_system": source_system,
-                                }
-                            )
-
-                # Parse Owners
-                owners_list = row["owners"] if isinstance(row["owners"], list) else []
-
-                # Deduplicate owners list
-                unique_owners = list(dict.fromkeys(str(o) for o in owners_list if o))
-
-                for owner_str in unique_owners:
-                    o_id, o_type = self._parse_identifier(owner_str)
-
-                    if o_type in ("user", "group"):
-                        # Create unique key for deduplication
-                        unique_key = (group_id, o_type, o_id, source_system)
-
-                        if unique_key not in seen_owners:
-                            seen_owners.add(unique_key)
-                            all_owners.append(
-                                {
-                                    "group_id": group_id,
-                                    "owner_type": o_type,
-                                    "owner_uniqname": o_id
-                                    if o_type == "user"
-                                    else None,
-                                    "owner_group_id": o_id
-                                    if o_type == "group"
-                                    else None,
-                                    "source_system": source_system,
-                                }
-                            )
-
-                stats["groups_processed"] += 1
-
-                # Progress logging
-                if stats["groups_processed"] % 1000 == 0:
-                    logger.info(
-                        f"📊 Progress: {stats['groups_processed']}/{total_groups} groups processed"
-                    )
-
-            stats["members_extracted"] = len(all_members)
-            stats["owners_extracted"] = len(all_owners)
+            # 2. Explode and parse member/owner lists column-wise
+            members, owners = self._extract_relationships(groups_df)
+            stats["groups_processed"] = total_groups
+            stats["members_extracted"] = len(members)
+            stats["owners_extracted"] = len(owners)
 
             logger.info(
                 f"🔍 Extracted {stats['members_extracted']} unique members and {stats['owners_extracted']} unique owners"
             )
 
+            # 3. Diff against stored relationships
+            existing_members, existing_owners = self._load_existing_relationships()
+            members_added, members_removed, members_common = self._diff_edges(
+                members, existing_members, self.MEMBER_KEY
+            )
+            members_changed = members_common[
+                members_common["is_direct_member"]
+                != members_common["is_direct_member_stored"]
+            ]
+            owners_added, owners_removed, _ = self._diff_edges(
+                owners, existing_owners, self.OWNER_KEY
+            )
+
+            stats["members_inserted"] = len(members_added)
+            stats["members_updated"] = len(members_changed)
+            stats["members_deleted"] = len(members_removed)
+            stats["owners_inserted"] = len(owners_added)
+            stats["owners_deleted"] = len(owners_removed)
+
             if dry_run:
                 logger.info(
-                    "🔍 [DRY RUN] Would upsert relationships. Skipping DB writes."
+                    "🔍 [DRY RUN] Would apply relationship changes. Skipping DB writes."
                 )
-                stats["members_inserted"] = stats["members_extracted"]
-                stats["owners_inserted"] = stats["owners_extracted"]
                 self._complete_ingestion_run(run_id, "completed")
                 stats["completed_at"] = datetime.now(timezone.utc)
                 self._log_final_summary(stats)
                 return stats
 
-            # 2. Upsert (Delete + Insert for full refresh)
+            # 4. Write only added, changed and removed edges
+            now = datetime.now(timezone.utc)
+            member_rows = [
+                {
+                    "group_id": group_id,
+                    "member_type": member_type,
+                    "member_uniqname": member_id if member_type == "user" else None,
+                    "member_group_id": member_id if member_type == "group" else None,
+                    "is_direct_member": bool(is_direct),
+                    "source_system": source_system,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for (
+                    group_id,
+                    member_type,
+                    member_id,
+                    source_system,
+                    is_direct,
+                ) in members_added.itertuples(index=False)
+            ]
+            owner_rows = [
+                {
+                    "group_id": group_id,
+                    "owner_type": owner_type,
+                    "owner_uniqname": owner_id if owner_type == "user" else None,
+                    "owner_group_id": owner_id if owner_type == "group" else None,
+                    "source_system": source_system,
+                    "created_at": now,
+                }
+                for (
+                    group_id,
+                    owner_type,
+                    owner_id,
+                    source_system,
+                ) in owners_added.itertuples(index=False)
+            ]
+
             with self.db_adapter.engine.connect() as conn:
                 with conn.begin():
-                    logger.info("🗑️  Clearing existing relationships...")
-                    conn.execute(text("TRUNCATE TABLE silver.group_members"))
-                    conn.execute(text("TRUNCATE TABLE silver.group_owners"))
+                    conn.execute(text("SET search_path TO silver, public"))
 
-                    # Insert Members
-                    if all_members:
-                        logger.info(f"✍️  Writing {len(all_members)} members...")
-                        chunk_size = 5000
-                        for i in range(0, len(all_members), chunk_size):
-                            chunk = all_members[i : i + chunk_size]
-                            conn.execute(
-                                text(
-                                    """
-                                    INSERT INTO silver.group_members (
-                                        group_id, member_type, member_uniqname, member_group_id,
-                                        is_direct_member, source_system
-                                    ) VALUES (
-                                        :group_id, :member_type, :member_uniqname, :member_group_id,
-                                        :is_direct_member, :source_system
-                                    )
+                    if members_removed:
+                        logger.info(f"🗑️  Removing {len(members_removed)} members...")
+                        conn.execute(
+                            text(
                                 """
-                                ),
-                                chunk,
-                            )
-                            stats["members_inserted"] += len(chunk)
-                            logger.info(
-                                f"  ✅ Inserted member chunk {i // chunk_size + 1}/{(len(all_members) + chunk_size - 1) // chunk_size}"
-                            )
+                                DELETE FROM group_members
+                                WHERE membership_id = ANY(CAST(:row_ids AS uuid[]))
+                                """
+                            ),
+                            {"row_ids": members_removed},
+                        )
+
+                    if owners_removed:
+                        logger.info(f"🗑️  Removing {len(owners_removed)} owners...")
+                        conn.execute(
+                            text(
+                                """
+                                DELETE FROM group_owners
+                                WHERE ownership_id = ANY(CAST(:row_ids AS uuid[]))
+                                """
+                            ),
+                            {"row_ids": owners_removed},
+                        )
+
+                    if len(members_changed):
+                        logger.info(
+                            f"✏️  Updating {len(members_changed)} direct-membership flags..."
+                        )
+                        conn.execute(
+                            text(
+                                """
+                                UPDATE group_members AS gm
+                                SET is_direct_member = changed.is_direct_member,
+                                    updated_at = :updated_at
+                                FROM unnest(
+                                    CAST(:row_ids AS uuid[]),
+                                    CAST(:flags AS boolean[])
+                                ) AS changed(membership_id, is_direct_member)
+                                WHERE gm.membership_id = changed.membership_id
+                                """
+                            ),
+                            {
+                                "row_ids": members_changed["row_id"].tolist(),
+                                "flags": [
+                                    bool(flag)
+                                    for flag in members_changed["is_direct_member"]
+                                ],
+                                "updated_at": now,
+                            },
+                        )
+
+                    # Insert Members
+                    if member_rows:
+                        logger.info(f"✍️  Writing {len(member_rows)} members...")
+                        self._insert_rows(conn, "group_members", member_rows)
 
                     # Insert Owners
-                    if all_owners:
-                        logger.info(f"✍️  Writing {len(all_owners)} owners...")
-                        chunk_size = 5000
-                        for i in range(0, len(all_owners), chunk_size):
-                            chunk = all_owners[i : i + chunk_size]
-                            conn.execute(
-                                text(
-                                    """
-                                    INSERT INTO silver.group_owners (
-                                        group_id, owner_type, owner_uniqname, owner_group_id,
-                                        source_system
-                                    ) VALUES (
-                                        :group_id, :owner_type, :owner_uniqname, :owner_group_id,
-                                        :source_system
-                                    )
-                                """
-                                ),
-                                chunk,
-                            )
-                            stats["owners_inserted"] += len(chunk)
-                            logger.info(
-                                f"  ✅ Inserted owner chunk {i // chunk_size + 1}/{(len(all_owners) + chunk_size - 1) // chunk_size}"
-                            )
+                    if owner_rows:
+                        logger.info(f"✍️  Writing {len(owner_rows)} owners...")
+                        self._insert_rows(conn, "group_owners", owner_rows)
 
             self._complete_ingestion_run(run_id, "completed")
             stats["completed_at"] = datetime.now(timezone.utc)
@@ -412,6 +542,18 @@ class GroupRelationshipsService:
             self._log_final_summary(stats)
             raise
 
+    @staticmethod
+    def _insert_rows(conn, table_name: str, rows: List[Dict[str, Any]]):
+        """Insert rows with multi-row INSERT statements in chunks."""
+        target = table(table_name, *[column(col) for col in rows[0]])
+        chunk_size = 5000
+        total_chunks = (len(rows) + chunk_size - 1) // chunk_size
+        for i in range(0, len(rows), chunk_size):
+            conn.execute(insert(target).values(rows[i : i + chunk_size]))
+            logger.info(
+                f"  ✅ Inserted {table_name} chunk {i // chunk_size + 1}/{total_chunks}"
+            )
+
     def _log_final_summary(self, stats: Dict[str, Any]):
         """Log comprehensive final summary."""
         duration = (stats["completed_at"] - stats["started_at"]).total_seconds()
@@ -424,8 +566,11 @@ class GroupRelationshipsService:
         logger.info(f"Groups Processed: {stats['groups_processed']}")
         logger.info(f"├─ Members Extracted: {stats['members_extracted']}")
         logger.info(f"├─ Members Inserted: {stats['members_inserted']}")
+        logger.info(f"├─ Members Updated: {stats['members_updated']}")
+        logger.info(f"├─ Members Deleted: {stats['members_deleted']}")
         logger.info(f"├─ Owners Extracted: {stats['owners_extracted']}")
-        logger.info(f"└─ Owners Inserted: {stats['owners_inserted']}")
+        logger.info(f"├─ Owners Inserted: {stats['owners_inserted']}")
+        logger.info(f"└─ Owners Deleted: {stats['owners_deleted']}")
         if stats.get("error"):
             logger.error(f"❌ Error: {stats['error']}")
         logger.info(f"{'=' * 60}")
@@ -456,8 +601,14 @@ def main():
         print(f"\n📊 Results Summary:")
         print(f"   Run ID: {results['run_id']}")
         print(f"   Groups Processed: {results['groups_processed']}")
-        print(f"   Members Inserted: {results['members_inserted']}")
-        print(f"   Owners Inserted: {results['owners_inserted']}")
+        print(
+            f"   Members Inserted/Updated/Deleted: {results['members_inserted']}/"
+            f"{results['members_updated']}/{results['members_deleted']}"
+        )
+        print(
+            f"   Owners Inserted/Deleted: {results['owners_inserted']}/"
+            f"{results['owners_deleted']}"
+        )
 
         duration = (results["completed_at"] - results["started_at"]).total_seconds()
         print(f"   Duration: {duration:.2f} seconds")
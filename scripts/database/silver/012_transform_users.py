@@ -12,11 +12,15 @@ Key features:
 - Calculates data quality scores
 - Content hash-based change detection
 - Incremental processing with --full-sync override
+- Full syncs stream the sources in uniqname order and merge-join them in
+  fixed-size chunks (--chunk-size), so memory does not grow with the user base
+- Optional process-pool merge stage (--merge-workers)
 - Optional alumni exclusion for performance
 """
 
 import argparse
 import hashlib
+import heapq
 import json
 import logging
 import math
@@ -24,10 +28,13 @@ import os
 import re
 import sys
 import uuid
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -40,6 +47,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter
+from database.parallel import chunked, map_chunks, resolve_workers
 
 # Set up logging
 script_name = os.path.basename(__file__).replace(".py", "")
@@ -190,21 +198,76 @@ class UserConsolidationService:
         """
         return None
 
+    # Source tables merged into silver.users, keyed by their slot in a user group
+    SOURCE_TABLES = (
+        ("tdx", "silver.tdx_users"),
+        ("ad", "silver.ad_users"),
+        ("umapi", "silver.umapi_employees"),
+        ("mcom", "silver.mcommunity_users"),
+    )
+
+    # Users are grouped by the trimmed, lower-cased uniqname. Both the
+    # incremental and the full-sync path compute it in SQL so they agree
+    MERGE_KEY_SQL = "LOWER(BTRIM(uniqname))"
+
+    # MCommunity users whose only affiliation is Alumni (--exclude-alumni)
+    ALUMNI_ONLY_FILTER = """
+                AND NOT (
+                    jsonb_array_length(ou) = 1
+                    AND ou->>0 = 'Alumni'
+                )
+                """
+
+    def _source_filter(self, source: str, exclude_alumni: bool) -> str:
+        """Extra WHERE conditions for a source table."""
+        if source == "mcom" and exclude_alumni:
+            return self.ALUMNI_ONLY_FILTER
+        return ""
+
+    def _query_records(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a query and return its rows as plain dictionaries.
+
+        Rows keep their database types (int, datetime, None) rather than the
+        column-wide dtypes pandas infers, so a merged record, and its hash, do
+        not depend on which other rows were fetched alongside it.
+        """
+        with self.db_adapter.engine.connect() as conn:
+            result = conn.execute(text(query), params or {})
+            return [dict(row._mapping) for row in result]
+
+    @staticmethod
+    def _new_source_group() -> Dict[str, Any]:
+        """Empty per-user container for source records."""
+        return {"tdx": None, "ad": None, "umapi": [], "mcom": None}
+
+    @staticmethod
+    def _add_source_record(
+        group: Dict[str, Any], source: str, record: Dict[str, Any]
+    ) -> None:
+        """Place a source record in its slot (UMAPI keeps every appointment)."""
+        if source == "umapi":
+            group["umapi"].append(record)
+        else:
+            group[source] = record
+
     def _fetch_source_records(
         self,
-        since_timestamp: Optional[datetime] = None,
-        full_sync: bool = False,
+        since_timestamp: datetime,
         exclude_alumni: bool = False,
     ) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch records from all 4 sources and group by uniqname.
+        Fetch records from all 4 sources for users updated since a timestamp.
 
         CRITICAL: For incremental updates, we must fetch COMPLETE records for any user
         that has been updated in ANY source. Otherwise we lose cross-source data during merge.
 
+        Full syncs use _iter_source_chunks() instead.
+
         Args:
-            since_timestamp: Only fetch records updated after this time
-            full_sync: Ignore timestamp and fetch all records
+            since_timestamp: Only fetch users with a record updated after this time
             exclude_alumni: If True, exclude MCommunity users with only "Alumni" affiliation
 
         Returns:
@@ -219,170 +282,159 @@ class UserConsolidationService:
             }
         """
         try:
-            # Determine which users to process
-            if full_sync or since_timestamp is None:
-                # Full sync: fetch everything
-                logger.info("📊 Fetching all user records (full sync)")
-                affected_uniqnames = None  # None means fetch all
-            else:
-                # Incremental: find affected uniqnames, then fetch ALL their data
-                logger.info(f"📊 Finding users updated after {since_timestamp}")
-
-                # Step 1: Find all uniqnames that have ANY source updated
-                # CRITICAL: Use UNION to get users updated in ANY source table
-                affected_query = """
-                SELECT DISTINCT uniqname FROM (
-                    SELECT LOWER(uniqname) as uniqname FROM silver.tdx_users
-                    WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
-                    UNION
-                    SELECT LOWER(uniqname) as uniqname FROM silver.ad_users
-                    WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
-                    UNION
-                    SELECT LOWER(uniqname) as uniqname FROM silver.umapi_employees
-                    WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
-                    UNION
-                    SELECT LOWER(uniqname) as uniqname FROM silver.mcommunity_users
-                    WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
-                ) affected
-                WHERE uniqname IS NOT NULL
-                """
-                affected_df = self.db_adapter.query_to_dataframe(
-                    affected_query, {"since_timestamp": since_timestamp}
-                )
-
-                if affected_df.empty:
-                    logger.info("✨ No updated users found")
-                    return {}
-
-                affected_uniqnames = [u for u in affected_df["uniqname"].tolist() if isinstance(u, str)]
-                logger.info(
-                    f"📍 Found {len(affected_uniqnames)} users with updates in any source"
-                )
-                logger.info(
-                    f"🔄 Fetching COMPLETE records for these users from ALL sources"
-                )
+            # Incremental: find affected uniqnames, then fetch ALL their data
+            logger.info(f"📊 Finding users updated after {since_timestamp}")
 
-            # Step 2: Fetch COMPLETE records for affected users (or all if full sync)
-
-            # 1. Fetch TDX Users
-            logger.info("📥 Fetching TDX users...")
-            if affected_uniqnames is not None:
-                tdx_query = """
-                SELECT * FROM silver.tdx_users
-                WHERE uniqname IS NOT NULL
-                  AND LOWER(uniqname) = ANY(:uniqnames)
-                """
-                tdx_records = self.db_adapter.query_to_dataframe(
-                    tdx_query, {"uniqnames": affected_uniqnames}
-                ).to_dict("records")
-            else:
-                tdx_query = "SELECT * FROM silver.tdx_users WHERE uniqname IS NOT NULL"
-                tdx_records = self.db_adapter.query_to_dataframe(tdx_query).to_dict(
-                    "records"
-                )
-
-            # 2. Fetch AD Users
-            logger.info("📥 Fetching AD users...")
-            if affected_uniqnames is not None:
-                ad_query = """
-                SELECT * FROM silver.ad_users
-                WHERE uniqname IS NOT NULL
-                  AND LOWER(uniqname) = ANY(:uniqnames)
-                """
-                ad_records = self.db_adapter.query_to_dataframe(
-                    ad_query, {"uniqnames": affected_uniqnames}
-                ).to_dict("records")
-            else:
-                ad_query = "SELECT * FROM silver.ad_users WHERE uniqname IS NOT NULL"
-                ad_records = self.db_adapter.query_to_dataframe(ad_query).to_dict(
-                    "records"
-                )
+            # Step 1: Find all uniqnames that have ANY source updated
+            # CRITICAL: Use UNION to get users updated in ANY source table
+            affected_query = f"""
+            SELECT DISTINCT uniqname FROM (
+                SELECT {self.MERGE_KEY_SQL} as uniqname FROM silver.tdx_users
+                WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
+                UNION
+                SELECT {self.MERGE_KEY_SQL} as uniqname FROM silver.ad_users
+                WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
+                UNION
+                SELECT {self.MERGE_KEY_SQL} as uniqname FROM silver.umapi_employees
+                WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
+                UNION
+                SELECT {self.MERGE_KEY_SQL} as uniqname FROM silver.mcommunity_users
+                WHERE updated_at > :since_timestamp AND uniqname IS NOT NULL
+            ) affected
+            WHERE uniqname IS NOT NULL
+            """
+            affected_df = self.db_adapter.query_to_dataframe(
+                affected_query, {"since_timestamp": since_timestamp}
+            )
 
-            # 3. Fetch UMAPI Employees
-            logger.info("📥 Fetching UMAPI employees...")
-            if affected_uniqnames is not None:
-                umapi_query = """
-                SELECT * FROM silver.umapi_employees
-                WHERE uniqname IS NOT NULL
-                  AND LOWER(uniqname) = ANY(:uniqnames)
-                """
-                umapi_records = self.db_adapter.query_to_dataframe(
-                    umapi_query, {"uniqnames": affected_uniqnames}
-                ).to_dict("records")
-            else:
-                umapi_query = (
-                    "SELECT * FROM silver.umapi_employees WHERE uniqname IS NOT NULL"
-                )
-                umapi_records = self.db_adapter.query_to_dataframe(umapi_query).to_dict(
-                    "records"
-                )
+            if affected_df.empty:
+                logger.info("✨ No updated users found")
+                return {}
 
-            # 4. Fetch MCommunity Users
-            logger.info("📥 Fetching MCommunity users...")
-            mcom_filter = ""
+            affected_uniqnames = [u for u in affected_df["uniqname"].tolist() if isinstance(u, str)]
+            logger.info(
+                f"📍 Found {len(affected_uniqnames)} users with updates in any source"
+            )
+            logger.info(
+                f"🔄 Fetching COMPLETE records for these users from ALL sources"
+            )
             if exclude_alumni:
-                mcom_filter = """
-                AND NOT (
-                    jsonb_array_length(ou) = 1
-                    AND ou->>0 = 'Alumni'
-                )
-                """
                 logger.info("🎓 Excluding alumni-only users from MCommunity fetch")
 
-            if affected_uniqnames is not None:
-                mcom_query = f"""
-                SELECT * FROM silver.mcommunity_users
-                WHERE uniqname IS NOT NULL
-                  AND LOWER(uniqname) = ANY(:uniqnames)
-                  {mcom_filter}
-                """
-                mcom_records = self.db_adapter.query_to_dataframe(
-                    mcom_query, {"uniqnames": affected_uniqnames}
-                ).to_dict("records")
-            else:
-                mcom_query = f"""
-                SELECT * FROM silver.mcommunity_users
+            # Step 2: Fetch COMPLETE records for affected users and group by uniqname
+            grouped_data = {}
+            for source, table_name in self.SOURCE_TABLES:
+                logger.info(f"📥 Fetching {source} records from {table_name}...")
+                query = f"""
+                SELECT *, {self.MERGE_KEY_SQL} AS _merge_key
+                FROM {table_name}
                 WHERE uniqname IS NOT NULL
-                  {mcom_filter}
+                  AND {self.MERGE_KEY_SQL} = ANY(:uniqnames)
+                  {self._source_filter(source, exclude_alumni)}
                 """
-                mcom_records = self.db_adapter.query_to_dataframe(mcom_query).to_dict(
-                    "records"
-                )
+                for r in self._query_records(query, {"uniqnames": affected_uniqnames}):
+                    u = r.pop("_merge_key")
+                    group = grouped_data.get(u)
+                    if group is None:
+                        group = grouped_data[u] = self._new_source_group()
+                    self._add_source_record(group, source, r)
 
-            # Step 3: Group by uniqname (existing logic)
-            grouped_data = {}
+            logger.info(
+                f"📦 Consolidated {len(grouped_data)} unique users from sources"
+            )
+            return grouped_data
+
+        except SQLAlchemyError as e:
+            logger.error(f"❌ Failed to fetch source records: {e}")
+            raise
+
+    def _stream_source(
+        self, conn, source: str, table_name: str, exclude_alumni: bool
+    ) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Stream one source table in merge-key order through a server-side cursor.
 
-            # Helper to get/create group
-            def get_group(u):
-                u = u.lower().strip()
-                if u not in grouped_data:
-                    grouped_data[u] = {
-                        "tdx": None,
-                        "ad": None,
-                        "umapi": [],
-                        "mcom": None,
-                    }
-                return grouped_data[u]
+        Rows are keyed by MERGE_KEY_SQL. Ordering with the
+        "C" collation sorts by code point, the same order Python uses to
+        compare strings, so the streams can be merge-joined in Python.
 
-            for r in tdx_records:
-                get_group(r["uniqname"])["tdx"] = r
+        Yields:
+            (merge_key, source, record) tuples
+        """
+        query = f"""
+        SELECT *, {self.MERGE_KEY_SQL} AS _merge_key
+        FROM {table_name}
+        WHERE uniqname IS NOT NULL
+          {self._source_filter(source, exclude_alumni)}
+        ORDER BY {self.MERGE_KEY_SQL} COLLATE "C"
+        """
+        result = conn.execution_options(stream_results=True).execute(text(query))
+        for row in result:
+            record = dict(row._mapping)
+            yield record.pop("_merge_key"), source, record
+
+    def _iter_source_chunks(
+        self, exclude_alumni: bool = False, chunk_size: int = 5000
+    ) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """
+        Stream all source records as chunks of grouped users (full sync).
 
-            for r in ad_records:
-                get_group(r["uniqname"])["ad"] = r
+        Each source table is read in uniqname order over its own connection
+        and the four streams are merge-joined on uniqname, so only one chunk
+        of users is held in memory no matter how large the tables grow.
+        Chunks cover disjoint, ascending uniqname ranges and can be merged
+        independently of each other.
 
-            for r in umapi_records:
-                get_group(r["uniqname"])["umapi"].append(r)
+        Args:
+            exclude_alumni: If True, exclude MCommunity users with only "Alumni" affiliation
+            chunk_size: Number of users per chunk
 
-            for r in mcom_records:
-                get_group(r["uniqname"])["mcom"] = r
+        Yields:
+            Dictionaries in the same shape as _fetch_source_records()
+        """
+        logger.info(
+            f"📊 Streaming all user records in uniqname order "
+            f"(full sync, {chunk_size} users per chunk)"
+        )
+        if exclude_alumni:
+            logger.info("🎓 Excluding alumni-only users from MCommunity fetch")
 
-            logger.info(
-                f"📦 Consolidated {len(grouped_data)} unique users from sources"
-            )
-            return grouped_data
+        try:
+            with ExitStack() as stack:
+                streams = [
+                    self._stream_source(
+                        stack.enter_context(self.db_adapter.engine.connect()),
+                        source,
+                        table_name,
+                        exclude_alumni,
+                    )
+                    for source, table_name in self.SOURCE_TABLES
+                ]
+
+                chunk: Dict[str, Dict[str, Any]] = {}
+                total = 0
+                for merge_key, entries in groupby(
+                    heapq.merge(*streams, key=itemgetter(0)), key=itemgetter(0)
+                ):
+                    if len(chunk) >= chunk_size:
+                        total += len(chunk)
+                        yield chunk
+                        chunk = {}
+
+                    group = chunk.get(merge_key)
+                    if group is None:
+                        group = chunk[merge_key] = self._new_source_group()
+                    for _, source, record in entries:
+                        self._add_source_record(group, source, record)
+
+                if chunk:
+                    total += len(chunk)
+                    yield chunk
+
+            logger.info(f"📦 Streamed {total} unique users from sources")
 
         except SQLAlchemyError as e:
-            logger.error(f"❌ Failed to fetch source records: {e}")
+            logger.error(f"❌ Failed to stream source records: {e}")
             raise
 
     def _aggregate_umapi_records(
@@ -686,6 +738,66 @@ class UserConsolidationService:
 
         return merged
 
+    def _merge_user_chunk(
+        self,
+        items: List[Tuple[str, Dict[str, Any]]],
+        pi_uniqnames: Set[str],
+        tdx_dept_map: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Merge, score and hash a chunk of grouped users.
+
+        Pure with respect to the database, so chunks can be merged in worker
+        processes. Skips and errors are returned for the caller to log.
+
+        Args:
+            items: (uniqname, source group) pairs as built by the fetch methods
+            pi_uniqnames: Uniqnames of known PIs
+            tdx_dept_map: Mapping from TDX DefaultAccountID to department Code
+
+        Returns:
+            Dictionary with "records" (merged rows), "invalid" ((uniqname,
+            sources) pairs), "errors" (messages) and "users" (chunk size)
+        """
+        records = []
+        invalid = []
+        errors = []
+
+        for uniqname, sources in items:
+            if not self._is_valid_uniqname(uniqname):
+                invalid.append(
+                    (uniqname, [s for s in ["tdx", "ad", "umapi", "mcom"] if sources.get(s)])
+                )
+                continue
+
+            try:
+                merged = self._merge_user_records(
+                    uniqname,
+                    sources["tdx"],
+                    sources["ad"],
+                    sources["umapi"],
+                    sources["mcom"],
+                    pi_uniqnames,
+                    tdx_dept_map,
+                )
+
+                q_score, q_flags = self._calculate_data_quality(merged)
+                merged["data_quality_score"] = q_score
+                merged["quality_flags"] = q_flags
+                merged["entity_hash"] = self._calculate_content_hash(merged)
+
+                records.append(merged)
+
+            except Exception as e:
+                errors.append(f"Error processing {uniqname}: {e}")
+
+        return {
+            "records": records,
+            "invalid": invalid,
+            "errors": errors,
+            "users": len(items),
+        }
+
     def _calculate_content_hash(self, merged_record: Dict[str, Any]) -> str:
         """Calculate content hash for change detection."""
         # Exclude metadata fields
@@ -977,8 +1089,19 @@ class UserConsolidationService:
         full_sync: bool = False,
         dry_run: bool = False,
         exclude_alumni: bool = False,
+        chunk_size: int = 5000,
+        merge_workers: int = 1,
     ):
-        """Main consolidation logic."""
+        """
+        Main consolidation logic.
+
+        Args:
+            full_sync: Rebuild every user instead of only those updated since the last run
+            dry_run: Merge records without writing to silver.users
+            exclude_alumni: Exclude MCommunity users with only "Alumni" affiliation
+            chunk_size: Users per streamed chunk in full-sync mode, and per merge chunk
+            merge_workers: Processes merging chunks in parallel (1 merges inline)
+        """
         last_run = None if full_sync else self._get_last_transformation_timestamp()
         run_id = self.create_transformation_run(full_sync) if not dry_run else "dry-run"
 
@@ -999,48 +1122,42 @@ class UserConsolidationService:
             tdx_dept_map = self._load_tdx_dept_id_to_code_map()
 
             # 2. Fetch Sources
-            source_data = self._fetch_source_records(
-                last_run, full_sync, exclude_alumni
-            )
-
-            if not source_data:
-                logger.info("✨ No records to process")
-                if not dry_run:
-                    self.complete_transformation_run(run_id, stats)
-                return
-
-            # 3. Process Users
-            total = len(source_data)
-            logger.info(f"🚀 Processing {total} users...")
+            if last_run is None:
+                # Full sync: stream disjoint uniqname ranges, one chunk at a time
+                source_chunks = (
+                    list(chunk.items())
+                    for chunk in self._iter_source_chunks(exclude_alumni, chunk_size)
+                )
+            else:
+                source_data = self._fetch_source_records(last_run, exclude_alumni)
+                source_chunks = chunked(source_data.items(), chunk_size)
 
+            # 3. Merge users (inline or in worker processes) and upsert
             batch_size = 2000
             batch_records = []
+            seen = 0
+
+            merged_chunks = map_chunks(
+                _merge_user_chunk,
+                source_chunks,
+                workers=merge_workers,
+                initializer=_init_merge_worker,
+                initargs=(pi_uniqnames, tdx_dept_map),
+            )
+            for result in merged_chunks:
+                seen += result["users"]
 
-            for idx, (uniqname, sources) in enumerate(source_data.items(), 1):
-                if not self._is_valid_uniqname(uniqname):
+                for uniqname, sources in result["invalid"]:
                     logger.warning(
-                        f"⚠️ Skipping invalid uniqname: {uniqname!r} "
-                        f"(sources: {[s for s in ['tdx','ad','umapi','mcom'] if sources.get(s)]})"
+                        f"⚠️ Skipping invalid uniqname: {uniqname!r} (sources: {sources})"
                     )
                     stats["skipped"] += 1
-                    continue
-
-                try:
-                    merged = self._merge_user_records(
-                        uniqname,
-                        sources["tdx"],
-                        sources["ad"],
-                        sources["umapi"],
-                        sources["mcom"],
-                        pi_uniqnames,
-                        tdx_dept_map,
-                    )
 
-                    q_score, q_flags = self._calculate_data_quality(merged)
-                    merged["data_quality_score"] = q_score
-                    merged["quality_flags"] = q_flags
-                    merged["entity_hash"] = self._calculate_content_hash(merged)
+                for err in result["errors"]:
+                    logger.error(f"❌ {err}")
+                    stats["errors"].append(err)
 
+                for merged in result["records"]:
                     batch_records.append(merged)
 
                     if len(batch_records) >= batch_size:
@@ -1051,12 +1168,13 @@ class UserConsolidationService:
                         stats["created"] += c  # Approximate
                         stats["skipped"] += s
                         batch_records = []
-                        logger.info(f"📈 Progress: {idx}/{total} users")
+                        logger.info(f"📈 Progress: {seen} users")
 
-                except Exception as e:
-                    err = f"Error processing {uniqname}: {e}"
-                    logger.error(f"❌ {err}")
-                    stats["errors"].append(err)
+            if not seen:
+                logger.info("✨ No records to process")
+                if not dry_run:
+                    self.complete_transformation_run(run_id, stats)
+                return
 
             # Process remaining batch
             if batch_records:
@@ -1088,6 +1206,33 @@ class UserConsolidationService:
             self.db_adapter.close()
 
 
+# =============================================================================
+# MERGE WORKERS
+# =============================================================================
+
+# Per-process merge state, installed by _init_merge_worker()
+_merge_context: Dict[str, Any] = {}
+
+
+def _init_merge_worker(
+    pi_uniqnames: Set[str], tdx_dept_map: Optional[Dict[str, str]]
+) -> None:
+    """Install the lookup tables used by _merge_user_chunk() in this process."""
+    # The merge helpers never touch the database, so no adapter is created
+    _merge_context["service"] = UserConsolidationService.__new__(
+        UserConsolidationService
+    )
+    _merge_context["pi_uniqnames"] = pi_uniqnames
+    _merge_context["tdx_dept_map"] = tdx_dept_map
+
+
+def _merge_user_chunk(items: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Merge one chunk of grouped users with the installed lookup tables."""
+    return _merge_context["service"]._merge_user_chunk(
+        items, _merge_context["pi_uniqnames"], _merge_context["tdx_dept_map"]
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Consolidate Silver Users")
     parser.add_argument("--full-sync", action="store_true", help="Force full sync")
@@ -1095,6 +1240,18 @@ def main():
     parser.add_argument(
         "--exclude-alumni", action="store_true", help="Exclude alumni-only users"
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=5000,
+        help="Users held in memory per streamed chunk during a full sync (default: 5000)",
+    )
+    parser.add_argument(
+        "--merge-workers",
+        type=int,
+        default=1,
+        help="Processes merging user chunks in parallel; 0 uses every CPU (default: 1)",
+    )
     args = parser.parse_args()
 
     load_dotenv()
@@ -1103,8 +1260,17 @@ def main():
         logger.error("❌ DATABASE_URL not set")
         sys.exit(1)
 
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
     service = UserConsolidationService(db_url)
-    service.consolidate_users(args.full_sync, args.dry_run, args.exclude_alumni)
+    service.consolidate_users(
+        args.full_sync,
+        args.dry_run,
+        args.exclude_alumni,
+        args.chunk_size,
+        resolve_workers(args.merge_workers),
+    )
 
 
 if __name__ == "__main__":
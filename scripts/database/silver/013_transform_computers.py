@@ -49,6 +49,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from dotenv import load_dotenv
 
 from database.adapters.postgres_adapter import PostgresAdapter
+from database.parallel import chunked, map_chunks, resolve_workers
 
 # ============================================================================
 # LOGGING SETUP
@@ -108,11 +109,16 @@ class ComputerConsolidationService:
     - Comprehensive audit trail via source_raw_ids
     """
 
+    # Matched groups per merge chunk
+    MERGE_CHUNK_SIZE = 1000
+
     def __init__(self, database_url: str):
         """Initialize service with database connection."""
         self.db_adapter = PostgresAdapter(
             database_url=database_url, pool_size=5, max_overflow=10
         )
+        # FK lookup tables, loaded by consolidate_computers()
+        self._reference: Dict[str, Any] = {}
         logger.info("✨ Computer consolidation service initialized")
 
     # ========================================================================
@@ -481,6 +487,77 @@ class ComputerConsolidationService:
         else:
             return "Other"
 
+    def _load_reference_data(self) -> Dict[str, Any]:
+        """
+        Load the user and department lookups used for FK resolution.
+
+        Loaded once per run, so merging a computer group needs no database
+        round trips and can run in worker processes.
+
+        Returns:
+            Dictionary of lookup tables (see the _resolve_* methods)
+        """
+        users_df = self.db_adapter.query_to_dataframe(
+            """
+            SELECT uniqname, tdx_user_uid::text AS tdx_user_uid
+            FROM silver.users
+            WHERE uniqname IS NOT NULL
+            ORDER BY uniqname
+            """
+        )
+        depts_df = self.db_adapter.query_to_dataframe(
+            """
+            SELECT dept_id, tdx_id, department_code, department_name
+            FROM silver.departments
+            WHERE dept_id IS NOT NULL
+            ORDER BY dept_id
+            """
+        )
+
+        uniqname_by_tdx_uid: Dict[str, str] = {}
+        for uniqname, uid in zip(users_df["uniqname"], users_df["tdx_user_uid"]):
+            if isinstance(uid, str):
+                uniqname_by_tdx_uid.setdefault(uid.lower(), uniqname)
+
+        dept_id_by_tdx_id: Dict[int, str] = {}
+        for dept_id, tdx_id in zip(depts_df["dept_id"], depts_df["tdx_id"]):
+            if not pd.isna(tdx_id):
+                dept_id_by_tdx_id.setdefault(int(tdx_id), dept_id)
+
+        # Exact dept_id matches win over department_code matches
+        dept_id_by_code: Dict[str, str] = {
+            dept_id: dept_id for dept_id in depts_df["dept_id"]
+        }
+        for dept_id, code in zip(depts_df["dept_id"], depts_df["department_code"]):
+            if isinstance(code, str):
+                dept_id_by_code.setdefault(code, dept_id)
+
+        reference = {
+            "uniqnames": set(users_df["uniqname"]),
+            "uniqname_by_tdx_uid": uniqname_by_tdx_uid,
+            "dept_id_by_tdx_id": dept_id_by_tdx_id,
+            "dept_id_by_code": dept_id_by_code,
+            "department_names": [
+                (dept_id, name)
+                for dept_id, name in zip(
+                    depts_df["dept_id"], depts_df["department_name"]
+                )
+                if isinstance(name, str)
+            ],
+        }
+        logger.info(
+            f"📋 Loaded {len(reference['uniqnames'])} users and "
+            f"{len(dept_id_by_code)} department keys for FK resolution"
+        )
+        return reference
+
+    @staticmethod
+    def _normalize_tdx_uid(uid: Any) -> Optional[str]:
+        """Lower-case a TDX UID for lookups (UUID columns compare case-insensitively)."""
+        if uid is None or (isinstance(uid, float) and pd.isna(uid)):
+            return None
+        return str(uid).lower()
+
     def _resolve_owner_uniqname(
         self, tdx: Optional[Dict], kc: Optional[Dict], ad: Optional[Dict]
     ) -> Tuple[Optional[str], List[str]]:
@@ -491,22 +568,15 @@ class ComputerConsolidationService:
         Returns: (uniqname, quality_flags)
         """
         quality_flags = []
+        reference = self._reference
 
         # Priority 1: TDX Owning Customer (operational owner)
         if tdx and tdx.get("owning_customer_id"):
-            uid = tdx["owning_customer_id"]
-            query = "SELECT uniqname FROM silver.users WHERE tdx_user_uid = :uid"
-            try:
-                result = self.db_adapter.query_to_dataframe(query, {"uid": uid})
-                if not result.empty:
-                    return result.iloc[0]["uniqname"], quality_flags
-                else:
-                    quality_flags.append("invalid_owner_tdx_uid")
-            except Exception as e:
-                logger.warning(
-                    f"⚠️  Failed to resolve TDX owning customer UID {uid}: {e}"
-                )
-                quality_flags.append("owner_lookup_error")
+            uid = self._normalize_tdx_uid(tdx["owning_customer_id"])
+            uniqname = reference["uniqname_by_tdx_uid"].get(uid)
+            if uniqname:
+                return uniqname, quality_flags
+            quality_flags.append("invalid_owner_tdx_uid")
 
         # Priority 2: KeyConfigure Owner (usually dept code or uniqname)
         if kc and kc.get("owner"):
@@ -519,15 +589,8 @@ class ComputerConsolidationService:
                 and " " not in owner
             ):
                 # Validate it exists in silver.users
-                query = "SELECT uniqname FROM silver.users WHERE uniqname = :uniqname"
-                try:
-                    result = self.db_adapter.query_to_dataframe(
-                        query, {"uniqname": owner}
-                    )
-                    if not result.empty:
-                        return owner, quality_flags
-                except Exception:
-                    pass
+                if owner in reference["uniqnames"]:
+                    return owner, quality_flags
 
         # Priority 3: AD Managed By (extract CN from DN)
         if ad and ad.get("managed_by"):
@@ -539,15 +602,8 @@ class ComputerConsolidationService:
             if match:
                 cn = match.group(1)
                 # Validate in silver.users
-                query = "SELECT uniqname FROM silver.users WHERE uniqname = :uniqname"
-                try:
-                    result = self.db_adapter.query_to_dataframe(
-                        query, {"uniqname": cn.lower()}
-                    )
-                    if not result.empty:
-                        return cn.lower(), quality_flags
-                except Exception:
-                    pass
+                if cn.lower() in reference["uniqnames"]:
+                    return cn.lower(), quality_flags
 
         quality_flags.append("no_valid_owner")
         return None, quality_flags
@@ -564,23 +620,38 @@ class ComputerConsolidationService:
         quality_flags = []
 
         if tdx and tdx.get("attr_financial_owner_uid"):
-            uid = tdx["attr_financial_owner_uid"]
-            query = "SELECT uniqname FROM silver.users WHERE tdx_user_uid = :uid"
-            try:
-                result = self.db_adapter.query_to_dataframe(query, {"uid": uid})
-                if not result.empty:
-                    return result.iloc[0]["uniqname"], quality_flags
-                else:
-                    quality_flags.append("invalid_financial_owner_tdx_uid")
-            except Exception as e:
-                logger.warning(
-                    f"⚠️  Failed to resolve TDX financial owner UID {uid}: {e}"
-                )
-                quality_flags.append("financial_owner_lookup_error")
+            uid = self._normalize_tdx_uid(tdx["attr_financial_owner_uid"])
+            uniqname = self._reference["uniqname_by_tdx_uid"].get(uid)
+            if uniqname:
+                return uniqname, quality_flags
+            quality_flags.append("invalid_financial_owner_tdx_uid")
 
         # No fallback - financial owner is TDX-specific
         return None, quality_flags
 
+    def _match_department_name(self, ou_dept: str) -> Optional[str]:
+        """
+        Find the first department (by dept_id) whose name matches ILIKE '%ou_dept%'.
+
+        LIKE wildcards in ou_dept keep their SQL meaning. Results are cached
+        per OU department, which repeat across most computers.
+        """
+        cache = self._reference.setdefault("department_name_matches", {})
+        if ou_dept not in cache:
+            pattern = re.compile(
+                re.escape(ou_dept).replace("%", ".*").replace("_", "."),
+                re.IGNORECASE | re.DOTALL,
+            )
+            cache[ou_dept] = next(
+                (
+                    dept_id
+                    for dept_id, name in self._reference["department_names"]
+                    if pattern.search(name)
+                ),
+                None,
+            )
+        return cache[ou_dept]
+
     def _resolve_department_id(
         self, tdx: Optional[Dict], ad: Optional[Dict], kc: Optional[Dict]
     ) -> Tuple[Optional[str], List[str]]:
@@ -589,54 +660,33 @@ class ComputerConsolidationService:
         Returns: (dept_id, quality_flags)
         """
         quality_flags = []
+        reference = self._reference
 
         # Priority 1: TDX Owning Department ID (map to silver.departments.dept_id)
         if tdx and tdx.get("owning_department_id"):
             tdx_dept_id = tdx["owning_department_id"]
             # Lookup in silver.departments: tdx_id -> dept_id
-            query = "SELECT dept_id FROM silver.departments WHERE tdx_id = :tdx_id"
             try:
-                result = self.db_adapter.query_to_dataframe(
-                    query, {"tdx_id": tdx_dept_id}
-                )
-                if not result.empty:
-                    return result.iloc[0]["dept_id"], quality_flags
-                else:
-                    quality_flags.append("invalid_department_tdx_id")
-            except Exception as e:
-                logger.warning(
-                    f"⚠️  Failed to resolve TDX department ID {tdx_dept_id}: {e}"
-                )
-                quality_flags.append("department_lookup_error")
+                dept_id = reference["dept_id_by_tdx_id"].get(int(tdx_dept_id))
+            except (TypeError, ValueError):
+                dept_id = None
+            if dept_id:
+                return dept_id, quality_flags
+            quality_flags.append("invalid_department_tdx_id")
 
         # Priority 2: AD OU Department (map to silver.departments by name)
-        if ad and ad.get("ou_department"):
-            ou_dept = ad["ou_department"]
-            # Try to match by department name
-            query = "SELECT dept_id FROM silver.departments WHERE department_name ILIKE :name"
-            try:
-                result = self.db_adapter.query_to_dataframe(
-                    query, {"name": f"%{ou_dept}%"}
-                )
-                if not result.empty:
-                    return result.iloc[0]["dept_id"], quality_flags
-            except Exception:
-                pass
+        if ad and ad.get("ou_department") and isinstance(ad["ou_department"], str):
+            dept_id = self._match_department_name(ad["ou_department"])
+            if dept_id:
+                return dept_id, quality_flags
 
         # Priority 3: KeyConfigure Owner (if it's a dept code)
         if kc and kc.get("owner"):
             owner = kc["owner"]
-            # Check if it matches dept_id pattern (e.g., "189100", "LSA-PSYC")
-            if owner:
-                query = "SELECT dept_id FROM silver.departments WHERE dept_id = :dept_id OR department_code = :dept_id"
-                try:
-                    result = self.db_adapter.query_to_dataframe(
-                        query, {"dept_id": owner}
-                    )
-                    if not result.empty:
-                        return result.iloc[0]["dept_id"], quality_flags
-                except Exception:
-                    pass
+            # Check if it matches dept_id or department_code (e.g., "189100", "LSA-PSYC")
+            dept_id = reference["dept_id_by_code"].get(owner)
+            if dept_id:
+                return dept_id, quality_flags
 
         quality_flags.append("no_valid_department")
         return None, quality_flags
@@ -1185,6 +1235,29 @@ class ComputerConsolidationService:
     # DATA QUALITY SCORING
     # ========================================================================
 
+    def _merge_computer_chunk(
+        self, groups: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge, score and hash a chunk of matched groups.
+
+        Uses only the preloaded reference data, so chunks can be merged in
+        worker processes.
+
+        Args:
+            groups: Matched groups from _match_records()
+
+        Returns:
+            Consolidated records with data_quality_score and entity_hash set
+        """
+        merged_records = []
+        for group in groups:
+            merged = self._merge_computer_group(group)
+            merged["data_quality_score"] = self._calculate_data_quality(merged)
+            merged["entity_hash"] = self._calculate_content_hash(merged)
+            merged_records.append(merged)
+        return merged_records
+
     def _calculate_data_quality(self, record: Dict[str, Any]) -> Decimal:
         """
         Calculate data quality score (0.00-1.00) based on completeness.
@@ -1255,141 +1328,192 @@ class ComputerConsolidationService:
     # DATABASE OPERATIONS
     # ========================================================================
 
+    # JSONB columns of silver.computers, serialized before binding
+    COMPUTER_JSONB_FIELDS = [
+        "computer_name_aliases",
+        "serial_numbers",
+        "mac_addresses",
+        "location_info",
+        "ownership_info",
+        "hardware_specs",
+        "os_details",
+        "network_info",
+        "ad_security_info",
+        "ad_ou_info",
+        "financial_info",
+        "activity_timestamps",
+        "tdx_attributes",
+        "tdx_attachments",
+        "source_raw_ids",
+        "quality_flags",
+    ]
+
+    def _fetch_existing_hashes(self) -> Dict[str, str]:
+        """
+        Load every (computer_id, entity_hash) pair from silver.computers.
+
+        Returns:
+            Dictionary mapping computer_id to its stored entity_hash
+        """
+        existing = self.db_adapter.query_to_dataframe(
+            "SELECT computer_id, entity_hash FROM silver.computers"
+        )
+        if existing.empty:
+            return {}
+        return dict(zip(existing["computer_id"], existing["entity_hash"]))
+
+    def _prepare_computer_row(
+        self, record: Dict[str, Any], run_id: str, now: datetime
+    ) -> Dict[str, Any]:
+        """Convert a consolidated record into bind parameters for silver.computers."""
+        db_record = record.copy()
+
+        # Remove internal fields
+        db_record.pop("_ad_member_of_groups", None)
+
+        # Convert JSONB fields to JSON strings
+        for field in self.COMPUTER_JSONB_FIELDS:
+            if field in db_record and db_record[field] is not None:
+                # Clean NaN values before JSON serialization
+                cleaned_data = clean_nan_for_json(db_record[field])
+                db_record[field] = json.dumps(cleaned_data, default=str)
+
+        # Handle pandas NaT/NaN values
+        for key, value in list(db_record.items()):
+            if pd.isna(value):
+                db_record[key] = None
+
+        # Add metadata
+        db_record["ingestion_run_id"] = run_id
+        db_record["updated_at"] = now
+        db_record["created_at"] = now
+        # Score and hash are normally computed by the merge stage
+        if "entity_hash" not in record:
+            db_record["data_quality_score"] = self._calculate_data_quality(record)
+            db_record["entity_hash"] = self._calculate_content_hash(record)
+        return db_record
+
     def _batch_upsert_computers(
         self, records: List[Dict[str, Any]], run_id: str, dry_run: bool
-    ) -> Tuple[int, int, int]:
+    ) -> Tuple[int, int, int, int]:
         """
         Batch upsert computer records to silver.computers.
-        Returns: (processed, created, updated)
+
+        Stored hashes are loaded once and diffed in memory; only new and
+        changed rows are written, with one multi-row INSERT ... ON CONFLICT
+        per batch. created_at is only written for new rows.
+
+        Returns: (processed, created, updated, unchanged)
         """
         if not records:
-            return 0, 0, 0
+            return 0, 0, 0, 0
 
         if dry_run:
             logger.info(f"🔍 [DRY RUN] Would upsert {len(records)} computer records")
-            return len(records), len(records), 0
+            return len(records), len(records), 0, 0
 
         try:
+            from sqlalchemy import column, table
             from sqlalchemy.dialects.postgresql import insert
 
+            existing_hashes = self._fetch_existing_hashes()
+            logger.info(
+                f"📋 Loaded {len(existing_hashes)} existing computer hashes for diffing"
+            )
+
             created = 0
             updated = 0
+            unchanged = 0
+            now = datetime.now(timezone.utc)
 
-            # Process in batches
-            batch_size = 100
-            for i in range(0, len(records), batch_size):
-                batch = records[i : i + batch_size]
-
-                for record in batch:
-                    # Prepare record for insertion
-                    db_record = record.copy()
-
-                    # Remove internal fields
-                    db_record.pop("_ad_member_of_groups", None)
-
-                    # Convert JSONB fields to JSON strings
-                    jsonb_fields = [
-                        "computer_name_aliases",
-                        "serial_numbers",
-                        "mac_addresses",
-                        "location_info",
-                        "ownership_info",
-                        "hardware_specs",
-                        "os_details",
-                        "network_info",
-                        "ad_security_info",
-                        "ad_ou_info",
-                        "financial_info",
-                        "activity_timestamps",
-                        "tdx_attributes",
-                        "tdx_attachments",
-                        "source_raw_ids",
-                        "quality_flags",
-                    ]
-                    for field in jsonb_fields:
-                        if field in db_record and db_record[field] is not None:
-                            # Clean NaN values before JSON serialization
-                            cleaned_data = clean_nan_for_json(db_record[field])
-                            db_record[field] = json.dumps(cleaned_data, default=str)
-
-                    # Handle pandas NaT/NaN values
-                    for key, value in list(db_record.items()):
-                        if pd.isna(value):
-                            db_record[key] = None
-
-                    # Add metadata
-                    db_record["ingestion_run_id"] = run_id
-                    db_record["updated_at"] = datetime.now(timezone.utc)
-
-                    # Calculate quality score
-                    db_record["data_quality_score"] = self._calculate_data_quality(
-                        record
-                    )
-
-                    # Calculate hash
-                    db_record["entity_hash"] = self._calculate_content_hash(record)
-
-                    # Check if record exists
-                    check_query = "SELECT entity_hash FROM silver.computers WHERE computer_id = :computer_id"
-                    existing = self.db_adapter.query_to_dataframe(
-                        check_query, {"computer_id": db_record["computer_id"]}
-                    )
-
-                    if existing.empty:
-                        # Insert new record
-                        db_record["created_at"] = datetime.now(timezone.utc)
-                        created += 1
-                    else:
-                        # Check if hash changed
-                        if existing.iloc[0]["entity_hash"] == db_record["entity_hash"]:
-                            # No change, skip
-                            continue
-                        updated += 1
-
-                    # Upsert using INSERT...ON CONFLICT
-                    with self.db_adapter.engine.connect() as conn:
+            # Diff against stored hashes. Later duplicates of a computer_id
+            # replace earlier ones, as sequential upserts would.
+            pending: Dict[str, Dict[str, Any]] = {}
+            for record in records:
+                db_record = self._prepare_computer_row(record, run_id, now)
+                computer_id = db_record["computer_id"]
+                stored_hash = existing_hashes.get(computer_id)
+
+                if stored_hash is None:
+                    created += 1
+                elif stored_hash == db_record["entity_hash"]:
+                    # No change, skip
+                    unchanged += 1
+                    continue
+                else:
+                    updated += 1
+
+                existing_hashes[computer_id] = db_record["entity_hash"]
+                pending[computer_id] = db_record
+
+            rows = list(pending.values())
+            if rows:
+                columns = list(rows[0].keys())
+                computers_table = table("computers", *[column(col) for col in columns])
+
+                batch_size = 500
+                with self.db_adapter.engine.connect() as conn:
+                    for i in range(0, len(rows), batch_size):
+                        batch = rows[i : i + batch_size]
+                        stmt = insert(computers_table).values(batch)
+                        stmt = stmt.on_conflict_do_update(
+                            index_elements=["computer_id"],
+                            set_={
+                                c.name: c
+                                for c in stmt.excluded
+                                if c.name not in ("computer_id", "created_at")
+                            },
+                        )
                         with conn.begin():
                             conn.execute(text("SET search_path TO silver, public"))
-
-                            # Build upsert statement
-                            columns = list(db_record.keys())
-                            values_placeholders = ", ".join(
-                                [f":{col}" for col in columns]
-                            )
-                            columns_str = ", ".join(columns)
-
-                            # Update columns (all except computer_id)
-                            update_set = ", ".join(
-                                [
-                                    f"{col} = EXCLUDED.{col}"
-                                    for col in columns
-                                    if col != "computer_id"
-                                ]
-                            )
-
-                            upsert_sql = f"""
-                            INSERT INTO computers ({columns_str})
-                            VALUES ({values_placeholders})
-                            ON CONFLICT (computer_id) DO UPDATE SET {update_set}
-                            """
-
-                            conn.execute(text(upsert_sql), db_record)
+                            conn.execute(stmt)
 
             logger.info(
-                f"✅ Upserted {created} new, {updated} updated computer records"
+                f"✅ Upserted {created} new, {updated} updated computer records "
+                f"({unchanged} unchanged)"
             )
-            return len(records), created, updated
+            return len(records), created, updated, unchanged
 
         except Exception as e:
             logger.error(f"❌ Batch upsert failed: {e}")
             raise
 
+    def _load_group_id_map(self) -> Dict[str, str]:
+        """
+        Load a CN -> group_id map from silver.groups in one query.
+
+        A CN resolves to the group whose cn matches, falling back to a group
+        whose group_name matches; ties go to the lowest group_id.
+
+        Returns:
+            Dictionary mapping group CN/name to group_id
+        """
+        groups = self.db_adapter.query_to_dataframe(
+            "SELECT group_id, cn, group_name FROM silver.groups ORDER BY group_id"
+        )
+        by_cn: Dict[str, str] = {}
+        by_name: Dict[str, str] = {}
+        for group_id, cn, group_name in groups.itertuples(index=False):
+            if isinstance(cn, str):
+                by_cn.setdefault(cn, group_id)
+            if isinstance(group_name, str):
+                by_name.setdefault(group_name, group_id)
+        return {**by_name, **by_cn}
+
     def _upsert_computer_groups(
         self, records: List[Dict[str, Any]], dry_run: bool
     ) -> int:
         """
-        Upsert computer group memberships to silver.computer_groups junction table.
-        Returns: count of memberships processed
+        Sync computer group memberships to silver.computer_groups junction table.
+
+        Group CNs are resolved through a map loaded once from silver.groups.
+        For every computer with AD data in this run, its stored memberships
+        are diffed against the current memberOf list: new memberships are
+        inserted, changed group_id resolutions updated and memberships the
+        computer no longer has deleted. Computers without AD data in this
+        run are left untouched.
+
+        Returns: count of current memberships processed
         """
         if dry_run:
             total_memberships = sum(
@@ -1404,68 +1528,139 @@ class ComputerConsolidationService:
             return total_memberships
 
         try:
+            from sqlalchemy import column, table
             from sqlalchemy.dialects.postgresql import insert
 
-            memberships = []
+            group_id_map = self._load_group_id_map()
+
+            # (computer_id, group_dn) -> (group_cn, group_id) for computers with AD data
+            current: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]] = {}
+            synced_computer_ids: Set[str] = set()
 
             for record in records:
                 computer_id = record.get("computer_id")
                 ad_groups = record.get("_ad_member_of_groups")
 
-                if not computer_id or not ad_groups:
+                if not computer_id or ad_groups is None:
                     continue
+                synced_computer_ids.add(computer_id)
 
                 # ad_groups is JSONB array of DNs
                 for group_dn in ad_groups:
                     # Extract CN from DN
                     match = re.match(r"CN=([^,]+)", group_dn)
                     group_cn = match.group(1) if match else None
+                    group_id = group_id_map.get(group_cn) if group_cn else None
+                    current[(computer_id, group_dn)] = (group_cn, group_id)
 
-                    # Try to resolve to silver.groups.group_id
-                    group_id = None
-                    if group_cn:
-                        query = "SELECT group_id FROM silver.groups WHERE cn = :cn OR group_name = :cn"
-                        try:
-                            result = self.db_adapter.query_to_dataframe(
-                                query, {"cn": group_cn}
-                            )
-                            if not result.empty:
-                                group_id = result.iloc[0]["group_id"]
-                        except Exception:
-                            pass
+            if not synced_computer_ids:
+                return 0
 
-                    memberships.append(
+            existing_df = self.db_adapter.query_to_dataframe(
+                """
+                SELECT computer_id, group_dn, group_id
+                FROM silver.computer_groups
+                WHERE computer_id = ANY(:computer_ids)
+                """,
+                {"computer_ids": sorted(synced_computer_ids)},
+            )
+            existing = {
+                (computer_id, group_dn): (group_id if isinstance(group_id, str) else None)
+                for computer_id, group_dn, group_id in existing_df.itertuples(index=False)
+            }
+
+            now = datetime.now(timezone.utc)
+            to_insert = []
+            to_update = []
+            for key, (group_cn, group_id) in current.items():
+                if key not in existing:
+                    to_insert.append(
                         {
-                            "computer_id": computer_id,
+                            "computer_id": key[0],
                             "group_id": group_id,
-                            "group_dn": group_dn,
+                            "group_dn": key[1],
                             "group_cn": group_cn,
                             "source_system": "active_directory",
-                            "created_at": datetime.now(timezone.utc),
-                            "updated_at": datetime.now(timezone.utc),
+                            "created_at": now,
+                            "updated_at": now,
                         }
                     )
+                elif existing[key] != group_id:
+                    to_update.append((key[0], key[1], group_id))
+            to_delete = [key for key in existing if key not in current]
 
-            if not memberships:
-                return 0
-
-            # Batch upsert
             with self.db_adapter.engine.connect() as conn:
                 with conn.begin():
                     conn.execute(text("SET search_path TO silver, public"))
 
-                    for membership in memberships:
-                        upsert_sql = """
-                        INSERT INTO computer_groups (computer_id, group_id, group_dn, group_cn, source_system, created_at, updated_at)
-                        VALUES (:computer_id, :group_id, :group_dn, :group_cn, :source_system, :created_at, :updated_at)
-                        ON CONFLICT (computer_id, group_dn) DO UPDATE SET
-                            group_id = EXCLUDED.group_id,
-                            updated_at = EXCLUDED.updated_at
-                        """
-                        conn.execute(text(upsert_sql), membership)
+                    if to_delete:
+                        conn.execute(
+                            text(
+                                """
+                                DELETE FROM computer_groups AS cg
+                                USING unnest(
+                                    CAST(:computer_ids AS text[]),
+                                    CAST(:group_dns AS text[])
+                                ) AS gone(computer_id, group_dn)
+                                WHERE cg.computer_id = gone.computer_id
+                                  AND cg.group_dn = gone.group_dn
+                                """
+                            ),
+                            {
+                                "computer_ids": [key[0] for key in to_delete],
+                                "group_dns": [key[1] for key in to_delete],
+                            },
+                        )
+
+                    if to_update:
+                        conn.execute(
+                            text(
+                                """
+                                UPDATE computer_groups AS cg
+                                SET group_id = changed.group_id,
+                                    updated_at = :updated_at
+                                FROM unnest(
+                                    CAST(:computer_ids AS text[]),
+                                    CAST(:group_dns AS text[]),
+                                    CAST(:group_ids AS text[])
+                                ) AS changed(computer_id, group_dn, group_id)
+                                WHERE cg.computer_id = changed.computer_id
+                                  AND cg.group_dn = changed.group_dn
+                                """
+                            ),
+                            {
+                                "computer_ids": [row[0] for row in to_update],
+                                "group_dns": [row[1] for row in to_update],
+                                "group_ids": [row[2] for row in to_update],
+                                "updated_at": now,
+                            },
+                        )
+
+                    if to_insert:
+                        memberships_table = table(
+                            "computer_groups", *[column(col) for col in to_insert[0]]
+                        )
+                        batch_size = 1000
+                        for i in range(0, len(to_insert), batch_size):
+                            stmt = insert(memberships_table).values(
+                                to_insert[i : i + batch_size]
+                            )
+                            stmt = stmt.on_conflict_do_update(
+                                index_elements=["computer_id", "group_dn"],
+                                set_={
+                                    "group_id": stmt.excluded.group_id,
+                                    "updated_at": stmt.excluded.updated_at,
+                                },
+                            )
+                            conn.execute(stmt)
 
-            logger.info(f"✅ Upserted {len(memberships)} computer group memberships")
-            return len(memberships)
+            logger.info(
+                f"✅ Synced {len(current)} computer group memberships for "
+                f"{len(synced_computer_ids)} computers ({len(group_id_map)} group names): "
+                f"{len(to_insert)} inserted, {len(to_update)} updated, "
+                f"{len(to_delete)} deleted"
+            )
+            return len(current)
 
         except Exception as e:
             logger.error(f"❌ Computer groups upsert failed: {e}")
@@ -1561,16 +1756,25 @@ class ComputerConsolidationService:
     # MAIN CONSOLIDATION LOGIC
     # ========================================================================
 
-    def consolidate_computers(self, full_sync: bool = False, dry_run: bool = False):
+    def consolidate_computers(
+        self, full_sync: bool = False, dry_run: bool = False, merge_workers: int = 1
+    ):
         """
         Main consolidation logic.
 
         Args:
             full_sync: If True, reprocess all records. If False, only process changed records.
             dry_run: If True, don't write to database, just log what would happen.
+            merge_workers: Processes merging matched groups in parallel (1 merges inline).
         """
         run_id = self.create_transformation_run() if not dry_run else "dry-run"
-        stats = {"processed": 0, "created": 0, "updated": 0, "groups_processed": 0}
+        stats = {
+            "processed": 0,
+            "created": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "groups_processed": 0,
+        }
 
         try:
             # 1. Get last transformation timestamp
@@ -1586,27 +1790,34 @@ class ComputerConsolidationService:
             logger.info("🧩 Matching records...")
             matched_groups = self._match_records(source_data)
 
-            # 4. Merge into consolidated records
+            # 4. Merge into consolidated records (inline or in worker processes)
             logger.info("🔗 Merging matched groups...")
+            self._reference = self._load_reference_data()
             consolidated_records = []
-            for i, group in enumerate(matched_groups):
-                if (i + 1) % 1000 == 0:
-                    logger.info(
-                        f"   ⏳ Processed {i + 1}/{len(matched_groups)} groups..."
-                    )
-                merged = self._merge_computer_group(group)
-                consolidated_records.append(merged)
+            merged_chunks = map_chunks(
+                _merge_computer_chunk,
+                chunked(matched_groups, self.MERGE_CHUNK_SIZE),
+                workers=merge_workers,
+                initializer=_init_merge_worker,
+                initargs=(self._reference,),
+            )
+            for merged_chunk in merged_chunks:
+                consolidated_records.extend(merged_chunk)
+                logger.info(
+                    f"   ⏳ Processed {len(consolidated_records)}/{len(matched_groups)} groups..."
+                )
 
             logger.info(f"✅ Merged {len(consolidated_records)} computer records")
 
             # 5. Upsert to silver.computers
             logger.info("💾 Upserting to silver.computers...")
-            processed, created, updated = self._batch_upsert_computers(
+            processed, created, updated, unchanged = self._batch_upsert_computers(
                 consolidated_records, run_id, dry_run
             )
             stats["processed"] = processed
             stats["created"] = created
             stats["updated"] = updated
+            stats["unchanged"] = unchanged
 
             # 6. Upsert to silver.computer_groups
             logger.info("💾 Upserting to silver.computer_groups...")
@@ -1626,6 +1837,7 @@ class ComputerConsolidationService:
             logger.info(f"📊 Computers processed: {stats['processed']}")
             logger.info(f"   ✨ Created: {stats['created']}")
             logger.info(f"   🔄 Updated: {stats['updated']}")
+            logger.info(f"   ⏭️  Unchanged: {stats['unchanged']}")
             logger.info(f"   👥 Group memberships: {stats['groups_processed']}")
             logger.info("=" * 80)
 
@@ -1644,6 +1856,27 @@ class ComputerConsolidationService:
         logger.info("🔒 Database connection closed")
 
 
+# ============================================================================
+# MERGE WORKERS
+# ============================================================================
+
+# Per-process merge service, installed by _init_merge_worker()
+_merge_context: Dict[str, Any] = {}
+
+
+def _init_merge_worker(reference: Dict[str, Any]) -> None:
+    """Install a service with the FK lookup tables used by _merge_computer_chunk()."""
+    # Merging only reads the reference data, so no database adapter is created
+    service = ComputerConsolidationService.__new__(ComputerConsolidationService)
+    service._reference = reference
+    _merge_context["service"] = service
+
+
+def _merge_computer_chunk(groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge one chunk of matched groups with the installed service."""
+    return _merge_context["service"]._merge_computer_chunk(groups)
+
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
@@ -1664,6 +1897,12 @@ def main():
         action="store_true",
         help="Reprocess all records (ignore last transformation timestamp)",
     )
+    parser.add_argument(
+        "--merge-workers",
+        type=int,
+        default=1,
+        help="Processes merging matched groups in parallel; 0 uses every CPU (default: 1)",
+    )
     args = parser.parse_args()
 
     # Load environment
@@ -1677,7 +1916,11 @@ def main():
     service = None
     try:
         service = ComputerConsolidationService(db_url)
-        service.consolidate_computers(full_sync=args.full_sync, dry_run=args.dry_run)
+        service.consolidate_computers(
+            full_sync=args.full_sync,
+            dry_run=args.dry_run,
+            merge_workers=resolve_workers(args.merge_workers),
+        )
     except Exception as e:
         logger.error(f"❌ Fatal error: {e}")
         sys.exit(1)
@@ -53,10 +53,12 @@ from uuid import uuid4
 # Add LSATS project to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+import pandas as pd
 from dotenv import load_dotenv
 from sqlalchemy import text
 
 from database.adapters.postgres_adapter import PostgresAdapter
+from database.substring_matcher import SubstringMatcher
 
 # Load environment
 load_dotenv()
@@ -99,6 +101,12 @@ class LabComputersTransformationService:
         self.labs_cache = {}  # {lab_id: lab_dict}
         self.computers_cache = {}  # {computer_id: computer_dict}
 
+        # Computer indexes (built with the computers cache, in cache order)
+        self.computers_by_owner = {}  # {owner_uniqname: [computer_id]}
+        self.computers_by_financial_owner = {}  # {financial_owner_uniqname: [computer_id]}
+        self.computers_by_last_user = {}  # {lowercased last_user: [computer_id]}
+        self.computer_positions = {}  # {computer_id: position in computers cache}
+
         logger.info(
             f"🔧 Initialized LabComputersTransformationService (dry_run={dry_run})"
         )
@@ -120,10 +128,7 @@ class LabComputersTransformationService:
         df = self.db_adapter.query_to_dataframe(query)
 
         # Group by lab_id
-        for _, row in df.iterrows():
-            lab_id = row["lab_id"]
-            uniqname = row["member_uniqname"]
-
+        for lab_id, uniqname in zip(df["lab_id"], df["member_uniqname"]):
             if lab_id not in self.lab_members_cache:
                 self.lab_members_cache[lab_id] = set()
 
@@ -147,14 +152,13 @@ class LabComputersTransformationService:
 
         df = self.db_adapter.query_to_dataframe(query)
 
-        for _, row in df.iterrows():
+        for computer_id, func_id in zip(df["computer_id"], df["function_id"]):
             # Convert float string to int string (27316.0 -> '27316')
-            func_id = row["function_id"]
             if func_id and isinstance(func_id, str):
                 func_id = str(int(float(func_id)))
             elif isinstance(func_id, float) and func_id != func_id:
                 func_id = None
-            self.function_cache[row["computer_id"]] = func_id
+            self.function_cache[computer_id] = func_id
 
         logger.info(f"   Loaded {len(self.function_cache)} computer functions")
 
@@ -186,11 +190,7 @@ class LabComputersTransformationService:
 
         df = self.db_adapter.query_to_dataframe(query)
 
-        for _, row in df.iterrows():
-            self.labs_cache[row["lab_id"]] = {
-                k: (None if (isinstance(v, float) and v != v) else v)
-                for k, v in dict(row).items()
-            }
+        self.labs_cache = dict(zip(df["lab_id"], self._records_without_nan(df)))
 
         logger.info(f"   Loaded {len(self.labs_cache)} active labs")
 
@@ -213,11 +213,25 @@ class LabComputersTransformationService:
 
         df = self.db_adapter.query_to_dataframe(query)
 
-        for _, row in df.iterrows():
-            self.computers_cache[row["computer_id"]] = {
-                k: (None if (isinstance(v, float) and v != v) else v)
-                for k, v in dict(row).items()
-            }
+        self.computers_cache = dict(
+            zip(df["computer_id"], self._records_without_nan(df))
+        )
+        self.computer_positions = {
+            computer_id: position
+            for position, computer_id in enumerate(self.computers_cache)
+        }
+
+        # Index computers by the user columns the PI/member methods match on
+        for index, column, normalize in (
+            (self.computers_by_owner, "owner_uniqname", None),
+            (self.computers_by_financial_owner, "financial_owner_uniqname", None),
+            (self.computers_by_last_user, "last_user", str.lower),
+        ):
+            for computer_id, value in zip(df["computer_id"], df[column]):
+                if not isinstance(value, str) or not value:
+                    continue
+                key = normalize(value) if normalize else value
+                index.setdefault(key, []).append(computer_id)
 
         logger.info(f"   Loaded {len(self.computers_cache)} active computers")
 
@@ -225,6 +239,23 @@ class LabComputersTransformationService:
     # HELPER METHODS
     # ========================================================================
 
+    @staticmethod
+    def _records_without_nan(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Convert a DataFrame to record dicts with missing values as None."""
+        df = df.astype(object)
+        return df.where(df.notna(), None).to_dict("records")
+
+    def _computers_for_users(
+        self, index: Dict[str, List[str]], uniqnames: Set[str]
+    ) -> List[str]:
+        """List computers indexed under any of the uniqnames, in cache order."""
+        computer_ids = [
+            computer_id
+            for uniqname in uniqnames
+            for computer_id in index.get(uniqname, ())
+        ]
+        return sorted(computer_ids, key=self.computer_positions.__getitem__)
+
     def _get_function_name(self, function_id: Optional[str]) -> str:
         """Get human-readable function name."""
         mapping = {
@@ -242,6 +273,32 @@ class LabComputersTransformationService:
     # DISCOVERY METHODS
     # ========================================================================
 
+    def _match_computers_by_substring(
+        self, patterns: List[str], field: str
+    ) -> Dict[str, List[str]]:
+        """
+        Find computers whose field contains any of the patterns (case-insensitive).
+
+        One Aho–Corasick automaton is built over all patterns and each
+        computer's field is scanned once, instead of testing every pattern
+        against every computer.
+
+        Args:
+            patterns: Substrings to look for (PI uniqnames, OU DNs)
+            field: Computer cache field to scan
+
+        Returns:
+            Dict of pattern -> matching computer IDs, in cache order
+        """
+        matcher = SubstringMatcher(patterns)
+        matches: Dict[str, List[str]] = {}
+
+        for computer_id, computer in self.computers_cache.items():
+            for pattern in matcher.find_all(computer.get(field)):
+                matches.setdefault(pattern, []).append(computer_id)
+
+        return matches
+
     def _discover_by_ad_ou(self) -> List[Dict[str, Any]]:
         """
         Method 1: AD OU Nested (confidence 0.80).
@@ -252,30 +309,29 @@ class LabComputersTransformationService:
 
         associations = []
 
-        for lab_id, lab in self.labs_cache.items():
-            if not lab.get("has_ad_ou") or not lab.get("ad_ou_dn"):
-                continue
-
-            lab_ou = lab["ad_ou_dn"]
-
-            # Find computers in this OU
-            for computer_id, computer in self.computers_cache.items():
-                if not computer.get("ad_distinguished_name"):
-                    continue
+        lab_ous = {
+            lab_id: lab["ad_ou_dn"]
+            for lab_id, lab in self.labs_cache.items()
+            if lab.get("has_ad_ou") and lab.get("ad_ou_dn")
+        }
+        matches = self._match_computers_by_substring(
+            list(lab_ous.values()), "ad_distinguished_name"
+        )
 
-                # Check if computer DN contains lab OU DN
-                if lab_ou.lower() in computer["ad_distinguished_name"].lower():
-                    associations.append(
-                        {
-                            "computer_id": computer_id,
-                            "lab_id": lab_id,
-                            "method": "ad_ou_nested",
-                            "base_confidence": Decimal("0.80"),
-                            "matched_ou": lab_ou,
-                            "matched_group_id": None,
-                            "matched_user": None,
-                        }
-                    )
+        for lab_id, lab_ou in lab_ous.items():
+            # Computers in this OU
+            for computer_id in matches.get(lab_ou, []):
+                associations.append(
+                    {
+                        "computer_id": computer_id,
+                        "lab_id": lab_id,
+                        "method": "ad_ou_nested",
+                        "base_confidence": Decimal("0.80"),
+                        "matched_ou": lab_ou,
+                        "matched_group_id": None,
+                        "matched_user": None,
+                    }
+                )
 
         logger.info(f"   Found {len(associations)} AD OU matches")
         return associations
@@ -295,20 +351,19 @@ class LabComputersTransformationService:
             if not pi:
                 continue
 
-            # Find computers owned by this PI
-            for computer_id, computer in self.computers_cache.items():
-                if computer.get("owner_uniqname") == pi:
-                    associations.append(
-                        {
-                            "computer_id": computer_id,
-                            "lab_id": lab_id,
-                            "method": "owner_is_pi",
-                            "base_confidence": Decimal("0.85"),
-                            "matched_ou": None,
-                            "matched_group_id": None,
-                            "matched_user": pi,
-                        }
-                    )
+            # Computers owned by this PI
+            for computer_id in self.computers_by_owner.get(pi, []):
+                associations.append(
+                    {
+                        "computer_id": computer_id,
+                        "lab_id": lab_id,
+                        "method": "owner_is_pi",
+                        "base_confidence": Decimal("0.85"),
+                        "matched_ou": None,
+                        "matched_group_id": None,
+                        "matched_user": pi,
+                    }
+                )
 
         logger.info(f"   Found {len(associations)} PI owner matches")
         return associations
@@ -332,20 +387,19 @@ class LabComputersTransformationService:
             if not pi:
                 continue
 
-            # Find computers financially owned by this PI
-            for computer_id, computer in self.computers_cache.items():
-                if computer.get("financial_owner_uniqname") == pi:
-                    associations.append(
-                        {
-                            "computer_id": computer_id,
-                            "lab_id": lab_id,
-                            "method": "fin_owner_is_pi",
-                            "base_confidence": Decimal("0.80"),
-                            "matched_ou": None,
-                            "matched_group_id": None,
-                            "matched_user": pi,
-                        }
-                    )
+            # Computers financially owned by this PI
+            for computer_id in self.computers_by_financial_owner.get(pi, []):
+                associations.append(
+                    {
+                        "computer_id": computer_id,
+                        "lab_id": lab_id,
+                        "method": "fin_owner_is_pi",
+                        "base_confidence": Decimal("0.80"),
+                        "matched_ou": None,
+                        "matched_group_id": None,
+                        "matched_user": pi,
+                    }
+                )
 
         logger.info(f"   Found {len(associations)} financial owner-PI matches")
         return associations
@@ -364,29 +418,29 @@ class LabComputersTransformationService:
 
         associations = []
 
-        for lab_id, lab in self.labs_cache.items():
-            pi = lab.get("pi_uniqname")
-            if not pi:
-                continue
-
-            pi_lower = pi.lower()
-
-            # Search for PI uniqname in computer names
-            for computer_id, computer in self.computers_cache.items():
-                computer_name = computer.get("computer_name", "").lower()
+        lab_pis = {
+            lab_id: lab["pi_uniqname"]
+            for lab_id, lab in self.labs_cache.items()
+            if lab.get("pi_uniqname")
+        }
+        # Search for every PI uniqname in one pass over the computer names
+        matches = self._match_computers_by_substring(
+            list(lab_pis.values()), "computer_name"
+        )
 
-                if pi_lower in computer_name:
-                    associations.append(
-                        {
-                            "computer_id": computer_id,
-                            "lab_id": lab_id,
-                            "method": "name_pattern_pi",
-                            "base_confidence": Decimal("0.70"),
-                            "matched_ou": None,
-                            "matched_group_id": None,
-                            "matched_user": pi,
-                        }
-                    )
+        for lab_id, pi in lab_pis.items():
+            for computer_id in matches.get(pi, []):
+                associations.append(
+                    {
+                        "computer_id": computer_id,
+                        "lab_id": lab_id,
+                        "method": "name_pattern_pi",
+                        "base_confidence": Decimal("0.70"),
+                        "matched_ou": None,
+                        "matched_group_id": None,
+                        "matched_user": pi,
+                    }
+                )
 
         logger.info(f"   Found {len(associations)} name pattern-PI matches")
         return associations
@@ -422,22 +476,23 @@ class LabComputersTransformationService:
             if not members:
                 continue
 
-            # Find computers owned by members (excluding PI)
-            for computer_id, computer in self.computers_cache.items():
-                owner = computer.get("owner_uniqname")
-
-                if owner and owner in members and owner != pi:
-                    associations.append(
-                        {
-                            "computer_id": computer_id,
-                            "lab_id": lab_id,
-                            "method": "owner_member",
-                            "base_confidence": Decimal("0.35"),
-                            "matched_ou": None,
-                            "matched_group_id": None,
-                            "matched_user": owner,
-                        }
-                    )
+            # Computers owned by members (excluding PI)
+            for computer_id in self._computers_for_users(
+                self.computers_by_owner, members - {pi}
+            ):
+                associations.append(
+                    {
+                        "computer_id": computer_id,
+                        "lab_id": lab_id,
+                        "method": "owner_member",
+                        "base_confidence": Decimal("0.35"),
+                        "matched_ou": None,
+                        "matched_group_id": None,
+                        "matched_user": self.computers_cache[computer_id][
+                            "owner_uniqname"
+                        ],
+                    }
+                )
 
         logger.info(f"   Found {len(associations)} owner-member matches")
         return associations
@@ -458,26 +513,23 @@ class LabComputersTransformationService:
             if not members:
                 continue
 
-            # Find computers where last_user is a member
-            for computer_id, computer in self.computers_cache.items():
-                last_user = computer.get("last_user")
-
-                if last_user:
-                    # Normalize to lowercase for matching
-                    last_user_lower = last_user.lower()
-
-                    if last_user_lower in members:
-                        associations.append(
-                            {
-                                "computer_id": computer_id,
-                                "lab_id": lab_id,
-                                "method": "last_user_member",
-                                "base_confidence": Decimal("0.30"),
-                                "matched_ou": None,
-                                "matched_group_id": None,
-                                "matched_user": last_user_lower,
-                            }
-                        )
+            # Computers whose last_user (lowercased) is a member
+            for computer_id in self._computers_for_users(
+                self.computers_by_last_user, members
+            ):
+                associations.append(
+                    {
+                        "computer_id": computer_id,
+                        "lab_id": lab_id,
+                        "method": "last_user_member",
+                        "base_confidence": Decimal("0.30"),
+                        "matched_ou": None,
+                        "matched_group_id": None,
+                        "matched_user": self.computers_cache[computer_id][
+                            "last_user"
+                        ].lower(),
+                    }
+                )
 
         logger.info(f"   Found {len(associations)} last-user matches")
         return associations
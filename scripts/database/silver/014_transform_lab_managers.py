@@ -6,7 +6,8 @@ Populates silver.lab_managers table using Python-based scoring logic.
 Replaces database function populate_lab_managers().
 
 Key features:
-- Uses LabManagerIdentificationService for scoring logic
+- Uses LabManagerIdentificationService for scoring logic (batch mode: one
+  query and one column-wise scoring pass for all labs)
 - Processes all legitimate labs or specific lab_id
 - Full refresh strategy (TRUNCATE + INSERT)
 - Incremental mode available (single lab update)
@@ -443,16 +444,14 @@ class LabManagersTransformationService:
             if not dry_run:
                 self._delete_existing_managers(lab_id)
 
-            # Step 4: Process each lab
+            # Step 4: Identify managers for every lab in one pass
+            managers_by_lab = self.manager_service.identify_managers_for_labs(lab_ids)
             all_managers = []
 
             for current_lab_id in lab_ids:
                 stats["labs_processed"] += 1
 
-                # Identify managers for this lab
-                managers = self.manager_service.identify_managers_for_lab(
-                    current_lab_id
-                )
+                managers = managers_by_lab.get(current_lab_id, [])
 
                 if managers:
                     # Enrich with department data
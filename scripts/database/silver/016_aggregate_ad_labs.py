@@ -8,8 +8,9 @@ This is a pipeline helper table, not a source-specific table.
 Logic:
 1. Find all users with is_pi = true
 2. Find AD OUs matching OU=<pi_uniqname> or OU name contains pi_uniqname
+   (one scan of all OU names with a multi-pattern matcher)
 3. Extract OU hierarchy and metadata
-4. Create ad_labs record
+4. Upsert new and changed ad_labs records in bulk
 """
 
 import argparse
@@ -20,7 +21,7 @@ import os
 import re
 import sys
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -31,6 +32,7 @@ from sqlalchemy.exc import SQLAlchemyError
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from database.adapters.postgres_adapter import PostgresAdapter
+from database.substring_matcher import SubstringMatcher
 
 # ============================================================================
 # LOGGING SETUP
@@ -57,6 +59,7 @@ class ADLabAggregationService:
     def __init__(self, database_url: str):
         self.db_adapter = PostgresAdapter(database_url=database_url)
         self.dept_cache = {}  # Cache of dept_id -> dept_name for matching
+        self.dept_by_name = {}  # Cache of lowercased dept_name -> dept_id
         logger.info("✨ AD Lab Aggregation Service initialized")
 
     def _get_pis(self) -> List[Dict[str, Any]]:
@@ -68,25 +71,42 @@ class ADLabAggregationService:
         """
         return self.db_adapter.query_to_dataframe(query).to_dict("records")
 
-    def _find_ou(self, pi_uniqname: str) -> Optional[Dict[str, Any]]:
-        """Find AD OU for a PI."""
-        # Look for OU where name matches uniqname exactly or contains it
-        # Prioritize exact match
+    def _find_ous(self, pi_uniqnames: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Find the AD OU for every PI in one pass over the OU table.
+
+        An OU named exactly after the uniqname wins; otherwise the newest OU
+        whose name contains the uniqname (case-insensitive, as ILIKE) is used.
+        Contained uniqnames are found with one automaton scan per OU name
+        instead of one ILIKE query per PI.
+        """
         query = """
         SELECT *
         FROM silver.ad_organizational_units
-        WHERE name = :uniqname OR name ILIKE :pattern
-        ORDER BY CASE WHEN name = :uniqname THEN 0 ELSE 1 END, created_at DESC
-        LIMIT 1
+        ORDER BY created_at DESC
         """
-        result = self.db_adapter.query_to_dataframe(query, {
-            "uniqname": pi_uniqname,
-            "pattern": f"%{pi_uniqname}%"
-        })
-        
-        if not result.empty:
-            return result.iloc[0].to_dict()
-        return None
+        ous_df = self.db_adapter.query_to_dataframe(query).astype(object)
+        # Missing values are None, as in the single-row lookups this replaces
+        ous = ous_df.where(ous_df.notna(), None).to_dict("records")
+        logger.info(f"📚 Loaded {len(ous)} AD OUs for matching")
+
+        matcher = SubstringMatcher(pi_uniqnames)
+        exact: Dict[str, Dict[str, Any]] = {}
+        contains: Dict[str, Dict[str, Any]] = {}
+        # OUs arrive newest first, so the first hit per PI is the one kept
+        for ou in ous:
+            name = ou.get("name")
+            if not isinstance(name, str):
+                continue
+            exact.setdefault(name, ou)
+            for uniqname in matcher.find_all(name):
+                contains.setdefault(uniqname, ou)
+
+        matches = {}
+        for uniqname in pi_uniqnames:
+            ou = exact.get(uniqname) or contains.get(uniqname)
+            if ou:
+                matches[uniqname] = ou
+        return matches
 
     def _calculate_quality_score(self, has_ou: bool) -> float:
         """Calculate data quality score."""
@@ -102,12 +122,23 @@ class ADLabAggregationService:
     def _load_department_cache(self):
         """Load all departments into cache for matching."""
         logger.info("📚 Loading department cache...")
-        query = "SELECT dept_id, department_name FROM silver.departments"
+        query = "SELECT dept_id, department_name FROM silver.departments ORDER BY dept_id"
         depts = self.db_adapter.query_to_dataframe(query).to_dict("records")
         for dept in depts:
             self.dept_cache[dept["dept_id"]] = dept["department_name"]
+            if isinstance(dept["department_name"], str):
+                self.dept_by_name.setdefault(
+                    dept["department_name"].lower(), dept["dept_id"]
+                )
         logger.info(f"📚 Loaded {len(self.dept_cache)} departments into cache")
-    
+
+    def _fetch_existing_hashes(self) -> Dict[str, str]:
+        """Load ad_lab_id -> entity_hash for every stored AD lab."""
+        existing = self.db_adapter.query_to_dataframe(
+            "SELECT ad_lab_id, entity_hash FROM silver.ad_labs"
+        )
+        return dict(zip(existing["ad_lab_id"], existing["entity_hash"]))
+
     def _extract_department_from_ou(self, ad_ou_dn: str) -> Optional[str]:
         """Extract department name from AD OU DN (typically 2nd level OU).
         
@@ -130,38 +161,81 @@ class ADLabAggregationService:
         
         return None
     
-    def _match_department(self, department_name: str) -> Dict[str, Any]:
-        """Match department name to dept_id using fuzzy similarity.
-        
-        Returns dict with keys: department_id, match_method, confidence
+    def _match_departments(self, department_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Match department names to dept_ids.
+
+        Names equal to a department name (ignoring case) resolve from the
+        cache with confidence 1.0, the score SIMILARITY() gives them. The rest
+        are fuzzy matched with PostgreSQL similarity in a single query.
+
+        Returns dict of name -> {department_id, match_method, confidence};
+        names without a match are absent.
         """
-        if not isinstance(department_name, str) or not department_name:
-            return {"department_id": None, "match_method": None, "confidence": None}
+        matches: Dict[str, Dict[str, Any]] = {}
+        remaining = []
+        for name in set(department_names):
+            if not isinstance(name, str) or not name:
+                continue
+            dept_id = self.dept_by_name.get(name.lower())
+            if dept_id is not None:
+                matches[name] = {
+                    "department_id": dept_id,
+                    "match_method": "fuzzy_match",
+                    "confidence": 1.0,
+                }
+            else:
+                remaining.append(name)
 
-        # Strategy: Fuzzy match using PostgreSQL similarity
-        query = """
-        SELECT
-            dept_id,
-            department_name,
-            SIMILARITY(:name, department_name) as score
-        FROM silver.departments
-        WHERE SIMILARITY(:name, department_name) > 0.50
-        ORDER BY score DESC
-        LIMIT 1
+        if remaining:
+            # Strategy: Fuzzy match using PostgreSQL similarity
+            query = """
+            SELECT DISTINCT ON (n.name)
+                n.name,
+                d.dept_id,
+                SIMILARITY(n.name, d.department_name) as score
+            FROM unnest(CAST(:names AS text[])) AS n(name)
+            JOIN silver.departments d
+              ON SIMILARITY(n.name, d.department_name) > 0.50
+            ORDER BY n.name, score DESC
+            """
+            result = self.db_adapter.query_to_dataframe(query, {"names": sorted(remaining)})
+            for match in result.to_dict("records"):
+                logger.debug(f"🔍 Fuzzy match: '{match['name']}' -> {match['dept_id']} (score: {match['score']:.2f})")
+                matches[match["name"]] = {
+                    "department_id": match["dept_id"],
+                    "match_method": "fuzzy_match",
+                    "confidence": round(float(match["score"]), 2),
+                }
+
+        logger.info(f"🔍 Matched {len(matches)} of {len(set(department_names) - {None})} OU department names")
+        return matches
+
+    def _upsert_ad_labs(self, records: List[Dict[str, Any]]):
+        """Write AD lab records with one multi-row INSERT ... ON CONFLICT per batch.
+
+        All batches run in a single transaction.
         """
-        result = self.db_adapter.query_to_dataframe(query, {"name": department_name})
-        if not result.empty:
-            match = result.iloc[0]
-            logger.debug(f"🔍 Fuzzy match: '{department_name}' -> {match['dept_id']} (score: {match['score']:.2f})")
-            return {
-                "department_id": match["dept_id"],
-                "match_method": "fuzzy_match",
-                "confidence": round(float(match["score"]), 2)
-            }
-        
-        # No match found
-        logger.debug(f"❌ No department match for: {department_name}")
-        return {"department_id": None, "match_method": None, "confidence": None}
+        from sqlalchemy import column, table
+        from sqlalchemy.dialects.postgresql import insert
+
+        columns = list(records[0].keys())
+        ad_labs_table = table("ad_labs", *[column(col) for col in columns])
+
+        batch_size = 500
+        with self.db_adapter.engine.connect() as conn:
+            with conn.begin():
+                conn.execute(text("SET search_path TO silver, public"))
+                for i in range(0, len(records), batch_size):
+                    stmt = insert(ad_labs_table).values(records[i : i + batch_size])
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["ad_lab_id"],
+                        set_={
+                            c.name: c
+                            for c in stmt.excluded
+                            if c.name not in ("ad_lab_id", "pi_uniqname", "source_system")
+                        },
+                    )
+                    conn.execute(stmt)
 
     def _create_ingestion_run(self, source_system: str, entity_type: str) -> str:
         """Create a new ingestion run record."""
@@ -201,19 +275,29 @@ class ADLabAggregationService:
 
         stats = {"processed": 0, "created": 0, "updated": 0, "skipped": 0, "dept_matched": 0, "dept_none": 0}
 
+        ous = self._find_ous([pi["uniqname"] for pi in pis])
+        dept_names = {
+            uniqname: self._extract_department_from_ou(ou.get("distinguished_name"))
+            for uniqname, ou in ous.items()
+        }
+        dept_matches = self._match_departments(list(dept_names.values()))
+        no_match = {"department_id": None, "match_method": None, "confidence": None}
+        existing_hashes = {} if dry_run else self._fetch_existing_hashes()
+        now = datetime.now(timezone.utc)
+
+        pending: List[Dict[str, Any]] = []
         for pi in pis:
             uniqname = pi["uniqname"]
             full_name = pi["full_name"]
             
-            ou = self._find_ou(uniqname)
+            ou = ous.get(uniqname)
             
             if ou:
                 lab_name = f"{full_name} Lab (AD)"
                 
-                # Extract and match department
                 ad_ou_dn = ou.get("distinguished_name")
-                dept_name = self._extract_department_from_ou(ad_ou_dn)
-                dept_match = self._match_department(dept_name)
+                dept_name = dept_names[uniqname]
+                dept_match = dept_matches.get(dept_name, no_match)
                 
                 # Track statistics
                 if dept_match["department_id"]:
@@ -258,66 +342,28 @@ class ADLabAggregationService:
                     stats["processed"] += 1
                     continue
 
-                try:
-                    existing_query = "SELECT entity_hash FROM silver.ad_labs WHERE ad_lab_id = :id"
-                    existing = self.db_adapter.query_to_dataframe(existing_query, {"id": uniqname})
-                    
-                    if not existing.empty and existing.iloc[0]["entity_hash"] == entity_hash and not full_sync:
-                        stats["skipped"] += 1
-                        continue
-                        
-                    upsert_sql = """
-                    INSERT INTO silver.ad_labs (
-                        ad_lab_id, pi_uniqname, lab_name,
-                        has_ad_ou, ad_ou_dn, ad_ou_hierarchy, ad_parent_ou, ad_ou_depth,
-                        ad_ou_created, ad_ou_modified, description, managed_by,
-                        department_name, department_id, department_match_method, department_match_confidence,
-                        data_quality_score, quality_flags, source_system, entity_hash, ingestion_run_id, updated_at
-                    ) VALUES (
-                        :ad_lab_id, :pi_uniqname, :lab_name,
-                        :has_ad_ou, :ad_ou_dn, :ad_ou_hierarchy, :ad_parent_ou, :ad_ou_depth,
-                        :ad_ou_created, :ad_ou_modified, :description, :managed_by,
-                        :department_name, :department_id, :department_match_method, :department_match_confidence,
-                        :data_quality_score, :quality_flags, :source_system, :entity_hash, :ingestion_run_id, CURRENT_TIMESTAMP
-                    )
-                    ON CONFLICT (ad_lab_id) DO UPDATE SET
-                        lab_name = EXCLUDED.lab_name,
-                        has_ad_ou = EXCLUDED.has_ad_ou,
-                        ad_ou_dn = EXCLUDED.ad_ou_dn,
-                        ad_ou_hierarchy = EXCLUDED.ad_ou_hierarchy,
-                        ad_parent_ou = EXCLUDED.ad_parent_ou,
-                        ad_ou_depth = EXCLUDED.ad_ou_depth,
-                        ad_ou_created = EXCLUDED.ad_ou_created,
-                        ad_ou_modified = EXCLUDED.ad_ou_modified,
-                        description = EXCLUDED.description,
-                        managed_by = EXCLUDED.managed_by,
-                        department_name = EXCLUDED.department_name,
-                        department_id = EXCLUDED.department_id,
-                        department_match_method = EXCLUDED.department_match_method,
-                        department_match_confidence = EXCLUDED.department_match_confidence,
-                        data_quality_score = EXCLUDED.data_quality_score,
-                        quality_flags = EXCLUDED.quality_flags,
-                        entity_hash = EXCLUDED.entity_hash,
-                        ingestion_run_id = EXCLUDED.ingestion_run_id,
-                        updated_at = CURRENT_TIMESTAMP
-                    """
-                    
-                    with self.db_adapter.engine.connect() as conn:
-                        conn.execute(text(upsert_sql), silver_record)
-                        conn.commit()
-                    
-                    if existing.empty:
-                        stats["created"] += 1
-                        logger.info(f"🆕 Created AD Lab for {uniqname}")
-                    else:
-                        stats["updated"] += 1
-                        logger.info(f"📝 Updated AD Lab for {uniqname}")
-                        
-                except SQLAlchemyError as e:
-                    logger.error(f"❌ Failed to upsert AD Lab for {uniqname}: {e}")
+                stored_hash = existing_hashes.get(uniqname)
+                if stored_hash == entity_hash and not full_sync:
+                    stats["skipped"] += 1
+                    continue
+
+                silver_record["updated_at"] = now
+                pending.append(silver_record)
+                if stored_hash is None:
+                    stats["created"] += 1
+                else:
+                    stats["updated"] += 1
 
             stats["processed"] += 1
 
+        if pending:
+            try:
+                self._upsert_ad_labs(pending)
+                logger.info(f"✅ Upserted {len(pending)} AD Labs")
+            except SQLAlchemyError as e:
+                logger.error(f"❌ Failed to upsert AD Labs: {e}")
+                stats["created"] = stats["updated"] = 0
+
         logger.info("📊 Aggregation Summary:")
         logger.info(f"   ├─ Processed PIs: {stats['processed']}")
         logger.info(f"   ├─ Created: {stats['created']}")
@@ -16,7 +16,7 @@ Logic:
 2. Left join with all aggregation tables
 3. Construct composite record
 4. Calculate quality scores and flags
-5. Upsert into silver.labs
+5. Diff against stored hashes and bulk upsert new/changed rows into silver.labs
 """
 
 import argparse
@@ -26,7 +26,7 @@ import logging
 import os
 import sys
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -227,6 +227,40 @@ class CompositeLabsTransformationService:
                 cleaned[k] = v
         return cleaned
 
+    def _fetch_existing_hashes(self) -> Dict[str, str]:
+        """Load lab_id -> entity_hash for every stored composite lab."""
+        existing = self.db_adapter.query_to_dataframe(
+            "SELECT lab_id, entity_hash FROM silver.labs"
+        )
+        return dict(zip(existing["lab_id"], existing["entity_hash"]))
+
+    def _upsert_labs(self, records: List[Dict[str, Any]]):
+        """
+        Write composite lab records with one multi-row INSERT ... ON CONFLICT
+        per batch, all in a single transaction.
+        """
+        from sqlalchemy import column, table
+        from sqlalchemy.dialects.postgresql import insert
+
+        columns = list(records[0].keys())
+        labs_table = table("labs", *[column(col) for col in columns])
+
+        batch_size = 500
+        with self.db_adapter.engine.connect() as conn:
+            with conn.begin():
+                conn.execute(text("SET search_path TO silver, public"))
+                for i in range(0, len(records), batch_size):
+                    stmt = insert(labs_table).values(records[i : i + batch_size])
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["lab_id"],
+                        set_={
+                            c.name: c
+                            for c in stmt.excluded
+                            if c.name not in ("lab_id", "pi_uniqname", "source_system")
+                        },
+                    )
+                    conn.execute(stmt)
+
     def transform_labs(self, dry_run: bool = False, full_sync: bool = False):
         """Run the transformation process."""
         logger.info("🔄 Starting Composite Labs transformation...")
@@ -237,10 +271,18 @@ class CompositeLabsTransformationService:
             run_id = self._create_ingestion_run("composite", "lab")
 
         raw_data = self._get_composite_data()
+        # A PI joined to several source rows keeps the last one, as sequential
+        # upserts did; a multi-row upsert cannot repeat a key
+        raw_data = list({row["pi_uniqname"]: row for row in raw_data}.values())
         logger.info(f"👥 Found {len(raw_data)} PIs to process")
 
         stats = {"processed": 0, "created": 0, "updated": 0, "skipped": 0}
 
+        # Stored hashes are loaded once and diffed in memory
+        existing_hashes = {} if dry_run else self._fetch_existing_hashes()
+        now = datetime.now(timezone.utc)
+
+        pending: List[Dict[str, Any]] = []
         for row in raw_data:
             uniqname = row["pi_uniqname"]
 
@@ -339,101 +381,28 @@ class CompositeLabsTransformationService:
                 stats["processed"] += 1
                 continue
 
-            try:
-                existing_query = (
-                    "SELECT entity_hash FROM silver.labs WHERE lab_id = :id"
-                )
-                existing = self.db_adapter.query_to_dataframe(
-                    existing_query, {"id": uniqname}
-                )
-
-                if (
-                    not existing.empty
-                    and existing.iloc[0]["entity_hash"] == entity_hash
-                    and not full_sync
-                ):
-                    stats["skipped"] += 1
-                    continue
-
-                upsert_sql = """
-                INSERT INTO silver.labs (
-                    lab_id, pi_uniqname, lab_name, lab_display_name,
-                    primary_department_id, department_ids, department_names,
-                    total_award_dollars, total_direct_dollars, total_indirect_dollars,
-                    award_count, active_award_count, earliest_award_start, latest_award_end,
-                    has_ad_ou, ad_ou_dn, ad_ou_hierarchy, ad_parent_ou, ad_ou_depth, ad_ou_created, ad_ou_modified,
-                    has_tdx_presence, computer_count,
-                    pi_count, investigator_count, member_count,
-                    is_active, has_active_awards, has_active_ou,
-                    has_award_data, has_ou_data, has_tdx_data, data_source,
-                    data_quality_score, quality_flags, source_system, entity_hash, ingestion_run_id, updated_at
-                ) VALUES (
-                    :lab_id, :pi_uniqname, :lab_name, :lab_display_name,
-                    :primary_department_id, :department_ids, :department_names,
-                    :total_award_dollars, :total_direct_dollars, :total_indirect_dollars,
-                    :award_count, :active_award_count, :earliest_award_start, :latest_award_end,
-                    :has_ad_ou, :ad_ou_dn, :ad_ou_hierarchy, :ad_parent_ou, :ad_ou_depth, :ad_ou_created, :ad_ou_modified,
-                    :has_tdx_presence, :computer_count,
-                    :pi_count, :investigator_count, :member_count,
-                    :is_active, :has_active_awards, :has_active_ou,
-                    :has_award_data, :has_ou_data, :has_tdx_data, :data_source,
-                    :data_quality_score, :quality_flags, :source_system, :entity_hash, :ingestion_run_id, CURRENT_TIMESTAMP
-                )
-                ON CONFLICT (lab_id) DO UPDATE SET
-                    lab_name = EXCLUDED.lab_name,
-                    lab_display_name = EXCLUDED.lab_display_name,
-                    primary_department_id = EXCLUDED.primary_department_id,
-                    department_ids = EXCLUDED.department_ids,
-                    department_names = EXCLUDED.department_names,
-                    total_award_dollars = EXCLUDED.total_award_dollars,
-                    total_direct_dollars = EXCLUDED.total_direct_dollars,
-                    total_indirect_dollars = EXCLUDED.total_indirect_dollars,
-                    award_count = EXCLUDED.award_count,
-                    active_award_count = EXCLUDED.active_award_count,
-                    earliest_award_start = EXCLUDED.earliest_award_start,
-                    latest_award_end = EXCLUDED.latest_award_end,
-                    has_ad_ou = EXCLUDED.has_ad_ou,
-                    ad_ou_dn = EXCLUDED.ad_ou_dn,
-                    ad_ou_hierarchy = EXCLUDED.ad_ou_hierarchy,
-                    ad_parent_ou = EXCLUDED.ad_parent_ou,
-                    ad_ou_depth = EXCLUDED.ad_ou_depth,
-                    ad_ou_created = EXCLUDED.ad_ou_created,
-                    ad_ou_modified = EXCLUDED.ad_ou_modified,
-                    has_tdx_presence = EXCLUDED.has_tdx_presence,
-                    computer_count = EXCLUDED.computer_count,
-                    pi_count = EXCLUDED.pi_count,
-                    investigator_count = EXCLUDED.investigator_count,
-                    member_count = EXCLUDED.member_count,
-                    is_active = EXCLUDED.is_active,
-                    has_active_awards = EXCLUDED.has_active_awards,
-                    has_active_ou = EXCLUDED.has_active_ou,
-                    has_award_data = EXCLUDED.has_award_data,
-                    has_ou_data = EXCLUDED.has_ou_data,
-                    has_tdx_data = EXCLUDED.has_tdx_data,
-                    data_source = EXCLUDED.data_source,
-                    data_quality_score = EXCLUDED.data_quality_score,
-                    quality_flags = EXCLUDED.quality_flags,
-                    entity_hash = EXCLUDED.entity_hash,
-                    ingestion_run_id = EXCLUDED.ingestion_run_id,
-                    updated_at = CURRENT_TIMESTAMP
-                """
-
-                with self.db_adapter.engine.connect() as conn:
-                    conn.execute(text(upsert_sql), parameters=silver_record)
-                    conn.commit()
-
-                if existing.empty:
-                    stats["created"] += 1
-                    logger.info(f"🆕 Created Composite Lab for {uniqname}")
-                else:
-                    stats["updated"] += 1
-                    logger.info(f"📝 Updated Composite Lab for {uniqname}")
+            stored_hash = existing_hashes.get(uniqname)
+            if stored_hash == entity_hash and not full_sync:
+                stats["skipped"] += 1
+                continue
 
-            except SQLAlchemyError as e:
-                logger.error(f"❌ Failed to upsert Composite Lab for {uniqname}: {e}")
+            silver_record["updated_at"] = now
+            if stored_hash is None:
+                stats["created"] += 1
+            else:
+                stats["updated"] += 1
+            pending.append(silver_record)
 
             stats["processed"] += 1
 
+        if pending:
+            try:
+                self._upsert_labs(pending)
+                logger.info(f"✅ Upserted {len(pending)} Composite Labs")
+            except SQLAlchemyError as e:
+                logger.error(f"❌ Failed to upsert Composite Labs: {e}")
+                stats["created"] = stats["updated"] = 0
+
         logger.info("📊 Transformation Summary:")
         logger.info(f"   ├─ Processed PIs: {stats['processed']}")
         logger.info(f"   ├─ Created: {stats['created']}")
@@ -8,9 +8,9 @@ membership extraction.
 
 Key features:
 - Starts with all PI users (is_pi = true)
-- Finds groups related to each PI (member, owner, name match, OU match)
-- Extracts all members from PI's groups
-- Enriches with silver.users data (job_title, department, etc.)
+- Finds groups related to all PIs in one query (owner, name match, OU match)
+- Extracts the members of every PI's groups in one query
+- Enriches with silver.users data (job_title, department, etc.) via a column-wise join
 - Optional award role enrichment
 - Full refresh strategy for simplicity
 """
@@ -28,6 +28,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -64,11 +65,11 @@ class LabMembersTransformationService:
         self.db_adapter = PostgresAdapter(
             database_url=database_url, pool_size=5, max_overflow=10
         )
-        self.user_cache: Dict[str, Dict[str, Any]] = {}
+        self.user_cache = pd.DataFrame()
         logger.info("✨ Lab members transformation service initialized")
 
     def _load_user_cache(self):
-        """Load all users into memory for fast lookups."""
+        """Load all users into a DataFrame indexed by uniqname for column-wise joins."""
         logger.info("📚 Loading user cache...")
         query = """
             SELECT
@@ -81,14 +82,9 @@ class LabMembersTransformationService:
                 department_name
             FROM silver.users
         """
-        df = self.db_adapter.query_to_dataframe(query)
-
-        for _, row in df.iterrows():
-            # Replace NaN (pandas read of SQL NULL) with None so INSERT params stay typed correctly
-            self.user_cache[row["uniqname"]] = {
-                k: (None if (isinstance(v, float) and v != v) else v)
-                for k, v in dict(row).items()
-            }
+        self.user_cache = self.db_adapter.query_to_dataframe(query).set_index(
+            "uniqname"
+        )
 
         logger.info(f"   Loaded {len(self.user_cache)} users into cache")
 
@@ -166,9 +162,9 @@ class LabMembersTransformationService:
         df = self.db_adapter.query_to_dataframe(query)
         return df.to_dict("records")
 
-    def _find_pi_groups(self, pi_uniqname: str) -> List[str]:
+    def _find_groups_for_pis(self, pi_uniqnames: List[str]) -> Dict[str, List[str]]:
         """
-        Find all groups related to a PI using STRICT criteria.
+        Find the groups related to every PI in one query, using STRICT criteria.
 
         Strict Criteria (only deliberate/structural relationships):
         - PI is an OWNER of the group (strongest signal - PI manages the group)
@@ -180,59 +176,89 @@ class LabMembersTransformationService:
         - Substring matching (too many false positives, e.g., "ter" in "International")
 
         Args:
-            pi_uniqname: The PI's uniqname
+            pi_uniqnames: Uniqnames of all PIs
 
         Returns:
-            List of group_ids
+            Dict mapping PI uniqname to its group_ids (PIs without groups are absent)
         """
+        if not pi_uniqnames:
+            return {}
+
         query = """
-            SELECT DISTINCT g.group_id
-            FROM silver.groups g
-            WHERE
-                -- PI is owner (STRONG SIGNAL - PI manages this group)
-                EXISTS (
-                    SELECT 1 FROM silver.group_owners go
-                    WHERE go.group_id = g.group_id
-                      AND go.owner_uniqname = :pi_uniqname
-                      AND go.owner_type = 'user'
-                )
+            WITH pis AS (
+                SELECT DISTINCT unnest(CAST(:pi_uniqnames AS text[])) AS pi_uniqname
+            )
+            -- PI is owner (STRONG SIGNAL - PI manages this group)
+            SELECT go.owner_uniqname AS pi_uniqname, g.group_id
+            FROM silver.group_owners go
+            JOIN pis p ON p.pi_uniqname = go.owner_uniqname
+            JOIN silver.groups g ON g.group_id = go.group_id
+            WHERE go.owner_type = 'user'
+            UNION
+            SELECT p.pi_uniqname, g.group_id
+            FROM pis p
+            JOIN silver.groups g ON (
                 -- Group DN contains OU (STRUCTURAL - AD organizational hierarchy)
-                OR g.distinguished_name ILIKE '%OU=' || :pi_uniqname || ',%'
+                g.distinguished_name ILIKE '%OU=' || p.pi_uniqname || ',%'
                 -- Group name contains PI as whole word (EXPLICIT - not substring)
                 -- Regex: (^|[^a-z])uniqname([^a-z]|$) ensures word boundaries
-                OR g.group_name ~* ('(^|[^a-z])' || :pi_uniqname || '([^a-z]|$)')
-                OR g.group_id ~* ('(^|[^a-z])' || :pi_uniqname || '([^a-z]|$)')
+                OR g.group_name ~* ('(^|[^a-z])' || p.pi_uniqname || '([^a-z]|$)')
+                OR g.group_id ~* ('(^|[^a-z])' || p.pi_uniqname || '([^a-z]|$)')
+            )
         """
 
-        df = self.db_adapter.query_to_dataframe(query, {"pi_uniqname": pi_uniqname})
-        return df["group_id"].tolist()
+        df = self.db_adapter.query_to_dataframe(
+            query, {"pi_uniqnames": list(pi_uniqnames)}
+        )
 
-    def _extract_group_members(
-        self, group_ids: List[str], max_group_size: int = 200
-    ) -> List[Dict]:
+        pi_groups: Dict[str, List[str]] = {}
+        for pi_uniqname, group_id in zip(df["pi_uniqname"], df["group_id"]):
+            pi_groups.setdefault(pi_uniqname, []).append(group_id)
+        return pi_groups
+
+    def _extract_members_for_pis(
+        self, pi_groups: Dict[str, List[str]], max_group_size: int = 200
+    ) -> pd.DataFrame:
         """
-        Extract all unique members from given groups.
+        Extract the unique members of every PI's groups in one query.
 
         Filters out very large groups (e.g., institutional seminar lists, notification groups)
         to avoid noise in lab membership.
 
         Args:
-            group_ids: List of group IDs to extract members from
+            pi_groups: Dict mapping PI uniqname to its group_ids
             max_group_size: Maximum number of members a group can have (default 200)
 
         Returns:
-            List of dicts with member_uniqname, source_system, source_group_ids
+            DataFrame with pi_uniqname, member_uniqname, source_systems, source_group_ids
         """
-        if not group_ids:
-            return []
+        pairs = [
+            (pi_uniqname, group_id)
+            for pi_uniqname, group_ids in pi_groups.items()
+            for group_id in group_ids
+        ]
+        if not pairs:
+            return pd.DataFrame(
+                columns=[
+                    "pi_uniqname",
+                    "member_uniqname",
+                    "source_systems",
+                    "source_group_ids",
+                ]
+            )
 
         query = """
-            WITH group_sizes AS (
+            WITH pi_groups AS (
+                SELECT *
+                FROM unnest(CAST(:pi_uniqnames AS text[]), CAST(:group_ids AS text[]))
+                    AS pg(pi_uniqname, group_id)
+            ),
+            group_sizes AS (
                 SELECT
                     group_id,
                     COUNT(*) as member_count
                 FROM silver.group_members
-                WHERE group_id = ANY(:group_ids)
+                WHERE group_id IN (SELECT group_id FROM pi_groups)
                   AND member_type = 'user'
                 GROUP BY group_id
             ),
@@ -242,77 +268,71 @@ class LabMembersTransformationService:
                 WHERE member_count <= :max_group_size
             )
             SELECT
+                pg.pi_uniqname,
                 gm.member_uniqname,
                 array_agg(DISTINCT gm.source_system) as source_systems,
                 array_agg(DISTINCT gm.group_id) as source_group_ids
-            FROM silver.group_members gm
-            JOIN filtered_groups fg ON fg.group_id = gm.group_id
+            FROM pi_groups pg
+            JOIN filtered_groups fg ON fg.group_id = pg.group_id
+            JOIN silver.group_members gm ON gm.group_id = pg.group_id
             WHERE gm.member_type = 'user'
               AND gm.member_uniqname IS NOT NULL
-            GROUP BY gm.member_uniqname
+            GROUP BY pg.pi_uniqname, gm.member_uniqname
+            ORDER BY pg.pi_uniqname, gm.member_uniqname
         """
 
-        df = self.db_adapter.query_to_dataframe(
-            query, {"group_ids": group_ids, "max_group_size": max_group_size}
+        return self.db_adapter.query_to_dataframe(
+            query,
+            {
+                "pi_uniqnames": [pi_uniqname for pi_uniqname, _ in pairs],
+                "group_ids": [group_id for _, group_id in pairs],
+                "max_group_size": max_group_size,
+            },
         )
-        return df.to_dict("records")
 
-    def _lookup_user(self, uniqname: str) -> Optional[Dict[str, Any]]:
-        """Lookup user in cache."""
-        return self.user_cache.get(uniqname)
-
-    def _enrich_with_user_data(
-        self, members: List[Dict], lab_id: str
-    ) -> List[Dict[str, Any]]:
+    def _enrich_with_user_data(self, members_df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
-        Enrich members with data from silver.users.
+        Enrich members with data from silver.users, column-wise.
 
         Args:
-            members: List of raw member dicts from group extraction
-            lab_id: The PI's uniqname (lab identifier)
+            members_df: Output of _extract_members_for_pis(); pi_uniqname is the lab_id
 
         Returns:
             List of enriched member records ready for insertion
         """
-        enriched = []
-
-        for member in members:
-            uniqname = member["member_uniqname"]
-            user = self._lookup_user(uniqname)
-
-            # Determine source_system (prefer most authoritative)
-            source_systems = member["source_systems"]
-            if "ad+mcommunity" in source_systems:
-                source_system = "lab_groups"  # Consolidated from both
-            elif "ad" in source_systems:
-                source_system = "lab_groups"
-            elif "mcommunity" in source_systems:
-                source_system = "lab_groups"
-            else:
-                source_system = "lab_groups"
-
-            enriched_member = {
-                "lab_id": lab_id,
-                "member_uniqname": uniqname,
-                "member_role": user.get("job_title") if user else None,
-                "member_first_name": user.get("first_name") if user else None,
-                "member_last_name": user.get("last_name") if user else None,
-                "member_full_name": user.get("full_name") if user else None,
-                "member_department_id": (user.get("department_id") or None) if user else None,
-                "member_department_name": user.get("department_name") if user else None,
-                "silver_user_exists": user is not None,
-                "member_job_title": user.get("job_title") if user else None,
-                "source_system": source_system,
-                "source_group_ids": json.dumps(member["source_group_ids"]),
+        if members_df.empty:
+            return []
+
+        enriched = members_df.join(self.user_cache, on="member_uniqname")
+        exists = enriched["member_uniqname"].isin(self.user_cache.index)
+
+        # Every source system (ad, mcommunity, ad+mcommunity) maps to lab_groups
+        records = pd.DataFrame(
+            {
+                "lab_id": enriched["pi_uniqname"],
+                "member_uniqname": enriched["member_uniqname"],
+                "member_role": enriched["job_title"],
+                "member_first_name": enriched["first_name"],
+                "member_last_name": enriched["last_name"],
+                "member_full_name": enriched["full_name"],
+                "member_department_id": enriched["department_id"].where(
+                    enriched["department_id"] != "", None
+                ),
+                "member_department_name": enriched["department_name"],
+                "silver_user_exists": exists,
+                "member_job_title": enriched["job_title"],
+                "source_system": "lab_groups",
+                "source_group_ids": enriched["source_group_ids"].map(json.dumps),
                 "source_award_ids": "[]",  # Will be enriched in future if needed
-                "is_pi": (uniqname == lab_id),
+                "is_pi": enriched["member_uniqname"] == enriched["pi_uniqname"],
                 "is_investigator": False,  # Will be enriched from awards in future
                 "award_role": None,
             }
+        )
 
-            enriched.append(enriched_member)
-
-        return enriched
+        # Replace NaN (missing users, SQL NULL) with None so INSERT params stay typed correctly
+        records = records.astype(object).where(records.notna(), None)
+        return records.to_dict("records")
 
     def transform_lab_members(self, dry_run: bool = False) -> Dict[str, Any]:
         """
@@ -356,53 +376,31 @@ class LabMembersTransformationService:
                 self._log_final_summary(stats)
                 return stats
 
-            # Collect all members across all PIs
-            all_members_to_insert = []
-
-            for idx, pi in enumerate(pis):
-                pi_uniqname = pi["uniqname"]
-
-                try:
-                    # Find PI's groups
-                    pi_groups = self._find_pi_groups(pi_uniqname)
-                    stats["total_groups_found"] += len(pi_groups)
-
-                    if pi_groups:
-                        stats["pis_with_groups"] += 1
-
-                        # Extract members from groups
-                        members = self._extract_group_members(pi_groups)
-                        stats["total_members_extracted"] += len(members)
-
-                        # Enrich with user data
-                        enriched_members = self._enrich_with_user_data(
-                            members, pi_uniqname
-                        )
-
-                        # Track user data availability
-                        for member in enriched_members:
-                            if member["silver_user_exists"]:
-                                stats["members_with_user_data"] += 1
-                            else:
-                                stats["members_without_user_data"] += 1
-
-                        all_members_to_insert.extend(enriched_members)
+            # Find the groups of every PI in one query
+            pi_groups = self._find_groups_for_pis([pi["uniqname"] for pi in pis])
+            stats["pis_processed"] = total_pis
+            stats["pis_with_groups"] = len(pi_groups)
+            stats["total_groups_found"] = sum(len(g) for g in pi_groups.values())
+            logger.info(
+                f"🔎 Found {stats['total_groups_found']} groups for "
+                f"{stats['pis_with_groups']} PIs"
+            )
 
-                    stats["pis_processed"] += 1
+            # Extract members of all selected groups at once
+            members_df = self._extract_members_for_pis(pi_groups)
+            stats["total_members_extracted"] = len(members_df)
 
-                    # Progress logging
-                    if stats["pis_processed"] % 50 == 0:
-                        logger.info(
-                            f"📊 Progress: {stats['pis_processed']}/{total_pis} PIs processed "
-                            f"({stats['pis_with_groups']} with groups, "
-                            f"{stats['total_members_extracted']} members found)"
-                        )
+            # Enrich with user data
+            all_members_to_insert = self._enrich_with_user_data(members_df)
 
-                except Exception as pi_error:
-                    logger.error(f"❌ Error processing PI {pi_uniqname}: {pi_error}")
-                    # Continue with next PI
-                    stats["pis_processed"] += 1
-                    continue
+            # Track user data availability
+            with_user_data = sum(
+                1 for member in all_members_to_insert if member["silver_user_exists"]
+            )
+            stats["members_with_user_data"] = with_user_data
+            stats["members_without_user_data"] = (
+                len(all_members_to_insert) - with_user_data
+            )
 
             logger.info(
                 f"🔍 Extracted {len(all_members_to_insert)} total lab member records"
@@ -12,6 +12,7 @@ Key features:
 - Score-based prioritization (1 = highest confidence, 14 = lowest)
 - Maximum 3 managers per lab
 - First-match-wins pattern evaluation
+- Batch mode scores every eligible member of every lab in one pass
 
 Tier 2 ordering (within Tier 2, Research Lab Specialists rank above Research Fellows):
 - Scores 5-8:  Research Lab Specialist (graded by seniority: Senior, Inter, Assoc, general)
@@ -26,6 +27,8 @@ Tier 2 ordering (within Tier 2, Research Lab Specialists rank above Research Fel
 import logging
 from typing import Any, Dict, List, Optional
 
+import pandas as pd
+
 from database.adapters.postgres_adapter import PostgresAdapter
 
 logger = logging.getLogger(__name__)
@@ -314,6 +317,180 @@ class LabManagerIdentificationService:
         # No match found
         return None
 
+    # Columns read from silver.v_eligible_lab_members
+    ELIGIBLE_MEMBER_COLUMNS = """
+                membership_id,
+                lab_id,
+                member_uniqname,
+                member_role,
+                member_job_title,
+                is_pi,
+                is_investigator,
+                job_codes,
+                tdx_user_uid
+    """
+
+    @staticmethod
+    def _normalize_job_codes(job_codes: Any) -> Optional[List[str]]:
+        """Convert a JSONB job_codes value to a list of strings (None if empty)."""
+        if not job_codes:
+            return None
+        if isinstance(job_codes, list):
+            return [str(code) for code in job_codes]
+        if isinstance(job_codes, dict):
+            # Handle case where job_codes is stored as JSON object
+            return [str(code) for code in job_codes.values()]
+        return None
+
+    @staticmethod
+    def _none_if_missing(value: Any) -> Any:
+        """Replace pandas missing values (NaN/None) with None."""
+        if isinstance(value, (list, dict)):
+            return value
+        return None if pd.isna(value) else value
+
+    def score_members(self, members_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score eligible members with the rule table, column-wise.
+
+        Gives the same result as calculate_manager_score() per row: rules are
+        evaluated in order over whole columns and each member keeps the first
+        rule it matches.
+
+        Args:
+            members_df: Rows of v_eligible_lab_members (member_role, job_codes)
+
+        Returns:
+            The matching rows with confidence_score, detection_reason and tier
+            columns added, in input order
+        """
+        # Only non-empty string roles take part in role matching
+        roles = (
+            members_df["member_role"]
+            .map(lambda role: role if isinstance(role, str) and role else None)
+            .astype("string")
+        )
+        lowered_roles = roles.str.lower()
+
+        # One row per (member, job code) for job code rules
+        job_codes = members_df["job_codes"].map(self._normalize_job_codes).explode()
+
+        rule_index = pd.Series(-1, index=members_df.index)
+        for position, rule in enumerate(self.SCORING_RULES):
+            unmatched = rule_index == -1
+            if not unmatched.any():
+                break
+
+            matched = pd.Series(False, index=members_df.index)
+            if rule.role_exact:
+                # Exact match (case-sensitive)
+                matched |= (roles == rule.role_exact).fillna(False).astype(bool)
+            elif rule.role_pattern:
+                # Same semantics as ScoringRule._ilike_match
+                search_str = rule.role_pattern.replace("%", "").lower()
+                matched |= (
+                    lowered_roles.str.contains(search_str, regex=False)
+                    .fillna(False)
+                    .astype(bool)
+                )
+            if rule.job_code:
+                matched |= members_df.index.isin(
+                    job_codes.index[job_codes == rule.job_code]
+                )
+
+            rule_index[unmatched & matched] = position
+
+        scored = members_df[rule_index != -1].copy()
+        rules = [self.SCORING_RULES[i] for i in rule_index[rule_index != -1]]
+        scored["confidence_score"] = [rule.score for rule in rules]
+        scored["detection_reason"] = [rule.detection_reason for rule in rules]
+        scored["tier"] = [rule.tier for rule in rules]
+        return scored
+
+    def rank_managers(self, scored_df: pd.DataFrame) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Select and rank up to 3 managers per lab from scored members.
+
+        Labs with any Tier 1 member keep only Tier 1 members. Candidates are
+        ranked by score (ascending) then role (alphabetical); ties keep
+        input order.
+
+        Args:
+            scored_df: Output of score_members() for one or more labs
+
+        Returns:
+            Dict mapping lab_id to its manager dicts, best first
+        """
+        if scored_df.empty:
+            return {}
+
+        has_tier1 = scored_df.groupby("lab_id")["tier"].transform("min") == 1
+        candidates = scored_df[~has_tier1 | (scored_df["tier"] == 1)]
+
+        ranked = candidates.sort_values(
+            ["lab_id", "confidence_score", "member_role"], kind="stable"
+        )
+        ranked = ranked.assign(
+            manager_rank=ranked.groupby("lab_id", sort=False).cumcount() + 1
+        )
+        ranked = ranked[ranked["manager_rank"] <= 3]
+
+        managers_by_lab: Dict[str, List[Dict[str, Any]]] = {}
+        for row in ranked.itertuples(index=False):
+            managers_by_lab.setdefault(row.lab_id, []).append(
+                {
+                    "lab_id": row.lab_id,
+                    "manager_uniqname": self._none_if_missing(row.member_uniqname),
+                    "manager_tdx_uid": self._none_if_missing(row.tdx_user_uid),
+                    "manager_role": self._none_if_missing(row.member_role),
+                    "manager_job_codes": self._none_if_missing(row.job_codes),
+                    "manager_confidence_score": int(row.confidence_score),
+                    "detection_reason": row.detection_reason,
+                    "manager_rank": int(row.manager_rank),
+                }
+            )
+        return managers_by_lab
+
+    def identify_managers_for_labs(
+        self, lab_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Identify up to 3 managers for many labs in one pass.
+
+        Loads the eligible members of all requested legitimate labs with one
+        query, scores them column-wise and ranks them per lab. Results are
+        identical to calling identify_managers_for_lab() for each lab.
+
+        Args:
+            lab_ids: Lab identifiers to process
+
+        Returns:
+            Dict mapping lab_id to its manager dicts (labs without managers are absent)
+        """
+        if not lab_ids:
+            return {}
+
+        eligible_query = f"""
+            SELECT {self.ELIGIBLE_MEMBER_COLUMNS}
+            FROM silver.v_eligible_lab_members
+            WHERE lab_id = ANY(:lab_ids)
+              AND lab_id IN (SELECT lab_id FROM silver.v_legitimate_labs)
+            ORDER BY lab_id, membership_id
+        """
+        eligible_df = self.db_adapter.query_to_dataframe(
+            eligible_query, {"lab_ids": list(lab_ids)}
+        )
+        logger.info(
+            f"📚 Loaded {len(eligible_df)} eligible members for {len(lab_ids)} labs"
+        )
+
+        if eligible_df.empty:
+            return {}
+
+        scored_df = self.score_members(eligible_df)
+        logger.info(f"🎯 {len(scored_df)} members match scoring criteria")
+        return self.rank_managers(scored_df)
+
     def identify_managers_for_lab(self, lab_id: str) -> List[Dict[str, Any]]:
         """
         Identify up to 3 managers for a single lab using role-based scoring.
@@ -321,7 +498,7 @@ class LabManagerIdentificationService:
         Algorithm:
         1. Score all eligible members using scoring rules (Tier 1 and Tier 2)
         2. If any Tier 1 (scores 1-4), use only Tier 1
-        3. If no Tier 1, use Tier 2 (scores 5-10)
+        3. If no Tier 1, use Tier 2 (scores 5-14)
         4. Rank by score (ascending) then role (alphabetical)
         5. Return top 3
 
@@ -332,117 +509,41 @@ class LabManagerIdentificationService:
         - Research Lab Specialists by seniority (scores 5-8), Research Fellows,
           Graduate Students, Scientists (scores 9-14)
 
+        Use identify_managers_for_labs() when processing many labs.
+
         Args:
             lab_id: The lab identifier
 
         Returns:
             List of manager dicts with uniqname, rank, score, reason
         """
-        # Step 1: Get lab info from v_legitimate_labs
-        lab_query = """
-            SELECT lab_id, member_count, pi_uniqname
-            FROM silver.v_legitimate_labs
-            WHERE lab_id = :lab_id
-        """
-
-        lab_df = self.db_adapter.query_to_dataframe(lab_query, {"lab_id": lab_id})
-
+        lab_df = self.db_adapter.query_to_dataframe(
+            "SELECT lab_id FROM silver.v_legitimate_labs WHERE lab_id = :lab_id",
+            {"lab_id": lab_id},
+        )
         if lab_df.empty:
             logger.warning(
                 f"   Lab '{lab_id}' not found in v_legitimate_labs - skipping"
             )
             return []
 
-        lab = lab_df.iloc[0]
-
-        # Step 2: Get eligible members from view
-        eligible_query = """
-            SELECT
-                membership_id,
-                lab_id,
-                member_uniqname,
-                member_role,
-                member_job_title,
-                is_pi,
-                is_investigator,
-                job_codes,
-                tdx_user_uid
+        eligible_df = self.db_adapter.query_to_dataframe(
+            f"""
+            SELECT {self.ELIGIBLE_MEMBER_COLUMNS}
             FROM silver.v_eligible_lab_members
             WHERE lab_id = :lab_id
-        """
-
-        eligible_df = self.db_adapter.query_to_dataframe(
-            eligible_query, {"lab_id": lab_id}
+            ORDER BY membership_id
+            """,
+            {"lab_id": lab_id},
         )
-
         if eligible_df.empty:
             logger.info(f"   Lab '{lab_id}': No eligible members")
             return []
 
-        # Step 3: Score all eligible members
-        scored_members = []
-
-        for idx, member in eligible_df.iterrows():
-            # Convert JSONB job_codes to list of strings
-            job_codes = None
-            if member["job_codes"]:
-                if isinstance(member["job_codes"], list):
-                    job_codes = [str(code) for code in member["job_codes"]]
-                elif isinstance(member["job_codes"], dict):
-                    # Handle case where job_codes is stored as JSON object
-                    job_codes = [str(code) for code in member["job_codes"].values()]
-
-            score_result = self.calculate_manager_score(
-                member["member_role"], job_codes
-            )
-
-            if score_result:
-                scored_members.append(
-                    {
-                        "lab_id": lab_id,
-                        "manager_uniqname": member["member_uniqname"],
-                        "manager_tdx_uid": member["tdx_user_uid"],
-                        "manager_role": member["member_role"],
-                        "manager_job_codes": member["job_codes"],
-                        "manager_confidence_score": score_result["confidence_score"],
-                        "detection_reason": score_result["detection_reason"],
-                        "tier": score_result["tier"],
-                    }
-                )
-
-        if not scored_members:
+        managers = self.rank_managers(self.score_members(eligible_df)).get(lab_id, [])
+        if not managers:
             logger.info(f"   Lab '{lab_id}': No members match scoring criteria")
-            return []
-
-        # Step 4: Check for Tier 1 (scores 1-4) managers
-        has_tier1 = any(m["tier"] == 1 for m in scored_members)
-
-        # Step 5: Filter based on tier logic
-        if has_tier1:
-            # Only use Tier 1 managers
-            final_managers = [m for m in scored_members if m["tier"] == 1]
-            logger.debug(
-                f"   Lab '{lab_id}': Found {len(final_managers)} Tier 1 managers - excluding Tier 2"
-            )
-        else:
-            # No Tier 1 found - use Tier 2
-            final_managers = scored_members
-            logger.debug(
-                f"   Lab '{lab_id}': No Tier 1 managers - using {len(final_managers)} Tier 2 candidates"
-            )
-
-        # Step 6: Sort by score (ascending) then role (alphabetical)
-        final_managers.sort(
-            key=lambda x: (x["manager_confidence_score"], x["manager_role"])
-        )
-
-        # Step 7: Assign ranks and limit to 3
-        for rank, manager in enumerate(final_managers[:3], start=1):
-            manager["manager_rank"] = rank
-            # Remove tier field (internal use only)
-            manager.pop("tier", None)
-
-        return final_managers[:3]
+        return managers
 
     def close(self):
         """Close database connections."""
@@ -48,6 +48,7 @@ setup(
             "keyring>=23.0.0",
             "requests>=2.25.0",
             "python-calamine>=0.1.0",
+            "orjson>=3.8.0",
         ],
         "compliance": [
             "python-dotenv>=0.15.0",
@@ -88,6 +89,7 @@ setup(
             "ldap3>=2.9.0",
             "keyring>=23.0.0",
             "requests>=2.25.0",
+            "orjson>=3.8.0",
             # google / compliance
             "google-api-python-client>=2.0.0",
             "google-auth>=2.38.0",
@@ -0,0 +1,31 @@
+"""
+Shared helpers for the silver transform tests.
+
+The transform scripts live under scripts/database/silver and their file
+names start with a sequence number, so they cannot be imported by name.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+SILVER_SCRIPTS = Path(__file__).resolve().parents[3] / "scripts/database/silver"
+
+
+def load_silver_script(name):
+    """
+    Import a silver transform script by file name.
+
+    Args:
+        name: Script file name, e.g. "014_transform_lab_computers.py"
+
+    Returns:
+        The imported module, registered under the name without its sequence
+        number (e.g. "transform_lab_computers")
+    """
+    module_name = Path(name).stem.split("_", 1)[1]
+    spec = importlib.util.spec_from_file_location(module_name, SILVER_SCRIPTS / name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,172 @@
+"""
+Unit tests for the silver group relationships transform.
+
+Covers column-wise identifier parsing against the per-string rules it
+replaced, and the added/removed/common split of the edge diff.
+"""
+
+import random
+
+import pandas as pd
+
+from conftest import load_silver_script
+
+service_class = load_silver_script(
+    "012_transform_group_relationships.py"
+).GroupRelationshipsService
+
+
+def parse_identifier(identifier):
+    """The per-string parsing rules _parse_identifiers() vectorizes."""
+    if not identifier:
+        return "", "unknown"
+
+    patterns = service_class.DN_PATTERNS
+    identifier_lower = identifier.lower()
+    if "=" in identifier:
+        if (
+            "ou=people" in identifier_lower
+            or "ou=accounts" in identifier_lower
+            or "ou=privileged" in identifier_lower
+        ):
+            match = patterns["user_uid"].search(identifier)
+            if match:
+                return match.group(1), "user"
+        if (
+            "ou=user groups" in identifier_lower
+            or "ou=groups" in identifier_lower
+            or "ou=mcommadsync" in identifier_lower
+        ):
+            match = patterns["group_cn"].search(identifier)
+            if match:
+                return match.group(1), "group"
+        match = patterns["user_uid"].search(identifier)
+        if match:
+            value = match.group(1)
+            if "lsa-" in value or "arcts-" in value or "turbo" in value:
+                return value, "group"
+            return value, "user"
+    else:
+        if " " in identifier or "lsa-" in identifier_lower:
+            return identifier, "group"
+        return identifier, "user"
+    return identifier, "unknown"
+
+
+IDENTIFIERS = [
+    "uid=jdoe,ou=People,dc=umich,dc=edu",
+    "CN=jdoe,OU=Accounts,DC=adsroot,DC=itcs",
+    "cn=admin-x,ou=Privileged,dc=example",
+    "ou=People,dc=umich,dc=edu",
+    "cn=lsa-staff,ou=User Groups,ou=Groups,dc=umich,dc=edu",
+    "CN=Lab Team,OU=MCommADSync,DC=adsroot",
+    "ou=groups,dc=example",
+    "cn=lsa-admins,ou=Other,dc=example",
+    "uid=turbo-users,dc=example",
+    "UID=arcts-ops,DC=example",
+    "cn=LSA-Upper,dc=example",
+    "cn=smithj,dc=example",
+    "o=university,c=us",
+    "jdoe",
+    "LSA-Research",
+    "Lab Managers",
+    "x=y",
+]
+
+
+class TestParseIdentifiers:
+    """Tests for GroupRelationshipsService._parse_identifiers()."""
+
+    def test_matches_per_string_rules(self):
+        """Test every rule branch gives the per-string id and type."""
+        parsed = service_class._parse_identifiers(pd.Series(IDENTIFIERS))
+        assert list(zip(parsed["id"], parsed["type"])) == [
+            parse_identifier(identifier) for identifier in IDENTIFIERS
+        ]
+
+    def test_matches_per_string_rules_randomized(self):
+        """Test random DNs and names built from the rule fragments agree."""
+        rng = random.Random(50)
+        attributes = ["uid", "cn", "UID", "CN", "ou", "o"]
+        values = ["jdoe", "lsa-x", "arcts-y", "turbo", "Lab Team", "LSA-Z", ""]
+        ous = ["People", "accounts", "Privileged", "User Groups", "groups",
+               "MCommADSync", "Other"]
+        identifiers = []
+        for _ in range(500):
+            if rng.random() < 0.25:
+                identifiers.append(rng.choice(values) or "name")
+                continue
+            parts = [
+                f"{rng.choice(attributes)}={rng.choice(values)}"
+                for _ in range(rng.randint(0, 2))
+            ]
+            parts += [f"ou={rng.choice(ous)}" for _ in range(rng.randint(0, 2))]
+            parts.append("dc=example")
+            rng.shuffle(parts)
+            identifiers.append(",".join(parts))
+
+        parsed = service_class._parse_identifiers(pd.Series(identifiers))
+        assert list(zip(parsed["id"], parsed["type"])) == [
+            parse_identifier(identifier) for identifier in identifiers
+        ]
+
+    def test_keeps_index(self):
+        """Test the result is aligned with the input index."""
+        identifiers = pd.Series(["jdoe", "lsa-x"], index=[7, 3])
+        assert service_class._parse_identifiers(identifiers).index.tolist() == [7, 3]
+
+
+class TestDiffEdges:
+    """Tests for GroupRelationshipsService._diff_edges()."""
+
+    KEY = service_class.MEMBER_KEY
+
+    def test_added_removed_and_common(self):
+        """Test edges are split into added, removed row IDs and common rows."""
+        current = pd.DataFrame(
+            [
+                ("g1", "user", "alice", "mcommunity", True),
+                ("g1", "user", "bob", "mcommunity", False),
+                ("g2", "group", "g1", "active_directory", True),
+            ],
+            columns=self.KEY + ["is_direct_member"],
+        )
+        existing = pd.DataFrame(
+            [
+                ("r1", "g1", "user", "alice", "mcommunity", True),
+                ("r2", "g1", "user", "carol", "mcommunity", True),
+                ("r3", "g2", "group", "g1", "active_directory", False),
+                ("r4", "g2", "group", "g1", "mcommunity", True),
+            ],
+            columns=["row_id"] + self.KEY + ["is_direct_member"],
+        )
+
+        added, removed, common = service_class._diff_edges(current, existing, self.KEY)
+
+        assert list(added.columns) == list(current.columns)
+        assert added[self.KEY].values.tolist() == [["g1", "user", "bob", "mcommunity"]]
+        assert sorted(removed) == ["r2", "r4"]
+        common = common.set_index("row_id").sort_index()
+        assert common.index.tolist() == ["r1", "r3"]
+        assert common["is_direct_member"].tolist() == [True, True]
+        assert common["is_direct_member_stored"].tolist() == [True, False]
+
+    def test_empty_sides(self):
+        """Test a first run adds everything and an empty source removes everything."""
+        current = pd.DataFrame(
+            [("g1", "user", "alice", "mcommunity", True)],
+            columns=self.KEY + ["is_direct_member"],
+        )
+        existing = pd.DataFrame(columns=["row_id"] + self.KEY + ["is_direct_member"])
+
+        added, removed, common = service_class._diff_edges(current, existing, self.KEY)
+        assert len(added) == 1 and removed == [] and common.empty
+
+        stored = pd.DataFrame(
+            [("r1", "g1", "user", "alice", "mcommunity", True)],
+            columns=["row_id"] + self.KEY + ["is_direct_member"],
+        )
+        added, removed, common = service_class._diff_edges(
+            current.iloc[0:0], stored, self.KEY
+        )
+        assert added.empty and removed == ["r1"] and common.empty
@@ -0,0 +1,191 @@
+"""
+Unit tests for the silver lab computers transform.
+
+Checks that the indexed and Aho–Corasick discovery lookups find exactly the
+computers a full scan of the computers cache finds, in the same order, on
+randomized labs, members and computers.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pandas as pd
+
+from conftest import load_silver_script
+
+service_class = load_silver_script(
+    "014_transform_lab_computers.py"
+).LabComputersTransformationService
+
+
+def build_service(seed):
+    """Build a service whose caches are loaded from randomized silver rows."""
+    rng = random.Random(seed)
+    # Overlapping and case-varied uniqnames exercise substring/case handling
+    users = [f"u{i}" for i in range(30)] + ["ab", "abc", "Bc", "smithj", "smith"]
+    labs = pd.DataFrame(
+        [
+            {
+                "lab_id": f"L{i}",
+                "pi_uniqname": rng.choice(users + [None]),
+                "ad_ou_dn": rng.choice(
+                    [None, f"OU={rng.choice(users)},OU=RSN", f"ou={rng.choice(users)}"]
+                ),
+                "has_ad_ou": rng.random() < 0.7,
+            }
+            for i in range(25)
+        ]
+    )
+    computers = pd.DataFrame(
+        [
+            {
+                "computer_id": f"C{i}",
+                "computer_name": rng.choice(
+                    [None, f"LSA-{rng.choice(users).upper()}{i}", f"{rng.choice(users)}-pc"]
+                ),
+                "owner_uniqname": rng.choice(users + [None]),
+                "financial_owner_uniqname": rng.choice(users + [None]),
+                "last_user": rng.choice([u.upper() for u in users] + users + [None]),
+                "ad_distinguished_name": rng.choice(
+                    [None, f"CN=C{i},OU={rng.choice(users)},OU=RSN,DC=x"]
+                ),
+                "has_recent_activity": rng.random() < 0.5,
+            }
+            for i in range(400)
+        ]
+    )
+    members = pd.DataFrame(
+        [
+            {"lab_id": f"L{rng.randrange(25)}", "member_uniqname": rng.choice(users)}
+            for _ in range(150)
+        ]
+    )
+    functions = pd.DataFrame({"computer_id": ["C1"], "function_id": ["27316"]})
+
+    def query_to_dataframe(query, params=None):
+        if "FROM silver.labs" in query:
+            return labs
+        if "FROM silver.lab_members" in query:
+            return members
+        if "function_id" in query:
+            return functions
+        if "FROM silver.computers" in query:
+            return computers
+        raise AssertionError(f"Unexpected query: {query}")
+
+    service = service_class(SimpleNamespace(query_to_dataframe=query_to_dataframe))
+    service._load_labs_cache()
+    service._load_computers_cache()
+    service._load_lab_members_cache()
+    service._load_function_cache()
+    return service
+
+
+def scan_by_substring(service, patterns, field):
+    """Full-scan reference for _match_computers_by_substring()."""
+    matches = {}
+    for pattern in patterns:
+        for computer_id, computer in service.computers_cache.items():
+            value = computer.get(field)
+            if value and pattern.lower() in value.lower():
+                matches.setdefault(pattern, []).append(computer_id)
+    return matches
+
+
+def scan_by_user(service, field, uniqnames, normalize=lambda value: value):
+    """Full-scan reference for _computers_for_users()."""
+    return [
+        computer_id
+        for computer_id, computer in service.computers_cache.items()
+        if computer.get(field) and normalize(computer[field]) in uniqnames
+    ]
+
+
+def edges(associations):
+    """Reduce associations to comparable tuples, keeping order."""
+    return [
+        (a["computer_id"], a["lab_id"], a["matched_ou"], a["matched_user"])
+        for a in associations
+    ]
+
+
+class TestDiscoveryLookups:
+    """Tests for the indexed discovery lookups."""
+
+    SEEDS = range(5)
+
+    def test_substring_matches_full_scan(self):
+        """Test _match_computers_by_substring() agrees with a pattern-by-pattern scan."""
+        for seed in self.SEEDS:
+            service = build_service(seed)
+            pis = [lab["pi_uniqname"] for lab in service.labs_cache.values()]
+            ous = [lab["ad_ou_dn"] for lab in service.labs_cache.values()]
+            for patterns, field in (
+                ([p for p in pis if p], "computer_name"),
+                ([o for o in ous if o], "ad_distinguished_name"),
+            ):
+                assert service._match_computers_by_substring(
+                    patterns, field
+                ) == scan_by_substring(service, set(patterns), field)
+
+    def test_computers_for_users_matches_full_scan(self):
+        """Test _computers_for_users() agrees with a scan, in cache order."""
+        rng = random.Random(49)
+        for seed in self.SEEDS:
+            service = build_service(seed)
+            for members in service.lab_members_cache.values():
+                uniqnames = set(rng.sample(sorted(members), k=len(members) // 2 + 1))
+                assert service._computers_for_users(
+                    service.computers_by_owner, uniqnames
+                ) == scan_by_user(service, "owner_uniqname", uniqnames)
+                assert service._computers_for_users(
+                    service.computers_by_financial_owner, uniqnames
+                ) == scan_by_user(service, "financial_owner_uniqname", uniqnames)
+                assert service._computers_for_users(
+                    service.computers_by_last_user, uniqnames
+                ) == scan_by_user(service, "last_user", uniqnames, str.lower)
+
+    def test_discovery_methods_match_nested_loops(self):
+        """Test each discovery method returns the lab × computer scan results."""
+        for seed in self.SEEDS:
+            service = build_service(seed)
+            ad_ou, owner_pi, financial_pi, name_pi, owner_member, last_user = (
+                [], [], [], [], [], []
+            )
+            for lab_id, lab in service.labs_cache.items():
+                pi = lab.get("pi_uniqname")
+                ou = lab.get("ad_ou_dn")
+                members = service.lab_members_cache.get(lab_id, set())
+                if lab.get("has_ad_ou") and ou:
+                    for computer_id in scan_by_substring(
+                        service, [ou], "ad_distinguished_name"
+                    ).get(ou, []):
+                        ad_ou.append((computer_id, lab_id, ou, None))
+                if pi:
+                    for target, field in (
+                        (owner_pi, "owner_uniqname"),
+                        (financial_pi, "financial_owner_uniqname"),
+                    ):
+                        for computer_id in scan_by_user(service, field, {pi}):
+                            target.append((computer_id, lab_id, None, pi))
+                    for computer_id in scan_by_substring(
+                        service, [pi], "computer_name"
+                    ).get(pi, []):
+                        name_pi.append((computer_id, lab_id, None, pi))
+                for computer_id in scan_by_user(
+                    service, "owner_uniqname", members - {pi}
+                ):
+                    owner = service.computers_cache[computer_id]["owner_uniqname"]
+                    owner_member.append((computer_id, lab_id, None, owner))
+                for computer_id in scan_by_user(
+                    service, "last_user", members, str.lower
+                ):
+                    user = service.computers_cache[computer_id]["last_user"].lower()
+                    last_user.append((computer_id, lab_id, None, user))
+
+            assert edges(service._discover_by_ad_ou()) == ad_ou
+            assert edges(service._discover_by_owner_pi()) == owner_pi
+            assert edges(service._discover_by_financial_owner_pi()) == financial_pi
+            assert edges(service._discover_by_name_pattern_pi()) == name_pi
+            assert edges(service._discover_by_owner_member()) == owner_member
+            assert edges(service._discover_by_last_user_member()) == last_user
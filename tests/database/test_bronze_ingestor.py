@@ -0,0 +1,157 @@
+"""
+Unit tests for database.bronze_ingestor.
+
+Covers per-batch change detection and the compact resume checkpoint used
+by the TDX enrichment scripts.
+"""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from database.bronze_ingestor import BronzeIngestor, ResumeCheckpoint, calculate_content_hash
+
+
+class RecordingIngestor(BronzeIngestor):
+    """Ingestor over in-memory records whose inserts are captured."""
+
+    source_system = "test"
+    entity_type = "user"
+    key_field = "Id"
+
+    def __init__(self):
+        self.inserted = []
+        db_adapter = SimpleNamespace(
+            bulk_insert_raw_entities=lambda entities, batch_size: self.inserted.extend(
+                entities
+            )
+        )
+        super().__init__(db_adapter)
+
+
+def empty_stats():
+    """Statistics dictionary as initialized by BronzeIngestor.run()."""
+    return {
+        "records_processed": 0,
+        "records_created": 0,
+        "records_skipped_unchanged": 0,
+        "records_skipped_missing_id": 0,
+        "records_skipped_duplicate": 0,
+        "new_records": 0,
+        "changed_records": 0,
+        "batches": 0,
+        "last_external_id": None,
+        "errors": [],
+        "prepare_seconds": 0.0,
+        "prefetch_seconds": 0.0,
+        "write_seconds": 0.0,
+        "started_at": datetime.now(timezone.utc),
+    }
+
+
+class TestProcessBatch:
+    """Tests for BronzeIngestor._process_batch()."""
+
+    def test_keeps_last_duplicate_per_external_id(self):
+        """Test only the last copy of a record in a batch is compared and inserted."""
+        ingestor = RecordingIngestor()
+        stored = {"Id": "1", "Name": "old"}
+        existing_hashes = {"1": calculate_content_hash(stored)}
+        stats = empty_stats()
+        batch = [
+            {"Id": "1", "Name": "interim"},
+            {"Id": "2", "Name": "new"},
+            {"Id": "1", "Name": "final"},
+        ]
+
+        ingestor._process_batch(batch, "run", existing_hashes, stats, None)
+
+        assert [entity["raw_data"]["Name"] for entity in ingestor.inserted] == [
+            "new",
+            "final",
+        ]
+        assert stats["records_skipped_duplicate"] == 1
+        assert (stats["new_records"], stats["changed_records"]) == (1, 1)
+
+    def test_last_duplicate_matching_stored_hash_is_skipped(self):
+        """Test a record that ends the batch unchanged is not inserted."""
+        ingestor = RecordingIngestor()
+        stored = {"Id": "1", "Name": "same"}
+        stats = empty_stats()
+
+        ingestor._process_batch(
+            [{"Id": "1", "Name": "interim"}, dict(stored)],
+            "run",
+            {"1": calculate_content_hash(stored)},
+            stats,
+            None,
+        )
+
+        assert ingestor.inserted == []
+        assert stats["records_skipped_unchanged"] == 1
+
+
+class TestResumeCheckpoint:
+    """Tests for ResumeCheckpoint."""
+
+    def test_watermark_follows_contiguous_prefix(self):
+        """Test out-of-order completions only advance the watermark when contiguous."""
+        checkpoint = ResumeCheckpoint("asset_id")
+        checkpoint.start(["a", "b", "c", "d"])
+
+        checkpoint.record("b", "enriched")
+        assert checkpoint.last_key is None
+        checkpoint.record("a", "skipped")
+        assert checkpoint.last_key == "b"
+        checkpoint.record("d", "enriched")
+        assert checkpoint.last_key == "b"
+        checkpoint.record("c", "error")
+        assert checkpoint.last_key == "d"
+        assert (checkpoint.processed, checkpoint.enriched) == (4, 2)
+        assert checkpoint.failed == {"c"}
+
+    def test_round_trip_and_is_done(self):
+        """Test a restored checkpoint skips handled keys and retries failed ones."""
+        checkpoint = ResumeCheckpoint("uid")
+        checkpoint.start(["u1", "u2", "u3", "u4"])
+        for uid, action in [("u1", "enriched"), ("u2", "error"), ("u3", "enriched")]:
+            checkpoint.record(uid, action)
+
+        payload = json.loads(json.dumps(checkpoint.to_dict()))
+        restored = ResumeCheckpoint("uid", payload)
+
+        assert payload["last_uid"] == "u3"
+        assert payload["failed_uids"] == ["u2"]
+        assert [restored.is_done(uid) for uid in ["u1", "u2", "u3", "u4"]] == [
+            True,
+            False,
+            True,
+            False,
+        ]
+        assert (restored.processed, restored.enriched) == (3, 2)
+
+    def test_retried_failure_is_cleared(self):
+        """Test a failed key that later succeeds leaves the failed list."""
+        checkpoint = ResumeCheckpoint("uid", {"last_uid": "u5", "failed_uids": ["u2"]})
+        checkpoint.start(["u2", "u6"])
+        checkpoint.record("u2", "enriched")
+        checkpoint.record("u6", "enriched")
+        assert checkpoint.failed == set()
+        assert checkpoint.last_key == "u6"
+
+    def test_payload_size_does_not_grow_with_progress(self):
+        """Test the saved payload stays small however many keys finish."""
+        checkpoint = ResumeCheckpoint("uid")
+        keys = [f"{i:06d}" for i in range(5000)]
+        checkpoint.start(keys)
+        sizes = []
+        for index, key in enumerate(keys):
+            checkpoint.record(key, "enriched")
+            if index in (10, 4999):
+                sizes.append(len(json.dumps(checkpoint.to_dict())))
+        # Only the counters' digits grow
+        assert sizes[1] - sizes[0] <= 6
+
+    def test_new_checkpoint_has_nothing_done(self):
+        """Test a fresh checkpoint treats every key as pending."""
+        assert not ResumeCheckpoint("uid").is_done("anything")
@@ -0,0 +1,243 @@
+"""
+Unit tests for database.hashing.
+
+Covers canonical serialization, compatibility with the json.dumps-based hashes
+stored by the ingestion scripts, digest selection, the batch API and the
+columnar hashing used by the document ingesters.
+"""
+
+import hashlib
+import json
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from database.hashing import (
+    HAS_ORJSON,
+    canonical_json,
+    column_content_hashes,
+    compatible_json,
+    content_hash,
+    content_hashes,
+    digest,
+    normalize_column,
+    normalize_value,
+    xxhash,
+)
+
+
+def legacy_hash(payload):
+    """The helper pattern used throughout the bronze and silver scripts."""
+    normalized_json = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(normalized_json.encode("utf-8")).hexdigest()
+
+
+class TestCanonicalJson:
+    """Tests for canonical_json()."""
+
+    def test_key_order_does_not_matter(self):
+        """Test that dict insertion order does not change the output."""
+        assert canonical_json({"b": 1, "a": [1, 2]}) == canonical_json(
+            {"a": [1, 2], "b": 1}
+        )
+
+    def test_compact_sorted_output(self):
+        """Test that output is compact with sorted keys."""
+        assert canonical_json({"b": True, "a": None}) == b'{"a":null,"b":true}'
+
+    def test_non_finite_floats_become_null(self):
+        """Test NaN and Infinity serialize as null."""
+        assert canonical_json([float("nan"), float("inf")]) == b"[null,null]"
+
+    def test_aware_datetimes_normalized_to_utc(self):
+        """Test that the same instant in different timezones serializes identically."""
+        utc = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        eastern = utc.astimezone(timezone(timedelta(hours=-5)))
+        assert canonical_json(utc) == canonical_json(eastern)
+        assert canonical_json(utc) == b'"2024-01-01T12:00:00+00:00"'
+
+    def test_naive_datetime_and_date(self):
+        """Test naive datetimes and dates use ISO 8601."""
+        assert canonical_json(datetime(2024, 1, 1, 8, 30)) == b'"2024-01-01T08:30:00"'
+        assert canonical_json(date(2024, 1, 1)) == b'"2024-01-01"'
+
+    def test_bytes_uuid_decimal_and_sets(self):
+        """Test deterministic handling of non-JSON types."""
+        value = {
+            "bytes": b"\x00\xff",
+            "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+            "decimal": Decimal("1.50"),
+            "set": {"b", "a"},
+        }
+        assert canonical_json(value) == (
+            b'{"bytes":"AP8=","decimal":"1.50","set":["a","b"],'
+            b'"uuid":"12345678-1234-5678-1234-567812345678"}'
+        )
+
+    def test_tuple_and_list_are_equivalent(self):
+        """Test sequences serialize the same regardless of container type."""
+        assert canonical_json((1, 2)) == canonical_json([1, 2])
+
+    def test_large_integers(self):
+        """Test integers beyond 64 bits still serialize."""
+        assert canonical_json({"n": 2**70}) == b'{"n":1180591620717411303424}'
+
+    def test_unsupported_type_raises(self):
+        """Test that values without a canonical form raise TypeError."""
+        with pytest.raises(TypeError):
+            canonical_json({"value": object()})
+
+    @pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+    def test_numpy_and_pandas_values(self):
+        """Test numpy scalars and pandas missing values."""
+        np = pytest.importorskip("numpy")
+        pd = pytest.importorskip("pandas")
+        value = {
+            "int": np.int64(3),
+            "float": np.float64("nan"),
+            "nat": pd.NaT,
+            "na": pd.NA,
+            "ts": pd.Timestamp("2024-01-01 12:00", tz="UTC"),
+        }
+        assert canonical_json(value) == (
+            b'{"float":null,"int":3,"na":null,"nat":null,'
+            b'"ts":"2024-01-01T12:00:00+00:00"}'
+        )
+
+
+class TestCompatibleJson:
+    """Tests for compatible_json()."""
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"UID": "abc", "FullName": "José García", "IsActive": True},
+            {"a": 1e16, "b": 1e-05, "c": [1.5, None], "d": "\x7f "},
+            {"created": datetime(2024, 1, 1, tzinfo=timezone.utc), "n": Decimal("2.5")},
+        ],
+    )
+    def test_matches_json_dumps(self, payload):
+        """Test byte-for-byte compatibility with the scripts' json.dumps call."""
+        expected = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        assert compatible_json(payload) == expected
+
+
+class TestDigest:
+    """Tests for digest()."""
+
+    def test_sha256_default(self):
+        """Test the default digest is SHA-256."""
+        assert digest(b"abc") == hashlib.sha256(b"abc").hexdigest()
+
+    def test_blake2b_is_128_bit(self):
+        """Test blake2b produces a 128-bit hex digest."""
+        assert len(digest(b"abc", "blake2b")) == 32
+
+    def test_unknown_algorithm(self):
+        """Test that unknown algorithms are rejected."""
+        with pytest.raises(ValueError):
+            digest(b"abc", "md5")
+
+    @pytest.mark.skipif(xxhash is not None, reason="xxhash is installed")
+    def test_xxh3_requires_xxhash(self):
+        """Test xxh3 raises ImportError when xxhash is missing."""
+        with pytest.raises(ImportError):
+            digest(b"abc", "xxh3")
+
+
+class TestContentHash:
+    """Tests for content_hash() and content_hashes()."""
+
+    def test_compatible_hash_matches_legacy_helper(self):
+        """Test compatible mode reproduces hashes already stored in bronze."""
+        record = {"ID": 1, "Name": "Lab PC", "Tags": ["a"], "_content_hash": "x"}
+        assert content_hash(record, compatible=True) == legacy_hash(
+            {"ID": 1, "Name": "Lab PC", "Tags": ["a"]}
+        )
+
+    def test_fields_projection(self):
+        """Test that only the listed fields are hashed and missing ones are null."""
+        record = {"ID": 1, "Name": "Lab PC", "Ignored": "x"}
+        assert content_hash(record, fields=["Name", "ID", "Missing"]) == content_hash(
+            {"ID": 1, "Name": "Lab PC", "Missing": None}
+        )
+
+    def test_underscore_fields_excluded_by_default(self):
+        """Test metadata fields do not affect the default hash."""
+        assert content_hash({"ID": 1, "_ingested": "a"}) == content_hash(
+            {"ID": 1, "_ingested": "b"}
+        )
+
+    def test_batch_matches_single(self):
+        """Test the batch API returns the same hashes as per-record calls."""
+        records = [{"ID": i, "Name": f"pc{i}"} for i in range(5)]
+        for compatible in (False, True):
+            assert content_hashes(records, ["ID", "Name"], compatible=compatible) == [
+                content_hash(r, ["ID", "Name"], compatible=compatible) for r in records
+            ]
+        assert content_hashes(records, algorithm="blake2b") == [
+            content_hash(r, algorithm="blake2b") for r in records
+        ]
+
+    def test_batch_accepts_dataframe(self):
+        """Test that a DataFrame is hashed row by row."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"ID": [1, 2], "Name": ["a", "b"], "_meta": ["x", "y"]})
+        assert content_hashes(df) == [
+            content_hash({"ID": 1, "Name": "a"}),
+            content_hash({"ID": 2, "Name": "b"}),
+        ]
+
+
+class TestColumnContentHashes:
+    """Tests for normalize_column() and column_content_hashes()."""
+
+    def test_normalize_column_matches_normalize_value(self):
+        """Test each column kind normalizes exactly like the per-cell rule."""
+        pd = pytest.importorskip("pandas")
+        columns = [
+            pd.Series([" a ", None, "b"]),
+            pd.Series([1, 2, 3]),
+            pd.Series([1.5, float("nan"), 2.0]),
+            pd.Series([True, False, True]),
+            pd.Series([1, "x ", None, 2.5], dtype=object),
+            pd.Series(
+                pd.to_datetime(
+                    ["2024-01-02 03:04:05", None, "2024-01-02 03:04:05.25"],
+                    format="ISO8601",
+                )
+            ),
+        ]
+        for column in columns:
+            assert normalize_column(column).tolist() == [
+                normalize_value(value) for value in column
+            ]
+
+    def test_matches_row_wise_legacy_hash(self):
+        """Test columnar hashes equal sha256 of the sorted compact row JSON."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {"Name": [" pc1", "pc2"], "RAM": [8, 16], "Ignored": ["x", "y"]}
+        )
+        expected = [
+            legacy_hash({"Name": "pc1", "RAM": 8, "Missing": None}),
+            legacy_hash({"Name": "pc2", "RAM": 16, "Missing": None}),
+        ]
+        assert column_content_hashes(df, ["RAM", "Name", "Missing"]).tolist() == expected
+
+    def test_aliases_used_when_field_missing(self):
+        """Test renamed columns hash the same as the original column name."""
+        pd = pytest.importorskip("pandas")
+        original = pd.DataFrame({"#": [4, 8], "Name": ["a", "b"]})
+        renamed = original.rename(columns={"#": "# of cores"}, index={0: 5, 1: 6})
+        hashes = column_content_hashes(
+            renamed, ["#", "Name"], aliases={"#": "# of cores"}
+        )
+        assert hashes.index.tolist() == [5, 6]
+        assert hashes.tolist() == column_content_hashes(original, ["#", "Name"]).tolist()
@@ -0,0 +1,91 @@
+"""
+Unit tests for database.parallel.
+
+Covers worker count resolution, chunking and ordered inline and
+process-pool mapping with a per-worker initializer.
+"""
+
+import os
+
+import pytest
+
+from database.parallel import chunked, map_chunks, resolve_workers
+
+# Set by _init_offset() in whichever process runs the chunk
+_OFFSET = {"value": 0}
+
+
+def _init_offset(value):
+    """Install the offset added by _add_offset()."""
+    _OFFSET["value"] = value
+
+
+def _add_offset(chunk):
+    """Add the installed offset to every item of a chunk."""
+    return [item + _OFFSET["value"] for item in chunk]
+
+
+class TestResolveWorkers:
+    """Tests for resolve_workers()."""
+
+    def test_zero_means_cpu_count(self):
+        """Test that 0 and None use one worker per CPU."""
+        assert resolve_workers(0) == (os.cpu_count() or 1)
+        assert resolve_workers(None) == (os.cpu_count() or 1)
+
+    def test_explicit_count(self):
+        """Test explicit counts are kept and negatives clamp to 1."""
+        assert resolve_workers(3) == 3
+        assert resolve_workers(-2) == 1
+
+
+class TestChunked:
+    """Tests for chunked()."""
+
+    def test_splits_in_order(self):
+        """Test chunks preserve order and the last chunk may be short."""
+        assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_consumes_generators_lazily(self):
+        """Test that a generator input is not exhausted up front."""
+        consumed = []
+
+        def items():
+            for i in range(6):
+                consumed.append(i)
+                yield i
+
+        first = next(chunked(items(), 2))
+        assert first == [0, 1]
+        assert consumed == [0, 1]
+
+    def test_rejects_invalid_size(self):
+        """Test that non-positive sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            list(chunked([1], 0))
+
+
+class TestMapChunks:
+    """Tests for map_chunks()."""
+
+    def test_inline_runs_initializer(self):
+        """Test inline mode applies the initializer before mapping."""
+        results = list(
+            map_chunks(_add_offset, [[1, 2], [3]], initializer=_init_offset, initargs=(10,))
+        )
+        assert results == [[11, 12], [13]]
+
+    def test_process_pool_preserves_order(self):
+        """Test pool results match inline results and keep input order."""
+        chunks = list(chunked(range(50), 4))
+        results = list(
+            map_chunks(
+                _add_offset,
+                iter(chunks),
+                workers=2,
+                initializer=_init_offset,
+                initargs=(100,),
+                max_pending=3,
+            )
+        )
+        assert results == [[item + 100 for item in chunk] for chunk in chunks]
@@ -0,0 +1,63 @@
+"""
+Unit tests for database.substring_matcher.
+
+Covers overlapping and nested patterns, case handling, duplicate and empty
+patterns, and agreement with a naive substring scan.
+"""
+
+import random
+
+from database.substring_matcher import SubstringMatcher
+
+
+class TestSubstringMatcher:
+    """Tests for SubstringMatcher."""
+
+    def test_finds_overlapping_and_nested_patterns(self):
+        """Test that patterns sharing prefixes and suffixes are all reported."""
+        matcher = SubstringMatcher(["he", "she", "his", "hers"])
+        assert sorted(matcher.iter_matches("ushers")) == [
+            (1, "she"),
+            (2, "he"),
+            (2, "hers"),
+        ]
+        assert matcher.find_all("ushers") == ["she", "he", "hers"]
+
+    def test_ignores_case_by_default(self):
+        """Test case-insensitive matching returns the original pattern."""
+        matcher = SubstringMatcher(["SmithJ", "doe"])
+        assert matcher.find_all("LSA-SMITHJ-doe01") == ["SmithJ", "doe"]
+
+    def test_case_sensitive(self):
+        """Test ignore_case=False compares text as given."""
+        matcher = SubstringMatcher(["smithj"], ignore_case=False)
+        assert matcher.find_all("LSA-SMITHJ") == []
+        assert matcher.find_all("lsa-smithj") == ["smithj"]
+
+    def test_skips_empty_and_duplicate_patterns(self):
+        """Test that empty/None patterns are dropped and duplicates reported once."""
+        matcher = SubstringMatcher(["abc", "", None, "abc"])
+        assert len(matcher) == 1
+        assert matcher.find_all("xabcabc") == ["abc"]
+
+    def test_empty_inputs(self):
+        """Test empty texts and matchers without patterns find nothing."""
+        assert SubstringMatcher([]).find_all("anything") == []
+        assert SubstringMatcher(["a"]).find_all("") == []
+        assert SubstringMatcher(["a"]).find_all(None) == []
+
+    def test_matches_naive_scan(self):
+        """Test results agree with `pattern in text` over random inputs."""
+        rng = random.Random(7)
+        alphabet = "abc"
+        patterns = sorted(
+            {
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                for _ in range(30)
+            }
+        )
+        matcher = SubstringMatcher(patterns)
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            expected = sorted(p for p in patterns if p in text)
+            assert sorted(matcher.find_all(text)) == expected
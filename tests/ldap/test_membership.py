@@ -0,0 +1,112 @@
+"""
+Unit tests for ldap.membership.
+
+Covers the threshold between sorted normalization and the streaming digest,
+order independence, and hashing ranged memberships page by page.
+"""
+
+import hashlib
+
+from ldap.membership import (
+    LARGE_MEMBERSHIP_THRESHOLD,
+    MembershipDigest,
+    digest_ranged_membership,
+    normalize_membership,
+)
+from ldap.normalizer import normalize_ldap_value
+
+
+def member_dns(count):
+    """Build distinct member DNs."""
+    return [f"CN=user{i},OU=People,DC=example,DC=edu" for i in range(count)]
+
+
+def reference_digest(members):
+    """The summed-sha256 digest the group ingesters stored before sharing it."""
+    total = 0
+    for member in members:
+        digest = hashlib.sha256(normalize_ldap_value(member).encode("utf-8")).digest()
+        total = (total + int.from_bytes(digest, "big")) % (1 << 256)
+    return f"{len(members)}:{total:064x}"
+
+
+class FakeAdapter:
+    """Serves ranged pages of a member list like LDAPAdapter.iter_attribute_values."""
+
+    def __init__(self, members, page_size):
+        self.members = members
+        self.page_size = page_size
+        self.calls = []
+
+    def iter_attribute_values(self, dn, attribute, start=0):
+        self.calls.append((dn, attribute, start))
+        for offset in range(start, len(self.members), self.page_size):
+            yield self.members[offset : offset + self.page_size]
+
+
+class TestNormalizeMembership:
+    """Tests for normalize_membership()."""
+
+    def test_small_lists_use_sorted_normalization(self):
+        """Test lists at the threshold keep the regular normalized form."""
+        members = member_dns(LARGE_MEMBERSHIP_THRESHOLD)
+        assert normalize_membership(members) == normalize_ldap_value(members)
+        assert normalize_membership("CN=one") == "CN=one"
+        assert normalize_membership(None) == ""
+
+    def test_large_lists_use_digest(self):
+        """Test lists above the threshold hash to the reference digest."""
+        members = member_dns(LARGE_MEMBERSHIP_THRESHOLD + 1)
+        assert normalize_membership(members) == reference_digest(members)
+
+    def test_digest_is_order_independent(self):
+        """Test member order does not change the digest."""
+        members = member_dns(LARGE_MEMBERSHIP_THRESHOLD + 10)
+        assert normalize_membership(members) == normalize_membership(members[::-1])
+
+
+class TestMembershipDigest:
+    """Tests for MembershipDigest."""
+
+    def test_paged_updates_match_whole_list(self):
+        """Test feeding pages gives the same value as the complete list."""
+        for count in (0, 5, LARGE_MEMBERSHIP_THRESHOLD, LARGE_MEMBERSHIP_THRESHOLD + 7):
+            members = member_dns(count)
+            digest = MembershipDigest()
+            for offset in range(0, count, 400):
+                digest.update(members[offset : offset + 400])
+            assert digest.value() == normalize_membership(members)
+            assert digest.count == count
+
+
+class TestDigestRangedMembership:
+    """Tests for digest_ranged_membership()."""
+
+    def test_streams_remaining_pages(self):
+        """Test the first page comes from the entry and the rest are streamed."""
+        members = member_dns(4000)
+        adapter = FakeAdapter(members, page_size=1500)
+        entry = {"dn": "CN=big", "member;range=0-1499": members[:1500]}
+
+        value, count = digest_ranged_membership(adapter, entry, "member")
+
+        assert (value, count) == (normalize_membership(members), 4000)
+        assert adapter.calls == [("CN=big", "member", 1500)]
+        assert entry == {"dn": "CN=big", "member;range=0-1499": members[:1500]}
+
+    def test_final_range_needs_no_fetch(self):
+        """Test a '*' range is hashed without further retrieval."""
+        members = member_dns(20)
+        adapter = FakeAdapter(members, page_size=10)
+        entry = {"dn": "CN=small", "Member;range=0-*": members}
+
+        assert digest_ranged_membership(adapter, entry, "member") == (
+            normalize_ldap_value(members),
+            20,
+        )
+        assert adapter.calls == []
+
+    def test_plain_attribute_returns_none(self):
+        """Test entries without a ranged attribute are left to the caller."""
+        entry = {"dn": "CN=g", "member": member_dns(3)}
+        assert digest_ranged_membership(FakeAdapter([], 10), entry, "member") is None
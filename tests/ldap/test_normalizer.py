@@ -0,0 +1,143 @@
+"""
+Unit tests for ldap.normalizer.
+
+Covers the reference normalization rules, parity between schema-planned
+conversion and the reference rules, and schema spec extraction.
+"""
+
+import base64
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from ldap.normalizer import LDAPNormalizer, normalize_ldap_value
+
+DIRECTORY_STRING = "1.3.6.1.4.1.1466.115.121.1.15"
+OCTET_STRING = "1.3.6.1.4.1.1466.115.121.1.40"
+GENERALIZED_TIME = "1.3.6.1.4.1.1466.115.121.1.24"
+
+SPECS = {
+    "cn": (True, DIRECTORY_STRING),
+    "memberOf": (False, DIRECTORY_STRING),
+    "objectGUID": (True, OCTET_STRING),
+    "userCertificate": (False, OCTET_STRING),
+    "whenCreated": (True, GENERALIZED_TIME),
+    "dSCorePropagationData": (False, GENERALIZED_TIME),
+}
+
+UTC_TIME = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+EASTERN_TIME = UTC_TIME.astimezone(timezone(timedelta(hours=-5)))
+
+# Values of every shape the ingesters see, for every planned attribute
+SAMPLE_VALUES = [
+    None,
+    [],
+    " text ",
+    ["only"],
+    ["b", " a", "c "],
+    b"plain bytes ",
+    b"\x00\x01guid",
+    b"\xff\xfe",
+    [b"\x00", b"abc"],
+    UTC_TIME,
+    [UTC_TIME, EASTERN_TIME],
+    EASTERN_TIME,
+    4096,
+    True,
+    [1, "x"],
+]
+
+
+class TestNormalizeLdapValue:
+    """Tests for normalize_ldap_value()."""
+
+    def test_none_and_empty_list(self):
+        """Test missing values normalize to an empty string."""
+        assert normalize_ldap_value(None) == ""
+        assert normalize_ldap_value([]) == ""
+
+    def test_single_element_list_collapses(self):
+        """Test single-element lists become the normalized element."""
+        assert normalize_ldap_value([" value "]) == "value"
+
+    def test_multi_valued_lists_are_sorted(self):
+        """Test multi-valued attributes are sorted after normalization."""
+        assert normalize_ldap_value(["b", " a"]) == ["a", "b"]
+
+    def test_text_bytes_are_decoded(self):
+        """Test UTF-8 bytes without control characters decode to text."""
+        assert normalize_ldap_value("café ".encode("utf-8")) == "café"
+        assert normalize_ldap_value(b"line\tone\r\n") == "line\tone"
+
+    @pytest.mark.parametrize("value", [b"\x00abc", b"a\x1fb", b"\xff\xfe\x00"])
+    def test_binary_bytes_are_base64(self, value):
+        """Test control characters or invalid UTF-8 force base64."""
+        assert normalize_ldap_value(value) == base64.b64encode(value).decode("ascii")
+
+    def test_datetimes_are_iso_formatted(self):
+        """Test datetimes keep their offset in ISO 8601 form."""
+        assert normalize_ldap_value(EASTERN_TIME) == "2024-01-01T07:00:00-05:00"
+
+    def test_other_values_are_stringified(self):
+        """Test integers and booleans use str()."""
+        assert normalize_ldap_value(4096) == "4096"
+        assert normalize_ldap_value(True) == "True"
+
+
+class TestLDAPNormalizer:
+    """Tests for LDAPNormalizer."""
+
+    @pytest.mark.parametrize("attribute", sorted(SPECS) + ["unknownAttribute"])
+    @pytest.mark.parametrize("value", SAMPLE_VALUES)
+    def test_plans_match_reference_rules(self, attribute, value):
+        """Test every plan returns exactly what normalize_ldap_value() returns."""
+        normalizer = LDAPNormalizer(SPECS)
+        assert normalizer.normalize_value(attribute, value) == normalize_ldap_value(
+            value
+        )
+
+    def test_time_cache_distinguishes_offsets(self):
+        """Test equal instants in different offsets are not served from the cache."""
+        normalizer = LDAPNormalizer(SPECS)
+        assert normalizer.normalize_value("whenCreated", UTC_TIME) == (
+            "2024-01-01T12:00:00+00:00"
+        )
+        assert normalizer.normalize_value("whenCreated", EASTERN_TIME) == (
+            "2024-01-01T07:00:00-05:00"
+        )
+
+    def test_attribute_names_match_case_insensitively(self):
+        """Test spec lookup ignores attribute name case."""
+        normalizer = LDAPNormalizer(SPECS)
+        assert normalizer.plan_for("OBJECTGUID") is not normalize_ldap_value
+        assert normalizer.plan_for("unknownAttribute") is normalize_ldap_value
+
+    def test_normalize_entries_is_lazy(self):
+        """Test entries are normalized one at a time, in order."""
+        normalizer = LDAPNormalizer(SPECS)
+        entries = iter([{"cn": [" a "]}, {"cn": "b"}])
+        normalized = normalizer.normalize_entries(entries)
+        assert next(normalized) == {"cn": "a"}
+        assert list(entries) == [{"cn": "b"}]
+
+    def test_from_schema_reads_attribute_types(self):
+        """Test specs come from single_value and syntax, following SUP."""
+        attribute_types = {
+            "name": SimpleNamespace(
+                single_value=True, syntax=f"{DIRECTORY_STRING}{{256}}", superior=None
+            ),
+            "cn": SimpleNamespace(single_value=False, syntax=None, superior=["name"]),
+        }
+        normalizer = LDAPNormalizer.from_schema(
+            SimpleNamespace(attribute_types=attribute_types)
+        )
+        assert normalizer._specs == {
+            "name": (True, DIRECTORY_STRING),
+            "cn": (False, DIRECTORY_STRING),
+        }
+
+    def test_from_schema_without_schema(self):
+        """Test a missing schema falls back to the reference rules."""
+        normalizer = LDAPNormalizer.from_schema(None)
+        assert normalizer.plan_for("cn") is normalize_ldap_value
@@ -0,0 +1,183 @@
+"""
+Unit tests for ranged attribute retrieval in LDAPAdapter.
+
+Runs the adapter against an ldap3 mock server that answers like Active
+Directory above MaxValRange: large 'member' values come back as
+'member;range=0-1499' and further pages must be requested explicitly.
+Covers search_as_dicts() with and without completion, iter_attribute_values()
+and digest_ranged_membership().
+"""
+
+from unittest.mock import patch
+
+from ldap3 import MOCK_SYNC, NONE, Connection
+
+from ldap.adapters.ldap_adapter import LDAPAdapter
+from ldap.membership import digest_ranged_membership, normalize_membership
+
+MAX_VAL_RANGE = 1500
+SERVICE_DN = "CN=svc,DC=example,DC=edu"
+BIG_GROUP_DN = "CN=big,OU=Groups,DC=example,DC=edu"
+SMALL_GROUP_DN = "CN=small,OU=Groups,DC=example,DC=edu"
+
+
+def member_dns(count):
+    """Build distinct member DNs."""
+    return [f"CN=user{i},OU=People,DC=example,DC=edu" for i in range(count)]
+
+
+class FakeActiveDirectory:
+    """
+    Connection factory for an ldap3 mock server with AD's MaxValRange paging.
+
+    Replaces ldap3.Connection inside the adapter and records the auto_range
+    setting of every connection it opens.
+    """
+
+    def __init__(self, server, entries):
+        self.server = server
+        self.auto_ranges = []
+        setup = Connection(server, client_strategy=MOCK_SYNC)
+        setup.strategy.add_entry(SERVICE_DN, {"userPassword": "secret"})
+        for dn, attributes in entries.items():
+            setup.strategy.add_entry(dn, attributes)
+
+    def __call__(self, server, **kwargs):
+        self.auto_ranges.append(kwargs.get("auto_range", True))
+        # ldap3's mock strategies do not honour auto_bind, so bind explicitly
+        auto_bind = kwargs.pop("auto_bind", False)
+        conn = Connection(server, client_strategy=MOCK_SYNC, **kwargs)
+        if auto_bind:
+            conn.bind()
+        execute_search = conn.strategy._execute_search
+
+        def ranged_search(request):
+            attributes = [str(attribute) for attribute in request["attributes"]]
+            ranged = [a for a in attributes if ";range=" in a.lower()]
+            if ranged:
+                # The mock only knows plain attribute names
+                request["attributes"] = [
+                    a for a in attributes if a not in ranged
+                ] + ["member"]
+            responses, result = execute_search(request)
+            for response in responses:
+                for attribute in response["attributes"]:
+                    if attribute["type"].lower() == "member":
+                        self._apply_range(attribute, ranged[0] if ranged else None)
+            return responses, result
+
+        conn.strategy._execute_search = ranged_search
+        return conn
+
+    @staticmethod
+    def _apply_range(attribute, requested):
+        """Cut the values down to one page the way AD does."""
+        values = attribute["vals"]
+        if requested is None:
+            if len(values) <= MAX_VAL_RANGE:
+                return
+            low, high = 0, MAX_VAL_RANGE - 1
+        else:
+            low, _, high = requested.split("=", 1)[1].partition("-")
+            low = int(low)
+            high = len(values) - 1 if high == "*" else int(high)
+            high = min(high, low + MAX_VAL_RANGE - 1)
+        if high >= len(values) - 1:
+            attribute["type"] = f"member;range={low}-*"
+            attribute["vals"] = values[low:]
+        else:
+            attribute["type"] = f"member;range={low}-{high}"
+            attribute["vals"] = values[low : high + 1]
+
+
+def build_adapter(members):
+    """Build an adapter whose connections talk to the fake AD server."""
+    adapter = LDAPAdapter(
+        {
+            "server": "ad.example.edu",
+            "search_base": "DC=example,DC=edu",
+            "user": SERVICE_DN,
+            "password": "secret",
+            "use_ssl": False,
+            "get_info": NONE,
+        }
+    )
+    directory = FakeActiveDirectory(
+        adapter._create_server(),
+        {
+            BIG_GROUP_DN: {"objectClass": "group", "cn": "big", "member": members},
+            SMALL_GROUP_DN: {
+                "objectClass": "group",
+                "cn": "small",
+                "member": members[:3],
+            },
+        },
+    )
+    return adapter, directory
+
+
+class TestRangedRetrieval:
+    """Tests for ranged 'member' retrieval against an AD-like server."""
+
+    MEMBERS = member_dns(4000)
+
+    def search_groups(self, adapter, **kwargs):
+        """Search both groups by DN order."""
+        entries = adapter.search_as_dicts(
+            "(objectClass=group)",
+            attributes=["cn", "member"],
+            use_pagination=False,
+            **kwargs,
+        )
+        return sorted(entries, key=lambda entry: entry["dn"])
+
+    def test_partial_range_reaches_caller(self):
+        """Test complete_ranges=False returns the server's first page as sent."""
+        adapter, directory = build_adapter(self.MEMBERS)
+        with patch("ldap.adapters.ldap_adapter.Connection", directory):
+            big, small = self.search_groups(adapter, complete_ranges=False)
+
+        assert big["member;range=0-1499"] == self.MEMBERS[:1500]
+        assert "member" not in big
+        assert small["member"] == self.MEMBERS[:3]
+        assert directory.auto_ranges == [False]
+
+    def test_search_completes_ranges(self):
+        """Test the default search replaces the partial range with all values."""
+        adapter, directory = build_adapter(self.MEMBERS)
+        with patch("ldap.adapters.ldap_adapter.Connection", directory):
+            big, small = self.search_groups(adapter)
+
+        assert big["member"] == self.MEMBERS
+        assert not [key for key in big if ";range=" in key]
+        assert small["member"] == self.MEMBERS[:3]
+        assert set(directory.auto_ranges) == {False}
+
+    def test_iter_attribute_values_streams_pages(self):
+        """Test pages follow the upper bound the server actually returned."""
+        adapter, directory = build_adapter(self.MEMBERS)
+        with patch("ldap.adapters.ldap_adapter.Connection", directory):
+            pages = list(adapter.iter_attribute_values(BIG_GROUP_DN, "member"))
+            resumed = list(
+                adapter.iter_attribute_values(
+                    BIG_GROUP_DN, "member", range_size=1000, start=1500
+                )
+            )
+
+        assert [len(page) for page in pages] == [1500, 1500, 1000]
+        assert sum(pages, []) == self.MEMBERS
+        assert [len(page) for page in resumed] == [1000, 1000, 500]
+        assert sum(resumed, []) == self.MEMBERS[1500:]
+        assert directory.auto_ranges == [False, False]
+
+    def test_digest_ranged_membership(self):
+        """Test the ranged first page plus streamed pages hash like the full list."""
+        adapter, directory = build_adapter(self.MEMBERS)
+        with patch("ldap.adapters.ldap_adapter.Connection", directory):
+            big, small = self.search_groups(adapter, complete_ranges=False)
+            digest = digest_ranged_membership(adapter, big, "member")
+            adapter.complete_ranged_attributes(big)
+
+        assert digest == (normalize_membership(self.MEMBERS), 4000)
+        assert big["member"] == self.MEMBERS
+        assert digest_ranged_membership(adapter, small, "member") is None
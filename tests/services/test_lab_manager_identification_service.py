@@ -0,0 +1,178 @@
+"""
+Unit tests for services.lab_manager_identification_service.
+
+Covers column-wise scoring against the per-member rule evaluation it
+replaced (ILIKE-style patterns, case-sensitive exact roles, list and dict
+job codes), the Tier 1 filter and the top-3 cut in ranking.
+"""
+
+import random
+
+import pandas as pd
+
+from services.lab_manager_identification_service import (
+    LabManagerIdentificationService,
+    ScoringRule,
+)
+
+# score_members() and rank_managers() never touch the database, so skip
+# __init__ (it opens and tests a PostgreSQL connection)
+service = LabManagerIdentificationService.__new__(LabManagerIdentificationService)
+
+
+def member(lab_id, uniqname, role=None, job_codes=None):
+    """Build one v_eligible_lab_members row."""
+    return {
+        "membership_id": f"{lab_id}-{uniqname}",
+        "lab_id": lab_id,
+        "member_uniqname": uniqname,
+        "member_role": role,
+        "member_job_title": None,
+        "is_pi": False,
+        "is_investigator": False,
+        "job_codes": job_codes,
+        "tdx_user_uid": None,
+    }
+
+
+def per_member_scores(members_df):
+    """Score each row with calculate_manager_score(), as before batching."""
+    scores = []
+    for row in members_df.itertuples():
+        score = service.calculate_manager_score(
+            row.member_role if isinstance(row.member_role, str) else None,
+            service._normalize_job_codes(row.job_codes),
+        )
+        if score:
+            scores.append((row.Index, score["confidence_score"], score["tier"]))
+    return scores
+
+
+def column_scores(members_df):
+    """Score the rows with score_members()."""
+    scored = service.score_members(members_df)
+    return list(zip(scored.index, scored["confidence_score"], scored["tier"]))
+
+
+class TestIlikeMatch:
+    """Tests for ScoringRule._ilike_match()."""
+
+    def test_wildcards_are_dropped_before_substring_match(self):
+        """Test '%Tech%Sr%' matches the case-insensitive substring 'techsr'."""
+        assert ScoringRule._ilike_match("Lab TECHSR II", "%Tech%Sr%")
+        assert not ScoringRule._ilike_match("Tech Sr", "%Tech%Sr%")
+        assert ScoringRule._ilike_match("senior research fellow", "Research Fellow%")
+
+
+class TestScoreMembers:
+    """Tests for LabManagerIdentificationService.score_members()."""
+
+    def test_wildcard_pattern_matches_per_member_rules(self):
+        """Test multi-wildcard patterns score like _ilike_match()."""
+        members_df = pd.DataFrame(
+            [
+                member("L1", "a", "Lab TechSr"),
+                member("L1", "b", "Tech Sr"),
+                member("L1", "c", "lab manager assistant"),
+            ]
+        )
+        assert column_scores(members_df) == per_member_scores(members_df)
+        assert column_scores(members_df)[0][1:] == (10, 2)
+
+    def test_exact_roles_are_case_sensitive(self):
+        """Test role_exact rules only match the exact spelling."""
+        members_df = pd.DataFrame(
+            [
+                member("L1", "a", "Admin Coord/Project Coord"),
+                member("L1", "b", "admin coord/project coord"),
+            ]
+        )
+        scored = service.score_members(members_df)
+        assert scored["member_uniqname"].tolist() == ["a"]
+        assert scored["confidence_score"].tolist() == [2]
+
+    def test_list_and_dict_job_codes(self):
+        """Test job codes stored as JSON lists or objects both match."""
+        members_df = pd.DataFrame(
+            [
+                member("L1", "a", job_codes=["111", "102945"]),
+                member("L1", "b", job_codes={"primary": "102946"}),
+                member("L1", "c", job_codes=[102929]),
+                member("L1", "d", job_codes="102945"),
+                member("L1", "e", job_codes=[]),
+            ]
+        )
+        scored = service.score_members(members_df)
+        assert scored["member_uniqname"].tolist() == ["a", "b", "c"]
+        assert column_scores(members_df) == per_member_scores(members_df)
+
+    def test_matches_per_member_rules_randomized(self):
+        """Test random roles and job codes score like calculate_manager_score()."""
+        rng = random.Random(46)
+        fragments = [
+            "Lab Manager", "lab coordinator", "LABORATORY MANAGER",
+            "Admin Coord/Project Coord", "Research Lab Specialist Lead",
+            "Research Lab Specialist Senior", "Research Lab Specialist Inter",
+            "Research Lab Specialist Assoc", "Research Lab Specialist",
+            "Research Fellow", "TechSr", "Tech Sr", "Team Lead",
+            "Research Scientist", "Graduate Student Instructor",
+            "Graduate Student Research Assistant", "Professor", "",
+        ]
+        codes = ["102945", "102946", "102929", "102909", "102908", "102944", "999"]
+        rows = []
+        for i in range(400):
+            role = rng.choice(
+                [None, rng.choice(fragments), " ".join(rng.sample(fragments, 2))]
+            )
+            sample = rng.sample(codes, rng.randint(0, 2))
+            job_codes = rng.choice(
+                [None, sample, {str(n): code for n, code in enumerate(sample)}]
+            )
+            rows.append(member(f"L{i % 7}", f"u{i}", role, job_codes))
+        members_df = pd.DataFrame(rows)
+
+        assert column_scores(members_df) == per_member_scores(members_df)
+
+
+class TestRankManagers:
+    """Tests for LabManagerIdentificationService.rank_managers()."""
+
+    def test_tier1_excludes_tier2(self):
+        """Test labs with a Tier 1 member drop their Tier 2 candidates."""
+        scored = service.score_members(
+            pd.DataFrame(
+                [
+                    member("L1", "fellow", "Research Fellow"),
+                    member("L1", "manager", "Lab Manager"),
+                    member("L2", "fellow", "Research Fellow"),
+                    member("L2", "gsi", "Graduate Student Instructor"),
+                ]
+            )
+        )
+        managers = service.rank_managers(scored)
+        assert [m["manager_uniqname"] for m in managers["L1"]] == ["manager"]
+        assert [m["manager_uniqname"] for m in managers["L2"]] == ["fellow", "gsi"]
+
+    def test_keeps_top_three_by_score_then_role(self):
+        """Test ranking orders by score and role and cuts after three."""
+        scored = service.score_members(
+            pd.DataFrame(
+                [
+                    member("L1", "e", "Project Coordinator"),
+                    member("L1", "d", "Lab Coordinator"),
+                    member("L1", "c", "Senior Lab Manager"),
+                    member("L1", "b", "Administrative Coordinator"),
+                    member("L1", "a", "Lab Manager"),
+                ]
+            )
+        )
+        managers = service.rank_managers(scored)["L1"]
+        assert [m["manager_uniqname"] for m in managers] == ["d", "a", "c"]
+        assert [m["manager_rank"] for m in managers] == [1, 2, 3]
+        assert [m["manager_confidence_score"] for m in managers] == [1, 1, 1]
+
+    def test_empty(self):
+        """Test no scored members gives no managers."""
+        scored = service.score_members(pd.DataFrame([member("L1", "a")]))
+        assert scored.empty
+        assert service.rank_managers(scored) == {}
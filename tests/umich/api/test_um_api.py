@@ -0,0 +1,159 @@
+import json
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from umich.api.um_api import OAuthTokenManager, UMichAPI
+
+
+class TestIterPagesConcurrently(unittest.TestCase):
+    """
+    Unit tests for UMichAPI.iter_pages_concurrently.
+
+    Pages are served by an in-memory fetch_page function; failures are
+    modelled by returning None, as UMichAPI.get does.
+    """
+
+    PAGE_SIZE = 10
+
+    def setUp(self):
+        """Set up an API client and 25 records."""
+        self.api = UMichAPI("https://gw.api.example.edu", "bf", {})
+        self.records = [{"id": i} for i in range(25)]
+        self.calls = []
+        self.calls_lock = threading.Lock()
+
+    def fetch_page(self, failing=(), slow=()):
+        """Build a fetch_page serving self.records, failing or slowing some pages."""
+        def fetch(start_index):
+            with self.calls_lock:
+                self.calls.append(start_index)
+            if start_index in slow:
+                time.sleep(0.2)
+            if start_index in failing:
+                return None
+            return self.records[start_index:start_index + self.PAGE_SIZE]
+        return fetch
+
+    def collect(self, fetch_page):
+        """Return the records yielded by iter_pages_concurrently, in index order."""
+        pages = self.api.iter_pages_concurrently(
+            fetch_page, page_size=self.PAGE_SIZE, max_workers=4,
+            page_attempts=2, retry_backoff=0,
+        )
+        return [record for _, page in sorted(pages, key=lambda item: item[0])
+                for record in page]
+
+    def test_all_pages_yielded(self):
+        """Test every record is yielded once when no request fails."""
+        self.assertEqual(self.collect(self.fetch_page()), self.records)
+
+    def test_failed_page_past_end_is_ignored(self):
+        """Test a speculative page past the end that keeps failing does not raise."""
+        # The last real page (20) arrives after the failing page 30 gave up
+        fetch = self.fetch_page(failing={30, 40}, slow={20})
+
+        self.assertEqual(self.collect(fetch), self.records)
+        self.assertEqual(self.calls.count(30), 2)
+
+    def test_failed_real_page_raises(self):
+        """Test a page inside the data that keeps failing raises RuntimeError."""
+        fetch = self.fetch_page(failing={10}, slow={20})
+
+        with self.assertRaises(RuntimeError):
+            self.collect(fetch)
+
+
+class TestOAuthTokenManager(unittest.TestCase):
+    """
+    Unit tests for OAuthTokenManager's counters and shared disk cache.
+
+    Tokens are seeded directly, so the token endpoint is never contacted.
+    """
+
+    def setUp(self):
+        """Set up a temporary directory for the shared cache file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, "tokens.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @staticmethod
+    def token(name):
+        """Build a token entry valid for an hour."""
+        return {'access_token': name, 'expires_at': time.time() + 3600,
+                'token_type': 'Bearer'}
+
+    def run_threads(self, target, count=8):
+        """Run target(i) on count threads started together, switching often."""
+        barrier = threading.Barrier(count)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def run(i):
+            barrier.wait()
+            target(i)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_memory_cache_hits_counted_under_concurrency(self):
+        """Test concurrent cache hits are all counted."""
+        manager = OAuthTokenManager("client", "secret", "scope")
+        manager._token = self.token("memory")
+
+        def hit(_):
+            for _ in range(2000):
+                self.assertEqual(manager.get_token(), "memory")
+
+        self.run_threads(hit)
+
+        self.assertEqual(manager.stats["memory_cache_hits"], 8 * 2000)
+        self.assertEqual(manager.stats["token_requests"], 0)
+
+    def test_concurrent_writers_keep_every_entry(self):
+        """Test managers writing the shared cache at once do not drop entries."""
+        managers = [
+            OAuthTokenManager("client", "secret", f"scope{i}",
+                              cache_path=self.cache_path)
+            for i in range(16)
+        ]
+
+        for _ in range(5):
+            if os.path.exists(self.cache_path):
+                os.unlink(self.cache_path)
+            self.run_threads(
+                lambda i: managers[i]._write_disk_cache(self.token(f"token{i}")),
+                count=len(managers),
+            )
+
+            with open(self.cache_path, encoding='utf-8') as f:
+                self.assertEqual(len(json.load(f)), len(managers))
+        for i, manager in enumerate(managers):
+            self.assertEqual(manager._read_disk_cache()['access_token'], f"token{i}")
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_path).st_mode), 0o600)
+
+    def test_disk_cache_shared_between_managers(self):
+        """Test a second manager reuses the token written by the first."""
+        first = OAuthTokenManager("client", "secret", "scope",
+                                  cache_path=self.cache_path)
+        first._write_disk_cache(self.token("shared"))
+        second = OAuthTokenManager("client", "secret", "scope",
+                                   cache_path=self.cache_path)
+
+        self.assertEqual(second.get_token(), "shared")
+        self.assertEqual(second.stats["disk_cache_hits"], 1)
+        self.assertEqual(second.stats["token_requests"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
-from .api.um_api import UMichAPI, create_headers
+from .api.um_api import UMichAPI, OAuthTokenManager, create_headers, get_token_manager
 from .api.department_api import DepartmentAPI
 
 __all__ = [
         "UMichAPI",
         "create_headers",
+        "OAuthTokenManager",
+        "get_token_manager",
         "DepartmentAPI"
 ]
@@ -1,5 +1,5 @@
 from .um_api import UMichAPI, create_headers
-from typing import Dict, List, Union, Any, Optional
+from typing import Callable, Dict, Iterator, List, Union, Any, Optional
 from urllib.parse import urlencode
 
 
@@ -127,110 +127,186 @@ class DepartmentAPI(UMichAPI):
 
         return self.get(endpoint)
 
-    def get_all_departments(
-        self, max_records: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    def _fetch_department_page(self, start_index: int, page_size: int = 1000) -> Optional[List[Dict[str, Any]]]:
         """
-        Get all department data by automatically handling pagination.
+        Fetch one page of department data as a list of records.
 
         Args:
-            max_records: Maximum number of records to retrieve. If None, retrieves all records.
+            start_index: 0-based index of the first record.
+            page_size: Number of records to request (max 1,000).
 
         Returns:
-            List[Dict[str, Any]]: List of all department records.
+            Optional[List[Dict[str, Any]]]: Department records (empty at the end), or
+            None if the request failed.
+        """
+        result = self.get_department_data(
+            pagination={"count": page_size, "start_index": start_index}
+        )
+        if result is None:
+            # Failed request, not the end of the data; the pager retries or raises
+            return None
 
-        Note:
-            This method automatically handles pagination by making multiple API calls if necessary.
-            Use with caution for large datasets as it may result in many API requests.
+        departments = result.get("DepartmentList", {}).get("DeptData") or []
+        return departments if isinstance(departments, list) else [departments]
+
+    def _fetch_department_employee_page(self, start_index: int, page_size: int = 1000) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch one page of department employee data as a list of records.
+
+        Args:
+            start_index: 0-based index of the first record.
+            page_size: Number of records to request (max 1,000).
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Employee records (empty at the end), or
+            None if the request failed.
+        """
+        result = self.get_department_employee_data(
+            pagination={"count": page_size, "start_index": start_index}
+        )
+        if result is None:
+            # Failed request, not the end of the data; the pager retries or raises
+            return None
+
+        # Unwrap the nested structure: DeptEmpInfo -> DeptEmpData
+        employees = result.get("DeptEmpInfo", {}).get("DeptEmpData") or []
+        return employees if isinstance(employees, list) else [employees]
+
+    def iter_department_pages(
+        self, max_workers: int = 4, requests_per_second: Optional[float] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of department data as they arrive, fetching pages concurrently.
+
+        Args:
+            max_workers: Maximum number of concurrent page requests.
+            requests_per_second: Upper bound on request starts per second.
+
+        Yields:
+            List[Dict[str, Any]]: Pages of department records, in arrival order.
+
+        Raises:
+            RuntimeError: If a page request keeps failing (results are never truncated).
         """
-        all_departments = []
-        start_index = 0
         page_size = 1000  # Maximum allowed by the API
+        for _, page in self.iter_pages_concurrently(
+            lambda start_index: self._fetch_department_page(start_index, page_size),
+            page_size=page_size,
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+        ):
+            yield page
+
+    def iter_department_employee_pages(
+        self, max_workers: int = 4, requests_per_second: Optional[float] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of department employee data as they arrive, fetching pages concurrently.
 
-        while True:
-            # Get current page
-            pagination = {"count": page_size, "start_index": start_index}
-            result = self.get_department_data(pagination=pagination)
-            result = result["DepartmentList"]["DeptData"]
-            if not result or (isinstance(result, list) and len(result) == 0):
-                break
+        Ingestion can start on the first page while later pages are still
+        downloading.
 
-            # Add results to our collection
-            if isinstance(result, list):
-                all_departments.extend(result)
-                # If we got fewer results than requested, we've reached the end
-                if len(result) < page_size:
-                    break
-            else:
-                # Single result
-                all_departments.append(result)
-                print(type(result))
-                break
+        Args:
+            max_workers: Maximum number of concurrent page requests.
+            requests_per_second: Upper bound on request starts per second.
 
-            # Check if we've hit our max_records limit
-            if max_records and len(all_departments) >= max_records:
-                all_departments = all_departments[:max_records]
-                break
+        Yields:
+            List[Dict[str, Any]]: Pages of employee records, in arrival order.
 
-            start_index += page_size
+        Raises:
+            RuntimeError: If a page request keeps failing (results are never truncated).
+        """
+        page_size = 1000  # Maximum allowed by the API
+        for _, page in self.iter_pages_concurrently(
+            lambda start_index: self._fetch_department_employee_page(start_index, page_size),
+            page_size=page_size,
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+        ):
+            yield page
+
+    def _collect_pages(
+        self,
+        fetch_page: Callable[[int], Optional[List[Dict[str, Any]]]],
+        max_records: Optional[int],
+        max_workers: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages concurrently and return the records in index order.
 
-        return all_departments
+        Args:
+            fetch_page: Function returning the records at a given start_index.
+            max_records: Maximum number of records to return. If None, returns all.
+            max_workers: Maximum number of concurrent page requests.
 
-    def get_all_department_employees(
-        self, max_records: Optional[int] = None
+        Returns:
+            List[Dict[str, Any]]: All records, ordered as the API returns them.
+        """
+        page_size = 1000  # Maximum allowed by the API
+        pages = {}
+        contiguous_end = 0
+
+        for start_index, page in self.iter_pages_concurrently(
+            fetch_page, page_size=page_size, max_workers=max_workers
+        ):
+            pages[start_index] = page
+            # Pages arrive out of order, so only stop once every page up to
+            # the limit has been fetched
+            while contiguous_end in pages:
+                contiguous_end += page_size
+            if max_records and contiguous_end >= max_records:
+                break
+
+        records = [record for start_index in sorted(pages) for record in pages[start_index]]
+        if max_records:
+            records = records[:max_records]
+        return records
+
+    def get_all_departments(
+        self, max_records: Optional[int] = None, max_workers: int = 4
     ) -> List[Dict[str, Any]]:
         """
-        Get all department employee data by automatically handling pagination.
+        Get all department data by automatically handling pagination.
 
         Args:
             max_records: Maximum number of records to retrieve. If None, retrieves all records.
+            max_workers: Maximum number of concurrent page requests (1 for sequential).
 
         Returns:
-            List[Dict[str, Any]]: List of all department employee records.
+            List[Dict[str, Any]]: List of all department records.
+
+        Raises:
+            RuntimeError: If a page request keeps failing (results are never truncated).
 
         Note:
             This method automatically handles pagination by making multiple API calls if necessary.
             Use with caution for large datasets as it may result in many API requests.
         """
-        all_employees = []
-        start_index = 0
-        page_size = 1000  # Maximum allowed by the API
-
-        while True:
-            # Get current page
-            pagination = {"count": page_size, "start_index": start_index}
-            result = self.get_department_employee_data(pagination=pagination)
+        return self._collect_pages(self._fetch_department_page, max_records, max_workers)
 
-            if not result:
-                break
-
-            # Unwrap the nested structure: DeptEmpInfo -> DeptEmpData
-            employee_list = result.get("DeptEmpInfo", {}).get("DeptEmpData", [])
-
-            if not employee_list or (
-                isinstance(employee_list, list) and len(employee_list) == 0
-            ):
-                break
+    def get_all_department_employees(
+        self, max_records: Optional[int] = None, max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all department employee data by automatically handling pagination.
 
-            # Add results to our collection
-            if isinstance(employee_list, list):
-                all_employees.extend(employee_list)
-                # If we got fewer results than requested, we've reached the end
-                if len(employee_list) < page_size:
-                    break
-            else:
-                # Single result
-                all_employees.append(employee_list)
-                break
+        Args:
+            max_records: Maximum number of records to retrieve. If None, retrieves all records.
+            max_workers: Maximum number of concurrent page requests (1 for sequential).
 
-            # Check if we've hit our max_records limit
-            if max_records and len(all_employees) >= max_records:
-                all_employees = all_employees[:max_records]
-                break
+        Returns:
+            List[Dict[str, Any]]: List of all department employee records.
 
-            start_index += page_size
+        Raises:
+            RuntimeError: If a page request keeps failing (results are never truncated).
 
-        return all_employees
+        Note:
+            This method automatically handles pagination by making multiple API calls if necessary.
+            Use iter_department_employee_pages() to start processing before all pages arrive.
+        """
+        return self._collect_pages(
+            self._fetch_department_employee_page, max_records, max_workers
+        )
 
     def get_all_employees_in_department(
         self, department_id: str, max_records: Optional[int] = None
@@ -1,101 +1,337 @@
+import hashlib
 import json
 import logging
+import os
 import requests
+import tempfile
+import threading
 import time
 import datetime
-from typing import Dict, List, Union, Any, Optional, TypeVar, cast
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Tuple, Union, Any, Optional, TypeVar, cast
 
 
 from requests.exceptions import JSONDecodeError
 
+try:
+    import fcntl
+except ImportError:  # Windows: the cache file is still replaced atomically
+    fcntl = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Type variable for generic return type
 T = TypeVar('T')
-# Global token cache to avoid unnecessary OAuth requests
-_token_cache: Dict[str, Dict[str, Any]] = {}
+DEFAULT_OAUTH_URL = "https://gw.api.it.umich.edu/um/oauth2/token"
 
-def get_oauth_token(client_id: str, client_secret: str, scope: str,
-                   oauth_url: str = "https://gw.api.it.umich.edu/um/oauth2/token") -> Optional[str]:
+# Environment variable naming a JSON file used to share tokens between processes
+TOKEN_CACHE_ENV_VAR = "UM_API_TOKEN_CACHE"
+
+
+class OAuthTokenManager:
     """
-    Obtain an OAuth2 access token using client credentials flow.
+    Thread-safe, expiry-aware OAuth2 client-credentials token source.
 
-    Args:
+    Tokens are refreshed proactively once they are within refresh_margin
+    seconds of expiring. A lock ensures concurrent callers trigger at most one
+    token request. When cache_path is set, tokens are also persisted to a JSON
+    file (mode 0600) so that scripts run back-to-back, such as those run by
+    orchestrate_bronze_umapi.sh, reuse a still-valid token instead of each
+    running the client-credentials flow again.
+
+    Attributes:
         client_id (str): The OAuth2 client ID.
-        client_secret (str): The OAuth2 client secret.
         scope (str): The requested scope for the token.
         oauth_url (str): The OAuth2 token endpoint URL.
+        refresh_margin (float): Seconds before expiry at which a token is refreshed.
+        cache_path (Optional[str]): Path of the shared on-disk token cache, if any.
+        stats (Dict[str, int]): Counters for token fetches and cache hits.
+    """
 
-    Returns:
-        Optional[str]: The access token if successful, None otherwise.
+    def __init__(self, client_id: str, client_secret: str, scope: str,
+                 oauth_url: str = DEFAULT_OAUTH_URL, refresh_margin: float = 60,
+                 cache_path: Optional[str] = None):
+        """
+        Initialize the token manager.
 
-    Raises:
-        requests.RequestException: If the OAuth request fails.
-        ValueError: If the response is missing required fields.
-    """
-    # Create cache key
-    cache_key = f"{client_id}:{scope}"
-
-    # Check if we have a valid cached token
-    if cache_key in _token_cache:
-        cached_token = _token_cache[cache_key]
-        # Check if token is still valid (with 60 second buffer)
-        if time.time() < cached_token['expires_at'] - 60:
-            logger.debug("Using cached OAuth token")
-            return cached_token['access_token']
-        else:
-            logger.debug("Cached OAuth token expired, requesting new token")
-
-    try:
-        # Prepare the request data
-        data = {
-            'grant_type': 'client_credentials',
-            'client_id': client_id,
-            'client_secret': client_secret,
-            'scope': scope
+        Args:
+            client_id (str): The OAuth2 client ID.
+            client_secret (str): The OAuth2 client secret.
+            scope (str): The requested scope for the token.
+            oauth_url (str): The OAuth2 token endpoint URL.
+            refresh_margin (float): Seconds before expiry at which a token is refreshed.
+            cache_path (Optional[str]): Path of a JSON file shared between processes.
+        """
+        self.client_id = client_id
+        self._client_secret = client_secret
+        self.scope = scope
+        self.oauth_url = oauth_url
+        self.refresh_margin = refresh_margin
+        self.cache_path = cache_path
+
+        # The secret is never written to disk; entries are keyed by a digest
+        self._cache_key = hashlib.sha256(
+            f"{client_id}:{scope}:{oauth_url}".encode("utf-8")
+        ).hexdigest()
+        self._token: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "token_requests": 0,
+            "token_request_failures": 0,
+            "memory_cache_hits": 0,
+            "disk_cache_hits": 0,
         }
 
-        headers = {
-            'content-type': 'application/x-www-form-urlencoded'
-        }
+    def _is_fresh(self, token: Optional[Dict[str, Any]]) -> bool:
+        """Return True if the token will not expire within refresh_margin seconds."""
+        return bool(token) and time.time() < token['expires_at'] - self.refresh_margin
+
+    def get_token(self, force_refresh: bool = False,
+                  rejected_token: Optional[str] = None) -> Optional[str]:
+        """
+        Return a valid access token, requesting a new one only when needed.
+
+        After a 401 response, pass the token that was rejected rather than
+        force_refresh. Only that token is skipped. When several requests fail
+        with the same token at once, the first caller refreshes it and the
+        others reuse the new token.
+
+        Args:
+            force_refresh (bool): Ignore all cached tokens.
+            rejected_token (Optional[str]): Access token the server rejected.
+
+        Returns:
+            Optional[str]: The access token if successful, None otherwise.
+        """
+        def usable(candidate: Optional[Dict[str, Any]]) -> bool:
+            return self._is_fresh(candidate) and candidate['access_token'] != rejected_token
+
+        token = self._token
+        if not force_refresh and usable(token):
+            with self._lock:
+                self.stats["memory_cache_hits"] += 1
+            return token['access_token']
+
+        with self._lock:
+            # Another thread may have refreshed the token while we waited
+            if not force_refresh and usable(self._token):
+                self.stats["memory_cache_hits"] += 1
+                return self._token['access_token']
+
+            if not force_refresh:
+                disk_token = self._read_disk_cache()
+                if usable(disk_token):
+                    logger.debug("Using OAuth token from shared token cache")
+                    self.stats["disk_cache_hits"] += 1
+                    self._token = disk_token
+                    return disk_token['access_token']
+
+            token = self._request_token()
+            if token is None:
+                return None
 
-        logger.debug(f"Requesting OAuth token for scope: {scope}")
+            self._token = token
+            self._write_disk_cache(token)
+            return token['access_token']
 
-        # Make the OAuth request
-        response = requests.post(oauth_url, data=data, headers=headers)
+    def invalidate(self) -> None:
+        """Discard the cached token, both in memory and in the shared cache file."""
+        with self._lock:
+            self._token = None
+            self._update_disk_cache(lambda entries: entries.pop(self._cache_key, None))
 
-        if response.status_code == 200:
-            token_data = response.json()
+    def _request_token(self) -> Optional[Dict[str, Any]]:
+        """
+        Run the client-credentials flow against the token endpoint.
 
-            # Validate response contains required fields
-            if 'access_token' not in token_data:
-                raise ValueError("OAuth response missing access_token")
-            if 'expires_in' not in token_data:
-                raise ValueError("OAuth response missing expires_in")
+        Must be called with self._lock held.
 
-            # Cache the token
-            expires_at = time.time() + token_data['expires_in']
-            _token_cache[cache_key] = {
-                'access_token': token_data['access_token'],
-                'expires_at': expires_at,
-                'token_type': token_data.get('token_type', 'Bearer')
+        Returns:
+            Optional[Dict[str, Any]]: The token entry if successful, None otherwise.
+        """
+        self.stats["token_requests"] += 1
+        try:
+            data = {
+                'grant_type': 'client_credentials',
+                'client_id': self.client_id,
+                'client_secret': self._client_secret,
+                'scope': self.scope
             }
 
-            logger.debug(f"OAuth token obtained successfully, expires in {token_data['expires_in']} seconds")
-            return token_data['access_token']
-        else:
-            logger.error(f"OAuth request failed: {response.status_code}")
-            logger.error(f"Response: {response.text}")
-            return None
+            headers = {
+                'content-type': 'application/x-www-form-urlencoded'
+            }
+
+            logger.debug(f"Requesting OAuth token for scope: {self.scope}")
+
+            response = requests.post(self.oauth_url, data=data, headers=headers)
+
+            if response.status_code == 200:
+                token_data = response.json()
+
+                # Validate response contains required fields
+                if 'access_token' not in token_data:
+                    raise ValueError("OAuth response missing access_token")
+                if 'expires_in' not in token_data:
+                    raise ValueError("OAuth response missing expires_in")
+
+                logger.debug(f"OAuth token obtained successfully, expires in {token_data['expires_in']} seconds")
+                return {
+                    'access_token': token_data['access_token'],
+                    'expires_at': time.time() + token_data['expires_in'],
+                    'token_type': token_data.get('token_type', 'Bearer')
+                }
+            else:
+                logger.error(f"OAuth request failed: {response.status_code}")
+                logger.error(f"Response: {response.text}")
+
+        except requests.RequestException as e:
+            logger.error(f"OAuth request failed with exception: {str(e)}")
+        except (ValueError, KeyError) as e:
+            logger.error(f"OAuth response parsing failed: {str(e)}")
 
-    except requests.RequestException as e:
-        logger.error(f"OAuth request failed with exception: {str(e)}")
+        self.stats["token_request_failures"] += 1
         return None
-    except (ValueError, KeyError) as e:
-        logger.error(f"OAuth response parsing failed: {str(e)}")
+
+    def _read_disk_cache(self) -> Optional[Dict[str, Any]]:
+        """Return this manager's entry from the shared cache file, if present."""
+        if not self.cache_path:
+            return None
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            entry = entries.get(self._cache_key)
+            if entry and 'access_token' in entry and 'expires_at' in entry:
+                return entry
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable OAuth token cache {self.cache_path}: {str(e)}")
         return None
 
+    def _write_disk_cache(self, token: Dict[str, Any]) -> None:
+        """Store a token in the shared cache file, dropping expired entries."""
+        def update(entries: Dict[str, Any]) -> None:
+            now = time.time()
+            for key in [k for k, v in entries.items() if v.get('expires_at', 0) <= now]:
+                del entries[key]
+            entries[self._cache_key] = token
+
+        self._update_disk_cache(update)
+
+    def _update_disk_cache(self, update: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Apply an in-place update to the shared cache file.
+
+        The file is replaced atomically and created with owner-only permissions,
+        so a concurrent reader never sees a partially written token. The
+        read-modify-write runs under an exclusive lock on a sidecar lock file,
+        so processes refreshing different tokens at once do not drop each
+        other's entries.
+        """
+        if not self.cache_path:
+            return
+        try:
+            cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            with self._disk_cache_lock():
+                self._replace_disk_cache(update, cache_dir)
+        except OSError as e:
+            logger.warning(f"Could not update OAuth token cache {self.cache_path}: {str(e)}")
+
+    @contextmanager
+    def _disk_cache_lock(self) -> Iterator[None]:
+        """Hold an exclusive inter-process lock on the shared cache file."""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(f"{self.cache_path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _replace_disk_cache(self, update: Callable[[Dict[str, Any]], Any],
+                            cache_dir: str) -> None:
+        """Read the cache file, apply update and atomically write it back."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                entries = {}
+        except (FileNotFoundError, ValueError):
+            entries = {}
+
+        update(entries)
+
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.um_api_token_')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# Token managers shared by every caller in this process, keyed by credentials
+_token_managers: Dict[Tuple[str, str, str], OAuthTokenManager] = {}
+_token_managers_lock = threading.Lock()
+
+
+def get_token_manager(client_id: str, client_secret: str, scope: str,
+                      oauth_url: str = DEFAULT_OAUTH_URL,
+                      cache_path: Optional[str] = None) -> OAuthTokenManager:
+    """
+    Return the process-wide token manager for a client and scope.
+
+    Args:
+        client_id (str): The OAuth2 client ID.
+        client_secret (str): The OAuth2 client secret.
+        scope (str): The requested scope for the token.
+        oauth_url (str): The OAuth2 token endpoint URL.
+        cache_path (Optional[str]): Path of the shared on-disk token cache.
+            Defaults to the UM_API_TOKEN_CACHE environment variable; when
+            neither is set, tokens are only cached in memory.
+
+    Returns:
+        OAuthTokenManager: The shared token manager.
+    """
+    key = (client_id, scope, oauth_url)
+    with _token_managers_lock:
+        manager = _token_managers.get(key)
+        if manager is None:
+            manager = OAuthTokenManager(
+                client_id, client_secret, scope, oauth_url=oauth_url,
+                cache_path=cache_path or os.getenv(TOKEN_CACHE_ENV_VAR) or None
+            )
+            _token_managers[key] = manager
+        return manager
+
+
+def get_oauth_token(client_id: str, client_secret: str, scope: str,
+                   oauth_url: str = DEFAULT_OAUTH_URL) -> Optional[str]:
+    """
+    Obtain an OAuth2 access token using client credentials flow.
+
+    Tokens are cached by the shared OAuthTokenManager for the client and
+    scope, so repeated calls only contact the token endpoint near expiry.
+
+    Args:
+        client_id (str): The OAuth2 client ID.
+        client_secret (str): The OAuth2 client secret.
+        scope (str): The requested scope for the token.
+        oauth_url (str): The OAuth2 token endpoint URL.
+
+    Returns:
+        Optional[str]: The access token if successful, None otherwise.
+    """
+    return get_token_manager(client_id, client_secret, scope, oauth_url).get_token()
+
 def create_headers(client_id: Optional[str] = None, client_secret: Optional[str] = None,
                   scope: Optional[str] = None, api_token: Optional[str] = None) -> Optional[Dict[str, str]]:
     """
@@ -138,8 +374,11 @@ def clear_token_cache() -> None:
     """
     Clear the OAuth token cache. Useful for testing or forcing token refresh.
     """
-    global _token_cache
-    _token_cache.clear()
+    with _token_managers_lock:
+        managers = list(_token_managers.values())
+        _token_managers.clear()
+    for manager in managers:
+        manager.invalidate()
     logger.debug("OAuth token cache cleared")
 
 class UMichAPI:
@@ -153,9 +392,11 @@ class UMichAPI:
         base_url (str): The base URL for the UM API Gateway.
         category_id (Union[int, str]): The category abbreviation that API is from (e.g. 'bf' for Business & Finance).
         headers (Dict[str, str]): HTTP headers to use for API requests.
+        token_manager (Optional[OAuthTokenManager]): Source of fresh bearer tokens, if any.
     """
 
-    def __init__(self, base_url: str, category_id: Union[int, str], headers: Dict[str, str]):
+    def __init__(self, base_url: str, category_id: Union[int, str], headers: Dict[str, str],
+                 token_manager: Optional[OAuthTokenManager] = None):
         """
         Initialize the UM API Gateway client.
 
@@ -163,10 +404,35 @@ class UMichAPI:
             base_url (str): The base URL for the UM API Gateway.
             category_id (Union[int, str]): The abbreviation of the category that API is from. e.g. 'bf' for Business & Finance.
             headers (Dict[str, str]): HTTP headers to use for API requests.
+            token_manager (Optional[OAuthTokenManager]): When provided, each request
+                uses its current token, so long runs survive token expiry.
         """
         self.base_url = base_url
         self.category_id = category_id
         self.headers = headers
+        self.token_manager = token_manager
+
+    def _request_headers(self, force_refresh: bool = False,
+                         rejected_token: Optional[str] = None) -> Dict[str, str]:
+        """
+        Return the headers for a request, with a current bearer token if managed.
+
+        Args:
+            force_refresh (bool): Request a new token instead of the cached one.
+            rejected_token (Optional[str]): Token the server rejected; a
+                different (refreshed) token is returned instead.
+
+        Returns:
+            Dict[str, str]: HTTP headers to send.
+        """
+        if self.token_manager is None:
+            return self.headers
+        access_token = self.token_manager.get_token(
+            force_refresh=force_refresh, rejected_token=rejected_token
+        )
+        if not access_token:
+            return self.headers
+        return {**self.headers, 'Authorization': f'Bearer {access_token}'}
 
     def get(self, url_suffix: str) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
@@ -181,7 +447,7 @@ class UMichAPI:
         """
         try:
                 url = f'{self.base_url}/{self.category_id}/{url_suffix}'
-                response = requests.get(url, headers=self.headers)
+                response = requests.get(url, headers=self._request_headers())
                 return self._handle_response(response)
         except Exception as e:
             logger.exception(f"Exception occurred during GET request: {str(e)}")
@@ -204,10 +470,10 @@ class UMichAPI:
         url = f'{self.base_url}/{self.category_id}/{url_suffix}'
         if files:
             # If files are provided, don't use json parameter
-            response = requests.post(url, data=data, files=files, headers=self.headers)
+            response = requests.post(url, data=data, files=files, headers=self._request_headers())
         else:
             # If no files, use json parameter for JSON encoding
-            response = requests.post(url, json=data, headers=self.headers)
+            response = requests.post(url, json=data, headers=self._request_headers())
         return self._handle_response(response)
 
     def put(self, url_suffix: str, data: Any) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
@@ -223,7 +489,7 @@ class UMichAPI:
             from the API if successful, None otherwise.
         """
         url = f'{self.base_url}/{self.category_id}/{url_suffix}'
-        response = requests.put(url, json=data, headers=self.headers)
+        response = requests.put(url, json=data, headers=self._request_headers())
         return self._handle_response(response)
 
     def delete(self, url_suffix: str, data: Optional[Any] = None) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
@@ -239,7 +505,7 @@ class UMichAPI:
             from the API if successful, None otherwise.
         """
         url = f'{self.base_url}/{self.category_id}/{url_suffix}'
-        response = requests.delete(url, json=data, headers=self.headers)
+        response = requests.delete(url, json=data, headers=self._request_headers())
         return self._handle_response(response)
 
     def patch(self, url_suffix: str, data: Any) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
@@ -255,15 +521,17 @@ class UMichAPI:
             from the API if successful, None otherwise.
         """
         url = f'{self.base_url}/{self.category_id}/{url_suffix}'
-        response = requests.patch(url, json=data, headers=self.headers)
+        response = requests.patch(url, json=data, headers=self._request_headers())
         return self._handle_response(response)
 
-    def _handle_response(self, response: requests.Response) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    def _handle_response(self, response: requests.Response,
+                         token_refreshed: bool = False) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Handle the HTTP response from the UM API Gateway.
 
         Args:
             response (requests.Response): The HTTP response object.
+            token_refreshed (bool): Whether the request already retried with a refreshed token.
 
         Returns:
             Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]: The JSON response
@@ -282,6 +550,17 @@ class UMichAPI:
             elif response.status_code == 204:
                 logger.debug(f"{response.status_code} | Successful Post!")
                 return None
+            elif response.status_code == 401 and self.token_manager is not None and not token_refreshed:
+                # The token was revoked or expired early; refresh it and retry once
+                logger.info("Request unauthorized, refreshing OAuth token and retrying")
+                request = response.request.copy()
+                # Refresh only if no other request has replaced this token yet
+                authorization = request.headers.get('Authorization', '')
+                rejected_token = authorization.removeprefix('Bearer ') or None
+                request.headers.update(self._request_headers(
+                    force_refresh=rejected_token is None, rejected_token=rejected_token
+                ))
+                return self._retry_request(request, token_refreshed=True)
             elif response.status_code == 429:
                 reset_time = response.headers.get('X-RateLimit-Reset')
                 if reset_time:
@@ -302,12 +581,12 @@ class UMichAPI:
 
                     logger.info(f"Rate limit exceeded. Sleeping for {sleep_time} seconds.")
                     time.sleep(sleep_time)
-                    return self._retry_request(response.request)
+                    return self._retry_request(response.request, token_refreshed)
                 else:
                     logger.warning("Rate limit exceeded but no reset time provided.")
                     # Consider adding a default backoff here
                     time.sleep(5)  # Simple default
-                    return self._retry_request(response.request)
+                    return self._retry_request(response.request, token_refreshed)
             else:
                 logger.error(f"Request failed: {response.status_code}")
                 logger.error(f"Response text: {response.text}")
@@ -316,12 +595,143 @@ class UMichAPI:
             logger.exception(f"Exception occurred during response handling: {str(e)}")
             return None
 
-    def _retry_request(self, request: requests.PreparedRequest) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    def iter_pages_concurrently(self, fetch_page: Callable[[int], Optional[List[Dict[str, Any]]]],
+                                page_size: int = 1000, max_workers: int = 4,
+                                requests_per_second: Optional[float] = None,
+                                page_attempts: int = 3,
+                                retry_backoff: float = 2.0) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Fetch start_index-paginated results with several page requests in flight.
+
+        The UM API Gateway does not report a total record count, so the first
+        page is fetched on its own; if it is full, further pages are requested
+        speculatively, keeping up to max_workers requests in flight. The first
+        short or empty page marks the end of the data, after which no new pages
+        are scheduled (at most max_workers - 1 requests past the end are wasted).
+
+        Pages are yielded as soon as they arrive, not in index order, so callers
+        can start processing while later pages are still downloading.
+
+        A failed request is never taken as the end of the data: the page is
+        retried, and if it still fails the iteration raises, so callers never
+        see a silently truncated result. The failure is held back until every
+        page before it has arrived, so a speculative request past the end of
+        the data that fails is discarded instead.
+
+        Args:
+            fetch_page (Callable[[int], Optional[List[Dict[str, Any]]]]): Function
+                returning the records at a given start_index ([] at the end), or
+                None when the request failed.
+            page_size (int): Records per page; a shorter page ends pagination.
+            max_workers (int): Maximum number of concurrent page requests.
+            requests_per_second (Optional[float]): Upper bound on request starts per
+                second to stay within the gateway's rate limit. None for no pacing.
+            page_attempts (int): Attempts per page before giving up.
+            retry_backoff (float): Seconds to wait before a retry, multiplied by
+                the attempt number.
+
+        Yields:
+            Tuple[int, List[Dict[str, Any]]]: (start_index, records) for each non-empty page.
+
+        Raises:
+            RuntimeError: If a page still fails after page_attempts attempts.
+        """
+        pacing_lock = threading.Lock()
+        next_request_at = [0.0]
+
+        def paced_fetch(start_index: int) -> Optional[List[Dict[str, Any]]]:
+            if requests_per_second:
+                with pacing_lock:
+                    now = time.monotonic()
+                    wait_time = next_request_at[0] - now
+                    next_request_at[0] = max(now, next_request_at[0]) + 1.0 / requests_per_second
+                if wait_time > 0:
+                    time.sleep(wait_time)
+            return fetch_page(start_index)
+
+        def fetch_with_retries(start_index: int) -> List[Dict[str, Any]]:
+            attempts = max(1, page_attempts)
+            for attempt in range(1, attempts + 1):
+                page = paced_fetch(start_index)
+                if page is not None:
+                    return page
+                if attempt < attempts:
+                    logger.warning(f"Page at start_index {start_index} failed "
+                                   f"(attempt {attempt}/{attempts}), retrying")
+                    time.sleep(retry_backoff * attempt)
+            raise RuntimeError(f"Failed to fetch page at start_index {start_index} "
+                               f"after {attempts} attempts")
+
+        first_page = fetch_with_retries(0)
+        if not first_page:
+            return
+        yield 0, first_page
+        if len(first_page) < page_size:
+            return
+
+        end_index: Optional[int] = None
+        next_index = page_size
+        # Lowest page that failed after its retries, and why
+        failed_index: Optional[int] = None
+        failure: Optional[Exception] = None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            pending = {}
+            try:
+                while True:
+                    # Keep the window full until the end of the data is known
+                    while (end_index is None and failure is None
+                           and len(pending) < max(1, max_workers)):
+                        pending[executor.submit(fetch_with_retries, next_index)] = next_index
+                        next_index += page_size
+
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        start_index = pending.pop(future)
+                        if end_index is not None and start_index >= end_index:
+                            # Speculative request past the end of the data
+                            continue
+
+                        try:
+                            page = future.result()
+                        except Exception as e:
+                            if failed_index is None or start_index < failed_index:
+                                failed_index, failure = start_index, e
+                            continue
+
+                        if page:
+                            yield start_index, page
+
+                        if len(page) < page_size:
+                            page_end = start_index + len(page)
+                            end_index = page_end if end_index is None else min(end_index, page_end)
+                            logger.debug(f"Pagination end detected at index {end_index}")
+
+                    if failure is not None:
+                        if end_index is not None and failed_index >= end_index:
+                            logger.debug(f"Ignoring failed page at start_index {failed_index} "
+                                         f"past the end of the data")
+                            failed_index = failure = None
+                        elif not any(index < failed_index for index in pending.values()):
+                            # Every earlier page was full, so the failed page holds data
+                            raise failure
+            except BaseException:
+                # Don't start queued pages once iteration has failed or stopped
+                for future in pending:
+                    future.cancel()
+                raise
+
+    def _retry_request(self, request: requests.PreparedRequest,
+                       token_refreshed: bool = False) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Retry a failed request.
 
         Args:
             request (requests.PreparedRequest): The original request to retry.
+            token_refreshed (bool): Whether the request already retried with a refreshed token.
 
         Returns:
             Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]: The JSON response
@@ -350,4 +760,4 @@ class UMichAPI:
         else:
             raise ValueError(f"Unsupported method: {method}")
 
-        return self._handle_response(response)
+        return self._handle_response(response, token_refreshed)